@@ -31,6 +31,7 @@ from octobot_trading.api.symbol_data import (
     get_symbol_data,
     get_symbol_candles_manager,
     get_symbol_historical_candles,
+    get_symbol_historical_candles_view,
     create_preloaded_candles_manager,
     are_symbol_candles_initialized,
     get_candles_as_list,
@@ -248,6 +249,7 @@ __all__ = [
     "get_symbol_data",
     "get_symbol_candles_manager",
     "get_symbol_historical_candles",
+    "get_symbol_historical_candles_view",
     "create_preloaded_candles_manager",
     "are_symbol_candles_initialized",
     "get_candles_as_list",
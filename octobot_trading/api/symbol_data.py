@@ -35,6 +35,10 @@ def get_symbol_historical_candles(symbol_data, time_frame, limit=-1) -> object:
     return get_symbol_candles_manager(symbol_data, time_frame).get_symbol_prices(limit)
 
 
+def get_symbol_historical_candles_view(symbol_data, time_frame, limit=-1, snapshot=False) -> dict:
+    return get_symbol_candles_manager(symbol_data, time_frame).get_symbol_prices_view(limit, snapshot=snapshot)
+
+
 async def create_preloaded_candles_manager(preloaded_candles):
     candles_manager = exchange_data.PreloadedCandlesManager()
     await candles_manager.initialize()
@@ -26,7 +26,7 @@ def get_trade_history(
 ) -> list:
     return [
         trade.to_dict() if as_dict else trade
-        for trade in exchange_manager.exchange_personal_data.trades_manager.get_trades()
+        for trade in exchange_manager.exchange_personal_data.trades_manager.get_trades(include_archived=True)
         if _trade_filter(trade, quote, symbol, since, include_cancelled)
     ]
 
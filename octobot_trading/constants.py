@@ -104,6 +104,8 @@ CCXT_WATCH_ORDER_BOOK_LIMIT = int(os.getenv("CCXT_WATCH_ORDER_BOOK_LIMIT", str(C
 CCXT_TIMEOUT_ON_EXIT_MS = 100
 THROTTLED_WS_UPDATES = float(os.getenv("THROTTLED_WS_UPDATES", "0.1"))  # avoid spamming CPU
 MAX_CANDLES_IN_RAM = int(os.getenv("MAX_CANDLES_IN_RAM", "3000"))    # max candles per CandlesManager
+# number of recently parsed exchange values (mostly price levels) to keep as decimal.Decimal
+DECIMAL_CONVERSION_CACHE_SIZE = int(os.getenv("DECIMAL_CONVERSION_CACHE_SIZE", "16384"))
 STORAGE_ORIGIN_VALUE = "origin_value"
 DISPLAY_TIME_FRAME = commons_enums.TimeFrames.ONE_HOUR
 DEFAULT_SUBACCOUNT_ID = "default_subaccount_id"
@@ -116,6 +118,10 @@ SIMULATED_BLOCKCHAIN_NETWORK = "SIMULATED"
 ENABLE_LIVE_CANDLES_STORAGE = os_util.parse_boolean_environment_var("ENABLE_LIVE_CANDLES_STORAGE", "False")
 ENABLE_HISTORICAL_ORDERS_UPDATES_STORAGE = os_util.parse_boolean_environment_var("ENABLE_HISTORICAL_ORDERS_UPDATES_STORAGE", "False")
 ENABLE_SIMULATED_ORDERS_STORAGE = os_util.parse_boolean_environment_var("ENABLE_SIMULATED_ORDERS_STORAGE", "False")
+# when enabled, only updated open orders are written in storage instead of every open order on each order update
+ENABLE_DIFF_BASED_OPEN_ORDERS_STORAGE = os_util.parse_boolean_environment_var(
+    "ENABLE_DIFF_BASED_OPEN_ORDERS_STORAGE", "False"
+)
 AUTH_UPDATE_DEBOUNCE_DURATION = float(os.getenv("AUTH_UPDATE_DEBOUNCE_DURATION", "10"))
 
 # Decimal default values (decimals are immutable, can be stored as constant)
@@ -231,7 +237,26 @@ BALANCE_CHANNEL = "Balance"
 BALANCE_PROFITABILITY_CHANNEL = "BalanceProfitability"
 POSITIONS_CHANNEL = "Positions"
 INDIVIDUAL_ORDER_SYNC_TIMEOUT = 1 * commons_constants.MINUTE_TO_SECONDS
+# maximum number of concurrent order requests when creating or cancelling multiple orders, requests are
+# still throttled by the exchange rate limiter
+MAX_CONCURRENT_ORDER_REQUESTS = int(os.getenv("MAX_CONCURRENT_ORDER_REQUESTS", "5"))
 MAX_TRADES_COUNT = int(os.getenv("MAX_TRADES_COUNT", "10000"))    # larger values can use a large part of ram
+# when enabled, trades older than TRADES_ARCHIVE_HORIZON seconds are compacted into the trades archive
+# instead of being removed when MAX_TRADES_COUNT is reached
+ENABLE_TRADES_ARCHIVE = os_util.parse_boolean_environment_var("ENABLE_TRADES_ARCHIVE", "False")
+TRADES_ARCHIVE_HORIZON = float(os.getenv("TRADES_ARCHIVE_HORIZON", str(commons_constants.DAYS_TO_SECONDS)))
+# when enabled, historical portfolio values are stored in float arrays instead of a HistoricalAssetValue each
+ENABLE_COLUMNAR_PORTFOLIO_HISTORY = os_util.parse_boolean_environment_var("ENABLE_COLUMNAR_PORTFOLIO_HISTORY", "False")
+# when enabled, portfolio values are updated incrementally: a price update only re-evaluates the assets using it
+ENABLE_INCREMENTAL_PORTFOLIO_VALUATION = os_util.parse_boolean_environment_var(
+    "ENABLE_INCREMENTAL_PORTFOLIO_VALUATION", "False"
+)
+# when enabled, backtesting updaters read each data series once and then select their data from memory
+ENABLE_BACKTESTING_DATA_STREAM = os_util.parse_boolean_environment_var("ENABLE_BACKTESTING_DATA_STREAM", "True")
+# when enabled, backtesting tickers and recent trades are generated from each symbol whole candles history
+ENABLE_SYNTHETIC_MARKET_DATA_FROM_HISTORY = os_util.parse_boolean_environment_var(
+    "ENABLE_SYNTHETIC_MARKET_DATA_FROM_HISTORY", "True"
+)
 
 # History
 DEFAULT_SAVED_HISTORICAL_TIMEFRAMES = [commons_enums.TimeFrames.ONE_DAY]
@@ -684,3 +684,12 @@ class TradingModeActivityType(enum.Enum):
 class ActiveOrderSwapTriggerPriceConfiguration(enum.Enum):
     FILLING_PRICE = "filling_price"
     ORDER_PARAMS_ONLY = "order_params_only"
+
+
+class ExchangeChannelConsumerMode(enum.Enum):
+    # each message is consumed
+    DEFAULT = "default"
+    # only the latest message of each symbol and time frame is consumed
+    COALESCING = "coalescing"
+    # every queued message is consumed at once
+    BATCHED = "batched"
@@ -15,6 +15,7 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 import asyncio
+import collections
 
 import octobot_commons.tree as commons_tree
 
@@ -26,6 +27,8 @@ import async_channel.producer as producers
 
 import octobot_commons.logging as logging
 
+import octobot_trading.enums as enums
+
 
 class ExchangeChannelConsumer(consumers.Consumer):
     """
@@ -33,6 +36,70 @@ class ExchangeChannelConsumer(consumers.Consumer):
     """
 
 
+class CoalescingQueue(asyncio.Queue):
+    """
+    Queue only keeping the latest message of each symbol and time frame: a message replaces the queued message
+    of its symbol and time frame, if any, without changing its place in the queue.
+    Messages without symbol are never replaced.
+    """
+    SYMBOL_KEY = "symbol"
+    TIME_FRAME_KEY = "time_frame"
+
+    def put_nowait(self, item):
+        key = self._get_message_key(item)
+        if key in self._queue:
+            # replaced messages are never consumed: there is no new unfinished task
+            self._queue[key] = item
+        else:
+            super().put_nowait(item)
+
+    async def put(self, item):
+        if self._get_message_key(item) in self._queue:
+            # don't wait for a free slot to replace a queued message
+            self.put_nowait(item)
+        else:
+            await super().put(item)
+
+    def _init(self, maxsize):
+        self._queue = collections.OrderedDict()
+
+    def _put(self, item):
+        self._queue[self._get_message_key(item)] = item
+
+    def _get(self):
+        return self._queue.popitem(last=False)[1]
+
+    def _get_message_key(self, message):
+        if (symbol := message.get(self.SYMBOL_KEY)) is None:
+            # nothing tells this message is about the same data as another one: use a unique key
+            return object()
+        return symbol, message.get(self.TIME_FRAME_KEY)
+
+
+class ExchangeChannelCoalescingConsumer(ExchangeChannelConsumer):
+    """
+    ExchangeChannelConsumer only consuming the latest message of each symbol and time frame: messages that are
+    replaced by a newer message before being consumed are skipped
+    """
+
+    def __init__(self, callback, size: int = channel_constants.DEFAULT_QUEUE_SIZE,
+                 priority_level: int = channel_enums.ChannelConsumerPriorityLevels.HIGH.value):
+        super().__init__(callback, size=size, priority_level=priority_level)
+        self.queue: CoalescingQueue = CoalescingQueue(maxsize=size)
+
+
+class ExchangeChannelBatchedConsumer(ExchangeChannelConsumer):
+    """
+    ExchangeChannelConsumer calling its callback with the list of every queued message instead of once per message
+    """
+
+    async def perform(self, kwargs) -> None:
+        messages = [kwargs]
+        while not self.queue.empty():
+            messages.append(self.queue.get_nowait())
+        await self.callback(messages)
+
+
 class ExchangeChannelInternalConsumer(consumers.InternalConsumer):
     """
     InternalConsumer adapted for ExchangeChannel
@@ -78,6 +145,10 @@ class ExchangeChannelProducer(producers.Producer):
 class ExchangeChannel(channels.Channel):
     PRODUCER_CLASS = ExchangeChannelProducer
     CONSUMER_CLASS = ExchangeChannelConsumer
+    CONSUMER_CLASS_BY_MODE = {
+        enums.ExchangeChannelConsumerMode.COALESCING: ExchangeChannelCoalescingConsumer,
+        enums.ExchangeChannelConsumerMode.BATCHED: ExchangeChannelBatchedConsumer,
+    }
     CRYPTOCURRENCY_KEY = "cryptocurrency"
     SYMBOL_KEY = "symbol"
     DEFAULT_PRIORITY_LEVEL = channel_enums.ChannelConsumerPriorityLevels.HIGH.value
@@ -89,6 +160,8 @@ class ExchangeChannel(channels.Channel):
 
         self.filter_send_counter = 0
         self.should_send_filter = False
+        # requested filters: filtered consumers, reset when consumers are added or removed
+        self._consumers_by_filters: dict = {}
 
     async def new_consumer(self,
                            callback: object = None,
@@ -97,10 +170,16 @@ class ExchangeChannel(channels.Channel):
                            priority_level: int = DEFAULT_PRIORITY_LEVEL,
                            symbol: str = channel_constants.CHANNEL_WILDCARD,
                            cryptocurrency: str = channel_constants.CHANNEL_WILDCARD,
+                           consumer_mode: enums.ExchangeChannelConsumerMode =
+                           enums.ExchangeChannelConsumerMode.DEFAULT,
                            **kwargs) -> ExchangeChannelConsumer:
-        consumer = consumer_instance if consumer_instance else self.CONSUMER_CLASS(
-            callback, size=size, priority_level=priority_level
-        )
+        """
+        :param consumer_mode: COALESCING to only consume the latest message of each symbol and time frame,
+        BATCHED to call callback with the list of every queued message
+        """
+        consumer = consumer_instance if consumer_instance else self.CONSUMER_CLASS_BY_MODE.get(
+            consumer_mode, self.CONSUMER_CLASS
+        )(callback, size=size, priority_level=priority_level)
         await self._add_new_consumer_and_run(consumer,
                                              cryptocurrency=cryptocurrency,
                                              symbol=symbol,
@@ -111,10 +190,24 @@ class ExchangeChannel(channels.Channel):
     def get_filtered_consumers(self,
                                cryptocurrency=channel_constants.CHANNEL_WILDCARD,
                                symbol=channel_constants.CHANNEL_WILDCARD):
-        return self.get_consumer_from_filters({
-            self.CRYPTOCURRENCY_KEY: cryptocurrency,
-            self.SYMBOL_KEY: symbol
-        })
+        try:
+            return self._consumers_by_filters[(cryptocurrency, symbol)]
+        except KeyError:
+            filtered_consumers = self._consumers_by_filters[(cryptocurrency, symbol)] = \
+                self.get_consumer_from_filters({
+                    self.CRYPTOCURRENCY_KEY: cryptocurrency,
+                    self.SYMBOL_KEY: symbol
+                })
+            return filtered_consumers
+
+    def add_new_consumer(self, consumer, consumer_filters) -> None:
+        super().add_new_consumer(consumer, consumer_filters)
+        self._consumers_by_filters = {}
+
+    async def remove_consumer(self, consumer) -> None:
+        # consumer is removed before any await in remove_consumer: filtered consumers can't be cached in between
+        self._consumers_by_filters = {}
+        await super().remove_consumer(consumer)
 
     async def _add_new_consumer_and_run(self, consumer,
                                         cryptocurrency=channel_constants.CHANNEL_WILDCARD,
@@ -140,11 +233,16 @@ class TimeFrameExchangeChannel(ExchangeChannel):
                                cryptocurrency=channel_constants.CHANNEL_WILDCARD,
                                symbol=channel_constants.CHANNEL_WILDCARD,
                                time_frame=channel_constants.CHANNEL_WILDCARD):
-        return self.get_consumer_from_filters({
-            self.CRYPTOCURRENCY_KEY: cryptocurrency,
-            self.SYMBOL_KEY: symbol,
-            self.TIME_FRAME_KEY: time_frame
-        })
+        try:
+            return self._consumers_by_filters[(cryptocurrency, symbol, time_frame)]
+        except KeyError:
+            filtered_consumers = self._consumers_by_filters[(cryptocurrency, symbol, time_frame)] = \
+                self.get_consumer_from_filters({
+                    self.CRYPTOCURRENCY_KEY: cryptocurrency,
+                    self.SYMBOL_KEY: symbol,
+                    self.TIME_FRAME_KEY: time_frame
+                })
+            return filtered_consumers
 
     async def _add_new_consumer_and_run(self, consumer,
                                         cryptocurrency=channel_constants.CHANNEL_WILDCARD,
@@ -49,6 +49,8 @@ from octobot_trading.exchange_data.ohlcv import (
     get_symbol_volume_candles,
     get_symbol_time_candles,
     get_candle_as_list,
+    SyntheticMarketData,
+    load_synthetic_market_data,
     OHLCVUpdaterSimulator,
     OHLCVProducer,
     OHLCVChannel,
@@ -62,6 +64,7 @@ from octobot_trading.exchange_data.order_book import (
     OrderBookTickerProducer,
     OrderBookTickerChannel,
     OrderBookManager,
+    PriceLevelOrderBook,
     OrderBookUpdaterSimulator,
 )
 from octobot_trading.exchange_data import prices
@@ -179,6 +182,8 @@ __all__ = [
     "get_symbol_volume_candles",
     "get_symbol_time_candles",
     "get_candle_as_list",
+    "SyntheticMarketData",
+    "load_synthetic_market_data",
     "OHLCVUpdaterSimulator",
     "OHLCVProducer",
     "OHLCVChannel",
@@ -189,6 +194,7 @@ __all__ = [
     "OrderBookTickerProducer",
     "OrderBookTickerChannel",
     "OrderBookManager",
+    "PriceLevelOrderBook",
     "OrderBookUpdaterSimulator",
     "MarkPriceUpdaterSimulator",
     "MarkPriceProducer",
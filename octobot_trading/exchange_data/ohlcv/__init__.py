@@ -16,6 +16,7 @@
 
 from octobot_trading.exchange_data.ohlcv import candles_manager
 from octobot_trading.exchange_data.ohlcv import candles_adapter
+from octobot_trading.exchange_data.ohlcv import synthetic_market_data
 from octobot_trading.exchange_data.ohlcv import channel
 
 from octobot_trading.exchange_data.ohlcv.candles_manager import (
@@ -33,6 +34,10 @@ from octobot_trading.exchange_data.ohlcv.candles_adapter import (
     get_symbol_time_candles,
     get_candle_as_list,
 )
+from octobot_trading.exchange_data.ohlcv.synthetic_market_data import (
+    SyntheticMarketData,
+    load_synthetic_market_data,
+)
 from octobot_trading.exchange_data.ohlcv.channel import (
     OHLCVUpdaterSimulator,
     OHLCVProducer,
@@ -52,6 +57,8 @@ __all__ = [
     "get_symbol_volume_candles",
     "get_symbol_time_candles",
     "get_candle_as_list",
+    "SyntheticMarketData",
+    "load_synthetic_market_data",
     "OHLCVUpdaterSimulator",
     "OHLCVProducer",
     "OHLCVChannel",
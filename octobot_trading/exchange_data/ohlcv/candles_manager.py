@@ -15,16 +15,27 @@
 #  License along with this library.
 import numpy as np
 
-import octobot_commons.data_util as data_util
 import octobot_commons.enums as enums
 import octobot_commons.logging as logging
 
 import octobot_trading.util as util
 import octobot_trading.constants as constants
 
+# enum values are looked up on each new candle: resolve them once
+_TIME_INDEX = enums.PriceIndexes.IND_PRICE_TIME.value
+_OPEN_INDEX = enums.PriceIndexes.IND_PRICE_OPEN.value
+_HIGH_INDEX = enums.PriceIndexes.IND_PRICE_HIGH.value
+_LOW_INDEX = enums.PriceIndexes.IND_PRICE_LOW.value
+_CLOSE_INDEX = enums.PriceIndexes.IND_PRICE_CLOSE.value
+_VOL_INDEX = enums.PriceIndexes.IND_PRICE_VOL.value
+
 
 class CandlesManager(util.Initializable):
     MAX_CANDLES_COUNT = constants.MAX_CANDLES_IN_RAM
+    # extra candles allocated in the candles buffer: once max_candles_count is reached, new candles are appended
+    # in this padding and the candles window only has to be moved back to the start of the buffer every
+    # (max_candles_count * CANDLES_BUFFER_PADDING_RATIO) candles instead of being shifted on each new candle
+    CANDLES_BUFFER_PADDING_RATIO = 0.25
 
     def __init__(self, max_candles_count=None):
         super().__init__()
@@ -41,6 +52,7 @@ class CandlesManager(util.Initializable):
         self.low_candles_index: int = 0
         self.time_candles_index: int = 0
         self.volume_candles_index: int = 0
+        # ordered views on the current candles window of self._candles
         self.close_candles: np.ndarray = None # type: ignore
         self.open_candles: np.ndarray = None # type: ignore
         self.high_candles: np.ndarray = None # type: ignore
@@ -48,6 +60,17 @@ class CandlesManager(util.Initializable):
         self.time_candles: np.ndarray = None # type: ignore
         self.volume_candles: np.ndarray = None # type: ignore
 
+        # (len(PriceIndexes), max_candles_count + padding) buffer, rows are indexed by PriceIndexes values
+        self._candles: np.ndarray = None # type: ignore
+        # buffer index of the first (oldest) candle of the candles window
+        self._candles_window_start: int = 0
+        # candle time -> candle number (position of the candle in every candle added since the last reset)
+        self._candle_number_by_time: dict[float, int] = {}
+        # candle number of the first (oldest) candle of the candles window
+        self._first_candle_number: int = 0
+        # when True, self._candles is referenced by snapshots and has to be copied before being updated
+        self._shared_candles: bool = False
+
         self.reached_max: bool = False
         self._reset_candles()
 
@@ -65,12 +88,14 @@ class CandlesManager(util.Initializable):
         self.time_candles_index = 0
         self.volume_candles_index = 0
 
-        self.close_candles = np.full(self.max_candles_count, fill_value=np.nan, dtype=np.float64)
-        self.open_candles = np.full(self.max_candles_count, fill_value=np.nan, dtype=np.float64)
-        self.high_candles = np.full(self.max_candles_count, fill_value=np.nan, dtype=np.float64)
-        self.low_candles = np.full(self.max_candles_count, fill_value=np.nan, dtype=np.float64)
-        self.time_candles = np.full(self.max_candles_count, fill_value=np.nan, dtype=np.float64)
-        self.volume_candles = np.full(self.max_candles_count, fill_value=np.nan, dtype=np.float64)
+        buffer_size = self.max_candles_count + \
+            max(1, int(self.max_candles_count * self.CANDLES_BUFFER_PADDING_RATIO))
+        self._candles = np.full((len(enums.PriceIndexes), buffer_size), fill_value=np.nan, dtype=np.float64)
+        self._candles_window_start = 0
+        self._bind_candles_views(self._candles_window_start, self._candles_window_start + self.max_candles_count)
+        self._candle_number_by_time = {}
+        self._first_candle_number = 0
+        self._shared_candles = False
 
     # getters
     def get_symbol_candles_count(self):
@@ -95,32 +120,44 @@ class CandlesManager(util.Initializable):
         return self._extract_limited_data(self.volume_candles, limit, max_limit=self.volume_candles_index)
 
     def get_symbol_prices(self, limit=-1):
-        return {
-            enums.PriceIndexes.IND_PRICE_CLOSE.value: self.get_symbol_close_candles(limit),
-            enums.PriceIndexes.IND_PRICE_OPEN.value: self.get_symbol_open_candles(limit),
-            enums.PriceIndexes.IND_PRICE_HIGH.value: self.get_symbol_high_candles(limit),
-            enums.PriceIndexes.IND_PRICE_LOW.value: self.get_symbol_low_candles(limit),
-            enums.PriceIndexes.IND_PRICE_VOL.value: self.get_symbol_volume_candles(limit),
-            enums.PriceIndexes.IND_PRICE_TIME.value: self.get_symbol_time_candles(limit)
-        }
+        # copy every candle value at once
+        return self._get_prices_by_price_index(self.get_symbol_candles_view(limit=limit).copy())
+
+    def get_symbol_prices_view(self, limit=-1, snapshot=False):
+        """
+        Same as get_symbol_prices but values are read-only views on the candles instead of copies
+        :param limit: the max number of candles to include, -1 for every candle
+        :param snapshot: when True, returned views are never updated by later candle updates
+        :return: a dict of read-only candles views by PriceIndexes value
+        """
+        return self._get_prices_by_price_index(self.get_symbol_candles_view(limit=limit, snapshot=snapshot))
+
+    def get_symbol_candles_view(self, limit=-1, snapshot=False):
+        """
+        Views are not copies: unless snapshot is True, they reflect later candle updates and are only
+        meaningful until the next candle update.
+        Snapshots are copy-on-write: the candles buffer is copied once on the next candle update
+        instead of copying the returned candles on each call.
+        :param limit: the max number of candles to include, -1 for every candle
+        :param snapshot: when True, the returned view is never updated by later candle updates
+        :return: a read-only (len(PriceIndexes), candles count) view on the candles, rows are indexed by
+        PriceIndexes values
+        """
+        candles_count = self.max_candles_count if self.reached_max else self.time_candles_index
+        first_candle_index = 0 if limit == -1 else max(0, candles_count - limit)
+        candles_view = self._candles[
+            :, self._candles_window_start + first_candle_index:self._candles_window_start + candles_count
+        ]
+        candles_view.flags.writeable = False
+        if snapshot:
+            self._shared_candles = True
+        return candles_view
 
     def get_candles(self, limit=-1):
-        candles_size = self.close_candles_index if limit == -1 else limit
-        candles = [[]] * candles_size
-        iter_range = range(self.close_candles_index) if limit == -1 \
-            else range(self.close_candles_index-limit, self.close_candles_index)
-        candles_index = 0
-        for index in iter_range:
-            candle = [0] * len(enums.PriceIndexes)
-            candle[enums.PriceIndexes.IND_PRICE_CLOSE.value] = self.close_candles[index]
-            candle[enums.PriceIndexes.IND_PRICE_OPEN.value] = self.open_candles[index]
-            candle[enums.PriceIndexes.IND_PRICE_HIGH.value] = self.high_candles[index]
-            candle[enums.PriceIndexes.IND_PRICE_LOW.value] = self.low_candles[index]
-            candle[enums.PriceIndexes.IND_PRICE_VOL.value] = self.volume_candles[index]
-            candle[enums.PriceIndexes.IND_PRICE_TIME.value] = self.time_candles[index]
-            candles[candles_index] = candle
-            candles_index += 1
-        return candles
+        first_candle_index = 0 if limit == -1 else max(0, self.close_candles_index - limit)
+        return self._candles[
+            :, self._candles_window_start + first_candle_index:self._candles_window_start + self.close_candles_index
+        ].T.tolist()
 
     def replace_all_candles(self, all_candles_data):
         self._reset_candles()
@@ -128,18 +165,12 @@ class CandlesManager(util.Initializable):
         self.candles_initialized = True
 
     def upsert_candle(self, updated_candle):
-        updated_candle_time = updated_candle[enums.PriceIndexes.IND_PRICE_TIME.value]
-        for index, candle_time in enumerate(self.time_candles):
-            if candle_time == updated_candle_time:
-                self.close_candles[index] = updated_candle[enums.PriceIndexes.IND_PRICE_CLOSE.value]
-                self.open_candles[index] = updated_candle[enums.PriceIndexes.IND_PRICE_OPEN.value]
-                self.high_candles[index] = updated_candle[enums.PriceIndexes.IND_PRICE_HIGH.value]
-                self.low_candles[index] = updated_candle[enums.PriceIndexes.IND_PRICE_LOW.value]
-                self.volume_candles[index] = updated_candle[enums.PriceIndexes.IND_PRICE_VOL.value]
-                return
-
-        # candle not in db, add it
-        self.add_new_candle(updated_candle)
+        index = self._get_candle_index_from_time(updated_candle[enums.PriceIndexes.IND_PRICE_TIME.value])
+        if index is None:
+            # candle not in db, add it
+            self.add_new_candle(updated_candle)
+        else:
+            self._write_candle(index, self._get_candle_values(updated_candle))
 
     def add_old_and_new_candles(self, candles_data):
         """
@@ -149,7 +180,7 @@ class CandlesManager(util.Initializable):
         """
         # check old candles
         for old_candle in candles_data[:-1]:
-            if old_candle[enums.PriceIndexes.IND_PRICE_TIME.value] not in self.time_candles:
+            if old_candle[enums.PriceIndexes.IND_PRICE_TIME.value] not in self._candle_number_by_time:
                 self.add_new_candle(old_candle)
 
         try:
@@ -162,20 +193,29 @@ class CandlesManager(util.Initializable):
         :param new_candle_data: new candles data
         :return:
         """
-        if self._should_add_new_candle(new_candle_data[enums.PriceIndexes.IND_PRICE_TIME.value]):
+        if self._should_add_new_candle(new_candle_data[_TIME_INDEX]):
             try:
+                candle_values = self._get_candle_values(new_candle_data)
                 self._check_max_candles()
-                self.close_candles[self.close_candles_index] = new_candle_data[enums.PriceIndexes.IND_PRICE_CLOSE.value]
-                self.open_candles[self.open_candles_index] = new_candle_data[enums.PriceIndexes.IND_PRICE_OPEN.value]
-                self.high_candles[self.high_candles_index] = new_candle_data[enums.PriceIndexes.IND_PRICE_HIGH.value]
-                self.low_candles[self.low_candles_index] = new_candle_data[enums.PriceIndexes.IND_PRICE_LOW.value]
-                self.time_candles[self.time_candles_index] = float(new_candle_data[enums.PriceIndexes.IND_PRICE_TIME.value])
-                self.volume_candles[self.volume_candles_index] = new_candle_data[enums.PriceIndexes.IND_PRICE_VOL.value]
+                self._write_candle(self.time_candles_index, candle_values)
+                self._candle_number_by_time[candle_values[_TIME_INDEX]] = \
+                    self._first_candle_number + self.time_candles_index
                 self._inc_candle_index()
             except IndexError as e:
                 self.logger.error(f"Fail to add new candle {new_candle_data} : {e}")
 
     # private
+    @staticmethod
+    def _get_prices_by_price_index(candles):
+        return {
+            _CLOSE_INDEX: candles[_CLOSE_INDEX],
+            _OPEN_INDEX: candles[_OPEN_INDEX],
+            _HIGH_INDEX: candles[_HIGH_INDEX],
+            _LOW_INDEX: candles[_LOW_INDEX],
+            _VOL_INDEX: candles[_VOL_INDEX],
+            _TIME_INDEX: candles[_TIME_INDEX],
+        }
+
     def _set_all_candles(self, new_candles_data):
         if isinstance(new_candles_data[-1], list):
             for candle_data in new_candles_data:
@@ -184,15 +224,61 @@ class CandlesManager(util.Initializable):
             self.add_new_candle(new_candles_data)
 
     def _change_current_candle(self):
-        self.close_candles = data_util.shift_value_array(self.close_candles, -1, np.nan, np.float64)
-        self.open_candles = data_util.shift_value_array(self.open_candles, -1, np.nan, np.float64)
-        self.high_candles = data_util.shift_value_array(self.high_candles, -1, np.nan, np.float64)
-        self.low_candles = data_util.shift_value_array(self.low_candles, -1, np.nan, np.float64)
-        self.volume_candles = data_util.shift_value_array(self.volume_candles, -1, np.nan, np.float64)
-        self.time_candles = data_util.shift_value_array(self.time_candles, -1, np.nan, np.float64)
+        # drop the oldest candle by moving the candles window forward: the last candle of the window is then
+        # ready to be written
+        self._unshare_candles()
+        self._candle_number_by_time.pop(self.time_candles[0], None)
+        next_window_start = self._candles_window_start + 1
+        if next_window_start + self.max_candles_count > self._candles.shape[1]:
+            # end of buffer: move the kept candles back to the start of the buffer
+            kept_candles_count = self.max_candles_count - 1
+            self._candles[:, :kept_candles_count] = \
+                self._candles[:, next_window_start:next_window_start + kept_candles_count]
+            next_window_start = 0
+        self._candles[:, next_window_start + self.max_candles_count - 1] = np.nan
+        self._first_candle_number += 1
+        self._candles_window_start = next_window_start
+        self._bind_candles_views(self._candles_window_start, self._candles_window_start + self.max_candles_count)
+
+    def _bind_candles_views(self, start, end):
+        self.time_candles = self._candles[_TIME_INDEX, start:end]
+        self.open_candles = self._candles[_OPEN_INDEX, start:end]
+        self.high_candles = self._candles[_HIGH_INDEX, start:end]
+        self.low_candles = self._candles[_LOW_INDEX, start:end]
+        self.close_candles = self._candles[_CLOSE_INDEX, start:end]
+        self.volume_candles = self._candles[_VOL_INDEX, start:end]
+
+    def _write_candle(self, index, candle_values):
+        self._unshare_candles()
+        self._candles[:, self._candles_window_start + index] = candle_values
+
+    def _unshare_candles(self):
+        if self._shared_candles:
+            # leave the current buffer to snapshots
+            self._candles = self._candles.copy()
+            self._bind_candles_views(self._candles_window_start, self._candles_window_start + len(self.time_candles))
+            self._shared_candles = False
+
+    @staticmethod
+    def _get_candle_values(candle):
+        # candle values ordered as self._candles rows
+        return (
+            float(candle[_TIME_INDEX]),
+            candle[_OPEN_INDEX],
+            candle[_HIGH_INDEX],
+            candle[_LOW_INDEX],
+            candle[_CLOSE_INDEX],
+            candle[_VOL_INDEX],
+        )
+
+    def _get_candle_index_from_time(self, candle_time):
+        try:
+            return self._candle_number_by_time[candle_time] - self._first_candle_number
+        except KeyError:
+            return None
 
     def _should_add_new_candle(self, new_open_time):
-        return new_open_time not in self.time_candles
+        return new_open_time not in self._candle_number_by_time
 
     def _check_max_candles(self):
         if self.reached_max:
@@ -16,7 +16,6 @@
 #  License along with this library.
 import asyncio
 import time
-import decimal
 
 import octobot_commons.constants as common_constants
 import octobot_commons.enums as common_enums
@@ -28,6 +27,7 @@ import octobot_trading.constants as constants
 import octobot_trading.enums as enums
 import octobot_trading.exchange_data.ohlcv.channel.ohlcv as ohlcv_channel
 import octobot_trading.exchanges as exchanges
+import octobot_trading.util as util
 
 
 class OHLCVUpdater(ohlcv_channel.OHLCVProducer):
@@ -220,7 +220,7 @@ class OHLCVUpdater(ohlcv_channel.OHLCVProducer):
         # Initialize mark price with last candle close to allow trading low liquidity markets. Those that might
         # take some time to produce a trade and therefore initialize their mark price, which is
         # required to create orders and might block the trading initialization
-        price = decimal.Decimal(str(candle[common_enums.PriceIndexes.IND_PRICE_CLOSE.value]))
+        price = util.to_decimal(candle[common_enums.PriceIndexes.IND_PRICE_CLOSE.value])
         self.channel.exchange_manager.get_symbol_data(pair).handle_mark_price_update(
             price,
             enums.MarkPriceSources.TICKER_CLOSE_PRICE.value
@@ -19,6 +19,7 @@ import octobot_commons.constants as constants
 import octobot_commons.enums as enums
 import octobot_commons.errors as errors
 
+import octobot_trading.constants as trading_constants
 import octobot_trading.exchange_data.ohlcv.channel.ohlcv_updater as ohlcv_updater
 import octobot_trading.util as util
 
@@ -38,6 +39,8 @@ class OHLCVUpdaterSimulator(ohlcv_updater.OHLCVUpdater):
                                         constants.MINUTE_TO_SECONDS
 
         self.last_candles_by_pair_by_time_frame = {}
+        # when set, each pair and time frame candles are read once and selected from this stream
+        self.data_stream = util.BacktestingDataStream() if trading_constants.ENABLE_BACKTESTING_DATA_STREAM else None
         self.require_last_init_candles_pairs_push = False
         self.traded_pairs = self._get_traded_pairs()
         self.traded_time_frame = self._get_time_frames()
@@ -56,13 +59,12 @@ class OHLCVUpdaterSimulator(ohlcv_updater.OHLCVUpdater):
                     # (selection is <= and >=)
                     # Use timestamp + self.future_candle_sec_length to include the future candle on the future candles
                     # time frame that will be sorted in exchange simulator for later uses.
-                    ohlcv_data: list = await self.exchange_data_importer.get_ohlcv_from_timestamps(
-                        exchange_name=self.exchange_name,
-                        symbol=pair,
-                        time_frame=time_frame,
-                        inferior_timestamp=self.last_timestamp_pushed + 1,
-                        superior_timestamp=timestamp + (self.future_candle_sec_length
-                                                        if self.future_candle_time_frame is time_frame else 0)
+                    ohlcv_data: list = await self._get_ohlcv_from_timestamps(
+                        pair,
+                        time_frame,
+                        self.last_timestamp_pushed + 1,
+                        timestamp + (self.future_candle_sec_length
+                                     if self.future_candle_time_frame is time_frame else 0)
                     )
                     if ohlcv_data:
                         pushed_data = await self._handle_ohlcv_data(ohlcv_data, time_frame, pair, timestamp)
@@ -93,6 +95,25 @@ class OHLCVUpdaterSimulator(ohlcv_updater.OHLCVUpdater):
             self.last_timestamp_pushed = timestamp
             self.require_last_init_candles_pairs_push = False
 
+    async def _get_ohlcv_from_timestamps(self, pair, time_frame, inferior_timestamp, superior_timestamp, **kwargs):
+        if self.data_stream is None:
+            return await self.exchange_data_importer.get_ohlcv_from_timestamps(
+                exchange_name=self.exchange_name,
+                symbol=pair,
+                time_frame=time_frame,
+                inferior_timestamp=inferior_timestamp,
+                superior_timestamp=superior_timestamp,
+                **kwargs
+            )
+        # use time_frame value: time frame enums are slower to hash
+        series_key = (pair, time_frame.value)
+        if not self.data_stream.has_series(series_key):
+            await self.data_stream.load_series(
+                series_key, self.exchange_data_importer.get_ohlcv,
+                exchange_name=self.exchange_name, symbol=pair, time_frame=time_frame
+            )
+        return self.data_stream.get_rows(series_key, inferior_timestamp, superior_timestamp)
+
     async def _handle_ohlcv_data(self, ohlcv_data, time_frame, pair, timestamp):
         has_future_candle = False
         if self.future_candle_time_frame is time_frame:
@@ -144,13 +165,12 @@ class OHLCVUpdaterSimulator(ohlcv_updater.OHLCVUpdater):
         ohlcv_data = None
         try:
             # only load candles starting from the star time of the backtesting
-            ohlcv_data: list = await self.exchange_data_importer.get_ohlcv_from_timestamps(
-                exchange_name=self.exchange_name,
-                symbol=pair,
-                time_frame=time_frame,
-                limit=self.OHLCV_OLD_LIMIT,
-                inferior_timestamp=self.initial_timestamp,
-                superior_timestamp=self.initial_timestamp)
+            ohlcv_data: list = await self._get_ohlcv_from_timestamps(
+                pair,
+                time_frame,
+                self.initial_timestamp,
+                self.initial_timestamp,
+                limit=self.OHLCV_OLD_LIMIT)
             candles_len = len(ohlcv_data)
             self.logger.info(f"Loaded pre-backtesting starting timestamp historical "
                              f"candles for: {pair} in {time_frame}: {candles_len} "
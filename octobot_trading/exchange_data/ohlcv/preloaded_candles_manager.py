@@ -45,12 +45,21 @@ class PreloadedCandlesManager(candles_manager.CandlesManager):
         return self.volume_candles
 
     def _set_all_candles(self, new_candles_data):
-        self.close_candles = self._get_candle_values_array(new_candles_data, enums.PriceIndexes.IND_PRICE_CLOSE.value)
-        self.open_candles = self._get_candle_values_array(new_candles_data, enums.PriceIndexes.IND_PRICE_OPEN.value)
-        self.high_candles = self._get_candle_values_array(new_candles_data, enums.PriceIndexes.IND_PRICE_HIGH.value)
-        self.low_candles = self._get_candle_values_array(new_candles_data, enums.PriceIndexes.IND_PRICE_LOW.value)
-        self.time_candles = self._get_candle_values_array(new_candles_data, enums.PriceIndexes.IND_PRICE_TIME.value)
-        self.volume_candles = self._get_candle_values_array(new_candles_data, enums.PriceIndexes.IND_PRICE_VOL.value)
+        # preloaded candles are never shifted: store them all in the candles buffer
+        self._candles = np.array(
+            [
+                self._get_candle_values_array(new_candles_data, price_index.value)
+                for price_index in enums.PriceIndexes
+            ],
+            dtype=np.float64
+        )
+        self._candles_window_start = 0
+        self._shared_candles = False
+        self._bind_candles_views(0, self._candles.shape[1])
+        self._candle_number_by_time = {}
+        for index, candle_time in enumerate(self.time_candles.tolist()):
+            # in case of duplicate candles, keep the first one
+            self._candle_number_by_time.setdefault(candle_time, index)
 
     def _get_candle_values_array(self, candles, key):
         return np.array([candle[key] for candle in candles], dtype=np.float64)
@@ -62,14 +71,13 @@ class PreloadedCandlesManager(candles_manager.CandlesManager):
 
         # return actual index + 1 as it is used as a select length
         select_index = 0 if self.time_candles_index == 0 else self.time_candles_index - 1
-        for delta_index, time_value in enumerate(self.time_candles[select_index:]):
-            if time_value == candle[enums.PriceIndexes.IND_PRICE_TIME.value]:
-                return self.time_candles_index + delta_index
+        index = self._get_candle_index_from_time(candle[enums.PriceIndexes.IND_PRICE_TIME.value])
+        if index is None:
+            return commons_constants.DEFAULT_IGNORED_VALUE
+        if index >= select_index:
+            return self.time_candles_index + index - select_index
         # candle in past candles
-        for index, time_value in enumerate(self.time_candles[:select_index]):
-            if time_value == candle[enums.PriceIndexes.IND_PRICE_TIME.value]:
-                return index
-        return commons_constants.DEFAULT_IGNORED_VALUE
+        return index
 
     def add_old_and_new_candles(self, candles_data):
         # candles are already loaded, just set indexes to the new candle
@@ -110,9 +118,9 @@ class PreloadedCandlesManager(candles_manager.CandlesManager):
         self.time_candles_index = 0
         self.volume_candles_index = 0
 
-        self.close_candles = np.ndarray((0,))
-        self.open_candles = np.ndarray((0,))
-        self.high_candles = np.ndarray((0,))
-        self.low_candles = np.ndarray((0,))
-        self.time_candles = np.ndarray((0,))
-        self.volume_candles = np.ndarray((0,))
+        self._candles = np.ndarray((len(enums.PriceIndexes), 0))
+        self._candles_window_start = 0
+        self._shared_candles = False
+        self._bind_candles_views(0, 0)
+        self._candle_number_by_time = {}
+        self._first_candle_number = 0
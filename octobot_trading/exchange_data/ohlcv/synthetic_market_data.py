@@ -0,0 +1,118 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import numpy as np
+
+import octobot_commons.constants as commons_constants
+import octobot_commons.enums as commons_enums
+
+import octobot_trading.enums as enums
+
+_TICKER_KEYS = (
+    enums.ExchangeConstantsTickersColumns.LAST.value,
+    enums.ExchangeConstantsTickersColumns.HIGH.value,
+    enums.ExchangeConstantsTickersColumns.LOW.value,
+    enums.ExchangeConstantsTickersColumns.OPEN.value,
+    enums.ExchangeConstantsTickersColumns.CLOSE.value,
+    enums.ExchangeConstantsTickersColumns.BASE_VOLUME.value,
+)
+_TICKER_PRICE_INDEXES = [
+    commons_enums.PriceIndexes.IND_PRICE_CLOSE.value,
+    commons_enums.PriceIndexes.IND_PRICE_HIGH.value,
+    commons_enums.PriceIndexes.IND_PRICE_LOW.value,
+    commons_enums.PriceIndexes.IND_PRICE_OPEN.value,
+    commons_enums.PriceIndexes.IND_PRICE_CLOSE.value,
+    commons_enums.PriceIndexes.IND_PRICE_VOL.value,
+]
+_RECENT_TRADES_PRICE_INDEXES = [
+    commons_enums.PriceIndexes.IND_PRICE_LOW.value,
+    commons_enums.PriceIndexes.IND_PRICE_HIGH.value,
+]
+_TICKER_TIMESTAMP_KEY = enums.ExchangeConstantsTickersColumns.TIMESTAMP.value
+_TICKER_SYMBOL_KEY = enums.ExchangeConstantsTickersColumns.SYMBOL.value
+_TRADE_TIMESTAMP_KEY = enums.ExchangeConstantsOrderColumns.TIMESTAMP.value
+_TRADE_PRICE_KEY = enums.ExchangeConstantsOrderColumns.PRICE.value
+
+
+class SyntheticMarketData:
+    """
+    SyntheticMarketData generates the tickers and recent trades of a symbol from its candles history.
+    Used in backtesting when no ticker or recent trades data is available: ticker and recent trades values of
+    every candle are selected in one pass over the candles array and only converted into the dicts pushed to
+    channels when their candle is reached.
+    Generated values are the ones of the per candle TickerUpdaterSimulator and RecentTradeUpdaterSimulator
+    generators, as floats.
+    """
+
+    def __init__(self, symbol: str, candles: list, time_frame_seconds: int):
+        """
+        :param symbol: the symbol of the candles
+        :param candles: the time sorted candles history as PriceIndexes ordered lists
+        :param time_frame_seconds: the candles time frame duration
+        """
+        self.symbol: str = symbol
+        self.time_frame_seconds: int = time_frame_seconds
+        candles_values = np.array(candles, dtype=np.float64).reshape(len(candles), len(commons_enums.PriceIndexes))
+        self._ticker_values: np.ndarray = candles_values[:, _TICKER_PRICE_INDEXES]
+        self._recent_trades_prices: np.ndarray = candles_values[:, _RECENT_TRADES_PRICE_INDEXES]
+        self._candle_index_by_time: dict = {}
+        for index, candle in enumerate(candles):
+            # in case of duplicate candles, keep the first one
+            self._candle_index_by_time.setdefault(candle[commons_enums.PriceIndexes.IND_PRICE_TIME.value], index)
+
+    def get_ticker(self, candle_time) -> dict:
+        """
+        :param candle_time: the time of the candle to generate the ticker from
+        :return: the ticker generated from this candle, None if this candle is unknown
+        """
+        try:
+            index = self._candle_index_by_time[candle_time]
+        except KeyError:
+            return None
+        ticker = dict(zip(_TICKER_KEYS, self._ticker_values[index].tolist()))
+        ticker[_TICKER_TIMESTAMP_KEY] = candle_time + self.time_frame_seconds
+        ticker[_TICKER_SYMBOL_KEY] = self.symbol
+        return ticker
+
+    def get_recent_trades(self, candle_time) -> list:
+        """
+        :param candle_time: the time of the candle to generate recent trades from
+        :return: the candle low price and high price recent trades, None if this candle is unknown
+        """
+        try:
+            index = self._candle_index_by_time[candle_time]
+        except KeyError:
+            return None
+        low_price, high_price = self._recent_trades_prices[index].tolist()
+        return [
+            {_TRADE_TIMESTAMP_KEY: candle_time, _TRADE_PRICE_KEY: low_price},
+            {_TRADE_TIMESTAMP_KEY: candle_time, _TRADE_PRICE_KEY: high_price},
+        ]
+
+
+async def load_synthetic_market_data(exchange_data_importer, exchange_name: str, symbol: str,
+                                     time_frame: commons_enums.TimeFrames) -> SyntheticMarketData:
+    """
+    :return: the SyntheticMarketData of the whole symbol candles history of the given time frame
+    """
+    ohlcv_data = await exchange_data_importer.get_ohlcv(exchange_name=exchange_name, symbol=symbol,
+                                                         time_frame=time_frame)
+    candles = sorted(
+        (ohlcv[-1] for ohlcv in ohlcv_data),
+        key=lambda candle: candle[commons_enums.PriceIndexes.IND_PRICE_TIME.value]
+    )
+    return SyntheticMarketData(
+        symbol, candles, commons_enums.TimeFramesMinutes[time_frame] * commons_constants.MINUTE_TO_SECONDS
+    )
@@ -0,0 +1,148 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import itertools
+import typing
+
+import sortedcontainers
+
+import octobot_commons.logging as logging
+
+import octobot_trading.enums as enums
+import octobot_trading.util as util
+from octobot_trading.enums import ExchangeConstantsOrderBookInfoColumns as ECOBIC
+
+
+class PriceLevelOrderBook(util.Initializable):
+    """
+    L2 order book: each side stores the aggregated size available at each price level.
+    Snapshots replace the whole book while deltas only update the given price levels: a delta
+    with a 0 size removes its price level.
+    Price levels are given as [price, size] pairs, prices are used as float keys.
+    This is a standalone building block: OrderBookManager and the order book channels don't use it, it's meant
+    for exchanges or tentacles receiving L2 snapshots and deltas that don't need OrderBookManager's per-order data.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.logger: logging.BotLogger = logging.get_logger(self.__class__.__name__)
+        self.order_book_initialized: bool = False
+        # price: size, best ask is the first item and best bid the last one
+        self.asks: sortedcontainers.SortedDict = sortedcontainers.SortedDict()
+        self.bids: sortedcontainers.SortedDict = sortedcontainers.SortedDict()
+        self.timestamp: float = 0
+
+    async def initialize_impl(self):
+        self.reset_order_book()
+
+    def reset_order_book(self):
+        self.order_book_initialized = False
+        self.asks.clear()
+        self.bids.clear()
+        self.timestamp = 0
+
+    def handle_new_book(self, order_book):
+        try:
+            self.handle_new_books(asks=order_book[ECOBIC.ASKS.value],
+                                  bids=order_book[ECOBIC.BIDS.value],
+                                  timestamp=order_book[ECOBIC.TIMESTAMP.value])
+        except KeyError:
+            self.logger.error("Failed to parse new order book")
+
+    def handle_new_books(self, asks, bids, timestamp=None):
+        """
+        Replace the order book content by the given snapshot
+        :param asks: the [price, size] ask price levels
+        :param bids: the [price, size] bid price levels
+        :param timestamp: the snapshot timestamp
+        """
+        self.asks.clear()
+        self.bids.clear()
+        self.handle_book_deltas(asks, bids, timestamp=timestamp)
+        self.order_book_initialized = True
+
+    def handle_book_deltas(self, asks, bids, timestamp=None):
+        """
+        Only update the given price levels, a 0 size removes the associated price level
+        :param asks: the [price, size] updated ask price levels
+        :param bids: the [price, size] updated bid price levels
+        :param timestamp: the update timestamp
+        """
+        _apply_price_level_deltas(self.asks, asks)
+        _apply_price_level_deltas(self.bids, bids)
+        if timestamp:
+            self.timestamp = timestamp
+
+    def get_ask(self) -> typing.Optional[tuple]:
+        """
+        :return: the best (price, size) ask price level, None when there is no ask
+        """
+        return self.asks.peekitem(0) if self.asks else None
+
+    def get_bid(self) -> typing.Optional[tuple]:
+        """
+        :return: the best (price, size) bid price level, None when there is no bid
+        """
+        return self.bids.peekitem(-1) if self.bids else None
+
+    def get_depth(self, side: enums.TradeOrderSide, levels_count: int) -> list:
+        """
+        :param side: BUY for bids, SELL for asks
+        :param levels_count: the number of price levels to include
+        :return: the levels_count best (price, size) price levels of the given side, best price first
+        """
+        return list(itertools.islice(self._iterate_price_levels(side), levels_count))
+
+    def get_depth_size(self, side: enums.TradeOrderSide, levels_count: int) -> float:
+        """
+        :param side: BUY for bids, SELL for asks
+        :param levels_count: the number of price levels to include
+        :return: the total size of the levels_count best price levels of the given side
+        """
+        return sum(size for _, size in itertools.islice(self._iterate_price_levels(side), levels_count))
+
+    def get_volume_weighted_average_price(self, side: enums.TradeOrderSide, size: float) -> typing.Optional[float]:
+        """
+        :param side: BUY for bids, SELL for asks
+        :param size: the size to fill from the given side
+        :return: the average price paid to fill size from the best price levels of the given side,
+        None when size is not positive or when the book side is not deep enough to fill size
+        """
+        if size <= 0:
+            return None
+        remaining_size = size
+        cost = 0
+        for price, level_size in self._iterate_price_levels(side):
+            filled_size = min(level_size, remaining_size)
+            cost += filled_size * price
+            remaining_size -= filled_size
+            if remaining_size <= 0:
+                return cost / size
+        return None
+
+    def _iterate_price_levels(self, side: enums.TradeOrderSide):
+        if side is enums.TradeOrderSide.BUY:
+            return ((price, self.bids[price]) for price in reversed(self.bids))
+        return iter(self.asks.items())
+
+
+def _apply_price_level_deltas(book_side, price_levels):
+    for price_level in price_levels:
+        price = float(price_level[0])
+        size = float(price_level[1])
+        if size:
+            book_side[price] = size
+        else:
+            book_side.pop(price, None)
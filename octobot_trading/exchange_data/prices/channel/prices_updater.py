@@ -24,6 +24,7 @@ import octobot_trading.constants as constants
 import octobot_trading.exchange_data.prices.channel.price as prices_channel
 import octobot_trading.exchange_data.prices.prices_manager as prices_manager
 import octobot_trading.enums as enums
+import octobot_trading.util as util
 
 
 class MarkPriceUpdater(prices_channel.MarkPriceProducer):
@@ -87,7 +88,7 @@ class MarkPriceUpdater(prices_channel.MarkPriceProducer):
         try:
             mark_price = prices_manager.calculate_mark_price_from_recent_trade_prices(
                 [
-                    decimal.Decimal(str(last_price[enums.ExchangeConstantsOrderColumns.PRICE.value]))
+                    util.to_decimal(last_price[enums.ExchangeConstantsOrderColumns.PRICE.value])
                     for last_price in recent_trades
                 ]
             )
@@ -103,7 +104,7 @@ class MarkPriceUpdater(prices_channel.MarkPriceProducer):
         """
         try:
             if ticker[enums.ExchangeConstantsTickersColumns.CLOSE.value]:
-                await self.push(symbol, decimal.Decimal(str(ticker[enums.ExchangeConstantsTickersColumns.CLOSE.value])),
+                await self.push(symbol, util.to_decimal(ticker[enums.ExchangeConstantsTickersColumns.CLOSE.value]),
                                 mark_price_source=enums.MarkPriceSources.TICKER_CLOSE_PRICE.value)
         except Exception as e:
             self.logger.exception(e, True, f"Fail to handle ticker update : {e}")
@@ -127,7 +128,7 @@ class MarkPriceUpdater(prices_channel.MarkPriceProducer):
             if self.channel.exchange_manager.exchange.FUNDING_WITH_MARK_PRICE:
                 mark_price, funding_rate = await self.channel.exchange_manager.exchange. \
                     get_mark_price_and_funding(symbol)
-                mark_price = decimal.Decimal(str(mark_price))
+                mark_price = util.to_decimal(mark_price)
                 await self.push_funding_rate(symbol, funding_rate)
             else:
                 mark_price = await self.channel.exchange_manager.exchange.get_mark_price(symbol)
@@ -15,9 +15,14 @@
 #  License along with this library.
 import asyncio
 import decimal
+import operator
 import typing
 
+import sortedcontainers
+
 import octobot_commons.logging as logging
+
+import octobot_trading.util as util
 from octobot_trading.enums import ExchangeConstantsOrderColumns as ECOC
 
 
@@ -31,13 +36,24 @@ class PriceEventsManager:
     The price event index from a price event tuple
     """
     PRICE_EVENT_INDEX = 2
+    TIMESTAMP_INDEX = 1
+    TRIGGER_ABOVE_INDEX = 3
+    REGISTRATION_INDEX = 4
     PRICE_KEY = "price"
     TIME_KEY = "time"
     MAX_LAST_RECENT_PRICES = 50
 
     def __init__(self):
         self.logger: logging.BotLogger = logging.get_logger(self.__class__.__name__)
-        self.events: list[tuple[decimal.Decimal, int, asyncio.Event, bool]] = []
+        # price event tuples by event
+        self.events: dict[asyncio.Event, tuple[decimal.Decimal, int, asyncio.Event, bool, int]] = {}
+        # price event tuples sorted by price: new prices only have to go through triggered events
+        self._trigger_above_events: sortedcontainers.SortedKeyList = \
+            sortedcontainers.SortedKeyList(key=operator.itemgetter(0))
+        self._trigger_below_events: sortedcontainers.SortedKeyList = \
+            sortedcontainers.SortedKeyList(key=operator.itemgetter(0))
+        # used to set triggered events in registration order
+        self._registered_events_count: int = 0
         self._last_recent_prices: list[dict[str, typing.Union[decimal.Decimal, int]]] = []
 
     def stop(self):
@@ -49,6 +65,8 @@ class PriceEventsManager:
         """
         self.clear_recent_prices()
         self.events.clear()
+        self._trigger_above_events.clear()
+        self._trigger_below_events.clear()
 
     def get_min_and_max_prices(self) -> (float, float):
         if len(self._last_recent_prices) < 2:
@@ -64,7 +82,7 @@ class PriceEventsManager:
         # reset recent prices on new recent trades
         self.clear_recent_prices()
         for recent_trade in recent_trades:
-            price = decimal.Decimal(str(recent_trade[ECOC.PRICE.value]))
+            price = util.to_decimal(recent_trade[ECOC.PRICE.value])
             timestamp = recent_trade[ECOC.TIMESTAMP.value]
             try:
                 self._add_recent_price(price, timestamp)
@@ -109,14 +127,20 @@ class PriceEventsManager:
         :param allow_instant_fill: True if recent prices should be checked to fill this event
         :return: the price event
         """
-        price_event_tuple = _new_price_event(price, timestamp, trigger_above)
+        price_event_tuple = _new_price_event(price, timestamp, trigger_above, self._registered_events_count)
+        self._registered_events_count += 1
+        event = price_event_tuple[PriceEventsManager.PRICE_EVENT_INDEX]
         if allow_instant_fill and self._is_triggered_by_last_recent_prices(price, timestamp, trigger_above):
             # don't add to self.events an event that is already set
-            price_event_tuple[PriceEventsManager.PRICE_EVENT_INDEX].set()
+            event.set()
         else:
             # this event will be set when conditions are met
-            self.events.append(price_event_tuple)
-        return price_event_tuple[PriceEventsManager.PRICE_EVENT_INDEX]
+            self.events[event] = price_event_tuple
+            if trigger_above:
+                self._trigger_above_events.add(price_event_tuple)
+            else:
+                self._trigger_below_events.add(price_event_tuple)
+        return event
 
     def _is_triggered_by_last_recent_prices(self, price, timestamp, trigger_above):
         """
@@ -156,34 +180,47 @@ class PriceEventsManager:
         Remove the event from events list
         :param event_to_remove: the event to remove
         """
-        for price_event_data in self.events:
-            if event_to_remove in price_event_data:
-                return self.events.remove(price_event_data)
+        price_event_tuple = self.events.pop(event_to_remove, None)
+        if price_event_tuple is None:
+            return
+        if price_event_tuple[PriceEventsManager.TRIGGER_ABOVE_INDEX]:
+            self._trigger_above_events.remove(price_event_tuple)
+        else:
+            self._trigger_below_events.remove(price_event_tuple)
 
     def _check_events(self, price, timestamp):
         """
         Check for each price, timestamp pair event if it should be triggered
         :param price: the price used to check
         :param timestamp: the timestamp used to check
-        :return: the event list that match
+        :return: the event list that match, in registration order
         """
+        # only go through events which price is reached
+        triggered_events = [
+            price_event_tuple
+            for price_event_tuple in self._trigger_above_events.irange_key(max_key=price)
+            if price_event_tuple[PriceEventsManager.TIMESTAMP_INDEX] <= timestamp
+        ]
+        triggered_events.extend(
+            price_event_tuple
+            for price_event_tuple in self._trigger_below_events.irange_key(min_key=price)
+            if price_event_tuple[PriceEventsManager.TIMESTAMP_INDEX] <= timestamp
+        )
+        if len(triggered_events) > 1:
+            triggered_events.sort(key=operator.itemgetter(PriceEventsManager.REGISTRATION_INDEX))
         return [
-            event
-            for event_price, event_timestamp, event, trigger_above in self.events
-            if event_timestamp <= timestamp and
-            (
-                (trigger_above and event_price <= price) or
-                (not trigger_above and event_price >= price)
-            )
+            price_event_tuple[PriceEventsManager.PRICE_EVENT_INDEX]
+            for price_event_tuple in triggered_events
         ]
 
 
-def _new_price_event(price, timestamp, trigger_above):
+def _new_price_event(price, timestamp, trigger_above, registration_index):
     """
     Create a new price event item
     :param price: the price condition
     :param timestamp: the timestamp condition
     :param trigger_above: True if waiting for an upper price
+    :param registration_index: the index of this event in registered events
     :return: a tuple to be added into events list
     """
-    return price, timestamp, asyncio.Event(), trigger_above
+    return price, timestamp, asyncio.Event(), trigger_above, registration_index
@@ -22,6 +22,7 @@ import octobot_commons.errors as errors
 import octobot_trading.constants as constants
 import octobot_trading.enums as enums
 import octobot_trading.exchange_channel as exchanges_channel
+import octobot_trading.exchange_data.ohlcv.synthetic_market_data as synthetic_market_data
 import octobot_trading.exchange_data.recent_trades.channel.recent_trade_updater as recent_trade_updater
 import octobot_trading.util as util
 
@@ -37,8 +38,13 @@ class RecentTradeUpdaterSimulator(recent_trade_updater.RecentTradeUpdater):
         self.last_timestamp_pushed = 0
         self.last_timestamp_pushed_by_symbol = {}
         self.time_consumer = None
+        # when set, each pair recent trades are read once and selected from this stream
+        self.data_stream = util.BacktestingDataStream() if constants.ENABLE_BACKTESTING_DATA_STREAM else None
         # Only generate recent trades from the shortest handled time frame
-        self.recent_trades_time_frame = self.channel.exchange_manager.exchange_config.get_shortest_time_frame().value
+        self.shortest_time_frame = self.channel.exchange_manager.exchange_config.get_shortest_time_frame()
+        self.recent_trades_time_frame = self.shortest_time_frame.value
+        # symbol: SyntheticMarketData (or None when unavailable) to generate recent trades from
+        self.synthetic_market_data_by_symbol = {}
 
     async def start(self):
         await self.resume()
@@ -46,11 +52,7 @@ class RecentTradeUpdaterSimulator(recent_trade_updater.RecentTradeUpdater):
     async def handle_timestamp(self, timestamp, **kwargs):
         try:
             for pair in self.channel.exchange_manager.exchange_config.traded_symbol_pairs:
-                recent_trades_data = (await self.exchange_data_importer.get_recent_trades_from_timestamps(
-                    exchange_name=self.exchange_name,
-                    symbol=pair,
-                    inferior_timestamp=timestamp,
-                    limit=1))[0]
+                recent_trades_data = await self._get_recent_trades_from_timestamp(pair, timestamp)
                 if recent_trades_data[0] > self.last_timestamp_pushed:
                     self.last_timestamp_pushed = recent_trades_data[0]
                     await self.push(pair, recent_trades_data[-1])
@@ -59,6 +61,19 @@ class RecentTradeUpdaterSimulator(recent_trade_updater.RecentTradeUpdater):
             await self.pause()
             await self.stop()
 
+    async def _get_recent_trades_from_timestamp(self, pair, timestamp):
+        if self.data_stream is None:
+            return (await self.exchange_data_importer.get_recent_trades_from_timestamps(
+                exchange_name=self.exchange_name,
+                symbol=pair,
+                inferior_timestamp=timestamp,
+                limit=1))[0]
+        if not self.data_stream.has_series(pair):
+            await self.data_stream.load_series(
+                pair, self.exchange_data_importer.get_recent_trades, exchange_name=self.exchange_name, symbol=pair
+            )
+        return self.data_stream.get_first_row(pair, timestamp)
+
     async def _recent_trades_from_ohlcv_callback(self, exchange: str, exchange_id: str,
                                                  cryptocurrency: str, symbol: str, time_frame, candle):
         if time_frame == self.recent_trades_time_frame:
@@ -71,10 +86,18 @@ class RecentTradeUpdaterSimulator(recent_trade_updater.RecentTradeUpdater):
                 future_candle = self.channel.exchange_manager.exchange.get_current_future_candles()[symbol][time_frame]
                 last_candle_timestamp = future_candle[common_enums.PriceIndexes.IND_PRICE_TIME.value]
                 if last_candle_timestamp > self.last_timestamp_pushed_by_symbol[symbol]:
-                    future_candle_low_price = future_candle[common_enums.PriceIndexes.IND_PRICE_LOW.value]
-                    future_candle_high_price = future_candle[common_enums.PriceIndexes.IND_PRICE_HIGH.value]
-                    recent_trades = [self._generate_recent_trade(last_candle_timestamp, future_candle_low_price),
-                                     self._generate_recent_trade(last_candle_timestamp, future_candle_high_price)]
+                    recent_trades = None
+                    if constants.ENABLE_SYNTHETIC_MARKET_DATA_FROM_HISTORY:
+                        symbol_synthetic_market_data = await self._get_synthetic_market_data(symbol)
+                        if symbol_synthetic_market_data is not None:
+                            recent_trades = symbol_synthetic_market_data.get_recent_trades(last_candle_timestamp)
+                    if recent_trades is None:
+                        future_candle_low_price = future_candle[common_enums.PriceIndexes.IND_PRICE_LOW.value]
+                        future_candle_high_price = future_candle[common_enums.PriceIndexes.IND_PRICE_HIGH.value]
+                        recent_trades = [
+                            self._generate_recent_trade(last_candle_timestamp, future_candle_low_price),
+                            self._generate_recent_trade(last_candle_timestamp, future_candle_high_price)
+                        ]
                     self.last_timestamp_pushed_by_symbol[symbol] = last_candle_timestamp
                     await self.push(symbol, recent_trades)
             except (KeyError, TypeError):
@@ -88,6 +111,20 @@ class RecentTradeUpdaterSimulator(recent_trade_updater.RecentTradeUpdater):
                         self.last_timestamp_pushed_by_symbol[symbol] = last_candle_timestamp
                         await self.push(symbol, recent_trades)
 
+    async def _get_synthetic_market_data(self, symbol):
+        try:
+            return self.synthetic_market_data_by_symbol[symbol]
+        except KeyError:
+            try:
+                self.synthetic_market_data_by_symbol[symbol] = await synthetic_market_data.load_synthetic_market_data(
+                    self.exchange_data_importer, self.exchange_name, symbol, self.shortest_time_frame
+                )
+            except Exception as e:
+                self.logger.warning(f"Failed to load {symbol} candles history, recent trades will be generated "
+                                    f"from each candle: {e}")
+                self.synthetic_market_data_by_symbol[symbol] = None
+            return self.synthetic_market_data_by_symbol[symbol]
+
     @staticmethod
     def _generate_recent_trade(timestamp, price):
         return {
@@ -17,8 +17,15 @@ import collections
 
 import octobot_commons.logging as logging
 
+import octobot_trading.enums as enums
 import octobot_trading.util as util
 
+_TRADE_ID_KEY = enums.ExchangeConstantsOrderColumns.ID.value
+_TRADE_TIMESTAMP_KEY = enums.ExchangeConstantsOrderColumns.TIMESTAMP.value
+_TRADE_SIDE_KEY = enums.ExchangeConstantsOrderColumns.SIDE.value
+_TRADE_PRICE_KEY = enums.ExchangeConstantsOrderColumns.PRICE.value
+_TRADE_AMOUNT_KEY = enums.ExchangeConstantsOrderColumns.AMOUNT.value
+
 
 class RecentTradesManager(util.Initializable):
     MAX_RECENT_TRADES_COUNT = 100
@@ -29,6 +36,9 @@ class RecentTradesManager(util.Initializable):
         self.logger: logging.BotLogger = logging.get_logger(self.__class__.__name__)
         self.recent_trades: collections.deque[dict] = collections.deque(maxlen=self.MAX_RECENT_TRADES_COUNT)
         self.liquidations: collections.deque[dict] = collections.deque(maxlen=self.MAX_LIQUIDATIONS_COUNT)
+        # keys of recent_trades, evicted with their trade, and their count in recent_trades
+        self._recent_trade_keys: collections.deque = collections.deque(maxlen=self.MAX_RECENT_TRADES_COUNT)
+        self._recent_trades_count_by_key: dict = {}
         self._reset_recent_trades()
 
     async def initialize_impl(self):
@@ -37,15 +47,22 @@ class RecentTradesManager(util.Initializable):
     def set_all_recent_trades(self, recent_trades):
         if recent_trades:
             self.recent_trades = recent_trades
+            self._recent_trade_keys = collections.deque(maxlen=getattr(recent_trades, "maxlen", None))
+            self._recent_trades_count_by_key = {}
+            self._add_recent_trade_keys([_get_trade_key(trade) for trade in recent_trades])
             return self.recent_trades
 
     def add_new_trades(self, recent_trades):
         if recent_trades:
-            new_recent_trades: list = [
-                trade
-                for trade in recent_trades
-                if trade not in self.recent_trades
-            ]
+            # only compare with previous trades: identical trades from the same update are all added
+            new_trade_keys: list = []
+            new_recent_trades: list = []
+            for trade in recent_trades:
+                trade_key = _get_trade_key(trade)
+                if trade_key not in self._recent_trades_count_by_key:
+                    new_trade_keys.append(trade_key)
+                    new_recent_trades.append(trade)
+            self._add_recent_trade_keys(new_trade_keys)
             self.recent_trades.extend(new_recent_trades)
             return new_recent_trades
 
@@ -58,6 +75,30 @@ class RecentTradesManager(util.Initializable):
             self.liquidations.extend(new_liquidations)
             return new_liquidations
 
+    def _add_recent_trade_keys(self, trade_keys):
+        count_by_key = self._recent_trades_count_by_key
+        for trade_key in trade_keys:
+            if len(self._recent_trade_keys) == self._recent_trade_keys.maxlen:
+                # the associated trade is also removed from recent_trades
+                evicted_key = self._recent_trade_keys[0]
+                if count_by_key[evicted_key] == 1:
+                    count_by_key.pop(evicted_key)
+                else:
+                    count_by_key[evicted_key] -= 1
+            self._recent_trade_keys.append(trade_key)
+            count_by_key[trade_key] = count_by_key.get(trade_key, 0) + 1
+
     def _reset_recent_trades(self):
         self.recent_trades = collections.deque(maxlen=self.MAX_RECENT_TRADES_COUNT)
         self.liquidations = collections.deque(maxlen=self.MAX_LIQUIDATIONS_COUNT)
+        self._recent_trade_keys = collections.deque(maxlen=self.MAX_RECENT_TRADES_COUNT)
+        self._recent_trades_count_by_key = {}
+
+
+def _get_trade_key(trade):
+    # trades are identified by their exchange id when available
+    trade_id = trade.get(_TRADE_ID_KEY)
+    if trade_id is not None:
+        return trade_id
+    return trade.get(_TRADE_TIMESTAMP_KEY), trade.get(_TRADE_SIDE_KEY), trade.get(_TRADE_PRICE_KEY), \
+        trade.get(_TRADE_AMOUNT_KEY)
@@ -14,13 +14,13 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 import asyncio
-import decimal
 
 import async_channel.constants as async_channel_constants
 
 import octobot_trading.exchange_channel as exchanges_channel
 import octobot_trading.enums as enums
 import octobot_trading.constants as constants
+import octobot_trading.util as util
 
 
 class TickerProducer(exchanges_channel.ExchangeChannelProducer):
@@ -102,7 +102,7 @@ class TickerProducer(exchanges_channel.ExchangeChannelProducer):
             await exchanges_channel.get_chan(constants.MARK_PRICE_CHANNEL,
                                              self.channel.exchange_manager.id).get_internal_producer().push(
                 symbol,
-                decimal.Decimal(str(ticker[enums.ExchangeConstantsMarkPriceColumns.MARK_PRICE.value])),
+                util.to_decimal(ticker[enums.ExchangeConstantsMarkPriceColumns.MARK_PRICE.value]),
                 mark_price_source=enums.MarkPriceSources.TICKER_CLOSE_PRICE.value
             )
         except Exception as e:
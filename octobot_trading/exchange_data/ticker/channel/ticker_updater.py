@@ -16,6 +16,7 @@
 #  License along with this library.
 import asyncio
 import contextlib
+import math
 
 import octobot_commons.html_util as html_util
 
@@ -33,6 +34,10 @@ class TickerUpdater(ticker_channel.TickerProducer):
     TICKER_REFRESH_TIME = 64
     TICKER_FUTURE_REFRESH_TIME = 14
     TICKER_REFRESH_DELAY_THRESHOLD = 10
+    # set False to always fetch tickers one pair at a time
+    ENABLE_BULK_TICKERS_FETCH = True
+    MAX_BULK_TICKERS_FETCH_SYMBOLS = 100
+    MAX_CONCURRENT_BULK_TICKERS_FETCHES = 3
 
     def __init__(self, channel):
         super().__init__(channel)
@@ -40,6 +45,10 @@ class TickerUpdater(ticker_channel.TickerProducer):
         self.is_fetching_future_data = False
         self.refresh_time = self.TICKER_REFRESH_TIME
         self.updating_pairs = set()
+        # set False when the exchange can't fetch multiple tickers at once
+        self.is_bulk_tickers_fetch_supported = self.ENABLE_BULK_TICKERS_FETCH
+        # timestamp of the last pushed ticker of each pair
+        self._last_ticker_timestamp_by_pair = {}
 
     async def start(self):
         use_futures = self._should_use_future()
@@ -51,8 +60,11 @@ class TickerUpdater(ticker_channel.TickerProducer):
         else:
             if use_futures or self._should_loop():
                 # initialize ticker
-                await asyncio.gather(*[self._fetch_ticker(pair)
-                                       for pair in self._get_pairs_to_update()])
+                pairs = self._get_pairs_to_update()
+                if self._should_fetch_bulk_tickers(pairs):
+                    await self._fetch_tickers(pairs)
+                else:
+                    await asyncio.gather(*[self._fetch_ticker(pair) for pair in pairs])
                 await asyncio.sleep(self.refresh_time)
                 await self.start_update_loop()
             else:
@@ -64,8 +76,7 @@ class TickerUpdater(ticker_channel.TickerProducer):
     async def start_update_loop(self):
         while not self.should_stop and not self.channel.is_paused:
             try:
-                for pair in self._get_pairs_to_update():
-                    await self._fetch_ticker(pair)
+                await self._fetch_tickers(self._get_pairs_to_update())
 
                 await asyncio.sleep(self.refresh_time)
             except errors.NotSupported:
@@ -78,6 +89,23 @@ class TickerUpdater(ticker_channel.TickerProducer):
                     f"Fail to update ticker : {html_util.get_html_summary_if_relevant(e)}"
                 )
 
+    async def _fetch_tickers(self, pairs):
+        if self._should_fetch_bulk_tickers(pairs):
+            try:
+                missing_pairs = await self.fetch_and_push_pairs(pairs)
+            except (errors.NotSupported, NotImplementedError):
+                self.logger.info(
+                    f"{self.channel.exchange_manager.exchange_name} is not supporting bulk tickers fetch, "
+                    f"fetching tickers one pair at a time"
+                )
+                self.is_bulk_tickers_fetch_supported = False
+                self._update_refresh_time()
+            else:
+                # fetch pairs that are missing in bulk tickers one by one
+                pairs = missing_pairs
+        for pair in pairs:
+            await self._fetch_ticker(pair)
+
     async def _fetch_ticker(self, pair):
         try:
             await self.fetch_and_push_pair(pair)
@@ -91,16 +119,74 @@ class TickerUpdater(ticker_channel.TickerProducer):
             if can_update:
                 ticker: dict = await self.channel.exchange_manager.exchange.get_price_ticker(pair)
                 if self._is_valid(ticker):
-                    await self.push(pair, ticker)
+                    await self._push_ticker(pair, ticker)
                 else:
                     self.logger.debug(f"Ignored incomplete ticker: {ticker}")
             else:
                 self.logger.debug(f"Skipping {pair} ticker update request: an update is already processing")
 
+    async def fetch_and_push_pairs(self, pairs: list) -> list:
+        """
+        Fetch tickers by batches of MAX_BULK_TICKERS_FETCH_SYMBOLS symbols and push each of them
+        :param pairs: the pairs to fetch tickers for
+        :return: the pairs that are missing from the fetched tickers, including pairs from failed batches.
+        Tickers that did not change since they were last pushed (tickers can be returned from a cache) are skipped
+        """
+        with self._multiple_pairs_update(pairs) as updatable_pairs:
+            semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_BULK_TICKERS_FETCHES)
+
+            async def _fetch_tickers_batch(batch_pairs):
+                async with semaphore:
+                    return await self.channel.exchange_manager.exchange.get_all_currencies_price_ticker(
+                        symbols=batch_pairs
+                    )
+
+            pairs_batches = [
+                updatable_pairs[index:index + self.MAX_BULK_TICKERS_FETCH_SYMBOLS]
+                for index in range(0, len(updatable_pairs), self.MAX_BULK_TICKERS_FETCH_SYMBOLS)
+            ]
+            # a failed batch should not prevent other batches tickers from being pushed
+            tickers_batches = await asyncio.gather(
+                *(_fetch_tickers_batch(batch_pairs) for batch_pairs in pairs_batches), return_exceptions=True
+            )
+            tickers = {}
+            failed_pairs = set()
+            for batch_pairs, tickers_batch in zip(pairs_batches, tickers_batches):
+                if isinstance(tickers_batch, errors.FailedRequest):
+                    self.logger.warning(
+                        f"Failed to fetch {len(batch_pairs)} tickers at once, fetching them one pair at a time: "
+                        f"{html_util.get_html_summary_if_relevant(tickers_batch)}"
+                    )
+                    failed_pairs.update(batch_pairs)
+                elif isinstance(tickers_batch, BaseException):
+                    raise tickers_batch
+                else:
+                    tickers.update(tickers_batch or {})
+            missing_pairs = []
+            for pair in updatable_pairs:
+                if pair in failed_pairs or (ticker := tickers.get(pair)) is None:
+                    missing_pairs.append(pair)
+                elif not self._is_valid(ticker):
+                    self.logger.debug(f"Ignored incomplete ticker: {ticker}")
+                elif self._is_outdated(pair, ticker):
+                    self.logger.debug(f"Ignored unchanged {pair} ticker")
+                else:
+                    await self._push_ticker(pair, ticker)
+        return missing_pairs
+
     async def trigger_ticker_update(self, symbol: str):
         self.logger.debug(f"Triggered ticker update for {symbol}")
         await self.fetch_and_push_pair(symbol)
 
+    async def _push_ticker(self, pair: str, ticker: dict):
+        self._last_ticker_timestamp_by_pair[pair] = ticker[enums.ExchangeConstantsTickersColumns.TIMESTAMP.value]
+        await self.push(pair, ticker)
+
+    def _is_outdated(self, pair: str, ticker: dict) -> bool:
+        last_ticker_timestamp = self._last_ticker_timestamp_by_pair.get(pair)
+        return last_ticker_timestamp is not None and \
+            ticker[enums.ExchangeConstantsTickersColumns.TIMESTAMP.value] <= last_ticker_timestamp
+
     @contextlib.contextmanager
     def _single_pair_update(self, pair: str):
         can_update = False
@@ -113,6 +199,23 @@ class TickerUpdater(ticker_channel.TickerProducer):
             if can_update:
                 self.updating_pairs.remove(pair)
 
+    @contextlib.contextmanager
+    def _multiple_pairs_update(self, pairs: list):
+        updatable_pairs = []
+        try:
+            updatable_pairs = [pair for pair in pairs if pair not in self.updating_pairs]
+            if skipped_pairs := [pair for pair in pairs if pair in self.updating_pairs]:
+                self.logger.debug(f"Skipping {skipped_pairs} tickers update request: an update is already processing")
+            self.updating_pairs.update(updatable_pairs)
+            yield updatable_pairs
+        finally:
+            self.updating_pairs.difference_update(updatable_pairs)
+
+    def _should_fetch_bulk_tickers(self, pairs: list) -> bool:
+        # future tickers can require exchange specific data (funding, mark price) that is not always
+        # available from bulk tickers
+        return self.is_bulk_tickers_fetch_supported and not self.is_fetching_future_data and len(pairs) > 1
+
     @staticmethod
     def _is_valid(ticker):
         try:
@@ -171,6 +274,8 @@ class TickerUpdater(ticker_channel.TickerProducer):
 
         if removed_pairs:
             self._added_pairs = [pair for pair in self._added_pairs if pair not in removed_pairs]
+            for pair in removed_pairs:
+                self._last_ticker_timestamp_by_pair.pop(pair, None)
             self.logger.info(f"Removed pairs : {removed_pairs}")
             self._update_refresh_time()
 
@@ -179,6 +284,9 @@ class TickerUpdater(ticker_channel.TickerProducer):
             # do not change ticker update rate on futures
             return
         pairs_to_update_count = len(self._get_pairs_to_update())
+        if self._should_fetch_bulk_tickers(self._get_pairs_to_update()):
+            # one request per MAX_BULK_TICKERS_FETCH_SYMBOLS pairs
+            pairs_to_update_count = math.ceil(pairs_to_update_count / self.MAX_BULK_TICKERS_FETCH_SYMBOLS)
         delay_multiplier = pairs_to_update_count // self.TICKER_REFRESH_DELAY_THRESHOLD + 1
         # there can be many ticker requests when a large number of currency is in a
         # portfolio, in this case, limit those requests
@@ -24,6 +24,7 @@ import octobot_trading.constants as constants
 import octobot_trading.enums as enums
 import octobot_trading.exchange_channel as exchanges_channel
 import octobot_trading.util as util
+import octobot_trading.exchange_data.ohlcv.synthetic_market_data as synthetic_market_data
 import octobot_trading.exchange_data.ticker.channel.ticker_updater as ticker_updater
 
 
@@ -36,11 +37,15 @@ class TickerUpdaterSimulator(ticker_updater.TickerUpdater):
         self.last_timestamp_pushed = 0
         self.last_timestamp_pushed_by_symbol = {}
         self.time_consumer = None
+        # when set, each pair tickers are read once and selected from this stream
+        self.data_stream = util.BacktestingDataStream() if constants.ENABLE_BACKTESTING_DATA_STREAM else None
         # Only generate tickers from the shortest handled time frame
-        shortest_time_frame = self.channel.exchange_manager.exchange_config.get_shortest_time_frame()
-        self.ticker_time_frame = shortest_time_frame.value
-        self.ticker_time_frame_seconds = common_enums.TimeFramesMinutes[shortest_time_frame] * \
+        self.shortest_time_frame = self.channel.exchange_manager.exchange_config.get_shortest_time_frame()
+        self.ticker_time_frame = self.shortest_time_frame.value
+        self.ticker_time_frame_seconds = common_enums.TimeFramesMinutes[self.shortest_time_frame] * \
             common_constants.MINUTE_TO_SECONDS
+        # symbol: SyntheticMarketData (or None when unavailable) to generate tickers from
+        self.synthetic_market_data_by_symbol = {}
 
     async def start(self):
         await self.resume()
@@ -48,11 +53,7 @@ class TickerUpdaterSimulator(ticker_updater.TickerUpdater):
     async def handle_timestamp(self, timestamp, **kwargs):
         try:
             for pair in self.channel.exchange_manager.exchange_config.traded_symbol_pairs:
-                ticker_data = (await self.exchange_data_importer.get_ticker_from_timestamps(
-                    exchange_name=self.exchange_name,
-                    symbol=pair,
-                    inferior_timestamp=timestamp,
-                    limit=1))[0]
+                ticker_data = await self._get_ticker_from_timestamp(pair, timestamp)
                 if ticker_data[0] > self.last_timestamp_pushed:
                     self.last_timestamp_pushed = ticker_data[0]
                     await self.push(pair, ticker_data[-1])
@@ -63,6 +64,19 @@ class TickerUpdaterSimulator(ticker_updater.TickerUpdater):
         except IndexError as e:
             self.logger.warning(f"Failed to access ticker_data : {e}")
 
+    async def _get_ticker_from_timestamp(self, pair, timestamp):
+        if self.data_stream is None:
+            return (await self.exchange_data_importer.get_ticker_from_timestamps(
+                exchange_name=self.exchange_name,
+                symbol=pair,
+                inferior_timestamp=timestamp,
+                limit=1))[0]
+        if not self.data_stream.has_series(pair):
+            await self.data_stream.load_series(
+                pair, self.exchange_data_importer.get_ticker, exchange_name=self.exchange_name, symbol=pair
+            )
+        return self.data_stream.get_first_row(pair, timestamp)
+
     async def _ticker_from_ohlcv_callback(self, exchange: str, exchange_id: str,
                                           cryptocurrency: str, symbol: str, time_frame, candle):
         if self.ticker_time_frame == time_frame and candle:
@@ -70,9 +84,29 @@ class TickerUpdaterSimulator(ticker_updater.TickerUpdater):
             ticker_timestamp = last_candle_timestamp + self.ticker_time_frame_seconds
             if ticker_timestamp > self.last_timestamp_pushed_by_symbol[symbol]:
                 self.last_timestamp_pushed_by_symbol[symbol] = ticker_timestamp
-                ticker = self._generate_ticker_from_candle(candle, symbol, ticker_timestamp)
+                ticker = None
+                if constants.ENABLE_SYNTHETIC_MARKET_DATA_FROM_HISTORY:
+                    symbol_synthetic_market_data = await self._get_synthetic_market_data(symbol)
+                    if symbol_synthetic_market_data is not None:
+                        ticker = symbol_synthetic_market_data.get_ticker(last_candle_timestamp)
+                if ticker is None:
+                    ticker = self._generate_ticker_from_candle(candle, symbol, ticker_timestamp)
                 await self.push(symbol, ticker)
 
+    async def _get_synthetic_market_data(self, symbol):
+        try:
+            return self.synthetic_market_data_by_symbol[symbol]
+        except KeyError:
+            try:
+                self.synthetic_market_data_by_symbol[symbol] = await synthetic_market_data.load_synthetic_market_data(
+                    self.exchange_data_importer, self.exchange_name, symbol, self.shortest_time_frame
+                )
+            except Exception as e:
+                self.logger.warning(f"Failed to load {symbol} candles history, tickers will be generated "
+                                    f"from each candle: {e}")
+                self.synthetic_market_data_by_symbol[symbol] = None
+            return self.synthetic_market_data_by_symbol[symbol]
+
     @staticmethod
     def _generate_ticker_from_candle(candle, symbol, last_candle_timestamp):
         return {
@@ -56,6 +56,7 @@ from octobot_trading.exchanges.exchange_factory import (
 from octobot_trading.exchanges.util import (
     ExchangeMarketStatusFixer,
     is_ms_valid,
+    MarketStatusCache,
     SymbolDetails,
     get_rest_exchange_class,
     get_order_side,
@@ -188,6 +189,7 @@ __all__ = [
     "RestExchange",
     "ExchangeMarketStatusFixer",
     "is_ms_valid",
+    "MarketStatusCache",
     "SymbolDetails",
     "AbstractWebsocketExchange",
     "force_disable_web_socket",
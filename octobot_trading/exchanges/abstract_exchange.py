@@ -200,6 +200,11 @@ class AbstractExchange(octobot_trading.accounts.AbstractAccount):
         """
         raise NotImplementedError("get_market_status is not implemented")
 
+    def clear_market_statuses_cache(self):
+        """
+        Forget cached market statuses, called when markets are reloaded
+        """
+
     async def get_balance(self, **kwargs: dict):
         """
         :return: current user balance from exchange
@@ -411,6 +416,27 @@ class AbstractExchange(octobot_trading.accounts.AbstractAccount):
         """
         raise NotImplementedError("create_order is not implemented")
 
+    async def create_orders(self, orders_kwargs: list[dict]) -> list[typing.Optional[dict]]:
+        """
+        Create orders on the exchange using batch requests
+        :param orders_kwargs: the create_order arguments of each order, orders can have different symbols
+        :return: the created order dicts, None for each order that has not been created
+        """
+        raise NotImplementedError("create_orders is not implemented")
+
+    async def cancel_orders(
+        self, exchange_order_ids: list[str], symbol: str,
+        order_types: typing.Optional[list[enums.TraderOrderType]] = None, **kwargs: dict
+    ) -> dict[str, enums.OrderStatus]:
+        """
+        Cancel orders on the exchange using batch requests
+        :param exchange_order_ids: the orders ids on exchange
+        :param symbol: the orders symbol
+        :param order_types: the type of each order
+        :return: the cancel status of each cancelled order by exchange order id
+        """
+        raise NotImplementedError("cancel_orders is not implemented")
+
     async def get_position(self, symbol: str, **kwargs: dict) -> dict:
         """
         Get a position
@@ -477,6 +503,19 @@ class AbstractExchange(octobot_trading.accounts.AbstractAccount):
         except KeyError:
             return False
 
+    def supports_native_create_orders(self, order_type: enums.TraderOrderType) -> bool:
+        """
+        :param order_type: the type of the orders to create
+        :return: True when orders of this type can be created using create_orders batch requests
+        """
+        return False
+
+    def supports_native_cancel_orders(self) -> bool:
+        """
+        :return: True when orders can be cancelled using cancel_orders batch requests
+        """
+        return False
+
     def get_bundled_order_parameters(self, order, stop_loss_price=None, take_profit_price=None) -> dict:
         """
         Returns the updated params when this exchange supports orders created upon other orders fill
@@ -17,6 +17,7 @@ import decimal
 
 import octobot_trading.errors as errors
 import octobot_trading.enums as enums
+import octobot_trading.util as util
 import octobot_commons.logging as logging
 import octobot_commons.constants as commons_constants
 
@@ -153,7 +154,7 @@ class AbstractAdapter:
 
     def safe_decimal(self, container, key, default) -> decimal.Decimal:
         if (val := container.get(key, default)) is not None:
-            return decimal.Decimal(str(val))
+            return util.to_decimal(val)
         return default
 
     def fix_order(self, raw, **kwargs) -> dict:
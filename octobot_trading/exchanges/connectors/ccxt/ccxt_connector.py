@@ -285,6 +285,8 @@ class CCXTConnector(abstract_exchange.AbstractExchange):
                             await unauth_client.close()
                 else:
                     raise
+        # markets might have changed: previous market statuses are outdated
+        self.exchange_manager.exchange.clear_market_statuses_cache()
         # markets are now loaded, trigger event
         commons_tree.EventProvider.instance().trigger_event(
             self.exchange_manager.bot_id, commons_tree.get_exchange_path(
@@ -973,6 +975,34 @@ class CCXTConnector(abstract_exchange.AbstractExchange):
                 f"({e.__class__.__name__})")
             raise e
 
+    def supports_native_create_orders(self, order_type: enums.TraderOrderType) -> bool:
+        return bool(self.client.has.get("createOrders"))
+
+    def supports_native_cancel_orders(self) -> bool:
+        return bool(self.client.has.get("cancelOrders"))
+
+    @ccxt_client_util.converted_ccxt_common_errors
+    async def create_orders(self, orders: list[dict]) -> list[typing.Optional[dict]]:
+        """
+        :param orders: ccxt orders requests (symbol, type, side, amount, price and params)
+        :return: the created orders, None for each order that has been refused by the exchange
+        """
+        with self.error_describer():
+            created_orders = await self.client.create_orders(orders)
+        return [
+            self.adapter.adapt_order(created_order, symbol=order["symbol"], quantity=order["amount"])
+            if created_order and created_order.get(ccxt_enums.ExchangeOrderCCXTColumns.ID.value) else None
+            for order, created_order in zip(orders, created_orders)
+        ]
+
+    @ccxt_client_util.converted_ccxt_common_errors
+    async def cancel_orders(self, exchange_order_ids: list[str], symbol: str, **kwargs: dict) -> list[dict]:
+        """
+        :return: the raw cancelled orders
+        """
+        with self.error_describer():
+            return await self.client.cancel_orders(exchange_order_ids, symbol=symbol, params=kwargs)
+
     async def withdraw(
         self, asset: str, amount: decimal.Decimal, network: str, address: str, tag: str = "", params: dict = None
     ) -> dict:
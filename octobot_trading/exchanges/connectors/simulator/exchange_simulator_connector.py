@@ -79,6 +79,7 @@ class ExchangeSimulatorConnector(abstract_exchange.AbstractExchange):
         self._forced_market_statuses = ccxt_client_simulation.parse_markets(
             self._get_exchange_class_rest_name(), additional_client_config, market_filter
         )
+        self.exchange_manager.exchange.clear_market_statuses_cache()
 
     def _get_exchange_class_rest_name(self):
         if self.exchange_manager.exchange.exchange_tentacle_class:
@@ -139,11 +139,10 @@ class ExchangeSimulator(rest_exchange.RestExchange):
         )
         return market_status
 
-    def get_fixed_market_status(self, symbol, price_example=None, with_fixer=True, remove_price_limits=False,
-                                adapt_for_contract_size=False):
+    def _get_adapted_market_status(self, symbol, remove_price_limits, adapt_for_contract_size):
         """
-        Override of the RESTExchange get_fixed_market_status to call adapt_market_status only on fetch market statuses
-        (should not be call on default market status)
+        Override of the RESTExchange _get_adapted_market_status to call adapt_market_status only on fetch market
+        statuses (should not be call on default market status)
         """
         market_status, is_real = self.connector.get_market_status(symbol, with_fixer=False)
         market_status = copy.deepcopy(market_status)
@@ -155,8 +154,6 @@ class ExchangeSimulator(rest_exchange.RestExchange):
             )
             if adapt_for_contract_size and self.exchange_manager.is_future:
                 self._adapt_market_status_for_contract_size(market_status, self.get_contract_size(symbol))
-        if with_fixer:
-            return exchange_util.ExchangeMarketStatusFixer(market_status, price_example).market_status
         return market_status
 
     async def load_pair_future_contract(self, pair: str):
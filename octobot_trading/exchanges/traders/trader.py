@@ -15,6 +15,7 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 
+import contextlib
 import decimal
 import typing
 
@@ -184,6 +185,138 @@ class Trader(util.Initializable):
 
         return created_order
 
+    @enabled_or_forced_only
+    async def create_orders(
+        self, orders: list, params: dict = None, wait_for_creation=True, raise_all_creation_error=False,
+        creation_timeout=octobot_trading.constants.INDIVIDUAL_ORDER_SYNC_TIMEOUT
+    ) -> list:
+        """
+        Create new orders from OrderFactory created orders. Uses exchange batch orders creation requests when
+        supported and concurrent order creation requests otherwise.
+        :param orders: Orders to create
+        :param params: Additional parameters to give to each order upon creation (used in real trading only)
+        :param wait_for_creation: when True, always make sure the orders are completely created before returning.
+        :param raise_all_creation_error: when True, will raise each creation error when possible
+        (instead of retuning None)
+        :param creation_timeout: time before raising a timeout error when waiting for an order creation
+        :return: The created order instances, None for each order that could not be created
+        """
+        if self.simulate:
+            # no exchange request: keep the orders creation order
+            return [
+                await self.create_order(
+                    order, params=params, wait_for_creation=wait_for_creation,
+                    raise_all_creation_error=raise_all_creation_error, creation_timeout=creation_timeout,
+                    force_if_disabled=True
+                )
+                for order in orders
+            ]
+        created_orders = [None] * len(orders)
+        batch_created_indexes = [
+            index
+            for index, order in enumerate(orders)
+            if self._should_create_order_on_exchange(order)
+            and not order.is_in_active_inactive_transition
+            and self.exchange_manager.exchange.supports_native_create_orders(order.order_type)
+        ]
+        if len(batch_created_indexes) > 1:
+            batch_created_orders = await self._create_orders_in_batch(
+                [orders[index] for index in batch_created_indexes], params or {},
+                wait_for_creation, creation_timeout
+            )
+            if batch_created_orders is not None:
+                for index, created_order in zip(batch_created_indexes, batch_created_orders):
+                    created_orders[index] = created_order
+        # create orders that have not been created in batch one by one
+        to_create_indexes = [index for index, created_order in enumerate(created_orders) if created_order is None]
+        for index, created_order in zip(
+            to_create_indexes,
+            await util.gather_with_bounded_concurrency(
+                (
+                    self.create_order(
+                        orders[index], params=params, wait_for_creation=wait_for_creation,
+                        raise_all_creation_error=raise_all_creation_error, creation_timeout=creation_timeout,
+                        force_if_disabled=True
+                    )
+                    for index in to_create_indexes
+                ),
+                octobot_trading.constants.MAX_CONCURRENT_ORDER_REQUESTS,
+                return_exceptions=True
+            )
+        ):
+            created_orders[index] = created_order
+        # only raise once every other order is created to avoid losing them
+        creation_error = None
+        for index, created_order in enumerate(created_orders):
+            if isinstance(created_order, Exception):
+                created_orders[index] = None
+                if raise_all_creation_error or isinstance(created_order, (
+                    errors.MissingFunds, errors.AuthenticationError,
+                    errors.ExchangeCompliancyError, errors.OrderCreationError
+                )):
+                    # forward errors that require actions to fix the situation
+                    self.logger.error(
+                        f"Error when creating order: {created_order} ({created_order.__class__.__name__}). "
+                        f"Order: {orders[index]}"
+                    )
+                    creation_error = creation_error or created_order
+                else:
+                    self.logger.exception(
+                        created_order, True,
+                        f"Unexpected error when creating order: {created_order}. Order: {orders[index]}"
+                    )
+        if creation_error is not None:
+            raise creation_error
+        return created_orders
+
+    async def _create_orders_in_batch(
+        self, orders: list, params: dict, wait_for_creation: bool, creation_timeout: float
+    ) -> typing.Optional[list]:
+        """
+        :return: the created orders, None for each order that has not been created on the exchange and the raised
+        error for each order created on the exchange that could not be initialized. None if orders can't be
+        created in batch
+        """
+        try:
+            for order in orders:
+                self.logger.info(f"Creating order: {order}")
+            exchange_created_orders = await self.exchange_manager.exchange.create_orders(
+                [self._get_exchange_order_creation_kwargs(order, params) for order in orders]
+            )
+        except errors.NotSupported as e:
+            self.logger.warning(
+                f"Batch orders creation is not supported on {self.exchange_manager.exchange_name} ({e}), "
+                f"creating orders one by one"
+            )
+            return None
+        except Exception as e:
+            self.logger.warning(
+                f"Failed to create {len(orders)} orders at once ({e} {e.__class__.__name__}), "
+                f"creating orders one by one"
+            )
+            return None
+        created_orders_by_order = {}
+        for order, exchange_created_order in zip(orders, exchange_created_orders):
+            if exchange_created_order is None:
+                self.logger.warning(f"Order not created in batch on {self.exchange_manager.exchange_name} "
+                                    f"(failed attempt to create: {order}), creating it alone.")
+            else:
+                created_orders_by_order[order] = self._get_order_from_created_order(order, exchange_created_order)
+        initialized_orders = iter(await util.gather_with_bounded_concurrency(
+            (
+                self._initialize_created_order(
+                    order, updated_order, is_pending_creation, wait_for_creation, creation_timeout
+                )
+                for order, (updated_order, is_pending_creation) in created_orders_by_order.items()
+            ),
+            octobot_trading.constants.MAX_CONCURRENT_ORDER_REQUESTS,
+            return_exceptions=True
+        ))
+        return [
+            next(initialized_orders) if order in created_orders_by_order else None
+            for order in orders
+        ]
+
     @enabled_or_forced_only
     async def create_artificial_order(
         self, order_type, symbol, current_price, quantity, price, reduce_only, close_position,
@@ -338,61 +471,78 @@ class Trader(util.Initializable):
         """
         updated_order = new_order
         is_pending_creation = False
-        if not self.simulate and not new_order.is_self_managed() and (
-            new_order.is_in_active_inactive_transition or new_order.is_active
-        ):
-            order_params = self.exchange_manager.exchange.get_order_additional_params(new_order)
-            order_params.update(new_order.exchange_creation_params)
-            order_params.update(params)
+        if self._should_create_order_on_exchange(new_order):
             created_order = await self.exchange_manager.exchange.create_order(
-                order_type=new_order.order_type,
-                symbol=new_order.symbol,
-                quantity=new_order.origin_quantity,
-                price=new_order.origin_price,
-                stop_price=new_order.origin_stop_price,
-                side=new_order.side,
-                current_price=new_order.created_last_price,
-                reduce_only=new_order.reduce_only,
-                params=order_params
+                **self._get_exchange_order_creation_kwargs(new_order, params)
             )
             if created_order is None:
                 return None
-            self.logger.debug(f"Successfully created order on {self.exchange_manager.exchange_name}: {created_order}")
+            updated_order, is_pending_creation = self._get_order_from_created_order(new_order, created_order)
+        return await self._initialize_created_order(
+            new_order, updated_order, is_pending_creation, wait_for_creation, creation_timeout
+        )
 
-            # get real order from exchange
-            updated_order = order_factory.create_order_instance_from_raw(
-                self, created_order, force_open_or_pending_creation=True, has_just_been_created=True
-            )
-            is_pending_creation = updated_order.status == enums.OrderStatus.PENDING_CREATION
-
-            # rebind local elements to new order instance
-            if new_order.order_group:
-                updated_order.add_to_order_group(new_order.order_group)
-            updated_order.order_id = new_order.order_id
-            updated_order.tag = new_order.tag
-            updated_order.chained_orders = new_order.chained_orders
-            for chained_order in new_order.chained_orders:
-                chained_order.triggered_by = updated_order
-            updated_order.triggered_by = new_order.triggered_by
-            updated_order.has_been_bundled = new_order.has_been_bundled
-            updated_order.exchange_creation_params = new_order.exchange_creation_params
-            updated_order.is_waiting_for_chained_trigger = new_order.is_waiting_for_chained_trigger
-            updated_order.associated_entry_ids = new_order.associated_entry_ids
-            updated_order.update_with_triggering_order_fees = new_order.update_with_triggering_order_fees
-            updated_order.trailing_profile = new_order.trailing_profile
-            updated_order.cancel_policy = new_order.cancel_policy
-            if new_order.active_trigger is not None:
-                updated_order.use_active_trigger(order_util.create_order_price_trigger(
-                    updated_order, new_order.active_trigger.trigger_price, new_order.active_trigger.trigger_above
-                ))
-            updated_order.is_in_active_inactive_transition = new_order.is_in_active_inactive_transition
+    def _should_create_order_on_exchange(self, new_order) -> bool:
+        return not self.simulate and not new_order.is_self_managed() and (
+            new_order.is_in_active_inactive_transition or new_order.is_active
+        )
 
-            if is_pending_creation:
-                # register order as pending order, it will then be added to live orders in order manager once open
-                self.exchange_manager.exchange_personal_data.orders_manager.register_pending_creation_order(
-                    updated_order
-                )
+    def _get_exchange_order_creation_kwargs(self, new_order, params: dict) -> dict:
+        order_params = self.exchange_manager.exchange.get_order_additional_params(new_order)
+        order_params.update(new_order.exchange_creation_params)
+        order_params.update(params)
+        return {
+            "order_type": new_order.order_type,
+            "symbol": new_order.symbol,
+            "quantity": new_order.origin_quantity,
+            "price": new_order.origin_price,
+            "stop_price": new_order.origin_stop_price,
+            "side": new_order.side,
+            "current_price": new_order.created_last_price,
+            "reduce_only": new_order.reduce_only,
+            "params": order_params,
+        }
+
+    def _get_order_from_created_order(self, new_order, created_order: dict) -> tuple:
+        self.logger.debug(f"Successfully created order on {self.exchange_manager.exchange_name}: {created_order}")
+        # get real order from exchange
+        updated_order = order_factory.create_order_instance_from_raw(
+            self, created_order, force_open_or_pending_creation=True, has_just_been_created=True
+        )
+        is_pending_creation = updated_order.status == enums.OrderStatus.PENDING_CREATION
+
+        # rebind local elements to new order instance
+        if new_order.order_group:
+            updated_order.add_to_order_group(new_order.order_group)
+        updated_order.order_id = new_order.order_id
+        updated_order.tag = new_order.tag
+        updated_order.chained_orders = new_order.chained_orders
+        for chained_order in new_order.chained_orders:
+            chained_order.triggered_by = updated_order
+        updated_order.triggered_by = new_order.triggered_by
+        updated_order.has_been_bundled = new_order.has_been_bundled
+        updated_order.exchange_creation_params = new_order.exchange_creation_params
+        updated_order.is_waiting_for_chained_trigger = new_order.is_waiting_for_chained_trigger
+        updated_order.associated_entry_ids = new_order.associated_entry_ids
+        updated_order.update_with_triggering_order_fees = new_order.update_with_triggering_order_fees
+        updated_order.trailing_profile = new_order.trailing_profile
+        updated_order.cancel_policy = new_order.cancel_policy
+        if new_order.active_trigger is not None:
+            updated_order.use_active_trigger(order_util.create_order_price_trigger(
+                updated_order, new_order.active_trigger.trigger_price, new_order.active_trigger.trigger_above
+            ))
+        updated_order.is_in_active_inactive_transition = new_order.is_in_active_inactive_transition
+
+        if is_pending_creation:
+            # register order as pending order, it will then be added to live orders in order manager once open
+            self.exchange_manager.exchange_personal_data.orders_manager.register_pending_creation_order(
+                updated_order
+            )
+        return updated_order, is_pending_creation
 
+    async def _initialize_created_order(
+        self, new_order, updated_order, is_pending_creation: bool, wait_for_creation: bool, creation_timeout: float
+    ):
         try:
             await updated_order.initialize()
             if is_pending_creation and wait_for_creation \
@@ -522,6 +672,156 @@ class Trader(util.Initializable):
             )
         return False
 
+    @enabled_or_forced_only
+    async def cancel_orders(
+        self, orders: list, wait_for_cancelling=True,
+        cancelling_timeout=octobot_trading.constants.INDIVIDUAL_ORDER_SYNC_TIMEOUT
+    ) -> list[bool]:
+        """
+        Cancels the given orders and updates the portfolio, publish in order channel. Uses exchange batch
+        orders cancel requests when supported and concurrent order cancel requests otherwise.
+        :param orders: Orders to cancel
+        :param wait_for_cancelling: when True, always make sure the orders are completely cancelled before returning.
+        :param cancelling_timeout: time before raising a timeout error when waiting for an order cancel
+        :return: True for each cancelled order, False for each order that could not be cancelled
+        """
+        if self.simulate:
+            # no exchange request: keep the orders cancel order
+            return [
+                await self._cancel_order_if_possible(order, wait_for_cancelling, cancelling_timeout)
+                for order in orders
+            ]
+        cancelled_orders = [False] * len(orders)
+        to_cancel_indexes = list(range(len(orders)))
+        cancel_error = None
+        batch_cancelled_indexes = [
+            index
+            for index, order in enumerate(orders)
+            if order.is_open() and order.is_active and not order.is_self_managed()
+            and not order.is_waiting_for_chained_trigger
+        ]
+        if len(batch_cancelled_indexes) > 1 and self.exchange_manager.exchange.supports_native_cancel_orders():
+            batch_cancelled_orders = [orders[index] for index in batch_cancelled_indexes]
+            for order in batch_cancelled_orders:
+                self.logger.info(f"Cancelling order: {order}")
+            async with self._orders_locks(batch_cancelled_orders):
+                order_status_by_order = await self._cancel_orders_on_exchange(
+                    batch_cancelled_orders, True
+                )
+            for index in batch_cancelled_indexes:
+                order = orders[index]
+                if order in order_status_by_order:
+                    self._update_cancelled_order_status(order, order_status_by_order[order])
+                    try:
+                        await self._on_order_cancel(order, order.is_refreshing(), None, wait_for_cancelling)
+                        cancelled_orders[index] = True
+                    except errors.UnexpectedExchangeSideOrderStateError as err:
+                        self.logger.warning(f"Skipping order cancel: {err} ({err.__class__.__name__})")
+            # cancel orders that have not been cancelled in batch one by one
+            to_cancel_indexes = [
+                index
+                for index in to_cancel_indexes
+                if index not in batch_cancelled_indexes or orders[index] not in order_status_by_order
+            ]
+        for index, cancelled in zip(
+            to_cancel_indexes,
+            await util.gather_with_bounded_concurrency(
+                (
+                    self._cancel_order_if_possible(orders[index], wait_for_cancelling, cancelling_timeout)
+                    for index in to_cancel_indexes
+                ),
+                octobot_trading.constants.MAX_CONCURRENT_ORDER_REQUESTS,
+                return_exceptions=True
+            )
+        ):
+            if isinstance(cancelled, Exception):
+                self.logger.error(
+                    f"Error when cancelling order: {cancelled} ({cancelled.__class__.__name__}). "
+                    f"Order: {orders[index]}"
+                )
+                cancel_error = cancel_error or cancelled
+                cancelled = False
+            cancelled_orders[index] = cancelled
+        # only raise once every other order is cancelled to avoid losing them
+        if cancel_error is not None:
+            raise cancel_error
+        return cancelled_orders
+
+    async def _cancel_order_if_possible(self, order, wait_for_cancelling: bool, cancelling_timeout: float) -> bool:
+        try:
+            return await self.cancel_order(
+                order, wait_for_cancelling=wait_for_cancelling, cancelling_timeout=cancelling_timeout,
+                force_if_disabled=True
+            )
+        except (errors.OrderCancelError, errors.UnexpectedExchangeSideOrderStateError) as err:
+            self.logger.warning(f"Skipping order cancel: {err} ({err.__class__.__name__})")
+            return False
+
+    async def _cancel_orders_on_exchange(self, orders: list, batch_requests_only: bool) -> dict:
+        """
+        Orders locks should be acquired before calling this method
+        :param batch_requests_only: when False, orders that can't be cancelled using batch requests are cancelled
+        using concurrent order cancel requests
+        :return: the cancelled order status by order, orders that could not be cancelled are not included
+        """
+        order_status_by_order = {}
+        if self.exchange_manager.exchange.supports_native_cancel_orders():
+            orders_by_symbol = {}
+            for order in orders:
+                orders_by_symbol.setdefault(order.symbol, []).append(order)
+            for symbol, symbol_orders in orders_by_symbol.items():
+                try:
+                    order_status_by_exchange_order_id = await self.exchange_manager.exchange.cancel_orders(
+                        [order.exchange_order_id for order in symbol_orders], symbol,
+                        order_types=[order.order_type for order in symbol_orders]
+                    )
+                    for order in symbol_orders:
+                        if order.exchange_order_id in order_status_by_exchange_order_id:
+                            order_status_by_order[order] = \
+                                order_status_by_exchange_order_id[order.exchange_order_id]
+                except Exception as err:
+                    self.logger.warning(
+                        f"Failed to cancel {len(symbol_orders)} {symbol} orders at once "
+                        f"({err} {err.__class__.__name__})"
+                    )
+        if batch_requests_only:
+            return order_status_by_order
+
+        async def _cancel_order_on_exchange(order):
+            try:
+                return await self.exchange_manager.exchange.cancel_order(
+                    order.exchange_order_id, order.symbol, order.order_type
+                )
+            except Exception as err:
+                self.logger.warning(f"Failed to cancel order {order} ({err} {err.__class__.__name__})")
+                return None
+
+        to_cancel_orders = [order for order in orders if order not in order_status_by_order]
+        for order, order_status in zip(
+            to_cancel_orders,
+            await util.gather_with_bounded_concurrency(
+                (_cancel_order_on_exchange(order) for order in to_cancel_orders),
+                octobot_trading.constants.MAX_CONCURRENT_ORDER_REQUESTS
+            )
+        ):
+            if order_status is not None:
+                order_status_by_order[order] = order_status
+        return order_status_by_order
+
+    @contextlib.asynccontextmanager
+    async def _orders_locks(self, orders: list):
+        # always acquire orders locks in the same order to avoid deadlocks between concurrent multiple orders
+        # operations
+        locked_orders = []
+        try:
+            for order in sorted(orders, key=lambda locked_order: str(locked_order.order_id)):
+                await order.lock.acquire()
+                locked_orders.append(order)
+            yield
+        finally:
+            for order in locked_orders:
+                order.lock.release()
+
     async def _handle_order_cancellation(
         self, order, ignored_order, wait_for_cancelling: bool, cancelling_timeout: float
     ) -> bool:
@@ -564,15 +864,21 @@ class Trader(util.Initializable):
                 self.logger.exception(err, True, f"Failed to cancel order {order}")
                 return False
             is_order_refreshing = order.is_refreshing()
-            if order_status is enums.OrderStatus.CANCELED:
-                order.status = enums.OrderStatus.CANCELED
-                self.logger.debug(f"Successfully cancelled order {order}")
-            elif order_status is enums.OrderStatus.PENDING_CANCEL:
-                order.status = enums.OrderStatus.PENDING_CANCEL
-                self.logger.debug(f"Order cancel in progress for {order}")
+            self._update_cancelled_order_status(order, order_status)
         else:
             order.status = enums.OrderStatus.CANCELED
+        await self._on_order_cancel(order, is_order_refreshing, ignored_order, wait_for_cancelling)
+        return True
 
+    def _update_cancelled_order_status(self, order, order_status: enums.OrderStatus):
+        if order_status is enums.OrderStatus.CANCELED:
+            order.status = enums.OrderStatus.CANCELED
+            self.logger.debug(f"Successfully cancelled order {order}")
+        elif order_status is enums.OrderStatus.PENDING_CANCEL:
+            order.status = enums.OrderStatus.PENDING_CANCEL
+            self.logger.debug(f"Order cancel in progress for {order}")
+
+    async def _on_order_cancel(self, order, is_order_refreshing: bool, ignored_order, wait_for_cancelling: bool):
         if not is_order_refreshing:
             # don't override state if order is already refreshing (most likely from open orders updater)
             await order.on_cancel(force_cancel=order.status is enums.OrderStatus.CANCELED,
@@ -581,7 +887,6 @@ class Trader(util.Initializable):
         if wait_for_cancelling and (order.is_refreshing() or order.is_pending()):
             # Don't wait for new state to avoid potential deadlock. Will raise if cancel is not in process
             self._ensure_probably_canceled_order(order, None)
-        return True
 
     async def _handle_order_cancel_error(self, order, err, wait_for_cancelling, cancelling_timeout):
         """
@@ -667,15 +972,14 @@ class Trader(util.Initializable):
             self.logger.info(f"Cancelling all {len(orders_to_cancel)} {symbol} orders")
         else:
             return success
-        try:
-            cancel_on_exchange = False
+        async with self._orders_locks(orders_to_cancel):
+            exchange_orders = []
             for order in orders_to_cancel:
-                await order.lock.acquire()
                 if self.simulate or order.is_self_managed():
                     order.status = enums.OrderStatus.CANCELED
                 else:
-                    cancel_on_exchange = True
-            if cancel_on_exchange:
+                    exchange_orders.append(order)
+            if exchange_orders:
                 try:
                     success = False
                     await self.exchange_manager.exchange.cancel_all_orders(symbol)
@@ -686,13 +990,9 @@ class Trader(util.Initializable):
                             f"cancel_all_orders is not supported on {self.exchange_manager.exchange_name}. Falling "
                             f"back to one by one cancel"
                         )
-                        for order in orders_to_cancel:
-                            if not await self.cancel_order(
-                                order.symbol,
-                                wait_for_cancelling=wait_for_cancelling,
-                                cancelling_timeout=cancelling_timeout
-                            ):
-                                success = False
+                        # orders locks are already acquired: directly cancel orders on exchange
+                        order_status_by_order = await self._cancel_orders_on_exchange(exchange_orders, False)
+                        success = len(order_status_by_order) == len(exchange_orders)
                     else:
                         # not supported and no fallback allowed: re-raise errors.NotSupported
                         raise
@@ -700,9 +1000,6 @@ class Trader(util.Initializable):
                 await order.on_cancel(force_cancel=True, is_from_exchange_data=False)
                 if wait_for_cancelling and order.state is not None and order.state.is_pending():
                     await self._wait_for_order_cancel(order, cancelling_timeout)
-        finally:
-            for order in orders_to_cancel:
-                order.lock.release()
         self.logger.info(f"Cancelling of all {len(orders_to_cancel)} {symbol} orders complete")
         return success
 
@@ -762,30 +1059,33 @@ class Trader(util.Initializable):
         :return: (True, orders): True if all orders got cancelled, False if an error occurred and the list of
         cancelled orders
         """
-        all_cancelled = True
-        cancelled_orders = []
-        for order in self.exchange_manager.exchange_personal_data.orders_manager.get_open_orders(since=since, until=until):
-            if order.symbol == symbol and \
-                    (side is None or order.side is side) and \
-                    not (order.is_cancelled() or order.is_closed()) and \
-                    (cancel_loaded_orders or order.is_from_this_octobot):
-                try:
-                    async with signals.remote_signal_publisher(self.exchange_manager, order.symbol, emit_trading_signals):
-                        cancelled, _ = await signals.cancel_order(
-                            self.exchange_manager,
-                            emit_trading_signals and signals.should_emit_trading_signal(self.exchange_manager),
-                            order,
-                            wait_for_cancelling=wait_for_cancelling,
-                            cancelling_timeout=cancelling_timeout,
-                            dependencies=dependencies,
-                            force_if_disabled=True
-                        )
-                    if cancelled:
-                        cancelled_orders.append(order)
-                    all_cancelled = cancelled and all_cancelled
-                except (errors.OrderCancelError, errors.UnexpectedExchangeSideOrderStateError) as err:
-                    self.logger.warning(f"Skipping order cancel: {err} ({err.__class__.__name__})")
-        return all_cancelled, cancelled_orders
+        orders_to_cancel = [
+            order
+            for order in self.exchange_manager.exchange_personal_data.orders_manager.get_open_orders(
+                symbol=symbol, since=since, until=until
+            )
+            if order.symbol == symbol and
+            (side is None or order.side is side) and
+            not (order.is_cancelled() or order.is_closed()) and
+            (cancel_loaded_orders or order.is_from_this_octobot)
+        ]
+        if not orders_to_cancel:
+            return True, []
+        async with signals.remote_signal_publisher(self.exchange_manager, symbol, emit_trading_signals):
+            cancelled_orders, _ = await signals.cancel_orders(
+                self.exchange_manager,
+                emit_trading_signals and signals.should_emit_trading_signal(self.exchange_manager),
+                orders_to_cancel,
+                wait_for_cancelling=wait_for_cancelling,
+                cancelling_timeout=cancelling_timeout,
+                dependencies=dependencies,
+                force_if_disabled=True
+            )
+        return all(cancelled_orders), [
+            order
+            for order, cancelled in zip(orders_to_cancel, cancelled_orders)
+            if cancelled
+        ]
 
     @enabled_or_forced_only
     async def cancel_all_open_orders_with_currency(
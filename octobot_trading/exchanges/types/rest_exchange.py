@@ -39,7 +39,7 @@ from octobot_trading.enums import ExchangeConstantsOrderColumns as ecoc
 import octobot_trading.exchanges.abstract_exchange as abstract_exchange
 import octobot_trading.exchange_data.contracts as contracts
 import octobot_trading.personal_data.orders as orders
-
+import octobot_trading.util as util
 
 
 def fetching_orders_request(f):
@@ -135,6 +135,11 @@ class RestExchange(abstract_exchange.AbstractExchange):
 
     # set True when fetch_tickers can sometimes miss symbols. In this case, the connector will try to fix it
     CAN_MISS_TICKERS_IN_ALL_TICKERS = True
+    # set False when the exchange createOrders and cancelOrders batch requests should not be used when handling
+    # multiple orders at once
+    ENABLE_NATIVE_BATCH_ORDERS_REQUESTS = True
+    # maximum number of orders in a single batch orders creation or cancel request
+    MAX_ORDERS_BY_BATCH_REQUEST = 5
 
     # text content of errors due to orders not found errors
     EXCHANGE_ORDER_NOT_FOUND_ERRORS: typing.List[typing.Iterable[str]] = []
@@ -182,6 +187,7 @@ class RestExchange(abstract_exchange.AbstractExchange):
             self._apply_fetched_details(config, exchange_manager)
         self.connector = self._create_connector(config, exchange_manager, connector_class)
         self.pair_contracts: dict[str, contracts.MarginContract] = {}
+        self._market_statuses_cache: exchanges_util.MarketStatusCache = exchanges_util.MarketStatusCache()
 
     def _create_connector(self, config, exchange_manager, connector_class):
         to_create_connector_class = connector_class or self.DEFAULT_CONNECTOR_CLASS
@@ -277,6 +283,90 @@ class RestExchange(abstract_exchange.AbstractExchange):
                 return await self._verify_order(created_order, order_type, symbol, price, quantity, side)
         return None
 
+    def supports_native_create_orders(self, order_type: enums.TraderOrderType) -> bool:
+        return (
+            self.ENABLE_NATIVE_BATCH_ORDERS_REQUESTS
+            and order_type in (enums.TraderOrderType.BUY_LIMIT, enums.TraderOrderType.SELL_LIMIT)
+            and self.connector.supports_native_create_orders(order_type)
+        )
+
+    def supports_native_cancel_orders(self) -> bool:
+        return self.ENABLE_NATIVE_BATCH_ORDERS_REQUESTS and self.connector.supports_native_cancel_orders()
+
+    async def create_orders(self, orders_kwargs: list[dict]) -> list[typing.Optional[dict]]:
+        """
+        Only limit orders can be created in batch, see supports_native_create_orders.
+        Each batch request only contains orders of the same symbol.
+        :return: the created orders, None for each order that has not been created by the exchange
+        """
+        indexes_by_symbol = {}
+        for index, order_kwargs in enumerate(orders_kwargs):
+            indexes_by_symbol.setdefault(order_kwargs["symbol"], []).append(index)
+        batches_indexes = [
+            symbol_indexes[index:index + self.MAX_ORDERS_BY_BATCH_REQUEST]
+            for symbol_indexes in indexes_by_symbol.values()
+            for index in range(0, len(symbol_indexes), self.MAX_ORDERS_BY_BATCH_REQUEST)
+        ]
+        created_orders_batches = await util.gather_with_bounded_concurrency(
+            (
+                self._create_orders_batch([orders_kwargs[index] for index in batch_indexes])
+                for batch_indexes in batches_indexes
+            ),
+            constants.MAX_CONCURRENT_ORDER_REQUESTS,
+            return_exceptions=True
+        )
+        created_orders = [None] * len(orders_kwargs)
+        for batch_indexes, created_orders_batch in zip(batches_indexes, created_orders_batches):
+            if isinstance(created_orders_batch, Exception):
+                self.logger.warning(
+                    f"Failed to create {len(batch_indexes)} {orders_kwargs[batch_indexes[0]]['symbol']} orders "
+                    f"at once ({created_orders_batch} {created_orders_batch.__class__.__name__})"
+                )
+                continue
+            for index, created_order in zip(batch_indexes, created_orders_batch):
+                created_orders[index] = created_order
+        return created_orders
+
+    async def _create_orders_batch(self, orders_kwargs: list[dict]) -> list[typing.Optional[dict]]:
+        first_order_kwargs = orders_kwargs[0]
+        async with self._order_operation(
+            first_order_kwargs["order_type"], first_order_kwargs["symbol"], first_order_kwargs["quantity"],
+            first_order_kwargs["price"], first_order_kwargs.get("stop_price")
+        ):
+            with contextlib.ExitStack() as creating_orders_stack:
+                orders_requests = []
+                for order_kwargs in orders_kwargs:
+                    symbol = order_kwargs["symbol"]
+                    quantity = order_kwargs["quantity"]
+                    if self.exchange_manager.is_future:
+                        # on futures exchange expects, quantity in contracts: convert quantity into contracts
+                        quantity = quantity / self.get_contract_size(symbol)
+                    creating_orders_stack.enter_context(
+                        self.creating_order(order_kwargs["side"], symbol, quantity, order_kwargs["price"])
+                    )
+                    params = dict(order_kwargs.get("params") or {})
+                    params.update(self.exchange_manager.exchange_backend.get_orders_parameters(None))
+                    orders_requests.append({
+                        "symbol": symbol,
+                        "type": enums.TradeOrderType.LIMIT.value,
+                        "side": order_kwargs["side"].value,
+                        "amount": float(quantity),
+                        "price": float(order_kwargs["price"]),
+                        "params": params,
+                    })
+                created_orders = await self.connector.create_orders(orders_requests)
+                self.logger.debug(f"Created orders: {created_orders}")
+                return [
+                    None if created_order is None else await self._verify_order(
+                        created_order, order_kwargs["order_type"], order_request["symbol"], order_kwargs["price"],
+                        decimal.Decimal(str(order_request["amount"])), order_kwargs["side"]
+                    )
+                    for order_kwargs, order_request, created_order in zip(
+                        orders_kwargs, orders_requests, created_orders
+                    )
+                ]
+        return [None] * len(orders_kwargs)
+
     async def edit_order(self, exchange_order_id: str, order_type: enums.TraderOrderType, symbol: str,
                          quantity: decimal.Decimal, price: decimal.Decimal,
                          stop_price: decimal.Decimal = None, side: enums.TradeOrderSide = None,
@@ -644,7 +734,17 @@ class RestExchange(abstract_exchange.AbstractExchange):
         Changes PRECISION_AMOUNT and PRECISION_PRICE from decimals to integers
         (use number of digits instead of price example) by default.
         Override _fix_market_status to change other elements
-        """
+        Market statuses are cached by symbol until markets are reloaded: returned values are read-only,
+        use copy.deepcopy() on them to get an editable market status.
+        """
+        return self._market_statuses_cache.get_market_status(
+            (symbol, remove_price_limits, adapt_for_contract_size),
+            lambda: self._get_adapted_market_status(symbol, remove_price_limits, adapt_for_contract_size),
+            price_example=price_example,
+            with_fixer=with_fixer,
+        )
+
+    def _get_adapted_market_status(self, symbol, remove_price_limits, adapt_for_contract_size):
         market_status = self.connector.adapter.adapt_market_status(
             copy.deepcopy(
                 self.connector.get_market_status(symbol, with_fixer=False)
@@ -653,10 +753,12 @@ class RestExchange(abstract_exchange.AbstractExchange):
         )
         if adapt_for_contract_size and self.exchange_manager.is_future:
             self._adapt_market_status_for_contract_size(market_status, self.get_contract_size(symbol))
-        if with_fixer:
-            return exchanges_util.ExchangeMarketStatusFixer(market_status, price_example).market_status
         return market_status
 
+    def clear_market_statuses_cache(self):
+        self._market_statuses_cache.clear()
+        self.connector.clear_market_statuses_cache()
+
     def get_max_orders_count(self, symbol: str, order_type: enums.TraderOrderType) -> int:
         return (
             constants.DEFAULT_MAX_STOP_ORDERS_COUNT if orders.is_stop_order(order_type)
@@ -865,6 +967,53 @@ class RestExchange(abstract_exchange.AbstractExchange):
         extended_kwargs = self.order_request_kwargs_factory(exchange_order_id, order_type, **(kwargs or {}))
         return await self.connector.cancel_order(exchange_order_id, symbol, order_type, **extended_kwargs)
 
+    async def cancel_orders(
+        self, exchange_order_ids: list[str], symbol: str,
+        order_types: typing.Optional[list[enums.TraderOrderType]] = None, **kwargs: dict
+    ) -> dict[str, enums.OrderStatus]:
+        """
+        Orders missing from the returned dict have not been cancelled by the exchange
+        :param order_types: the type of each order, used to create each order request kwargs
+        """
+        # orders requiring the same request kwargs are cancelled together
+        ids_and_kwargs = []
+        for exchange_order_id, order_type in zip(
+            exchange_order_ids, order_types or [None] * len(exchange_order_ids)
+        ):
+            extended_kwargs = self.order_request_kwargs_factory(exchange_order_id, order_type, **(kwargs or {}))
+            for grouped_ids, grouped_kwargs in ids_and_kwargs:
+                if grouped_kwargs == extended_kwargs:
+                    grouped_ids.append(exchange_order_id)
+                    break
+            else:
+                ids_and_kwargs.append(([exchange_order_id], extended_kwargs))
+        batches = [
+            (grouped_ids[index:index + self.MAX_ORDERS_BY_BATCH_REQUEST], grouped_kwargs)
+            for grouped_ids, grouped_kwargs in ids_and_kwargs
+            for index in range(0, len(grouped_ids), self.MAX_ORDERS_BY_BATCH_REQUEST)
+        ]
+        cancelled_orders_batches = await util.gather_with_bounded_concurrency(
+            (
+                self.connector.cancel_orders(batch_ids, symbol, **batch_kwargs)
+                for batch_ids, batch_kwargs in batches
+            ),
+            constants.MAX_CONCURRENT_ORDER_REQUESTS,
+            return_exceptions=True
+        )
+        cancelled_order_status_by_id = {}
+        for (batch_ids, _), cancelled_orders in zip(batches, cancelled_orders_batches):
+            if isinstance(cancelled_orders, Exception):
+                self.logger.warning(
+                    f"Failed to cancel {len(batch_ids)} {symbol} orders at once "
+                    f"({cancelled_orders} {cancelled_orders.__class__.__name__})"
+                )
+                continue
+            for cancelled_order in cancelled_orders:
+                if (exchange_order_id := cancelled_order.get(ccxt_enums.ExchangeOrderCCXTColumns.ID.value)) \
+                        in batch_ids:
+                    cancelled_order_status_by_id[exchange_order_id] = _get_cancelled_order_status(cancelled_order)
+        return cancelled_order_status_by_id
+
     def get_trade_fee(self, symbol: str, order_type: enums.TraderOrderType, quantity, price, taker_or_maker) -> dict:
         return self.connector.get_trade_fee(symbol, order_type, quantity, price, taker_or_maker)
 
@@ -1398,3 +1547,14 @@ class RestExchange(abstract_exchange.AbstractExchange):
         :return: the uniformized mark price status
         """
         return self.connector.parse_mark_price(mark_price_dict, from_ticker=from_ticker)
+
+
+def _get_cancelled_order_status(cancelled_order: dict) -> enums.OrderStatus:
+    try:
+        if orders.parse_is_cancelled(cancelled_order):
+            return enums.OrderStatus.CANCELED
+    except ValueError:
+        # unknown status
+        pass
+    # order states will synchronize the order to make sure it is cancelled
+    return enums.OrderStatus.PENDING_CANCEL
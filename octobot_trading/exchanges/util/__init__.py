@@ -19,6 +19,10 @@ from octobot_trading.exchanges.util.exchange_market_status_fixer import (
     ExchangeMarketStatusFixer,
     is_ms_valid,
 )
+from octobot_trading.exchanges.util import market_status_cache
+from octobot_trading.exchanges.util.market_status_cache import (
+    MarketStatusCache,
+)
 from octobot_trading.exchanges.util import symbol_details
 from octobot_trading.exchanges.util.symbol_details import (
     SymbolDetails,
@@ -58,6 +62,7 @@ from octobot_trading.exchanges.util.websockets_util import (
 __all__ = [
     "ExchangeMarketStatusFixer",
     "is_ms_valid",
+    "MarketStatusCache",
     "SymbolDetails",
     "get_rest_exchange_class",
     "get_order_side",
@@ -130,6 +130,8 @@ class ExchangeMarketStatusFixer:
         self.logger = logging.get_logger(self.__class__.__name__)
         self.market_status = market_status
         self.price_example = price_example
+        # True when the fixed market status depends on price_example
+        self.requires_price_example = False
 
         if Ecmsc.INFO.value in self.market_status:
             self.market_status_specific = self.market_status[Ecmsc.INFO.value]
@@ -190,6 +192,7 @@ class ExchangeMarketStatusFixer:
             (market_precision.get(Ecmsc.PRECISION_AMOUNT.value), market_precision.get(Ecmsc.PRECISION_PRICE.value)),
             zero_valid=True
          ):
+            self.requires_price_example = True
             if self.price_example is not None:
                 self._fix_market_status_precision_with_price()
 
@@ -227,8 +230,10 @@ class ExchangeMarketStatusFixer:
             if self.market_status_specific and not check_market_status_limits(market_limit):
                 self._fix_market_status_limits_with_specific()
 
-            if self.price_example is not None and not check_market_status_limits(market_limit):
-                self._fix_market_status_limits_with_price()
+            if not check_market_status_limits(market_limit):
+                self.requires_price_example = True
+                if self.price_example is not None:
+                    self._fix_market_status_limits_with_price()
 
     def _calculate_amount(self):
         amount_log_price = math.log(self.price_example, 10)
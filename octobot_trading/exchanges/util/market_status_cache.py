@@ -0,0 +1,68 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import copy
+import typing
+
+import octobot_trading.util as util
+import octobot_trading.exchanges.util.exchange_market_status_fixer as exchange_market_status_fixer
+
+
+class MarketStatusCache:
+    """
+    Read-only market statuses by key (usually including their symbol), created only once until cleared.
+    Fixed market statuses are also cached unless ExchangeMarketStatusFixer requires a price example to fix them.
+    Callers editing market statuses should edit their copy.deepcopy() instead.
+    """
+
+    def __init__(self):
+        # key: (market status, fixed market status or None when fixing it requires a price example)
+        self._market_statuses: dict[typing.Hashable, tuple[util.ReadOnlyDict, typing.Optional[util.ReadOnlyDict]]] = {}
+
+    def get_market_status(
+        self, key: typing.Hashable, market_status_factory: typing.Callable[[], dict],
+        price_example=None, with_fixer=True
+    ) -> dict:
+        """
+        :param key: the cached market status key
+        :param market_status_factory: called to create the market status when it's not cached yet
+        :param price_example: the price example to fix the market status with when it requires one
+        :param with_fixer: when True, the market status is fixed by ExchangeMarketStatusFixer
+        :return: the read-only cached market status, a new dict when it has to be fixed using price_example
+        """
+        try:
+            market_status, fixed_market_status = self._market_statuses[key]
+        except KeyError:
+            market_status, fixed_market_status = self._market_statuses[key] = _create_cached_market_statuses(
+                market_status_factory()
+            )
+        if not with_fixer:
+            return market_status
+        if fixed_market_status is None:
+            return exchange_market_status_fixer.ExchangeMarketStatusFixer(
+                copy.deepcopy(market_status), price_example
+            ).market_status
+        return fixed_market_status
+
+    def clear(self):
+        self._market_statuses.clear()
+
+
+def _create_cached_market_statuses(market_status: dict) -> tuple[util.ReadOnlyDict, typing.Optional[util.ReadOnlyDict]]:
+    fixer = exchange_market_status_fixer.ExchangeMarketStatusFixer(copy.deepcopy(market_status))
+    return (
+        util.get_read_only_dict(market_status),
+        None if fixer.requires_price_example else util.get_read_only_dict(fixer.market_status)
+    )
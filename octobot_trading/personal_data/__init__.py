@@ -156,6 +156,8 @@ from octobot_trading.personal_data.portfolios import (
     SubPortfolio,
     PortfolioManager,
     ValueConverter,
+    PortfolioValuation,
+    HoldingsValuation,
     PortfolioValueHolder,
     FuturesPortfolioValueHolder,
     OptionPortfolioValueHolder,
@@ -187,9 +189,12 @@ from octobot_trading.personal_data.portfolios import (
     get_assets_delta_from_orders,
     get_fees_only_asset_deltas_from_orders,
     HistoricalAssetValue,
+    ColumnarHistoricalAssetValues,
+    ColumnarHistoricalAssetValue,
     HistoricalPortfolioValueManager,
     SubPortfolioData,
     ResolvedOrdersPortoflioDelta,
+    UnknownOrdersCombinations,
     FilledOrderUpdateEvent,
     TransactionUpdateEvent,
     PortfolioUpdateEvent,
@@ -234,6 +239,7 @@ from octobot_trading.personal_data.trades import (
     compute_win_rate,
     aggregate_trades_by_exchange_order_id,
     get_real_or_estimated_trade_fee,
+    is_registered_fee,
 )
 from octobot_trading.personal_data import transactions
 from octobot_trading.personal_data.transactions import (
@@ -421,6 +427,8 @@ __all__ = [
     "SubPortfolio",
     "PortfolioManager",
     "ValueConverter",
+    "PortfolioValuation",
+    "HoldingsValuation",
     "PortfolioValueHolder",
     "FuturesPortfolioValueHolder",
     "OptionPortfolioValueHolder",
@@ -443,6 +451,8 @@ __all__ = [
     "get_draw_down",
     "create_historical_asset_value_from_dict_like_object",
     "HistoricalAssetValue",
+    "ColumnarHistoricalAssetValues",
+    "ColumnarHistoricalAssetValue",
     "HistoricalPortfolioValueManager",
     "PositionsUpdaterSimulator",
     "Position",
@@ -477,6 +487,7 @@ __all__ = [
     "compute_win_rate",
     "aggregate_trades_by_exchange_order_id",
     "get_real_or_estimated_trade_fee",
+    "is_registered_fee",
     "ExchangePersonalData",
     "get_asset_price_from_converter_or_tickers",
     "resolve_sub_portfolios",
@@ -501,6 +512,7 @@ __all__ = [
     "create_transfer_transaction",
     "SubPortfolioData",
     "ResolvedOrdersPortoflioDelta",
+    "UnknownOrdersCombinations",
     "create_cancel_policy",
     "OrderCancelPolicy",
     "ExpirationTimeOrderCancelPolicy",
@@ -36,6 +36,9 @@ import octobot_trading.personal_data.orders.cancel_policies.order_cancel_policy
 import octobot_trading.personal_data.orders.cancel_policies.cancel_policy_factory as cancel_policy_factory
 import octobot_trading.util as util
 
+if typing.TYPE_CHECKING:
+    import octobot_trading.personal_data.orders.orders_manager as orders_manager_import
+
 
 class Order(util.Initializable):
     """
@@ -49,6 +52,9 @@ class Order(util.Initializable):
 
     def __init__(self, trader, side=None):
         super().__init__()
+        # orders manager to notify when symbol, status, exchange_order_id, tag or order_group change:
+        # set while this order is in its orders manager
+        self.indexing_orders_manager: typing.Optional["orders_manager_import.OrdersManager"] = None
         self.trader: octobot_trading.exchanges.Trader = trader
         self.exchange_manager: octobot_trading.exchanges.ExchangeManager = trader.exchange_manager
         self.lock: asyncio.Lock = asyncio.Lock()
@@ -58,9 +64,9 @@ class Order(util.Initializable):
 
         self.logger_name: typing.Optional[str] = None
         self.order_id: str = order_util.generate_order_id()        # used id; kept through instances and trading signals
-        self.exchange_order_id: str = trader.parse_order_id(None)  # given by the exchange, local to the user account
-        self.status: enums.OrderStatus = enums.OrderStatus.OPEN
-        self.symbol: str = None # type: ignore
+        self._exchange_order_id: str = trader.parse_order_id(None)  # given by the exchange, local to the user account
+        self._status: enums.OrderStatus = enums.OrderStatus.OPEN
+        self._symbol: str = None # type: ignore
         self.currency: typing.Optional[str] = None
         self.market: typing.Optional[str] = None
         self.quantity_currency: typing.Optional[str] = None
@@ -68,7 +74,7 @@ class Order(util.Initializable):
         self.timestamp: float = 0
         self.side: enums.TradeOrderSide = side # type: ignore
         self.trigger_above: bool = None # type: ignore
-        self.tag: str = None # type: ignore
+        self._tag: str = None # type: ignore
         self.associated_entry_ids: typing.Optional[list[str]] = None
         self.broker_applied: bool = False
 
@@ -96,7 +102,7 @@ class Order(util.Initializable):
         # canceled order attributes
         self.canceled_time: float = 0
 
-        self.order_group: typing.Optional[order_group_import.OrderGroup] = None
+        self._order_group: typing.Optional[order_group_import.OrderGroup] = None
         self.trailing_profile: typing.Optional[trailing_profiles.TrailingProfile] = None
 
         # order state is initialized in initialize_impl()
@@ -143,6 +149,63 @@ class Order(util.Initializable):
         # kwargs given to trader.create_order() when this order should be created later on
         self.trader_creation_kwargs: dict[str, typing.Any] = {}
 
+    @property
+    def symbol(self) -> str:
+        return self._symbol
+
+    @symbol.setter
+    def symbol(self, symbol: str):
+        previous_symbol = self._symbol
+        self._symbol = symbol
+        if self.indexing_orders_manager is not None:
+            self.indexing_orders_manager.on_order_indexed_attribute_update(self, "symbol", previous_symbol)
+
+    @property
+    def status(self) -> enums.OrderStatus:
+        return self._status
+
+    @status.setter
+    def status(self, status: enums.OrderStatus):
+        previous_status = self._status
+        self._status = status
+        if self.indexing_orders_manager is not None:
+            self.indexing_orders_manager.on_order_indexed_attribute_update(self, "status", previous_status)
+
+    @property
+    def exchange_order_id(self) -> str:
+        return self._exchange_order_id
+
+    @exchange_order_id.setter
+    def exchange_order_id(self, exchange_order_id: str):
+        previous_exchange_order_id = self._exchange_order_id
+        self._exchange_order_id = exchange_order_id
+        if self.indexing_orders_manager is not None:
+            self.indexing_orders_manager.on_order_indexed_attribute_update(
+                self, "exchange_order_id", previous_exchange_order_id
+            )
+
+    @property
+    def tag(self) -> str:
+        return self._tag
+
+    @tag.setter
+    def tag(self, tag: str):
+        previous_tag = self._tag
+        self._tag = tag
+        if self.indexing_orders_manager is not None:
+            self.indexing_orders_manager.on_order_indexed_attribute_update(self, "tag", previous_tag)
+
+    @property
+    def order_group(self) -> typing.Optional["order_group_import.OrderGroup"]:
+        return self._order_group
+
+    @order_group.setter
+    def order_group(self, order_group: typing.Optional["order_group_import.OrderGroup"]):
+        previous_order_group = self._order_group
+        self._order_group = order_group
+        if self.indexing_orders_manager is not None:
+            self.indexing_orders_manager.on_order_indexed_attribute_update(self, "order_group", previous_order_group)
+
     @classmethod
     def get_name(cls):
         return cls.__name__
@@ -35,6 +35,8 @@ import octobot_trading.personal_data.orders.order_group as order_group_import
 
 class OrdersManager(util.Initializable):
     MAX_ORDERS_COUNT = 0
+    # order attributes to index orders by: orders notify their orders manager when those change
+    INDEXED_ORDER_ATTRIBUTES = ("symbol", "status", "exchange_order_id", "tag", "order_group")
 
     def __init__(self, trader):
         super().__init__()
@@ -42,6 +44,13 @@ class OrdersManager(util.Initializable):
         self.trader: octobot_trading.exchanges.Trader = trader
         self.orders_initialized: bool = False
         self.enable_order_auto_synchronization: bool = True
+        # orders indexes by order attribute, orders are kept in self.orders order using their position
+        self._orders_indexes: dict[str, util.AttributeIndex] = {
+            attribute: util.AttributeIndex() for attribute in self.INDEXED_ORDER_ATTRIBUTES
+        }
+        self._order_positions: dict[order_class.Order, int] = {}
+        self._next_order_position: int = 0
+        self._orders: util.NotifyingOrderedDict = None
         self.orders: collections.OrderedDict[str, order_class.Order] = collections.OrderedDict()
         self.order_groups: dict[str, order_group_import.OrderGroup] = {}
         # orders that are expected from exchange but have not yet been fetched: will be removed when fetched
@@ -49,6 +58,16 @@ class OrdersManager(util.Initializable):
         # if this the orders manager completed the initial exchange orders sync phase (only on real trader)
         self.are_exchange_orders_initialized: bool = self.trader.simulate
 
+    @property
+    def orders(self) -> util.NotifyingOrderedDict:
+        return self._orders
+
+    @orders.setter
+    def orders(self, orders: dict):
+        # self.orders can also be edited directly: it notifies its updates to keep orders indexes up to date
+        self._reset_orders_indexes()
+        self._orders = util.NotifyingOrderedDict(self._on_order_set, self._on_order_removed, orders)
+
     async def initialize_impl(self):
         self._reset_orders()
 
@@ -96,19 +115,37 @@ class OrdersManager(util.Initializable):
 
     def get_order(self, order_id: typing.Optional[str], exchange_order_id: typing.Optional[str]=None) -> order_class.Order:
         if order_id is None:
-            for order in self.orders.values():
-                if order.exchange_order_id == exchange_order_id:
-                    return order
+            for order in self._get_indexed_orders("exchange_order_id", exchange_order_id):
+                return order
             raise KeyError(exchange_order_id)
         return self.orders[order_id]
 
     def get_order_from_group(self, group_name: str) -> list[order_class.Order]:
         return [
             order
-            for order in self.orders.values()
-            if order.order_group is not None and order.order_group.name == group_name
+            for order in self._get_indexed_orders("order_group", group_name)
+            if order.order_group is not None
         ]
 
+    def on_order_indexed_attribute_update(self, order: order_class.Order, attribute: str, previous_value):
+        """
+        Called by orders when one of their INDEXED_ORDER_ATTRIBUTES changes
+        :param order: the updated order
+        :param attribute: the updated attribute
+        :param previous_value: the attribute value before the update
+        """
+        try:
+            position = self._order_positions[order]
+        except KeyError:
+            # order is not in this orders manager
+            return
+        previous_key = _get_order_index_key(attribute, previous_value)
+        key = _get_order_index_key(attribute, getattr(order, attribute))
+        if key != previous_key:
+            index = self._orders_indexes[attribute]
+            index.remove(previous_key, order)
+            index.add(key, order, position)
+
     def get_or_create_group(
         self, group_type: type[order_group_import.OrderGroup], group_name: str,
         active_order_swap_strategy: typing.Optional[active_order_swap_strategy_import.ActiveOrderSwapStrategy] = None
@@ -227,11 +264,11 @@ class OrdersManager(util.Initializable):
                 return True
             except KeyError:
                 return False
-        return order_id in set(self.orders.keys())
+        return order_id in self.orders
 
     def remove_order_instance(self, order):
         if self.has_order(order.order_id):
-            self.orders.pop(order.order_id, None)
+            self.orders.pop(order.order_id)
             order.clear()
         else:
             self.logger.warning(f"Attempt to remove an order that is not in orders_manager: "
@@ -241,7 +278,7 @@ class OrdersManager(util.Initializable):
 
     def replace_order(self, previous_id, order):
         if self.has_order(previous_id):
-            self.orders.pop(previous_id, None)
+            self.orders.pop(previous_id)
         self._add_order(order.order_id, order)
         self._check_orders_size()
 
@@ -275,7 +312,7 @@ class OrdersManager(util.Initializable):
     ):
         orders = [
             order
-            for order in self.orders.values()
+            for order in self._get_selectable_orders(state, symbol, tag)
             if (
                 (state is None or order.status == state) and
                 (symbol is None or (symbol and order.symbol == symbol)) and
@@ -287,6 +324,56 @@ class OrdersManager(util.Initializable):
         ]
         return orders if limit == constants.NO_DATA_LIMIT else orders[0:limit]
 
+    def _get_selectable_orders(self, state, symbol, tag) -> typing.Iterable[order_class.Order]:
+        # use the smallest index matching the selection, if any
+        selectable_orders = None
+        for attribute, key in (("status", state), ("symbol", symbol), ("tag", tag)):
+            if key is not None:
+                indexed_orders = self._get_indexed_orders(attribute, key)
+                if selectable_orders is None or len(indexed_orders) < len(selectable_orders):
+                    selectable_orders = indexed_orders
+        return self.orders.values() if selectable_orders is None else selectable_orders
+
+    def _get_indexed_orders(self, attribute, key) -> dict[order_class.Order, int]:
+        return self._orders_indexes[attribute].get(key)
+
+    def _add_to_orders_indexes(self, order, position=None):
+        if order in self._order_positions:
+            # order is already indexed using another order id
+            self._remove_from_orders_indexes(order)
+        if position is None:
+            position = self._next_order_position
+            self._next_order_position += 1
+        self._order_positions[order] = position
+        order.indexing_orders_manager = self
+        for attribute, index in self._orders_indexes.items():
+            index.add(_get_order_index_key(attribute, getattr(order, attribute)), order, position)
+
+    def _remove_from_orders_indexes(self, order) -> typing.Optional[int]:
+        position = self._order_positions.pop(order, None)
+        if position is not None:
+            order.indexing_orders_manager = None
+            for attribute, index in self._orders_indexes.items():
+                index.remove(_get_order_index_key(attribute, getattr(order, attribute)), order)
+        return position
+
+    def _reset_orders_indexes(self):
+        for order in self._order_positions:
+            order.indexing_orders_manager = None
+        self._order_positions = {}
+        self._next_order_position = 0
+        for index in self._orders_indexes.values():
+            index.clear()
+
+    def _on_order_set(self, order, previous_order):
+        if previous_order is not order:
+            # replacing an order keeps its position in self.orders
+            position = None if previous_order is None else self._remove_from_orders_indexes(previous_order)
+            self._add_to_orders_indexes(order, position)
+
+    def _on_order_removed(self, order):
+        self._remove_from_orders_indexes(order)
+
     def _remove_oldest_orders(self, nb_to_remove):
         for _ in range(nb_to_remove):
             self.orders.popitem(last=False)
@@ -297,6 +384,13 @@ class OrdersManager(util.Initializable):
         self._reset_orders()
 
 
+def _get_order_index_key(attribute, value):
+    if attribute == "order_group":
+        # groups are indexed by name
+        return None if value is None else value.name
+    return value
+
+
 async def _update_order_from_raw(order, raw_order):
     """
     Calling order update from raw method
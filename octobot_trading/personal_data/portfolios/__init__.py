@@ -41,6 +41,7 @@ from octobot_trading.personal_data.portfolios import portfolio_manager
 from octobot_trading.personal_data.portfolios import portfolio_value_holder
 from octobot_trading.personal_data.portfolios import portfolio_value_holder_factory
 from octobot_trading.personal_data.portfolios import value_converter
+from octobot_trading.personal_data.portfolios import portfolio_valuation
 from octobot_trading.personal_data.portfolios import types
 from octobot_trading.personal_data.portfolios import portfolio_util
 from octobot_trading.personal_data.portfolios import history
@@ -62,6 +63,10 @@ from octobot_trading.personal_data.portfolios.portfolio_manager import (
 from octobot_trading.personal_data.portfolios.value_converter import (
     ValueConverter,
 )
+from octobot_trading.personal_data.portfolios.portfolio_valuation import (
+    PortfolioValuation,
+    HoldingsValuation,
+)
 from octobot_trading.personal_data.portfolios.portfolio_value_holder import (
     PortfolioValueHolder
 )
@@ -105,6 +110,8 @@ from octobot_trading.personal_data.portfolios.portfolio_util import (
 from octobot_trading.personal_data.portfolios.history import (
     create_historical_asset_value_from_dict_like_object,
     HistoricalAssetValue,
+    ColumnarHistoricalAssetValues,
+    ColumnarHistoricalAssetValue,
     HistoricalPortfolioValueManager,
 )
 from octobot_trading.personal_data.portfolios.sub_portfolio_data import (
@@ -113,6 +120,10 @@ from octobot_trading.personal_data.portfolios.sub_portfolio_data import (
 from octobot_trading.personal_data.portfolios.resolved_orders_portfolio_delta import (
     ResolvedOrdersPortoflioDelta,
 )
+from octobot_trading.personal_data.portfolios import unknown_orders_combinations
+from octobot_trading.personal_data.portfolios.unknown_orders_combinations import (
+    UnknownOrdersCombinations,
+)
 from octobot_trading.personal_data.portfolios.update_events import (
     FilledOrderUpdateEvent,
     TransactionUpdateEvent,
@@ -135,6 +146,8 @@ __all__ = [
     "SubPortfolio",
     "PortfolioManager",
     "ValueConverter",
+    "PortfolioValuation",
+    "HoldingsValuation",
     "PortfolioValueHolder",
     "FuturesPortfolioValueHolder",
     "OptionPortfolioValueHolder",
@@ -166,9 +179,12 @@ __all__ = [
     "create_historical_asset_value_from_dict_like_object",
     "get_draw_down",
     "HistoricalAssetValue",
+    "ColumnarHistoricalAssetValues",
+    "ColumnarHistoricalAssetValue",
     "HistoricalPortfolioValueManager",
     "SubPortfolioData",
     "ResolvedOrdersPortoflioDelta",
+    "UnknownOrdersCombinations",
     "FilledOrderUpdateEvent",
     "TransactionUpdateEvent",
     "PortfolioUpdateEvent",
@@ -24,6 +24,12 @@ from octobot_trading.personal_data.portfolios.history.historical_asset_value imp
     HistoricalAssetValue,
 )
 
+from octobot_trading.personal_data.portfolios.history import columnar_historical_asset_values
+from octobot_trading.personal_data.portfolios.history.columnar_historical_asset_values import (
+    ColumnarHistoricalAssetValues,
+    ColumnarHistoricalAssetValue,
+)
+
 from octobot_trading.personal_data.portfolios.history import historical_portfolio_value_manager
 from octobot_trading.personal_data.portfolios.history.historical_portfolio_value_manager import (
     HistoricalPortfolioValueManager,
@@ -32,5 +38,7 @@ from octobot_trading.personal_data.portfolios.history.historical_portfolio_value
 __all__ = [
     "create_historical_asset_value_from_dict_like_object",
     "HistoricalAssetValue",
+    "ColumnarHistoricalAssetValues",
+    "ColumnarHistoricalAssetValue",
     "HistoricalPortfolioValueManager",
 ]
@@ -0,0 +1,307 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import collections.abc
+import decimal
+import math
+import typing
+
+import numpy
+
+import octobot_trading.personal_data.portfolios.history.historical_asset_value as historical_asset_value
+
+
+class ColumnarHistoricalAssetValues(collections.abc.Mapping):
+    """
+    Columnar storage of historical asset values: timestamps and values of each currency are stored in float arrays
+    grown by chunks, missing values are stored as nan. Rows are sorted by timestamp.
+    Behaves like a SortedDict of timestamp: HistoricalAssetValue where values are views on their row.
+    Values are stored as float and returned as decimal.Decimal, as when historical values are loaded from storage.
+    """
+    CHUNK_SIZE = 4096
+
+    def __init__(self):
+        # rows are stored in [self._start_index:self._end_index] to avoid moving data when the oldest row is removed
+        self._timestamps: numpy.ndarray = numpy.empty(0, dtype=numpy.float64)
+        self._values_by_currency: dict[str, numpy.ndarray] = {}
+        self._start_index: int = 0
+        self._end_index: int = 0
+
+    def __len__(self):
+        return self._end_index - self._start_index
+
+    def __iter__(self):
+        return iter(self._get_timestamps().tolist())
+
+    def __contains__(self, timestamp):
+        return self._get_row_index(timestamp) is not None
+
+    def __getitem__(self, timestamp) -> "ColumnarHistoricalAssetValue":
+        if self._get_row_index(timestamp) is None:
+            raise KeyError(timestamp)
+        return ColumnarHistoricalAssetValue(self, timestamp)
+
+    def __setitem__(self, timestamp, value: historical_asset_value.HistoricalAssetValue):
+        value_by_currency = {currency: value.get(currency) for currency in value.get_currencies()}
+        if self and timestamp > self._timestamps[self._end_index - 1]:
+            # most values are added after the latest one
+            row_index = self._insert_row(timestamp, len(self))
+        elif (row_index := self._get_row_index(timestamp)) is None:
+            row_index = self._insert_row(timestamp, int(numpy.searchsorted(self._get_timestamps(), timestamp)))
+        else:
+            for column in self._values_by_currency.values():
+                column[row_index] = math.nan
+        self._set_row_values(row_index, value_by_currency)
+
+    def keys(self) -> numpy.ndarray:
+        """
+        :return: the sorted timestamps, as a view that is only valid until the next update
+        """
+        return self._get_timestamps()
+
+    def values(self) -> typing.Iterator["ColumnarHistoricalAssetValue"]:
+        return (ColumnarHistoricalAssetValue(self, timestamp) for timestamp in self)
+
+    def items(self) -> typing.Iterator[tuple[float, "ColumnarHistoricalAssetValue"]]:
+        return ((timestamp, ColumnarHistoricalAssetValue(self, timestamp)) for timestamp in self)
+
+    def index(self, timestamp) -> int:
+        if (row_index := self._get_row_index(timestamp)) is None:
+            raise ValueError(f"{timestamp} is not in {self.__class__.__name__}")
+        return row_index - self._start_index
+
+    def popitem(self, index=-1) -> tuple[float, historical_asset_value.HistoricalAssetValue]:
+        """
+        Removes the row at the given index
+        :return: the removed timestamp and its HistoricalAssetValue, which is not stored in columns anymore
+        """
+        if not self:
+            raise KeyError(f"{self.__class__.__name__} is empty")
+        row_index = (self._end_index if index < 0 else self._start_index) + index
+        if not self._start_index <= row_index < self._end_index:
+            raise IndexError(f"{self.__class__.__name__} index out of range")
+        timestamp = self._timestamps[row_index].item()
+        removed_value = historical_asset_value.HistoricalAssetValue(timestamp, self.get_values(timestamp))
+        if row_index == self._start_index:
+            self._start_index += 1
+        else:
+            for column in self._get_columns():
+                column[row_index:self._end_index - 1] = column[row_index + 1:self._end_index]
+            self._end_index -= 1
+        return timestamp, removed_value
+
+    def clear(self):
+        self.__init__()
+
+    def get_value(self, timestamp, currency) -> decimal.Decimal:
+        return decimal.Decimal(f"{self.get_float_value(timestamp, currency)}")
+
+    def get_float_value(self, timestamp, currency) -> float:
+        row_index = self._get_existing_row_index(timestamp)
+        try:
+            value = self._values_by_currency[currency][row_index].item()
+        except KeyError:
+            raise KeyError(currency)
+        if math.isnan(value):
+            raise KeyError(currency)
+        return value
+
+    def get_float_values(self, timestamp) -> dict[str, float]:
+        row_index = self._get_existing_row_index(timestamp)
+        return {
+            currency: value
+            for currency, column in self._values_by_currency.items()
+            if not math.isnan(value := column[row_index].item())
+        }
+
+    def get_values(self, timestamp) -> dict[str, decimal.Decimal]:
+        return {
+            currency: decimal.Decimal(f"{value}")
+            for currency, value in self.get_float_values(timestamp).items()
+        }
+
+    def update_values(self, timestamp, value_by_currency: dict):
+        self._set_row_values(self._get_existing_row_index(timestamp), value_by_currency)
+
+    def to_dicts(self) -> list[dict]:
+        """
+        :return: the HistoricalAssetValue.to_dict() values of each row, read directly from columns
+        """
+        currencies = list(self._values_by_currency)
+        rows_values = numpy.stack(
+            [column[self._start_index:self._end_index] for column in self._values_by_currency.values()], axis=1
+        ) if currencies else numpy.empty((len(self), 0))
+        return [
+            {
+                historical_asset_value.HistoricalAssetValue.TIMESTAMP_KEY: timestamp,
+                historical_asset_value.HistoricalAssetValue.VALUES_KEY: {
+                    currency: value
+                    for currency, value in zip(currencies, row_values)
+                    if not math.isnan(value)
+                } if has_missing_values else dict(zip(currencies, row_values))
+            }
+            for timestamp, row_values, has_missing_values in zip(
+                self._get_timestamps().tolist(),
+                rows_values.tolist(),
+                numpy.isnan(rows_values).any(axis=1).tolist()
+            )
+        ]
+
+    @classmethod
+    def from_dicts(cls, dict_values: list) -> "ColumnarHistoricalAssetValues":
+        """
+        :param dict_values: HistoricalAssetValue.to_dict() like values
+        :return: a ColumnarHistoricalAssetValues of the given values, without creating intermediary objects
+        """
+        historical_asset_values = cls()
+        sorted_dict_values = sorted(
+            dict_values, key=lambda element: element[historical_asset_value.HistoricalAssetValue.TIMESTAMP_KEY]
+        )
+        historical_asset_values._timestamps = numpy.array(
+            [element[historical_asset_value.HistoricalAssetValue.TIMESTAMP_KEY] for element in sorted_dict_values],
+            dtype=numpy.float64
+        )
+        historical_asset_values._end_index = len(historical_asset_values._timestamps)
+        for index, element in enumerate(sorted_dict_values):
+            historical_asset_values._set_row_values(
+                index, element[historical_asset_value.HistoricalAssetValue.VALUES_KEY]
+            )
+        return historical_asset_values
+
+    def save(self, file_path: str):
+        """
+        Saves rows in file_path as a numpy structured array: the timestamps field is followed by one field per currency
+        """
+        rows = numpy.empty(
+            len(self),
+            dtype=[(historical_asset_value.HistoricalAssetValue.TIMESTAMP_KEY, numpy.float64)] +
+                  [(currency, numpy.float64) for currency in self._values_by_currency]
+        )
+        for field, column in zip(rows.dtype.names, self._get_columns()):
+            rows[field] = column[self._start_index:self._end_index]
+        numpy.save(file_path, rows, allow_pickle=False)
+
+    @classmethod
+    def load(cls, file_path: str, memory_map=True) -> "ColumnarHistoricalAssetValues":
+        """
+        :param file_path: a file created by save()
+        :param memory_map: when True, the file is memory mapped in copy-on-write mode: rows are read from disk
+        when accessed and updates are never written to the file
+        :return: a ColumnarHistoricalAssetValues of the saved rows
+        """
+        rows = numpy.load(file_path, mmap_mode="c" if memory_map else None, allow_pickle=False)
+        historical_asset_values = cls()
+        timestamp_field, *currencies = rows.dtype.names
+        historical_asset_values._timestamps = rows[timestamp_field]
+        historical_asset_values._values_by_currency = {currency: rows[currency] for currency in currencies}
+        historical_asset_values._end_index = len(rows)
+        return historical_asset_values
+
+    def _get_timestamps(self) -> numpy.ndarray:
+        return self._timestamps[self._start_index:self._end_index]
+
+    def _get_columns(self) -> list[numpy.ndarray]:
+        return [self._timestamps, *self._values_by_currency.values()]
+
+    def _get_row_index(self, timestamp) -> typing.Optional[int]:
+        index = int(numpy.searchsorted(self._get_timestamps(), timestamp))
+        row_index = self._start_index + index
+        if row_index < self._end_index and self._timestamps[row_index] == timestamp:
+            return row_index
+        return None
+
+    def _get_existing_row_index(self, timestamp) -> int:
+        if (row_index := self._get_row_index(timestamp)) is None:
+            raise KeyError(timestamp)
+        return row_index
+
+    def _insert_row(self, timestamp, index) -> int:
+        if self._end_index == len(self._timestamps):
+            self._resize(len(self) + self.CHUNK_SIZE)
+        row_index = self._start_index + index
+        for column in self._get_columns():
+            if row_index < self._end_index:
+                column[row_index + 1:self._end_index + 1] = column[row_index:self._end_index]
+            column[row_index] = math.nan
+        self._timestamps[row_index] = timestamp
+        self._end_index += 1
+        return row_index
+
+    def _resize(self, capacity):
+        # also moves rows at the beginning of the new arrays
+        rows_count = len(self)
+        resized_columns = []
+        for column in self._get_columns():
+            resized_column = numpy.full(capacity, math.nan, dtype=numpy.float64)
+            resized_column[:rows_count] = column[self._start_index:self._end_index]
+            resized_columns.append(resized_column)
+        self._timestamps, *resized_values = resized_columns
+        self._values_by_currency = dict(zip(self._values_by_currency, resized_values))
+        self._start_index = 0
+        self._end_index = rows_count
+
+    def _set_row_values(self, row_index, value_by_currency: dict):
+        for currency, value in value_by_currency.items():
+            if currency not in self._values_by_currency:
+                self._values_by_currency[currency] = numpy.full(len(self._timestamps), math.nan, dtype=numpy.float64)
+            self._values_by_currency[currency][row_index] = float(value)
+
+
+class ColumnarHistoricalAssetValue(historical_asset_value.HistoricalAssetValue):
+    """
+    HistoricalAssetValue of a ColumnarHistoricalAssetValues row
+    """
+
+    def __init__(self, historical_asset_values: ColumnarHistoricalAssetValues, timestamp):
+        # values are stored in historical_asset_values columns: don't copy them in a value_by_currency dict
+        # pylint: disable=super-init-not-called
+        self._timestamp = timestamp
+        self._historical_asset_values: ColumnarHistoricalAssetValues = historical_asset_values
+
+    @property
+    def _value_by_currency(self):
+        return self._historical_asset_values.get_values(self._timestamp)
+
+    def __contains__(self, item):
+        return item in self._historical_asset_values.get_float_values(self._timestamp)
+
+    def get(self, currency):
+        return self._historical_asset_values.get_value(self._timestamp, currency)
+
+    def set(self, currency, value):
+        self._historical_asset_values.update_values(self._timestamp, {currency: value})
+
+    def update(self, value_by_currency):
+        # update exiting values and add new ones
+        float_value_by_currency = {currency: float(value) for currency, value in value_by_currency.items()}
+        if self._historical_asset_values.get_float_values(self._timestamp) == float_value_by_currency:
+            return False
+        self._historical_asset_values.update_values(self._timestamp, float_value_by_currency)
+        return True
+
+    def get_currencies(self):
+        return self._historical_asset_values.get_float_values(self._timestamp).keys()
+
+    def is_significant_change(self, currency, value):
+        stored_value = self._historical_asset_values.get_float_value(self._timestamp, currency)
+        if not stored_value:
+            return bool(value)
+        return abs(stored_value - float(value)) / stored_value >= self.SIGNIFICANT_VALUE_CHANGE_THRESHOLD
+
+    def to_dict(self):
+        return {
+            self.TIMESTAMP_KEY: self._timestamp,
+            self.VALUES_KEY: self._historical_asset_values.get_float_values(self._timestamp)
+        }
@@ -13,6 +13,7 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import itertools
 import time
 import typing
 
@@ -22,7 +23,6 @@ import copy
 import octobot_commons.logging as logging
 import octobot_commons.constants as commons_constants
 import octobot_commons.enums as commons_enums
-import octobot_commons.symbols as symbol_util
 
 import octobot_trading.util as util
 import octobot_trading.errors as errors
@@ -30,6 +30,8 @@ import octobot_trading.constants as constants
 import octobot_trading.personal_data.portfolios.portfolio_util as portfolio_util
 import octobot_trading.personal_data.portfolios.history.historical_asset_value as historical_asset_value
 import octobot_trading.personal_data.portfolios.history.historical_asset_value_factory as historical_asset_value_factory
+import octobot_trading.personal_data.portfolios.history.columnar_historical_asset_values as \
+    columnar_historical_asset_values
 import octobot_trading.personal_data.portfolios
 
 
@@ -79,7 +81,13 @@ class HistoricalPortfolioValueManager(util.Initializable):
         self.ending_portfolio: typing.Optional[dict[str, float]] = None
 
         self.max_history_size: int = self.__class__.MAX_HISTORY_SIZE
-        self.historical_portfolio_value: dict[float, historical_asset_value.HistoricalAssetValue] = sortedcontainers.SortedDict()
+        # when True, historical values are stored in a ColumnarHistoricalAssetValues
+        self.use_columnar_history: bool = constants.ENABLE_COLUMNAR_PORTFOLIO_HISTORY
+        self.historical_portfolio_value: dict[float, historical_asset_value.HistoricalAssetValue] = \
+            self._create_historical_portfolio_value()
+        # (currency, time_frame): SortedDict of relevant timestamps and their value in currency, None when currency is
+        # not in the historical value. Created on first query and updated when historical values are added.
+        self._downsampled_values: dict[tuple[str, commons_enums.TimeFrames], sortedcontainers.SortedDict] = {}
 
     async def initialize_impl(self):
         """
@@ -94,7 +102,8 @@ class HistoricalPortfolioValueManager(util.Initializable):
         self.last_update_time = self.starting_time
         self.starting_portfolio = None
         self.ending_portfolio = None
-        self.historical_portfolio_value = sortedcontainers.SortedDict()
+        self.historical_portfolio_value = self._create_historical_portfolio_value()
+        self._downsampled_values = {}
         # reset uploaded portfolio history
         await self.save_historical_portfolio_value(reset=True)
 
@@ -158,23 +167,18 @@ class HistoricalPortfolioValueManager(util.Initializable):
         :param to_timestamp: selected time window end time
         """
         to_timestamp = to_timestamp or self.portfolio_manager.exchange_manager.exchange.get_exchange_current_time()
-        time_frame_seconds = commons_enums.TimeFramesMinutes[time_frame] * commons_constants.MINUTE_TO_SECONDS
-        sorted_available_timestamps = list(self.historical_portfolio_value)
-        relevant_historical_values = [
-            value
-            for timestamp, value in self.historical_portfolio_value.items()
-            if self._is_historical_timestamp_relevant(
-                timestamp, time_frame_seconds, from_timestamp, to_timestamp, sorted_available_timestamps
-            )
-        ]
+        downsampled_values = self._get_downsampled_values(currency, time_frame)
         historical_values = {}
-        for historical_value in relevant_historical_values:
-            try:
-                historical_values[historical_value.get_timestamp()] = \
-                    self._get_value_in_currency(historical_value, currency)
-            except errors.MissingPriceDataError as e:
-                # do not add missing historical values
-                self.logger.debug(f"Missing price data when computing historical portfolio value: {e}")
+        for timestamp in downsampled_values.irange(from_timestamp or 0, to_timestamp or time.time()):
+            value = downsampled_values[timestamp]
+            if value is None:
+                try:
+                    value = self._convert_historical_value(self.historical_portfolio_value[timestamp], currency)
+                except errors.MissingPriceDataError as e:
+                    # do not add missing historical values
+                    self.logger.debug(f"Missing price data when computing historical portfolio value: {e}")
+                    continue
+            historical_values[timestamp] = value
         return historical_values
 
     def get_historical_value(self, timestamp):
@@ -184,7 +188,9 @@ class HistoricalPortfolioValueManager(util.Initializable):
         changed = False
         for timestamp in timestamps:
             try:
-                changed = self.get_historical_value(timestamp).update(value_by_currency) or changed
+                if self.get_historical_value(timestamp).update(value_by_currency):
+                    self._update_downsampled_values(timestamp)
+                    changed = True
             except KeyError:
                 self._add_historical_portfolio_value(timestamp, value_by_currency)
                 changed = True
@@ -199,9 +205,61 @@ class HistoricalPortfolioValueManager(util.Initializable):
                 f"has been reached"
             )
             # remove the oldest element
-            self.historical_portfolio_value.popitem(0)
+            oldest_timestamp, _ = self.historical_portfolio_value.popitem(0)
+            for downsampled_values in self._downsampled_values.values():
+                downsampled_values.pop(oldest_timestamp, None)
+            if self.historical_portfolio_value:
+                # the new oldest element has no previous timestamp anymore
+                self._update_downsampled_values(self.historical_portfolio_value.keys()[0])
         self.historical_portfolio_value[timestamp] = \
             historical_asset_value.HistoricalAssetValue(timestamp, value_by_currency)
+        # adding timestamp can change the relevancy of its neighbors
+        self._update_downsampled_values(timestamp, include_neighbors=True)
+
+    def _get_downsampled_values(self, currency, time_frame):
+        try:
+            return self._downsampled_values[(currency, time_frame)]
+        except KeyError:
+            time_frame_seconds = commons_enums.TimeFramesMinutes[time_frame] * commons_constants.MINUTE_TO_SECONDS
+            timestamps = self.historical_portfolio_value.keys()
+            downsampled_values = sortedcontainers.SortedDict({
+                timestamp: self._get_downsampled_value(self.historical_portfolio_value[timestamp], currency)
+                for previous_timestamp, timestamp, next_timestamp in zip(
+                    itertools.chain((0, ), timestamps),
+                    timestamps,
+                    itertools.chain(itertools.islice(timestamps, 1, None), (None, ))
+                )
+                if self._is_timestamp_relevant(timestamp, time_frame_seconds, previous_timestamp, next_timestamp)
+            })
+            self._downsampled_values[(currency, time_frame)] = downsampled_values
+            return downsampled_values
+
+    def _update_downsampled_values(self, timestamp, include_neighbors=False):
+        if not self._downsampled_values or not self.historical_portfolio_value:
+            return
+        timestamps = self.historical_portfolio_value.keys()
+        timestamp_index = self.historical_portfolio_value.index(timestamp)
+        updated_indexes = range(
+            max(timestamp_index - 1, 0), min(timestamp_index + 2, len(timestamps))
+        ) if include_neighbors else (timestamp_index, )
+        for index in updated_indexes:
+            updated_timestamp = timestamps[index]
+            previous_timestamp = timestamps[index - 1] if index > 0 else 0
+            next_timestamp = timestamps[index + 1] if index < len(timestamps) - 1 else None
+            historical_value = self.historical_portfolio_value[updated_timestamp]
+            for (currency, time_frame), downsampled_values in self._downsampled_values.items():
+                time_frame_seconds = commons_enums.TimeFramesMinutes[time_frame] * commons_constants.MINUTE_TO_SECONDS
+                if self._is_timestamp_relevant(
+                    updated_timestamp, time_frame_seconds, previous_timestamp, next_timestamp
+                ):
+                    downsampled_values[updated_timestamp] = self._get_downsampled_value(historical_value, currency)
+                else:
+                    downsampled_values.pop(updated_timestamp, None)
+
+    @staticmethod
+    def _get_downsampled_value(historical_value, currency):
+        # None values are converted from other currencies when queried as conversion depends on current prices
+        return historical_value.get(currency) if currency in historical_value else None
 
     def _update_portfolios(self):
         if self.portfolio_manager.portfolio is None or self.portfolio_manager.portfolio.portfolio is None:
@@ -236,14 +294,48 @@ class HistoricalPortfolioValueManager(util.Initializable):
         except Exception as err:
             self.logger.exception(err, True, f"Error when ready portfolio history: {err}")
 
+    def _create_historical_portfolio_value(self):
+        if self.use_columnar_history:
+            return columnar_historical_asset_values.ColumnarHistoricalAssetValues()
+        return sortedcontainers.SortedDict()
+
     def _load_historical_values(self, dict_values):
-        self.historical_portfolio_value = sortedcontainers.SortedDict({
-            element[historical_asset_value.HistoricalAssetValue.TIMESTAMP_KEY]:
-                historical_asset_value_factory.create_historical_asset_value_from_dict_like_object(
-                    historical_asset_value.HistoricalAssetValue, element
-                )
-            for element in dict_values
-        })
+        if self.use_columnar_history:
+            self.historical_portfolio_value = \
+                columnar_historical_asset_values.ColumnarHistoricalAssetValues.from_dicts(dict_values)
+        else:
+            self.historical_portfolio_value = sortedcontainers.SortedDict({
+                element[historical_asset_value.HistoricalAssetValue.TIMESTAMP_KEY]:
+                    historical_asset_value_factory.create_historical_asset_value_from_dict_like_object(
+                        historical_asset_value.HistoricalAssetValue, element
+                    )
+                for element in dict_values
+            })
+        self._downsampled_values = {}
+        self._load_historical_starting_portfolio_values()
+
+    def save_historical_values_file(self, file_path):
+        """
+        Saves historical values in file_path, to be memory mapped by load_historical_values_file
+        """
+        if self.use_columnar_history:
+            self.historical_portfolio_value.save(file_path)
+        else:
+            columnar_historical_asset_values.ColumnarHistoricalAssetValues.from_dicts(
+                self.get_dict_historical_values()
+            ).save(file_path)
+
+    def load_historical_values_file(self, file_path, memory_map=True):
+        """
+        Replaces historical values by the ones saved in file_path by save_historical_values_file, values are
+        then stored in a ColumnarHistoricalAssetValues
+        :param memory_map: when True, rows are read from the file when accessed instead of being loaded in memory
+        """
+        self.use_columnar_history = True
+        self.historical_portfolio_value = columnar_historical_asset_values.ColumnarHistoricalAssetValues.load(
+            file_path, memory_map=memory_map
+        )
+        self._downsampled_values = {}
         self._load_historical_starting_portfolio_values()
 
     def _load_metadata(self, metadata_list):
@@ -261,33 +353,20 @@ class HistoricalPortfolioValueManager(util.Initializable):
                 if currency not in self.historical_starting_portfolio_values:
                     self.historical_starting_portfolio_values[currency] = value.get(currency)
 
-    def _is_historical_timestamp_relevant(
-        self, timestamp, time_frame_seconds, from_timestamp, to_timestamp, sorted_available_timestamps: list
-    ):
-        from_timestamp = from_timestamp or 0
-        to_timestamp = to_timestamp or time.time()
-        return self._is_timestamp_relevant(timestamp, time_frame_seconds, sorted_available_timestamps) and \
-           from_timestamp <= timestamp <= to_timestamp
-
     @staticmethod
-    def _is_timestamp_relevant(timestamp, time_frame_seconds, sorted_available_timestamps: list):
+    def _is_timestamp_relevant(timestamp, time_frame_seconds, previous_timestamp, next_timestamp):
+        """
+        :param previous_timestamp: the previous available timestamp, 0 when timestamp is the first one
+        :param next_timestamp: the next available timestamp, None when timestamp is the last one
+        """
         if timestamp % time_frame_seconds == 0:
             # timestamp is expected at this time
             return True
         else:
             # timestamp is relevant only if there is no other available timestamp within the given timeframe range
-            current_timestamp_index = sorted_available_timestamps.index(timestamp)
             allowed_delta = time_frame_seconds / 2
-            previous_timestamp = (
-                sorted_available_timestamps[current_timestamp_index - 1]
-                if current_timestamp_index > 0
-                else 0
-            )
-            next_timestamp = (
-                sorted_available_timestamps[current_timestamp_index + 1]
-                if current_timestamp_index < len(sorted_available_timestamps) - 1
-                else (timestamp + allowed_delta)
-            )
+            if next_timestamp is None:
+                next_timestamp = timestamp + allowed_delta
             return previous_timestamp + allowed_delta <= timestamp <= next_timestamp - allowed_delta
 
     @staticmethod
@@ -326,12 +405,6 @@ class HistoricalPortfolioValueManager(util.Initializable):
             return True
         return False
 
-    def _get_value_in_currency(self, historical_value, currency):
-        try:
-            return historical_value.get(currency)
-        except KeyError:
-            return self._convert_historical_value(historical_value, currency)
-
     def _convert_historical_value(self, historical_value, target_currency):
         # TODO try to get a more accurate historical value into target_currency currency using price history
         # last chance: try to get any usable value from portfolio value holder (not accurate since used the intermediary
@@ -339,13 +412,13 @@ class HistoricalPortfolioValueManager(util.Initializable):
         for currency in historical_value.get_currencies():
             quantity = historical_value.get(currency)
             # 1. try from pairs with price
-            for pair in self.portfolio_manager.portfolio_value_holder.value_converter.last_prices_by_trading_pair:
-                base_and_quote = symbol_util.parse_symbol(pair).base_and_quote()
-                if currency in base_and_quote and target_currency in base_and_quote:
-                    return self.portfolio_manager.portfolio_value_holder.value_converter\
-                        .convert_currency_value_using_last_prices(
-                            historical_value.get(currency), currency, target_currency
-                        )
+            if self.portfolio_manager.portfolio_value_holder.value_converter.has_last_price_symbol(
+                currency, target_currency
+            ):
+                return self.portfolio_manager.portfolio_value_holder.value_converter\
+                    .convert_currency_value_using_last_prices(
+                        historical_value.get(currency), currency, target_currency
+                    )
             # 2. try from existing indirect pairs
             try:
                 value = self.portfolio_manager.portfolio_value_holder.value_converter.\
@@ -359,6 +432,8 @@ class HistoricalPortfolioValueManager(util.Initializable):
         raise errors.MissingPriceDataError(f"no price data to evaluate {historical_value} on {target_currency}")
 
     def get_dict_historical_values(self):
+        if self.use_columnar_history:
+            return self.historical_portfolio_value.to_dicts()
         return [historical_asset.to_dict() for historical_asset in self.historical_portfolio_value.values()]
 
     def get_metadata(self):
@@ -16,7 +16,6 @@
 import copy
 import decimal
 import typing
-import itertools
 import math
 import asyncio
 import time
@@ -29,9 +28,11 @@ import octobot_trading.personal_data.orders.order as order_import
 import octobot_trading.personal_data.orders.order_util as order_util
 import octobot_trading.personal_data.portfolios.sub_portfolio_data as sub_portfolio_data
 import octobot_trading.personal_data.portfolios.resolved_orders_portfolio_delta as resolved_orders_portfolio_delta
+import octobot_trading.personal_data.portfolios.unknown_orders_combinations as unknown_orders_combinations
 import octobot_trading.constants as constants
 import octobot_trading.enums as enums
 import octobot_trading.errors as errors
+import octobot_trading.util as util
 
 import octobot_commons.constants as commons_constants
 import octobot_commons.logging as commons_logging
@@ -49,14 +50,15 @@ def parse_decimal_portfolio(portfolio, as_decimal=True):
             portfolio_to_fill = decimal_portfolio[symbol]
             for balance_type, balance_val in symbol_balance.items():
                 if isinstance(balance_val, (int, float, decimal.Decimal)):
-                    portfolio_to_fill[balance_type] = decimal.Decimal(str(balance_val)) \
-                        if as_decimal else float(balance_val)
                     # convert negative values to zero, as this can happen 
                     # (ex: bingx: 'SSV': {'free': -7e-07, 'total': -7e-07})
-                    if as_decimal and balance_val < constants.ZERO:
-                        portfolio_to_fill[balance_type] = constants.ZERO
-                    elif not as_decimal and balance_val < 0:
-                        portfolio_to_fill[balance_type] = 0
+                    if as_decimal:
+                        # compare decimal.Decimal values: comparing float and decimal.Decimal is much slower
+                        decimal_val = util.to_decimal(balance_val)
+                        portfolio_to_fill[balance_type] = constants.ZERO if decimal_val < constants.ZERO \
+                            else decimal_val
+                    else:
+                        portfolio_to_fill[balance_type] = 0 if balance_val < 0 else float(balance_val)
     return decimal_portfolio
 
 
@@ -765,9 +767,26 @@ async def _compute_most_probable_assets_deltas_from_orders_considering_unknown_o
     )
     
     compute_forecasted_fees = False # don't compute forecasted fees as it will 10x the time to compute the deltas
+    orders_combinations = unknown_orders_combinations.UnknownOrdersCombinations(
+        unknown_filled_or_cancelled_orders, ignored_filled_quantity_per_order_exchange_id,
+        post_filled_orders_portfolio_asset_deltas, not compute_forecasted_fees
+    )
+    # orders unrelated to portfolio deltas are never part of combinations: skipped orders counts can have
+    # few enough actual combinations to be checked
+    secondary_check_orders_to_fill_counts.extend(
+        orders_to_fill_count
+        for orders_to_fill_count, _ in skipped_combinations
+        if orders_combinations.get_combinations_count(orders_to_fill_count)
+        <= constants.MAX_ORDER_SECONDARY_INFERENCE_COMBINATIONS_COUNT
+    )
+    skipped_combinations = [
+        (orders_to_fill_count, combinations_count)
+        for orders_to_fill_count, combinations_count in skipped_combinations
+        if orders_to_fill_count not in secondary_check_orders_to_fill_counts
+    ]
     best_inferred_resolved_delta = _compute_most_probable_assets_deltas_from_orders_considering_unknown_orders_after_filled_orders_deltas(
         quick_check_orders_to_fill_counts, 
-        unknown_filled_or_cancelled_orders, ignored_filled_quantity_per_order_exchange_id, 
+        orders_combinations, ignored_filled_quantity_per_order_exchange_id, 
         compute_forecasted_fees, post_filled_orders_portfolio_asset_deltas, known_filled_orders_resolved_delta, 
         portfolios_asset_deltas, best_inferred_resolved_delta, None
     )
@@ -818,7 +837,7 @@ async def _compute_most_probable_assets_deltas_from_orders_considering_unknown_o
             best_inferred_resolved_delta = await asyncio.to_thread(    
                 _compute_most_probable_assets_deltas_from_orders_considering_unknown_orders_after_filled_orders_deltas,
                 secondary_check_orders_to_fill_counts, 
-                unknown_filled_or_cancelled_orders, ignored_filled_quantity_per_order_exchange_id, 
+                orders_combinations, ignored_filled_quantity_per_order_exchange_id, 
                 compute_forecasted_fees, post_filled_orders_portfolio_asset_deltas, known_filled_orders_resolved_delta, 
                 portfolios_asset_deltas, best_inferred_resolved_delta, cancelled_event
             )
@@ -842,7 +861,7 @@ async def _compute_most_probable_assets_deltas_from_orders_considering_unknown_o
 
 def _compute_most_probable_assets_deltas_from_orders_considering_unknown_orders_after_filled_orders_deltas(
     sorted_orders_to_fill_counts: typing.Iterable[int],
-    unknown_filled_or_cancelled_orders: list[order_import.Order],
+    orders_combinations: unknown_orders_combinations.UnknownOrdersCombinations,
     ignored_filled_quantity_per_order_exchange_id: dict[str, decimal.Decimal],
     compute_forecasted_fees: bool,
     post_filled_orders_portfolio_asset_deltas: dict[str, dict[str, decimal.Decimal]],
@@ -852,8 +871,9 @@ def _compute_most_probable_assets_deltas_from_orders_considering_unknown_orders_
     cancelled_event: typing.Optional[threading.Event],
 ) -> resolved_orders_portfolio_delta.ResolvedOrdersPortoflioDelta:
     last_sleep_time = time.time()
+    unknown_filled_or_cancelled_orders = orders_combinations.unknown_orders
     for orders_to_fill_count in sorted_orders_to_fill_counts:
-        for filled_orders_combination in itertools.combinations(unknown_filled_or_cancelled_orders, orders_to_fill_count):
+        for filled_orders_indexes in orders_combinations.iterate_combinations(orders_to_fill_count):
             if cancelled_event:
                 if time.time() - last_sleep_time > constants.MAX_ORDER_INFERENCE_ITERATIONS_DURATION:
                     # If cancelled_event is set, this is running in a thread. As this function requires a lot of CPU, force 
@@ -864,13 +884,21 @@ def _compute_most_probable_assets_deltas_from_orders_considering_unknown_orders_
                 if cancelled_event.is_set():
                     # cancelled, complete function immediately
                     return best_inferred_resolved_delta
-            potential_filled_orders_combination = list(filled_orders_combination)
-            (
-                orders_asset_deltas, expected_fee_related_deltas, possible_fees_asset_deltas, counted_exchange_fee_deltas
-            ) = get_assets_delta_from_orders(
-                potential_filled_orders_combination, ignored_filled_quantity_per_order_exchange_id, 
-                compute_forecasted_fees, force_fully_filled_orders=True
-            )
+            potential_filled_orders_combination = orders_combinations.get_orders(filled_orders_indexes)
+            if compute_forecasted_fees:
+                (
+                    orders_asset_deltas, expected_fee_related_deltas, possible_fees_asset_deltas,
+                    counted_exchange_fee_deltas
+                ) = get_assets_delta_from_orders(
+                    potential_filled_orders_combination, ignored_filled_quantity_per_order_exchange_id, 
+                    compute_forecasted_fees, force_fully_filled_orders=True
+                )
+            else:
+                # same deltas as get_assets_delta_from_orders, from precomputed orders deltas
+                (
+                    orders_asset_deltas, expected_fee_related_deltas, possible_fees_asset_deltas,
+                    counted_exchange_fee_deltas
+                ) = orders_combinations.get_assets_deltas(filled_orders_indexes)
             if any(
                 asset_name not in post_filled_orders_portfolio_asset_deltas
                 for asset_name in orders_asset_deltas
@@ -0,0 +1,169 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import decimal
+
+import octobot_commons.symbols as symbol_util
+
+import octobot_trading.constants as constants
+import octobot_trading.errors as errors
+import octobot_trading.personal_data.portfolios.value_converter as value_converter_import
+
+
+class PortfolioValuation:
+    """
+    PortfolioValuation incrementally values assets in target_currency.
+    Each asset unit value is stored with the symbols its conversion used: a symbol price update only re-evaluates
+    the assets depending on this symbol. Values of holdings registered as HoldingsValuation are then updated
+    using the re-evaluated unit values.
+    """
+
+    def __init__(self, value_converter, target_currency, synced_unit_values=None):
+        self.value_converter: value_converter_import.ValueConverter = value_converter
+        self.target_currency: str = target_currency
+        # currency: value of one unit of currency in target_currency, ZERO when it can't be valued
+        self.unit_values: dict[str, decimal.Decimal] = {}
+        # when set, also updated with each new unit value
+        self.synced_unit_values: dict[str, decimal.Decimal] = synced_unit_values
+        self.holdings_valuations: list[HoldingsValuation] = []
+        # dependency edges: symbol: currencies which unit values are using this symbol price and the reverse
+        self._currencies_by_symbol: dict[str, set[str]] = {}
+        self._symbols_by_currency: dict[str, set[str]] = {}
+        self._priced_symbols: set[str] = set()
+
+    def add_currency(self, currency, init_price_fetchers=True):
+        """
+        Evaluates currency unit value when not already evaluated
+        """
+        if currency not in self.unit_values:
+            self._evaluate_unit_value(currency, init_price_fetchers)
+
+    def on_price_update(self, symbol):
+        """
+        Re-evaluates the unit value of currencies depending on symbol price. When symbol is a new priced symbol,
+        also re-evaluates the currencies that might be valued from a different conversion, including currencies
+        without value.
+        """
+        if symbol in self._priced_symbols:
+            updated_currencies = self._currencies_by_symbol.get(symbol, ())
+        else:
+            self._priced_symbols.add(symbol)
+            symbol_currencies = symbol_util.parse_symbol(symbol).base_and_quote()
+            updated_currencies = [
+                currency
+                for currency, unit_value in self.unit_values.items()
+                if currency != self.target_currency and (
+                    not unit_value
+                    or len(self._symbols_by_currency[currency]) > 1
+                    or currency in symbol_currencies
+                )
+            ]
+        for currency in list(updated_currencies):
+            self._evaluate_unit_value(currency, False)
+
+    def clear(self):
+        self.unit_values = {}
+        self._currencies_by_symbol = {}
+        self._symbols_by_currency = {}
+        self._priced_symbols = set()
+        for holdings_valuation in self.holdings_valuations:
+            holdings_valuation.clear()
+
+    def _evaluate_unit_value(self, currency, init_price_fetchers):
+        with self.value_converter.recorded_price_symbols() as price_symbols:
+            try:
+                unit_value = self.value_converter.evaluate_value(
+                    currency, constants.ONE, target_currency=self.target_currency,
+                    init_price_fetchers=init_price_fetchers
+                )
+            except errors.MissingPriceDataError:
+                unit_value = constants.ZERO
+        for removed_symbol in self._symbols_by_currency.get(currency, set()).difference(price_symbols):
+            self._currencies_by_symbol[removed_symbol].discard(currency)
+        for symbol in price_symbols:
+            self._currencies_by_symbol.setdefault(symbol, set()).add(currency)
+        self._symbols_by_currency[currency] = price_symbols
+        if self.unit_values.get(currency) != unit_value:
+            self.unit_values[currency] = unit_value
+            if self.synced_unit_values is not None:
+                self.synced_unit_values[currency] = unit_value
+            for holdings_valuation in self.holdings_valuations:
+                holdings_valuation.on_unit_value_update(currency, unit_value)
+
+
+class HoldingsValuation:
+    """
+    HoldingsValuation values holdings in its PortfolioValuation target_currency.
+    Each currency holdings value is stored as its contribution to total_value, which is updated when holdings
+    or unit values change.
+    """
+
+    def __init__(self, portfolio_valuation: PortfolioValuation):
+        self.portfolio_valuation: PortfolioValuation = portfolio_valuation
+        self.total_value: decimal.Decimal = constants.ZERO
+        self._holdings: dict[str, decimal.Decimal] = {}
+        self._holdings_values: dict[str, decimal.Decimal] = {}
+        portfolio_valuation.holdings_valuations.append(self)
+
+    def get_holdings_value(self, currency) -> decimal.Decimal:
+        return self._holdings_values.get(currency, constants.ZERO)
+
+    def sync_holdings(self, portfolio, init_price_fetchers=True, valued_currencies=()):
+        """
+        Updates values of the holdings that changed since the last call
+        :param portfolio: the currency: Asset dict to value
+        :param init_price_fetchers: When True, can init price using fetchers
+        :param valued_currencies: currencies to value even when their holdings are zero
+        """
+        for currency, asset in portfolio.items():
+            # decimal.Decimal are immutable: updated holdings are different instances
+            if self._holdings.get(currency) is not asset.total or (
+                currency in valued_currencies and currency not in self.portfolio_valuation.unit_values
+            ):
+                self.update_holdings(
+                    currency, asset.total, init_price_fetchers=init_price_fetchers,
+                    force_valuation=currency in valued_currencies
+                )
+        if len(self._holdings) > len(portfolio):
+            for currency in [currency for currency in self._holdings if currency not in portfolio]:
+                self.remove_holdings(currency)
+
+    def update_holdings(self, currency, quantity, init_price_fetchers=True, force_valuation=False):
+        """
+        :param force_valuation: when True, currency unit value is evaluated even when quantity is zero
+        """
+        self._holdings[currency] = quantity
+        holdings_value = constants.ZERO
+        if quantity or force_valuation:
+            self.portfolio_valuation.add_currency(currency, init_price_fetchers=init_price_fetchers)
+            holdings_value = self.portfolio_valuation.unit_values[currency] * quantity
+        self._update_holdings_value(currency, holdings_value)
+
+    def remove_holdings(self, currency):
+        self._holdings.pop(currency, None)
+        self.total_value -= self._holdings_values.pop(currency, constants.ZERO)
+
+    def on_unit_value_update(self, currency, unit_value):
+        if self._holdings.get(currency):
+            self._update_holdings_value(currency, unit_value * self._holdings[currency])
+
+    def clear(self):
+        self.total_value = constants.ZERO
+        self._holdings = {}
+        self._holdings_values = {}
+
+    def _update_holdings_value(self, currency, holdings_value):
+        self.total_value += holdings_value - self._holdings_values.get(currency, constants.ZERO)
+        self._holdings_values[currency] = holdings_value
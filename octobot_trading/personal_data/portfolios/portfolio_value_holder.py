@@ -24,6 +24,7 @@ import octobot_trading.constants as constants
 import octobot_trading.errors as errors
 import octobot_trading.enums as enums
 import octobot_trading.personal_data.portfolios.value_converter as value_converter
+import octobot_trading.personal_data.portfolios.portfolio_valuation as portfolio_valuation
 import octobot_trading.personal_data.portfolios
 
 
@@ -48,6 +49,12 @@ class PortfolioValueHolder:
         self.origin_crypto_currencies_values: dict[str, decimal.Decimal] = {}
         self.current_crypto_currencies_values: dict[str, decimal.Decimal] = {}
 
+        # when True, current and origin portfolio values are incrementally updated by a PortfolioValuation
+        self.use_incremental_valuation: bool = constants.ENABLE_INCREMENTAL_PORTFOLIO_VALUATION
+        self.portfolio_valuation: typing.Optional[portfolio_valuation.PortfolioValuation] = None
+        self._current_holdings_valuation: typing.Optional[portfolio_valuation.HoldingsValuation] = None
+        self._origin_holdings_valuation: typing.Optional[portfolio_valuation.HoldingsValuation] = None
+
     def reset_portfolio_values(self):
         self.portfolio_origin_value = constants.ZERO
         self.portfolio_current_value = constants.ZERO
@@ -56,6 +63,7 @@ class PortfolioValueHolder:
 
         self.origin_crypto_currencies_values = {}
         self.current_crypto_currencies_values = {}
+        self.portfolio_valuation = None
 
     def update_origin_crypto_currencies_values(self, symbol, mark_price):
         """
@@ -80,6 +88,8 @@ class PortfolioValueHolder:
             )
         )
         self.value_converter.update_last_price(symbol, mark_price)
+        if self.use_incremental_valuation:
+            self._get_portfolio_valuation().on_price_update(symbol)
         if origin_currencies_should_be_updated:
             # Will fail if symbol doesn't have a price in
             # self.origin_crypto_currencies_values and therefore
@@ -184,6 +194,10 @@ class PortfolioValueHolder:
             self.current_crypto_currencies_values.update(
                 self._evaluate_config_crypto_currencies_and_portfolio_values(self.origin_portfolio.portfolio)
             )
+        elif self.use_incremental_valuation:
+            self._get_portfolio_valuation()
+            self._origin_holdings_valuation.sync_holdings(self.origin_portfolio.portfolio)
+            return self._origin_holdings_valuation.total_value
         return self._update_portfolio_current_value(
             self.origin_portfolio.portfolio, currencies_values=self.current_crypto_currencies_values
         )
@@ -253,10 +267,44 @@ class PortfolioValueHolder:
         :param init_price_fetchers: When True, can init price using fetchers
         Update the portfolio current value with the current portfolio instance
         """
+        if self.use_incremental_valuation:
+            self.portfolio_current_value = self._sync_incremental_portfolio_current_value(init_price_fetchers)
+            return
         self.portfolio_current_value = self._update_portfolio_current_value(
             self.portfolio_manager.portfolio.portfolio, init_price_fetchers=init_price_fetchers
         )
 
+    def _get_portfolio_valuation(self) -> portfolio_valuation.PortfolioValuation:
+        if self.portfolio_valuation is None \
+           or self.portfolio_valuation.target_currency != self.portfolio_manager.reference_market:
+            self.portfolio_valuation = portfolio_valuation.PortfolioValuation(
+                self.value_converter, self.portfolio_manager.reference_market,
+                synced_unit_values=self.current_crypto_currencies_values
+            )
+            self._current_holdings_valuation = portfolio_valuation.HoldingsValuation(self.portfolio_valuation)
+            self._origin_holdings_valuation = portfolio_valuation.HoldingsValuation(self.portfolio_valuation)
+        return self.portfolio_valuation
+
+    def _sync_incremental_portfolio_current_value(self, init_price_fetchers) -> decimal.Decimal:
+        """
+        Only values the updated holdings: prices updates are handled by update_origin_crypto_currencies_values
+        :return: the current portfolio value
+        """
+        valuation = self._get_portfolio_valuation()
+        traded_symbols = self.portfolio_manager.exchange_manager.exchange_config.traded_symbols
+        if traded_symbols:
+            # also value the 1st traded symbol currencies as in _evaluate_config_currencies_values
+            for currency in traded_symbols[0].base_and_quote():
+                valuation.add_currency(currency, init_price_fetchers=init_price_fetchers)
+        self._current_holdings_valuation.sync_holdings(
+            self.portfolio_manager.portfolio.portfolio, init_price_fetchers=init_price_fetchers,
+            valued_currencies=self.portfolio_manager.portfolio_profitability.valuated_currencies
+        )
+        if len(self.current_crypto_currencies_values) > len(self.origin_crypto_currencies_values):
+            # add any missing value to origin_crypto_currencies_values (can happen with indirect valuations)
+            self._fill_currencies_values(self.origin_crypto_currencies_values)
+        return self._current_holdings_valuation.total_value
+
     def _recompute_origin_portfolio_initial_value(self):
         """
         Compute origin portfolio initial value and update portfolio_origin_value
@@ -0,0 +1,216 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import decimal
+import itertools
+import math
+import typing
+
+import numpy
+
+import octobot_commons.constants as commons_constants
+import octobot_commons.logging as commons_logging
+import octobot_commons.symbols as symbol_util
+
+import octobot_trading.constants as constants
+import octobot_trading.enums as enums
+import octobot_trading.personal_data.orders.order as order_import
+
+
+class UnknownOrdersCombinations:
+    """
+    Selects the combinations of unknown orders that might explain portfolio deltas when considered as filled.
+    Selected combinations are the ones of itertools.combinations(unknown_orders, orders_count), in the same order,
+    without the ones that can't add any explanation to portfolio deltas:
+    1. orders trading assets that are not in portfolio deltas (and can't be fees only deltas) are never selected
+    2. when screen_combinations is True, combinations are pre-screened by chunks using float asset deltas: the
+    ones that can't explain any portfolio delta are skipped. Should only be used when forecasted fees are not
+    computed as they make deltas explainable in other ways.
+    """
+    SCREENED_COMBINATIONS_CHUNK_SIZE = 10000
+    # relative margin on float deltas: float sums can't be further from Decimal sums
+    SCREENING_TOLERANCE = 1e-9
+
+    def __init__(
+        self,
+        unknown_orders: list[order_import.Order],
+        ignored_filled_quantity_per_order_exchange_id: dict[str, decimal.Decimal],
+        portfolio_asset_deltas: dict[str, dict[str, decimal.Decimal]],
+        screen_combinations: bool,
+    ):
+        self.unknown_orders: list[order_import.Order] = unknown_orders
+        self.screen_combinations: bool = screen_combinations
+        # (asset, delta) of each order, in get_assets_delta_from_orders order
+        self._assets_deltas_by_order: list[list[tuple[str, decimal.Decimal]]] = []
+        self._exchange_fees_deltas_by_order: list[list[tuple[str, decimal.Decimal]]] = []
+        self._init_orders_deltas(ignored_filled_quantity_per_order_exchange_id)
+        # indexes of the orders that can be part of a selected combination
+        self.candidate_orders_indexes: list[int] = self._get_candidate_orders_indexes(portfolio_asset_deltas)
+        self._screened_asset_deltas: numpy.ndarray = None
+        self._screened_asset_presence: numpy.ndarray = None
+        self._screened_asset_max_deltas: numpy.ndarray = None
+        self._screened_asset_tolerances: numpy.ndarray = None
+        if self.screen_combinations:
+            self._init_screening(portfolio_asset_deltas)
+
+    def get_combinations_count(self, orders_count: int) -> int:
+        """
+        :return: the number of combinations of orders_count candidate orders, before screening
+        """
+        return math.comb(len(self.candidate_orders_indexes), orders_count)
+
+    def get_orders(self, orders_indexes: tuple[int, ...]) -> list[order_import.Order]:
+        return [self.unknown_orders[index] for index in orders_indexes]
+
+    def get_assets_deltas(
+        self, orders_indexes: tuple[int, ...]
+    ) -> tuple[
+        dict[str, decimal.Decimal], dict[str, decimal.Decimal], dict[str, decimal.Decimal], dict[str, decimal.Decimal]
+    ]:
+        """
+        :return: the same deltas as get_assets_delta_from_orders(orders, ignored_filled_quantity_per_order_exchange_id,
+        False, force_fully_filled_orders=True) from precomputed orders deltas
+        """
+        asset_deltas = {}
+        counted_exchange_fee_deltas = {}
+        for index in orders_indexes:
+            for asset_name, delta in self._assets_deltas_by_order[index]:
+                if asset_name in asset_deltas:
+                    asset_deltas[asset_name] += delta
+                else:
+                    asset_deltas[asset_name] = delta
+            for asset_name, delta in self._exchange_fees_deltas_by_order[index]:
+                if asset_name in counted_exchange_fee_deltas:
+                    counted_exchange_fee_deltas[asset_name] += delta
+                else:
+                    counted_exchange_fee_deltas[asset_name] = delta
+        return asset_deltas, {}, {}, counted_exchange_fee_deltas
+
+    def iterate_combinations(self, orders_count: int) -> typing.Iterator[tuple[int, ...]]:
+        """
+        :return: the selected orders_count orders combinations as unknown_orders indexes
+        """
+        combinations = itertools.combinations(self.candidate_orders_indexes, orders_count)
+        if not self.screen_combinations:
+            yield from combinations
+            return
+        while (chunk := numpy.fromiter(
+            itertools.chain.from_iterable(itertools.islice(combinations, self.SCREENED_COMBINATIONS_CHUNK_SIZE)),
+            dtype=numpy.intp
+        )).size:
+            combinations_indexes = chunk.reshape(-1, orders_count)
+            for selected_index in numpy.flatnonzero(self._may_explain_deltas(combinations_indexes)):
+                yield tuple(combinations_indexes[selected_index].tolist())
+
+    def _may_explain_deltas(self, combinations_indexes: numpy.ndarray) -> numpy.ndarray:
+        # an asset delta can be explained by orders when orders delta is of the same sign and not larger than
+        # the maximum allowed portfolio delta (smaller deltas are partially explained)
+        asset_deltas = self._screened_asset_deltas[combinations_indexes].sum(axis=1)
+        asset_presence = self._screened_asset_presence[combinations_indexes].any(axis=1)
+        return (
+            asset_presence
+            & (asset_deltas >= -self._screened_asset_tolerances)
+            & (asset_deltas < self._screened_asset_max_deltas + self._screened_asset_tolerances)
+        ).any(axis=1)
+
+    def _init_orders_deltas(self, ignored_filled_quantity_per_order_exchange_id: dict[str, decimal.Decimal]):
+        for order in self.unknown_orders:
+            assets_deltas = []
+            exchange_fees_deltas = []
+            self._assets_deltas_by_order.append(assets_deltas)
+            self._exchange_fees_deltas_by_order.append(exchange_fees_deltas)
+            base, quote = symbol_util.parse_symbol(order.symbol).base_and_quote()
+            ignored_filled_quantity = ignored_filled_quantity_per_order_exchange_id.get(order.exchange_order_id)
+            delta_quantity = (
+                (order.origin_quantity - ignored_filled_quantity) if ignored_filled_quantity
+                else order.origin_quantity
+            )
+            if delta_quantity < constants.ZERO:
+                commons_logging.get_logger(self.__class__.__name__).error(
+                    f"Invalid delta quantity: {delta_quantity} for order {order.exchange_order_id} on {order.symbol} "
+                    f"ignored filled quantity: {ignored_filled_quantity}."
+                )
+                continue
+            if delta_quantity == constants.ZERO:
+                commons_logging.get_logger(self.__class__.__name__).info(
+                    f"Skipped zero delta quantity: {delta_quantity} for order {order.exchange_order_id} on "
+                    f"{order.symbol} ignored filled quantity: {ignored_filled_quantity}."
+                )
+                continue
+            if order.side is enums.TradeOrderSide.BUY:
+                added_unit_and_amount = (base, delta_quantity)
+                removed_unit_and_amount = (quote, order.get_cost(delta_quantity))
+            elif order.side is enums.TradeOrderSide.SELL:
+                added_unit_and_amount = (quote, order.get_cost(delta_quantity))
+                removed_unit_and_amount = (base, delta_quantity)
+            else:
+                raise ValueError(f"Invalid order side: {order.side}")
+            assets_deltas.append((added_unit_and_amount[0], added_unit_and_amount[1] * decimal.Decimal(1)))
+            assets_deltas.append((removed_unit_and_amount[0], removed_unit_and_amount[1] * decimal.Decimal(-1)))
+            if (actual_fees := order.fee) and (
+                actual_fees[enums.FeePropertyColumns.IS_FROM_EXCHANGE.value]
+                and actual_fees[enums.FeePropertyColumns.COST.value]
+            ):
+                fee_delta = (
+                    actual_fees[enums.FeePropertyColumns.CURRENCY.value],
+                    -decimal.Decimal(str(actual_fees[enums.FeePropertyColumns.COST.value]))
+                )
+                assets_deltas.append(fee_delta)
+                exchange_fees_deltas.append(fee_delta)
+
+    def _get_candidate_orders_indexes(self, portfolio_asset_deltas: dict[str, dict[str, decimal.Decimal]]) -> list[int]:
+        # a combination including an order trading an asset that is neither in portfolio deltas nor paid as
+        # exchange fees by any order is always skipped
+        exchange_fees_assets = set(
+            asset_name
+            for exchange_fees_deltas in self._exchange_fees_deltas_by_order
+            for asset_name, _ in exchange_fees_deltas
+        )
+        return [
+            index
+            for index, assets_deltas in enumerate(self._assets_deltas_by_order)
+            if all(
+                asset_name in portfolio_asset_deltas or asset_name in exchange_fees_assets
+                for asset_name, _ in assets_deltas
+            )
+        ]
+
+    def _init_screening(self, portfolio_asset_deltas: dict[str, dict[str, decimal.Decimal]]):
+        # deltas are oriented by the sign of their portfolio delta: explainable deltas are >= 0
+        orientation_by_asset = {
+            asset_name: (1 if holdings_delta[commons_constants.PORTFOLIO_TOTAL] > constants.ZERO else -1)
+            for asset_name, holdings_delta in portfolio_asset_deltas.items()
+            # a zero portfolio delta can't be explained by orders
+            if holdings_delta[commons_constants.PORTFOLIO_TOTAL] != constants.ZERO
+        }
+        asset_indexes = {asset_name: index for index, asset_name in enumerate(orientation_by_asset)}
+        self._screened_asset_deltas = numpy.zeros((len(self.unknown_orders), len(asset_indexes)), dtype=numpy.float64)
+        self._screened_asset_presence = numpy.zeros(self._screened_asset_deltas.shape, dtype=bool)
+        for order_index, assets_deltas in enumerate(self._assets_deltas_by_order):
+            for asset_name, delta in assets_deltas:
+                if (asset_index := asset_indexes.get(asset_name)) is not None:
+                    self._screened_asset_deltas[order_index, asset_index] += \
+                        orientation_by_asset[asset_name] * float(delta)
+                    self._screened_asset_presence[order_index, asset_index] = True
+        self._screened_asset_max_deltas = numpy.array([
+            float(abs(
+                portfolio_asset_deltas[asset_name][commons_constants.PORTFOLIO_TOTAL]
+                * (constants.ONE + constants.SUB_PORTFOLIO_ALLOWED_DELTA_RATIO)
+            ))
+            for asset_name in asset_indexes
+        ], dtype=numpy.float64)
+        self._screened_asset_tolerances = self.SCREENING_TOLERANCE * (
+            numpy.abs(self._screened_asset_deltas).sum(axis=0) + self._screened_asset_max_deltas
+        )
@@ -14,7 +14,10 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 import asyncio
+import collections
+import contextlib
 import decimal
+import typing
 
 import octobot_commons.logging as logging
 import octobot_commons.symbols as symbol_util
@@ -39,6 +42,10 @@ class ValueConverter:
                                          f"[{self.portfolio_manager.exchange_manager.exchange_name}]")
 
         self.last_prices_by_trading_pair = {}
+        # last_prices_by_trading_pair symbols by parsed (base, quote) and by currency
+        self._last_price_symbols_by_base_and_quote = {}
+        self._last_price_symbols_by_currency = {}
+        self._indexed_last_price_symbols = set()
 
         self.initializing_symbol_prices = set()
         self.initializing_symbol_prices_pairs = set()
@@ -49,12 +56,40 @@ class ValueConverter:
         # internal price conversion elements
         self._price_bridge_by_symbol = {}
         self._missing_price_bridges = set()
+        # currency: {other currency: pair} for each pair of _get_priced_pairs()
+        self._currency_graph = {}
+        self._currency_graph_pairs = frozenset()
+        # last_prices_by_trading_pair symbols read within recorded_price_symbols()
+        self._recorded_price_symbols: typing.Optional[set] = None
 
     def update_last_price(self, symbol, price):
         if symbol not in self.last_prices_by_trading_pair:
             self.reset_missing_price_bridges()
             self.logger.debug(f"Initialized last price for {symbol}")
         self.last_prices_by_trading_pair[symbol] = price
+        if symbol not in self._indexed_last_price_symbols:
+            self._index_last_price_symbol(symbol)
+
+    @contextlib.contextmanager
+    def recorded_price_symbols(self) -> typing.Iterator[set]:
+        """
+        Records the last_prices_by_trading_pair symbols which prices are read within this context
+        :return: the set of read symbols
+        """
+        previous_recorded_price_symbols = self._recorded_price_symbols
+        self._recorded_price_symbols = recorded_price_symbols = set()
+        try:
+            yield recorded_price_symbols
+        finally:
+            self._recorded_price_symbols = previous_recorded_price_symbols
+
+    def has_last_price_symbol(self, currency, target_currency) -> bool:
+        """
+        :return: True when a pair of currency and target_currency is in last_prices_by_trading_pair
+        """
+        self._ensure_up_to_date_last_price_symbols_index()
+        return (currency, target_currency) in self._last_price_symbols_by_base_and_quote \
+            or (target_currency, currency) in self._last_price_symbols_by_base_and_quote
 
     def evaluate_value(self, currency, quantity, raise_error=True, target_currency=None, init_price_fetchers=True):
         """
@@ -78,7 +113,10 @@ class ValueConverter:
     def get_usd_like_value(self, currency, quantity, raise_error=True, init_price_fetchers=True):
         if symbol_util.is_usd_like_coin(currency):
             return quantity
-        if symbol := self.get_usd_like_symbol_from_symbols(currency, self.last_prices_by_trading_pair):
+        self._ensure_up_to_date_last_price_symbols_index()
+        if symbol := self.get_usd_like_symbol_from_symbols(
+            currency, self._last_price_symbols_by_currency.get(currency, ())
+        ):
             base, quote = symbol_util.parse_symbol(symbol).base_and_quote()
             usd_like_currency = base if symbol_util.is_usd_like_coin(base) else quote
             return self.evaluate_value(
@@ -100,13 +138,17 @@ class ValueConverter:
     @staticmethod
     def get_usd_like_symbols_from_symbols(currency: str, symbols) -> list:
         # look for symbols using USD_LIKE_COINS priorities
-        usd_like_symbols = []
-        for usd_like_coin in commons_constants.USD_LIKE_COINS:
-            for symbol in symbols:
-                base_and_quote = symbol_util.parse_symbol(symbol).base_and_quote()
-                if currency in base_and_quote and usd_like_coin in base_and_quote:
-                    usd_like_symbols.append(symbol)
-        return usd_like_symbols
+        currency_symbols = []
+        for symbol in symbols:
+            base_and_quote = symbol_util.parse_symbol(symbol).base_and_quote()
+            if currency in base_and_quote:
+                currency_symbols.append((symbol, base_and_quote))
+        return [
+            symbol
+            for usd_like_coin in commons_constants.USD_LIKE_COINS
+            for symbol, base_and_quote in currency_symbols
+            if usd_like_coin in base_and_quote
+        ]
 
     @staticmethod
     def can_convert_symbol_to_usd_like(symbol: str) -> bool:
@@ -256,7 +298,7 @@ class ValueConverter:
     ) -> decimal.Decimal:
         # settlement_asset needs to be handled to add support for futures
 
-        # try with two pairs
+        # try with multiple pairs
         # for example:
         # currency: ETH - ref market: USDT
         # ETH/USDT is not available. ETH/BTC and BTC/USDT are available though.
@@ -269,76 +311,106 @@ class ValueConverter:
             if self.is_missing_price_bridge(currency, target):
                 return None
             # try to find a bridge
-        if len(base_bridge) > self.MAX_PRICE_BRIDGE_DEPTH:
-            self._save_missing_price_bridge(currency, target)
+        bridge = self._find_price_bridge(currency, target, base_bridge)
+        if bridge is None:
             return None
-        part_1_base = currency
-        part_2_quote = target
-        # look into available symbols to find pair bridges
-        for bridge_part_1_symbol in self._get_priced_pairs():
-            parsed_bridge_part_1_symbol = symbol_util.parse_symbol(bridge_part_1_symbol)
-            if (parsed_bridge_part_1_symbol.base, parsed_bridge_part_1_symbol.quote) in base_bridge\
-               or (parsed_bridge_part_1_symbol.quote, parsed_bridge_part_1_symbol.base) in base_bridge:
-                # avoid looping in symbols
-                continue
-            # part 1: check if bridge_part_1_symbol can be used as part 1 of the bridge
-            is_inverse_part_1 = False
-            if part_1_base == parsed_bridge_part_1_symbol.quote:
-                is_inverse_part_1 = True
-            elif part_1_base != parsed_bridge_part_1_symbol.base:
+        self._remove_from_missing_currency_data(currency)
+        # also save bridges from intermediary currencies
+        for index in range(len(bridge) - 1):
+            self._save_price_bridge(bridge[index][0], target, bridge[index:])
+        return self.convert_currency_value_from_saved_price_bridges(currency, target, quantity)
+
+    def _find_price_bridge(self, currency, target, base_bridge):
+        """
+        Breadth first search of the shortest chain of priced pairs converting currency into target.
+        Already saved bridges to target are used as bridge ends when they are not longer than the bridge
+        that would be found otherwise.
+        :return: the (base, quote) list of the found bridge, None when no bridge is available
+        """
+        self._update_currency_graph()
+        # base_bridge pairs are already used, avoid looping in them
+        excluded_pairs = set(base_bridge)
+        max_depth = self.MAX_PRICE_BRIDGE_DEPTH + 1 - len(base_bridge)
+        previous_currencies = {currency: None}
+        to_visit = collections.deque([(currency, 0)])
+        has_pending_price = False
+        # shortest bridge ending with a saved bridge
+        saved_bridge_end_bridge = None
+        while to_visit:
+            bridge_currency, depth = to_visit.popleft()
+            if depth >= max_depth:
                 continue
-            part_1_quote = parsed_bridge_part_1_symbol.quote
-            if is_inverse_part_1:
-                part_1_quote = parsed_bridge_part_1_symbol.base
-                part_1_base = parsed_bridge_part_1_symbol.quote
-            try:
-                bridge_part_1_value = self.convert_currency_value_using_last_prices(
-                    quantity, part_1_base, part_1_quote
-                )
-                # check that bridge_part_1_value is really set
-                if not bridge_part_1_value:
+            if saved_bridge_end_bridge is not None and depth + 1 >= len(saved_bridge_end_bridge):
+                # no shorter bridge can be found
+                return saved_bridge_end_bridge
+            next_currencies = self._currency_graph.get(bridge_currency, {})
+            if saved_bridge_end_bridge is not None and depth + 2 >= len(saved_bridge_end_bridge):
+                # saved bridges contain at least 2 pairs: only a direct pair to target can give a shorter bridge
+                next_currencies = {target: next_currencies[target]} if target in next_currencies else {}
+            for next_currency, pair in next_currencies.items():
+                if next_currency in previous_currencies \
+                   or (bridge_currency, next_currency) in excluded_pairs \
+                   or (next_currency, bridge_currency) in excluded_pairs:
                     continue
-            except errors.MissingPriceDataError:
-                # first pair might not be initialized or is not available at all
-                # make sure it's not just initializing
-                self._ensure_no_pending_symbol_price(part_1_base, part_1_quote)
-                # try with other pairs
-                continue
-            # part 2: bridge part 1 is found and valued, try to get a compatible second part
-            # case 1: 2 parts bridge
-            try:
-                bridge_part_2_value = self.convert_currency_value_using_last_prices(
-                    constants.ONE,
-                    part_1_quote,
-                    part_2_quote,
-                )
-                if bridge_part_2_value:
-                    self._remove_from_missing_currency_data(currency)
-                    local_bridge = [(part_1_base, part_1_quote), (part_1_quote, part_2_quote)]
-                    self._save_price_bridge(currency, target, local_bridge)
-                    return bridge_part_1_value * bridge_part_2_value
-            except errors.MissingPriceDataError:
-                # conversion pairs might not be initialized or is not available at all
-                self._ensure_no_pending_symbol_price(part_1_quote, part_2_quote)
-                # otherwise continue with other pairs
-            bridge = base_bridge + [(part_1_base, part_1_quote)]
-            # case 2: X parts bridge
-            nested_value = self.try_convert_currency_value_using_multiple_pairs(
-                part_1_quote, target, constants.ONE, bridge
-            )
-            if nested_value:
-                try:
-                    extended_bridge = [(part_1_base, part_1_quote)] \
-                        + self.get_saved_price_conversion_bridge(part_1_quote, target)
-                    self._save_price_bridge(currency, target, extended_bridge)
-                except KeyError:
-                    # should not happen, however if it does, do not crash
-                    pass
-                return bridge_part_1_value * nested_value
+                # check that pair price is really set
+                if not self.last_prices_by_trading_pair.get(pair) \
+                   and not self._can_convert_using_last_prices(bridge_currency, next_currency):
+                    # pair might not be initialized or is not available at all
+                    has_pending_price = has_pending_price or \
+                        self._is_pending_symbol_price(bridge_currency, next_currency)
+                    continue
+                previous_currencies[next_currency] = bridge_currency
+                if next_currency == target:
+                    return self._get_found_price_bridge(previous_currencies, next_currency, [])
+                saved_bridge = self._price_bridge_by_symbol.get(symbol_util.merge_currencies(next_currency, target))
+                if saved_bridge is not None and depth + 1 + len(saved_bridge) <= max_depth and (
+                    saved_bridge_end_bridge is None
+                    or depth + 1 + len(saved_bridge) < len(saved_bridge_end_bridge)
+                ):
+                    saved_bridge_end_bridge = self._get_found_price_bridge(
+                        previous_currencies, next_currency, saved_bridge
+                    )
+                to_visit.append((next_currency, depth + 1))
+        if saved_bridge_end_bridge is not None:
+            return saved_bridge_end_bridge
+        if has_pending_price:
+            # a bridge pair price is still to be fetched
+            raise errors.PendingPriceDataError
         # no bridge found
         self._save_missing_price_bridge(currency, target)
         return None
 
+    @staticmethod
+    def _get_found_price_bridge(previous_currencies, reached_currency, reached_currency_bridge):
+        bridge = []
+        while previous_currencies[reached_currency] is not None:
+            bridge.append((previous_currencies[reached_currency], reached_currency))
+            reached_currency = previous_currencies[reached_currency]
+        return bridge[::-1] + reached_currency_bridge
+
+    def _can_convert_using_last_prices(self, currency, target):
+        try:
+            # check that conversion value is really set
+            return bool(self.convert_currency_value_using_last_prices(constants.ONE, currency, target))
+        except errors.MissingPriceDataError:
+            return False
+
+    def _update_currency_graph(self):
+        # pairs sources can be edited directly and pairs replaced by others: compare their content
+        priced_pairs = frozenset(self._get_priced_pairs())
+        if priced_pairs == self._currency_graph_pairs:
+            return
+        if not self._currency_graph_pairs <= priced_pairs:
+            # pairs have been removed: rebuild the graph
+            self._currency_graph = {}
+            self._currency_graph_pairs = frozenset()
+        for pair in self._get_priced_pairs():
+            if pair not in self._currency_graph_pairs:
+                parsed_pair = symbol_util.parse_symbol(pair)
+                self._currency_graph.setdefault(parsed_pair.base, {})[parsed_pair.quote] = pair
+                self._currency_graph.setdefault(parsed_pair.quote, {})[parsed_pair.base] = pair
+        self._currency_graph_pairs = priced_pairs
+
     def _get_priced_pairs(self):
         for pair in self.last_prices_by_trading_pair:
             # first look into pairs with price
@@ -352,11 +424,12 @@ class ValueConverter:
                 # finally into initializing pairs
                 yield pair
 
-    def _ensure_no_pending_symbol_price(self, base, quote):
-        for symbol in (symbol_util.merge_currencies(base, quote), symbol_util.merge_currencies(quote, base)):
-            if symbol in self.portfolio_manager.exchange_manager.exchange_config.traded_symbol_pairs \
-                    or symbol in self.initializing_symbol_prices_pairs:
-                raise errors.PendingPriceDataError
+    def _is_pending_symbol_price(self, base, quote):
+        return any(
+            symbol in self.portfolio_manager.exchange_manager.exchange_config.traded_symbol_pairs
+            or symbol in self.initializing_symbol_prices_pairs
+            for symbol in (symbol_util.merge_currencies(base, quote), symbol_util.merge_currencies(quote, base))
+        )
 
     def get_saved_price_conversion_bridge(self, currency, target) -> list:
         return self._price_bridge_by_symbol[symbol_util.merge_currencies(currency, target)]
@@ -392,15 +465,41 @@ class ValueConverter:
 
     def _get_last_price_data(self, symbol):
         try:
-            return self.last_prices_by_trading_pair[symbol]
+            price = self.last_prices_by_trading_pair[symbol]
         except KeyError:
             # a settlement asset or other symbol extra 
             # data might be different, try to ignore it
-            to_find_symbol = symbol_util.parse_symbol(symbol)
-            for symbol_key, last_prices in self.last_prices_by_trading_pair.items():
-                if symbol_util.parse_symbol(symbol_key).is_same_base_and_quote(to_find_symbol):
-                    return last_prices
-        raise KeyError(symbol)
+            self._ensure_up_to_date_last_price_symbols_index()
+            base_and_quote = symbol_util.parse_symbol(symbol).base_and_quote()
+            if base_and_quote not in self._last_price_symbols_by_base_and_quote:
+                raise KeyError(symbol)
+            symbol = self._last_price_symbols_by_base_and_quote[base_and_quote]
+            price = self.last_prices_by_trading_pair[symbol]
+        if self._recorded_price_symbols is not None:
+            self._recorded_price_symbols.add(symbol)
+        return price
+
+    def _index_last_price_symbol(self, symbol):
+        self._indexed_last_price_symbols.add(symbol)
+        base, quote = symbol_util.parse_symbol(symbol).base_and_quote()
+        # keep the first symbol as in last_prices_by_trading_pair iteration
+        self._last_price_symbols_by_base_and_quote.setdefault((base, quote), symbol)
+        for currency in (base, quote):
+            self._last_price_symbols_by_currency.setdefault(currency, []).append(symbol)
+
+    def _ensure_up_to_date_last_price_symbols_index(self):
+        # last_prices_by_trading_pair can also be updated without update_last_price and symbols replaced by
+        # others: compare their content
+        if self._indexed_last_price_symbols == self.last_prices_by_trading_pair.keys():
+            return
+        if not self._indexed_last_price_symbols <= self.last_prices_by_trading_pair.keys():
+            # symbols have been removed: rebuild index
+            self._last_price_symbols_by_base_and_quote = {}
+            self._last_price_symbols_by_currency = {}
+            self._indexed_last_price_symbols = set()
+        for symbol in self.last_prices_by_trading_pair:
+            if symbol not in self._indexed_last_price_symbols:
+                self._index_last_price_symbol(symbol)
 
     def clear(self):
         self.portfolio_manager = None
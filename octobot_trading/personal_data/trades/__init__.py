@@ -43,6 +43,7 @@ from octobot_trading.personal_data.trades.trades_util import (
     compute_win_rate,
     aggregate_trades_by_exchange_order_id,
     get_real_or_estimated_trade_fee,
+    is_registered_fee,
 )
 
 __all__ = [
@@ -59,4 +60,5 @@ __all__ = [
     "compute_win_rate",
     "aggregate_trades_by_exchange_order_id",
     "get_real_or_estimated_trade_fee",
+    "is_registered_fee",
 ]
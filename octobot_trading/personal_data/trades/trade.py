@@ -23,11 +23,17 @@ import octobot_trading.personal_data.orders.order as order_import
 import octobot_trading.exchanges
 import octobot_commons.symbols as commons_symbols
 
+if typing.TYPE_CHECKING:
+    import octobot_trading.personal_data.trades.trades_manager as trades_manager_import
+
 
 class Trade:
     CLOSING_TRADE_ORDER_STATUS = {enums.OrderStatus.CANCELED, enums.OrderStatus.FILLED, enums.OrderStatus.CLOSED}
 
     def __init__(self, trader):
+        # trades manager to notify when origin_order_id, exchange_order_id, associated_entry_ids or fee change:
+        # set while this trade is in its trades manager
+        self.indexing_trades_manager: typing.Optional["trades_manager_import.TradesManager"] = None
         self.trader: octobot_trading.exchanges.Trader = trader
         self.exchange_manager: octobot_trading.exchanges.ExchangeManager = trader.exchange_manager
 
@@ -35,8 +41,8 @@ class Trade:
         self.creation_time: float = self.exchange_manager.exchange.get_exchange_current_time()
 
         self.trade_id: str = trader.parse_order_id(None)
-        self.origin_order_id: str = None # type: ignore
-        self.exchange_order_id: str = None # type: ignore
+        self._origin_order_id: str = None # type: ignore
+        self._exchange_order_id: str = None # type: ignore
         # One order might create multiple trades when matched to multiple open orders.
         # in this case those trades would share the same exchange_order_id
         self.exchange_trade_id: str = None # type: ignore
@@ -55,19 +61,69 @@ class Trade:
         self.executed_quantity: decimal.Decimal = constants.ZERO
         self.canceled_time: float = 0
         self.executed_time: float = 0
-        self.fee: typing.Optional[dict[str, typing.Any]] = None
+        self._fee: typing.Optional[dict[str, typing.Any]] = None
         self.executed_price: decimal.Decimal = constants.ZERO
         self.trade_profitability: decimal.Decimal = constants.ZERO
         self.total_cost: decimal.Decimal = constants.ZERO
         self.reduce_only: bool = False
         self.tag: str = None # type: ignore
         self.quantity_currency: str = None # type: ignore
-        self.associated_entry_ids: typing.Optional[list[str]] = None
+        self._associated_entry_ids: typing.Optional[list[str]] = None
         self.broker_applied: bool = False
 
         # raw exchange trade type, used to create trade dict
         self.exchange_trade_type: typing.Optional[enums.TradeOrderType] = None
 
+    @property
+    def origin_order_id(self) -> str:
+        return self._origin_order_id
+
+    @origin_order_id.setter
+    def origin_order_id(self, origin_order_id: str):
+        previous_origin_order_id = self._origin_order_id
+        self._origin_order_id = origin_order_id
+        if self.indexing_trades_manager is not None:
+            self.indexing_trades_manager.on_trade_indexed_attribute_update(
+                self, "origin_order_id", previous_origin_order_id
+            )
+
+    @property
+    def exchange_order_id(self) -> str:
+        return self._exchange_order_id
+
+    @exchange_order_id.setter
+    def exchange_order_id(self, exchange_order_id: str):
+        previous_exchange_order_id = self._exchange_order_id
+        self._exchange_order_id = exchange_order_id
+        if self.indexing_trades_manager is not None:
+            self.indexing_trades_manager.on_trade_indexed_attribute_update(
+                self, "exchange_order_id", previous_exchange_order_id
+            )
+
+    @property
+    def associated_entry_ids(self) -> typing.Optional[list[str]]:
+        return self._associated_entry_ids
+
+    @associated_entry_ids.setter
+    def associated_entry_ids(self, associated_entry_ids: typing.Optional[list[str]]):
+        previous_associated_entry_ids = self._associated_entry_ids
+        self._associated_entry_ids = associated_entry_ids
+        if self.indexing_trades_manager is not None:
+            self.indexing_trades_manager.on_trade_indexed_attribute_update(
+                self, "associated_entry_ids", previous_associated_entry_ids
+            )
+
+    @property
+    def fee(self) -> typing.Optional[dict[str, typing.Any]]:
+        return self._fee
+
+    @fee.setter
+    def fee(self, fee: typing.Optional[dict[str, typing.Any]]):
+        previous_fee = self._fee
+        self._fee = fee
+        if self.indexing_trades_manager is not None:
+            self.indexing_trades_manager.on_trade_indexed_attribute_update(self, "fee", previous_fee)
+
     def update_from_order(self, order, creation_time=0, canceled_time=0, executed_time=0, exchange_trade_id=None):
         self.currency = order.currency
         self.market = order.market
@@ -0,0 +1,255 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import array
+import decimal
+import math
+import typing
+
+import octobot_trading.enums as enums
+import octobot_trading.personal_data.trades.trade as trade_import
+import octobot_trading.personal_data.trades.trades_util as trades_util
+
+# decimal coefficients digits count that always fit in a signed 64 bits integer
+_MAX_DECIMAL_COEFFICIENT_DIGITS = 18
+_MIN_DECIMAL_EXPONENT = -128
+_MAX_DECIMAL_EXPONENT = 127
+
+
+class TradesArchive:
+    """
+    Compact storage of closed trades: each trade is stored as a row of its to_dict() values
+    in per-value columns instead of a Trade instance.
+    Times and decimal values are stored in typed arrays, values shared by many trades (symbols, sides, ...)
+    are stored once and referenced by code.
+    Archived trades are materialized into Trade instances when accessed, as when loaded from storage.
+    """
+    # float columns stored in typed arrays, None values are stored as nan
+    FLOAT_COLUMNS = (
+        enums.ExchangeConstantsOrderColumns.TIMESTAMP.value,
+        enums.TradeExtraConstants.CREATION_TIME.value,
+    )
+    # decimal.Decimal columns stored in typed arrays
+    DECIMAL_COLUMNS = (
+        enums.ExchangeConstantsOrderColumns.PRICE.value,
+        enums.ExchangeConstantsOrderColumns.AMOUNT.value,
+        enums.ExchangeConstantsOrderColumns.COST.value,
+    )
+    # columns with few distinct values
+    ENCODED_COLUMNS = (
+        enums.ExchangeConstantsOrderColumns.SYMBOL.value,
+        enums.ExchangeConstantsOrderColumns.MARKET.value,
+        enums.ExchangeConstantsOrderColumns.STATUS.value,
+        enums.ExchangeConstantsOrderColumns.TYPE.value,
+        enums.ExchangeConstantsOrderColumns.SIDE.value,
+        enums.ExchangeConstantsOrderColumns.QUANTITY_CURRENCY.value,
+        enums.ExchangeConstantsOrderColumns.TAKER_OR_MAKER.value,
+        enums.ExchangeConstantsOrderColumns.REDUCE_ONLY.value,
+        enums.ExchangeConstantsOrderColumns.TAG.value,
+        enums.ExchangeConstantsOrderColumns.BROKER_APPLIED.value,
+    )
+
+    def __init__(self, trader):
+        self.trader = trader
+        self._columns: dict[str, typing.Union[list, _FloatColumn, _DecimalColumn, _EncodedColumn]] = {}
+        self._rows_count: int = 0
+        self._row_by_trade_id: dict[str, int] = {}
+        # archived trades rows by order id, oldest archived first
+        self._rows_by_origin_order_id: dict[str, list[int]] = {}
+        self._rows_by_exchange_order_id: dict[str, list[int]] = {}
+        # running total of archived trades fees by currency
+        self.paid_fees: dict[str, typing.Any] = {}
+
+    def __len__(self):
+        return len(self._row_by_trade_id)
+
+    def __contains__(self, trade_id):
+        return trade_id in self._row_by_trade_id
+
+    def archive_trade(self, trade: trade_import.Trade):
+        trade_dict = trade.to_dict()
+        if not self._columns:
+            self._columns = {
+                key: self._create_column(key)
+                for key in trade_dict
+            }
+        for key, column in self._columns.items():
+            column.append(trade_dict.get(key))
+        row = self._rows_count
+        self._rows_count += 1
+        self._row_by_trade_id[trade.trade_id] = row
+        if trade.origin_order_id:
+            self._rows_by_origin_order_id.setdefault(trade.origin_order_id, []).append(row)
+        if trade.exchange_order_id:
+            self._rows_by_exchange_order_id.setdefault(trade.exchange_order_id, []).append(row)
+        if trades_util.is_registered_fee(trade.fee):
+            fee_cost = trade.fee[enums.FeePropertyColumns.COST.value]
+            fee_currency = trade.fee[enums.FeePropertyColumns.CURRENCY.value]
+            if fee_currency in self.paid_fees:
+                self.paid_fees[fee_currency] += fee_cost
+            else:
+                self.paid_fees[fee_currency] = fee_cost
+
+    def get_trade(self, trade_id: str) -> trade_import.Trade:
+        """
+        :return: a Trade instance of the archived trade, raises KeyError when the trade is not archived
+        """
+        return trade_import.Trade.from_dict(self.trader, self._get_trade_dict(self._row_by_trade_id[trade_id]))
+
+    def get_trades(self, origin_order_id=None, exchange_order_id=None) -> list[trade_import.Trade]:
+        """
+        :return: Trade instances of the archived trades from the given order ids, oldest archived first
+        """
+        return [
+            trade_import.Trade.from_dict(self.trader, trade_dict)
+            for trade_dict in self.get_trade_dicts(origin_order_id=origin_order_id,
+                                                   exchange_order_id=exchange_order_id)
+        ]
+
+    def get_trade_dict(self, trade_id: str) -> dict:
+        """
+        :return: the to_dict() value of the archived trade, raises KeyError when the trade is not archived
+        """
+        return self._get_trade_dict(self._row_by_trade_id[trade_id])
+
+    def get_trade_ids(self) -> typing.KeysView[str]:
+        """
+        :return: the archived trades ids, oldest archived first
+        """
+        return self._row_by_trade_id.keys()
+
+    def get_trade_dicts(self, origin_order_id=None, exchange_order_id=None) -> typing.Iterator[dict]:
+        """
+        :return: to_dict() values of the archived trades from the given order ids, oldest archived first
+        """
+        if origin_order_id:
+            rows = self._rows_by_origin_order_id.get(origin_order_id, [])
+            if exchange_order_id:
+                exchange_order_rows = set(self._rows_by_exchange_order_id.get(exchange_order_id, []))
+                rows = [row for row in rows if row in exchange_order_rows]
+        elif exchange_order_id:
+            rows = self._rows_by_exchange_order_id.get(exchange_order_id, [])
+        else:
+            rows = range(self._rows_count)
+        for row in rows:
+            yield self._get_trade_dict(row)
+
+    def clear(self):
+        self._columns = {}
+        self._rows_count = 0
+        self._row_by_trade_id = {}
+        self._rows_by_origin_order_id = {}
+        self._rows_by_exchange_order_id = {}
+        self.paid_fees = {}
+
+    def _create_column(self, key: str) -> typing.Union[list, "_FloatColumn", "_DecimalColumn", "_EncodedColumn"]:
+        if key in self.FLOAT_COLUMNS:
+            return _FloatColumn()
+        if key in self.DECIMAL_COLUMNS:
+            return _DecimalColumn()
+        if key in self.ENCODED_COLUMNS:
+            return _EncodedColumn()
+        return []
+
+    def _get_trade_dict(self, row: int) -> dict:
+        return {
+            key: column[row]
+            for key, column in self._columns.items()
+        }
+
+
+class _FloatColumn:
+    """
+    float values in a typed array, None values are stored as nan
+    """
+    __slots__ = ("_values", )
+
+    def __init__(self):
+        self._values: array.array = array.array("d")
+
+    def append(self, value):
+        self._values.append(math.nan if value is None else value)
+
+    def __getitem__(self, row: int):
+        value = self._values[row]
+        return None if math.isnan(value) else value
+
+
+class _DecimalColumn:
+    """
+    decimal.Decimal values as integer coefficients and exponents in typed arrays.
+    Values that can't be stored this way (None, floats, too precise decimals, ...) are stored as is
+    """
+    __slots__ = ("_coefficients", "_exponents", "_other_values")
+
+    def __init__(self):
+        self._coefficients: array.array = array.array("q")
+        self._exponents: array.array = array.array("b")
+        self._other_values: dict[int, typing.Any] = {}
+
+    def append(self, value):
+        if isinstance(value, decimal.Decimal):
+            sign, digits, exponent = value.as_tuple()
+            if (
+                isinstance(exponent, int)   # not nan or infinity
+                and _MIN_DECIMAL_EXPONENT <= exponent <= _MAX_DECIMAL_EXPONENT
+                and len(digits) <= _MAX_DECIMAL_COEFFICIENT_DIGITS
+            ):
+                coefficient = int("".join(map(str, digits)))
+                if coefficient or not sign:   # -0 can't be stored as an integer coefficient
+                    self._coefficients.append(-coefficient if sign else coefficient)
+                    self._exponents.append(exponent)
+                    return
+        self._other_values[len(self._coefficients)] = value
+        self._coefficients.append(0)
+        self._exponents.append(0)
+
+    def __getitem__(self, row: int):
+        if row in self._other_values:
+            return self._other_values[row]
+        return decimal.Decimal(f"{self._coefficients[row]}E{self._exponents[row]}")
+
+
+class _EncodedColumn:
+    """
+    Each distinct value is stored once, rows store its code in a typed array.
+    Unhashable values are stored as is
+    """
+    __slots__ = ("_codes", "_values", "_code_by_value", "_other_values")
+
+    def __init__(self):
+        self._codes: array.array = array.array("I")
+        self._values: list = []
+        # values are identified with their type as True == 1
+        self._code_by_value: dict[tuple[type, typing.Hashable], int] = {}
+        self._other_values: dict[int, typing.Any] = {}
+
+    def append(self, value):
+        key = (value.__class__, value)
+        try:
+            code = self._code_by_value[key]
+        except KeyError:
+            code = self._code_by_value[key] = len(self._values)
+            self._values.append(value)
+        except TypeError:
+            # unhashable value
+            self._other_values[len(self._codes)] = value
+            code = 0
+        self._codes.append(code)
+
+    def __getitem__(self, row: int):
+        if row in self._other_values:
+            return self._other_values[row]
+        return self._values[self._codes[row]]
@@ -24,20 +24,51 @@ import octobot_trading.constants as constants
 import octobot_trading.enums as enums
 import octobot_trading.personal_data as personal_data
 import octobot_trading.personal_data.trades.trade_pnl as trade_pnl
+import octobot_trading.personal_data.trades.trades_archive as trades_archive
+import octobot_trading.personal_data.trades.trades_util as trades_util
 import octobot_trading.util as util
 
 
 class TradesManager(util.Initializable):
     # memory usage for 100000 trades: approx 180 Mo
     MAX_TRADES_COUNT = constants.MAX_TRADES_COUNT
+    ENABLE_TRADES_ARCHIVE = constants.ENABLE_TRADES_ARCHIVE
+    TRADES_ARCHIVE_HORIZON = constants.TRADES_ARCHIVE_HORIZON
+    # trade attributes to index trades by: trades notify their trades manager when those change
+    INDEXED_TRADE_ATTRIBUTES = ("origin_order_id", "exchange_order_id", "associated_entry_ids")
 
     def __init__(self, trader):
         super().__init__()
         self.logger: logging.BotLogger = logging.get_logger(self.__class__.__name__)
         self.trader = trader
         self.trades_initialized: bool = False
+        # old trades compacted out of self.trades when ENABLE_TRADES_ARCHIVE is True
+        self.trades_archive: typing.Optional[trades_archive.TradesArchive] = \
+            trades_archive.TradesArchive(trader) if self.ENABLE_TRADES_ARCHIVE else None
+        # trades indexes by trade attribute, trades are kept in self.trades order using their position
+        self._trades_indexes: dict[str, util.AttributeIndex] = {
+            attribute: util.AttributeIndex() for attribute in self.INDEXED_TRADE_ATTRIBUTES
+        }
+        self._trade_positions: dict[personal_data.Trade, int] = {}
+        self._next_trade_position: int = 0
+        # running total of self.trades fees by currency
+        self._paid_fees: dict[str, typing.Any] = {}
+        self._paid_fees_trades_count: collections.Counter = collections.Counter()
+        # trades which fee is not counted in self._paid_fees
+        self._trades_without_registered_fee: dict[personal_data.Trade, None] = {}
+        self._trades: util.NotifyingOrderedDict = None
         self.trades: collections.OrderedDict[str, personal_data.Trade] = collections.OrderedDict()
 
+    @property
+    def trades(self) -> util.NotifyingOrderedDict:
+        return self._trades
+
+    @trades.setter
+    def trades(self, trades: dict):
+        # self.trades can also be edited directly: it notifies its updates to keep trades indexes up to date
+        self._reset_trades_indexes()
+        self._trades = util.NotifyingOrderedDict(self._on_trade_set, self._on_trade_removed, trades)
+
     async def initialize_impl(self):
         await self.reload_history(False)
         self.trades_initialized = True
@@ -51,7 +82,7 @@ class TradesManager(util.Initializable):
         await self._load_trades_history(reset)
 
     def upsert_trade(self, trade_id: str, raw_trade: dict) -> bool:
-        if trade_id not in self.trades:
+        if not self.has_trade(trade_id):
             try:
                 created_trade = personal_data.create_trade_instance_from_raw(self.trader, raw_trade)
                 if trade_id in self.trades:
@@ -66,7 +97,7 @@ class TradesManager(util.Initializable):
         return False
 
     def upsert_trade_instance(self, trade) -> bool:
-        if trade.trade_id not in self.trades:
+        if not self.has_trade(trade.trade_id):
             return self._add_trade_if_relevant(trade.trade_id, trade)
         return False
 
@@ -84,7 +115,6 @@ class TradesManager(util.Initializable):
         self._check_trades_size()
         return True
 
-
     def has_closing_trade_with_exchange_order_id(self, exchange_order_id) -> bool:
         for trade in self.get_trades(exchange_order_id=exchange_order_id):
             if trade.is_closing_order:
@@ -92,17 +122,16 @@ class TradesManager(util.Initializable):
         return False
 
     def get_total_paid_fees(self):
-        total_fees = {}
-        for trade in self.trades.values():
-            if trade.fee is not None:
-                fee_cost = trade.fee[enums.FeePropertyColumns.COST.value]
-                fee_currency = trade.fee[enums.FeePropertyColumns.CURRENCY.value]
+        total_fees = dict(self._paid_fees)
+        for trade in self._trades_without_registered_fee:
+            if trade.status is not enums.OrderStatus.CANCELED:
+                self.logger.warning(f"Trade without any registered fee: {trade.to_dict()}")
+        if self.trades_archive is not None:
+            for fee_currency, fee_cost in self.trades_archive.paid_fees.items():
                 if fee_currency in total_fees:
                     total_fees[fee_currency] += fee_cost
                 else:
                     total_fees[fee_currency] = fee_cost
-            elif trade.status is not enums.OrderStatus.CANCELED:
-                self.logger.warning(f"Trade without any registered fee: {trade.to_dict()}")
         return total_fees
 
     def get_completed_trade_pnl(
@@ -115,54 +144,208 @@ class TradesManager(util.Initializable):
         return pnls[0] if pnls else None
 
     def get_completed_trades_pnl(self, trades_history=None, selected_trades=None) -> list[trade_pnl.TradePnl]:
-        trades = trades_history or self.get_trades()
-        trades_by_order_id = {
-            trade.origin_order_id: trade
-            for trade in trades
-        }
+        if trades_history:
+            trades_by_order_id = {
+                trade.origin_order_id: trade
+                for trade in trades_history
+            }
+            get_entry_trade = trades_by_order_id.get
+            exit_trades = trades_history
+        else:
+            get_entry_trade = self._get_last_trade_from_order_id
+            # only trades with associated entries can be exit trades
+            exit_trades = self._get_indexed_trades("associated_entry_ids", True)
+        entry_trade_by_entry_id = {}
         exits_by_entry_id = {}
-        for trade in (selected_trades or trades):
+        for trade in (selected_trades or exit_trades):
             if trade.status is not enums.OrderStatus.CANCELED and trade.associated_entry_ids:
                 for entry_id in trade.associated_entry_ids:
-                    if entry_id not in trades_by_order_id:
-                        continue
                     if entry_id not in exits_by_entry_id:
+                        if (entry_trade := get_entry_trade(entry_id)) is None:
+                            continue
+                        entry_trade_by_entry_id[entry_id] = entry_trade
                         exits_by_entry_id[entry_id] = []
                     exits_by_entry_id[entry_id].append(trade)
         return [
             trade_pnl.TradePnl(
-                [trades_by_order_id[entry_id]],
+                [entry_trade_by_entry_id[entry_id]],
                 exit_trade,
             )
             for entry_id, exit_trade in exits_by_entry_id.items()
         ]
 
     def get_trade(self, trade_id: str):
-        return self.trades[trade_id]
+        try:
+            return self.trades[trade_id]
+        except KeyError:
+            if self.trades_archive is not None and trade_id in self.trades_archive:
+                return self.trades_archive.get_trade(trade_id)
+            raise
+
+    def has_trade(self, trade_id: str) -> bool:
+        return trade_id in self.trades or (self.trades_archive is not None and trade_id in self.trades_archive)
 
     def get_trade_from_order_id(self, order_id: str):
         if trades := self.get_trades(origin_order_id=order_id):
             return trades[0]
         return None
 
-    def get_trades(self, origin_order_id=None, exchange_order_id=None):
+    def get_trades(self, origin_order_id=None, exchange_order_id=None, include_archived=False):
+        """
+        :param include_archived: when True, archived trades are materialized and included before other trades
+        """
+        if include_archived and self.trades_archive is not None:
+            return self.trades_archive.get_trades(
+                origin_order_id=origin_order_id, exchange_order_id=exchange_order_id
+            ) + self.get_trades(origin_order_id=origin_order_id, exchange_order_id=exchange_order_id)
+        if origin_order_id:
+            trades = self._get_indexed_trades("origin_order_id", origin_order_id)
+        elif exchange_order_id:
+            trades = self._get_indexed_trades("exchange_order_id", exchange_order_id)
+        else:
+            trades = self.trades.values()
         return [
             trade
-            for trade in self.trades.values()
+            for trade in trades
             if (
                 (not origin_order_id or trade.origin_order_id == origin_order_id)
                 and (not exchange_order_id or trade.exchange_order_id == exchange_order_id)
             )
         ]
 
+    def on_trade_indexed_attribute_update(self, trade: "personal_data.Trade", attribute: str, previous_value):
+        """
+        Called by trades when their fee or one of their INDEXED_TRADE_ATTRIBUTES changes
+        :param trade: the updated trade
+        :param attribute: the updated attribute
+        :param previous_value: the attribute value before the update
+        """
+        try:
+            position = self._trade_positions[trade]
+        except KeyError:
+            # trade is not in this trades manager
+            return
+        if attribute == "fee":
+            self._remove_paid_fee(trade, previous_value)
+            self._add_paid_fee(trade, trade.fee)
+            return
+        previous_key = _get_trade_index_key(attribute, previous_value)
+        key = _get_trade_index_key(attribute, getattr(trade, attribute))
+        if key != previous_key:
+            index = self._trades_indexes[attribute]
+            index.remove(previous_key, trade)
+            index.add(key, trade, position)
+
+    def archive_trades(self, until=None) -> int:
+        """
+        Compact trades executed or cancelled before until into the trades archive
+        :param until: the archived trades time limit, defaults to TRADES_ARCHIVE_HORIZON seconds ago
+        :return: the number of archived trades
+        """
+        if self.trades_archive is None:
+            return 0
+        if until is None:
+            until = self.trader.exchange_manager.exchange.get_exchange_current_time() - self.TRADES_ARCHIVE_HORIZON
+        to_archive = [
+            trade_id
+            for trade_id, trade in self.trades.items()
+            if trade.get_time() < until
+        ]
+        for trade_id in to_archive:
+            self.trades_archive.archive_trade(self.trades.pop(trade_id))
+        return len(to_archive)
+
     # private
+    def _get_last_trade_from_order_id(self, order_id: str) -> typing.Optional["personal_data.Trade"]:
+        # the last trade wins when many trades share the same origin_order_id
+        if trades := self._get_indexed_trades("origin_order_id", order_id):
+            return next(reversed(trades))
+        return None
+
+    def _get_indexed_trades(self, attribute, key) -> dict["personal_data.Trade", int]:
+        return self._trades_indexes[attribute].get(key)
+
+    def _add_to_trades_indexes(self, trade, position=None):
+        if trade in self._trade_positions:
+            # trade is already indexed using another trade id
+            self._remove_from_trades_indexes(trade)
+        if position is None:
+            position = self._next_trade_position
+            self._next_trade_position += 1
+        self._trade_positions[trade] = position
+        trade.indexing_trades_manager = self
+        for attribute, index in self._trades_indexes.items():
+            index.add(_get_trade_index_key(attribute, getattr(trade, attribute)), trade, position)
+        self._add_paid_fee(trade, trade.fee)
+
+    def _remove_from_trades_indexes(self, trade) -> typing.Optional[int]:
+        position = self._trade_positions.pop(trade, None)
+        if position is not None:
+            trade.indexing_trades_manager = None
+            for attribute, index in self._trades_indexes.items():
+                index.remove(_get_trade_index_key(attribute, getattr(trade, attribute)), trade)
+            self._remove_paid_fee(trade, trade.fee)
+        return position
+
+    def _add_paid_fee(self, trade, fee):
+        if not trades_util.is_registered_fee(fee):
+            self._trades_without_registered_fee[trade] = None
+        else:
+            fee_cost = fee[enums.FeePropertyColumns.COST.value]
+            fee_currency = fee[enums.FeePropertyColumns.CURRENCY.value]
+            if fee_currency in self._paid_fees:
+                self._paid_fees[fee_currency] += fee_cost
+            else:
+                self._paid_fees[fee_currency] = fee_cost
+            self._paid_fees_trades_count[fee_currency] += 1
+
+    def _remove_paid_fee(self, trade, fee):
+        if not trades_util.is_registered_fee(fee):
+            self._trades_without_registered_fee.pop(trade, None)
+        else:
+            fee_currency = fee[enums.FeePropertyColumns.CURRENCY.value]
+            self._paid_fees_trades_count[fee_currency] -= 1
+            if self._paid_fees_trades_count[fee_currency] > 0:
+                self._paid_fees[fee_currency] -= fee[enums.FeePropertyColumns.COST.value]
+            else:
+                # no more paid fee in this currency
+                self._paid_fees.pop(fee_currency, None)
+                self._paid_fees_trades_count.pop(fee_currency, None)
+
+    def _reset_trades_indexes(self):
+        for trade in self._trade_positions:
+            trade.indexing_trades_manager = None
+        self._trade_positions = {}
+        self._next_trade_position = 0
+        for index in self._trades_indexes.values():
+            index.clear()
+        self._paid_fees = {}
+        self._paid_fees_trades_count = collections.Counter()
+        self._trades_without_registered_fee = {}
+
+    def _on_trade_set(self, trade, previous_trade):
+        if previous_trade is not trade:
+            # replacing a trade keeps its position in self.trades
+            position = None if previous_trade is None else self._remove_from_trades_indexes(previous_trade)
+            self._add_to_trades_indexes(trade, position)
+
+    def _on_trade_removed(self, trade):
+        self._remove_from_trades_indexes(trade)
+
     def _check_trades_size(self):
+        if len(self.trades) > self.MAX_TRADES_COUNT and self.trades_archive is not None:
+            self.archive_trades()
         if len(self.trades) > self.MAX_TRADES_COUNT:
             self._remove_oldest_trades(int(self.MAX_TRADES_COUNT / 10))
 
+    def _get_trades_count(self):
+        return len(self.trades) + (0 if self.trades_archive is None else len(self.trades_archive))
+
     def _reset_trades(self):
         self.trades_initialized = False
         self.trades = collections.OrderedDict()
+        if self.trades_archive is not None:
+            self.trades_archive.clear()
 
     async def _load_trades_history(self, reset):
         if self.trader.exchange_manager.is_backtesting:
@@ -170,16 +353,20 @@ class TradesManager(util.Initializable):
             return
         try:
             if self.trader.exchange_manager.storage_manager.trades_storage:
-                full_history = await self.trader.exchange_manager.storage_manager.trades_storage.get_history()
                 self.logger.debug(
-                    f"Loading {len(full_history)} {self.trader.exchange_manager.exchange_name} historical trades ..."
+                    f"Loading {self.trader.exchange_manager.exchange_name} historical trades ..."
                 )
-                if full_history:
-                    for trade_dict in full_history:
+                stored_trades_count = 0
+                # stored trades are created one by one, only when they are not already loaded
+                async for trade_dict in self.trader.exchange_manager.storage_manager.trades_storage.iter_history():
+                    stored_trades_count += 1
+                    if not self.has_trade(trade_dict.get(enums.ExchangeConstantsOrderColumns.ID.value)):
                         self.upsert_trade_instance(personal_data.Trade.from_dict(self.trader, trade_dict))
+                if stored_trades_count:
                     self.logger.debug(
                         f"Included {dict(self._get_trades_count_by_symbols())} "
-                        f"{self.trader.exchange_manager.exchange_name} trades"
+                        f"{self.trader.exchange_manager.exchange_name} trades from {stored_trades_count} "
+                        f"stored trades"
                     )
 
                 if reset:
@@ -187,10 +374,10 @@ class TradesManager(util.Initializable):
                     await self.trader.exchange_manager.storage_manager.trades_storage.trigger_debounced_update_auth_data(
                         True
                     )
-                if len(full_history) > len(self.trades):
+                if stored_trades_count > self._get_trades_count():
                     # clear removed trades from db
                     self.logger.debug(
-                        f"Removed {len(full_history) - len(self.trades)} beyond limit trades from storage"
+                        f"Removed {stored_trades_count - self._get_trades_count()} beyond limit trades from storage"
                     )
                     await self.trader.exchange_manager.storage_manager.trades_storage.store_history()
 
@@ -208,9 +395,10 @@ class TradesManager(util.Initializable):
             f"Clearing the {nb_to_remove} oldest historical {self.trader.exchange_manager.exchange_name} "
             f"trades as the maximum count of trades ({self.MAX_TRADES_COUNT}) has been reached"
         )
-        popped = []
-        for _ in range(nb_to_remove):
-            popped.append(self.trades.popitem(last=False)[1])
+        popped = [
+            self.trades.popitem(last=False)[1]
+            for _ in range(nb_to_remove)
+        ]
         self.logger.info(
             f"Cleared the {len(popped)} {self.trader.exchange_manager.exchange_name} oldest historical trades: "
             f"{dict(self._get_trades_count_by_symbols(trades=popped))}"
@@ -231,3 +419,10 @@ class TradesManager(util.Initializable):
         for trade in self.trades.values():
             trade.clear()
         self._reset_trades()
+
+
+def _get_trade_index_key(attribute, value):
+    if attribute == "associated_entry_ids":
+        # only index whether trades have associated entries
+        return value is not None
+    return value
@@ -14,6 +14,7 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 import decimal
+import typing
 
 import octobot_commons.symbols as symbols_util
 import octobot_trading.enums as trading_enums
@@ -158,3 +159,12 @@ def get_real_or_estimated_trade_fee(trade: "personal_data.Trade") -> tuple[dict,
         )
         is_estimated_trading_fee = True
     return trading_fee, is_estimated_trading_fee
+
+
+def is_registered_fee(fee: typing.Optional[dict]) -> bool:
+    """
+    :return: True when the fee can be counted in paid fees: it has a cost and a currency
+    """
+    return fee is not None \
+        and trading_enums.FeePropertyColumns.COST.value in fee \
+        and trading_enums.FeePropertyColumns.CURRENCY.value in fee
@@ -107,6 +107,45 @@ async def create_order(
     return created_order
 
 
+async def create_orders(
+    exchange_manager, should_emit_signal, orders_to_create: list,
+    params: dict = None,
+    wait_for_creation=True,
+    creation_timeout=constants.INDIVIDUAL_ORDER_SYNC_TIMEOUT,
+    dependencies: typing.Optional[signals.SignalDependencies] = None,
+    force_if_disabled=False
+) -> list:
+    orders_pf_percents = []
+    if should_emit_signal:
+        for order in orders_to_create:
+            orders_pf_percents.append((
+                await _get_order_portfolio_percent(order, exchange_manager),
+                [
+                    (chained_order, await _get_order_portfolio_percent(chained_order, exchange_manager))
+                    for chained_order in order.chained_orders
+                ]
+            ))
+    created_orders = await exchange_manager.trader.create_orders(
+        orders_to_create, params=params,
+        wait_for_creation=wait_for_creation, creation_timeout=creation_timeout,
+        force_if_disabled=force_if_disabled
+    )
+    if should_emit_signal:
+        for created_order, (order_pf_percent, chained_orders_pf_percent) in zip(created_orders, orders_pf_percents):
+            if created_order is None:
+                continue
+            builder = signals.SignalPublisher.instance().get_signal_bundle_builder(created_order.symbol)
+            builder.add_created_order(
+                created_order, exchange_manager, target_amount=order_pf_percent, dependencies=dependencies
+            )
+            for chained_order, chained_order_pf_percent in chained_orders_pf_percent:
+                builder.add_created_order(
+                    chained_order, exchange_manager, target_amount=chained_order_pf_percent,
+                    dependencies=dependencies
+                )
+    return created_orders
+
+
 async def update_order_as_inactive(
     exchange_manager, should_emit_signal, order, ignored_order: object = None, wait_for_cancelling=True,
     cancelling_timeout=constants.INDIVIDUAL_ORDER_SYNC_TIMEOUT, dependencies: typing.Optional[signals.SignalDependencies] = None
@@ -152,6 +191,28 @@ async def cancel_order(
     return cancelled, signals_util.get_order_dependency(order)
 
 
+async def cancel_orders(
+    exchange_manager, should_emit_signal, orders_to_cancel: list,
+    wait_for_cancelling=True, cancelling_timeout=constants.INDIVIDUAL_ORDER_SYNC_TIMEOUT,
+    dependencies: typing.Optional[signals.SignalDependencies] = None, force_if_disabled=False
+) -> tuple[list[bool], signals.SignalDependencies]:
+    cancelled_orders = await exchange_manager.trader.cancel_orders(
+        orders_to_cancel,
+        wait_for_cancelling=wait_for_cancelling,
+        cancelling_timeout=cancelling_timeout,
+        force_if_disabled=force_if_disabled
+    )
+    if should_emit_signal:
+        for order, cancelled in zip(orders_to_cancel, cancelled_orders):
+            if cancelled:
+                signals.SignalPublisher.instance().get_signal_bundle_builder(order.symbol).add_cancelled_order(
+                    order, exchange_manager, dependencies=dependencies
+                )
+    return cancelled_orders, signals_util.get_orders_dependencies(
+        [order for order, cancelled in zip(orders_to_cancel, cancelled_orders) if cancelled]
+    )
+
+
 async def edit_order(
     exchange_manager,
     should_emit_signal,
@@ -35,6 +35,7 @@ class AbstractStorage:
     IS_HISTORICAL = True
     HISTORY_TABLE = None
     FLUSH_DEBOUNCE_DURATION = 5   # avoid disc spam on multiple quick live updated
+    MAX_BUFFERED_DOCUMENTS_COUNT = 100   # buffered documents are written at once when this count is reached
     IS_MULTI_EXCHANGE_STORAGE = False   # set True when this storage is updating data from all other exchanges as well
     LAST_UPDATE_TIME_PER_MATRIX_ID = {}
 
@@ -50,6 +51,8 @@ class AbstractStorage:
         self._update_task = None
         self._flush_task = None
         self._to_update_auth_data_ids_buffer = set()
+        # documents to append to HISTORY_TABLE
+        self._buffered_documents = []
 
     def should_register_live_consumer(self):
         return self.IS_LIVE_CONSUMER and \
@@ -87,6 +90,8 @@ class AbstractStorage:
                 await self.stop(clear=False)
 
     async def stop(self, clear=True):
+        if self._buffered_documents and self.exchange_manager is not None:
+            await self._write_buffered_documents()
         if self.consumer is not None:
             await self.consumer.stop()
         for task in (self._update_task, self._flush_task):
@@ -118,13 +123,37 @@ class AbstractStorage:
         self._flush_task = asyncio.create_task(self._waiting_flush())
 
     async def get_history(self):
-        # override if necessary
         return [
-            copy.copy(document[trading_constants.STORAGE_ORIGIN_VALUE])
-            for document in await self._get_db().all(self.HISTORY_TABLE)
-            if trading_constants.STORAGE_ORIGIN_VALUE in document
+            element
+            async for element in self.iter_history()
         ]
 
+    async def iter_history(self):
+        """
+        Yields the stored elements one by one. The database reads HISTORY_TABLE documents at once: only the
+        yielded elements are copied lazily, which lets consumers skip elements before building objects from them
+        """
+        # override if necessary
+        await self._write_buffered_documents()
+        for document in await self._get_db().all(self.HISTORY_TABLE):
+            if trading_constants.STORAGE_ORIGIN_VALUE in document:
+                yield copy.copy(document[trading_constants.STORAGE_ORIGIN_VALUE])
+
+    async def _buffer_documents(self, documents: list):
+        """
+        Append documents to HISTORY_TABLE, documents are written at once when
+        MAX_BUFFERED_DOCUMENTS_COUNT is reached or on flush
+        """
+        self._buffered_documents.extend(documents)
+        if len(self._buffered_documents) >= self.MAX_BUFFERED_DOCUMENTS_COUNT:
+            await self._write_buffered_documents()
+
+    async def _write_buffered_documents(self):
+        if self._buffered_documents:
+            documents = self._buffered_documents
+            self._buffered_documents = []
+            await self._get_db().log_many(self.HISTORY_TABLE, documents, cache=False)
+
     async def _waiting_update_auth_data(self, reset):
         try:
             debounce_interval = trading_constants.AUTH_UPDATE_DEBOUNCE_DURATION
@@ -160,9 +189,11 @@ class AbstractStorage:
         raise NotImplementedError(f"_get_db not implemented for {self.__class__.__name__}")
 
     async def clear_history(self, flush=True):
+        self._buffered_documents = []
         await self.clear_database_history(self._get_db(), flush=flush)
 
     async def flush(self):
+        await self._write_buffered_documents()
         await self._get_db().flush()
 
     @contextlib.contextmanager
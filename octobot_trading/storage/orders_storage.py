@@ -36,6 +36,7 @@ class OrdersStorage(abstract_storage.AbstractStorage):
     HISTORY_TABLE = commons_enums.DBTables.ORDERS.value
     HISTORICAL_OPEN_ORDERS_TABLE = commons_enums.DBTables.HISTORICAL_ORDERS_UPDATES.value
     ENABLE_HISTORICAL_ORDER_UPDATES_STORAGE = constants.ENABLE_HISTORICAL_ORDERS_UPDATES_STORAGE
+    ENABLE_DIFF_BASED_OPEN_ORDERS_STORAGE = constants.ENABLE_DIFF_BASED_OPEN_ORDERS_STORAGE
     IS_MULTI_EXCHANGE_STORAGE = True   # set True when this storage is updating data from all other exchanges as well
 
     def __init__(self, exchange_manager, use_live_consumer_in_backtesting=None, is_historical=None):
@@ -44,6 +45,10 @@ class OrdersStorage(abstract_storage.AbstractStorage):
             use_live_consumer_in_backtesting=use_live_consumer_in_backtesting, is_historical=is_historical
         )
         self.startup_orders = {}
+        # order_id: open order document as stored in HISTORY_TABLE, None when the stored documents are unknown
+        self._stored_open_order_documents = None
+        # ids of the orders updated since the last open orders documents write
+        self._updated_order_ids = set()
 
     def should_store_data(self):
         return (
@@ -53,6 +58,22 @@ class OrdersStorage(abstract_storage.AbstractStorage):
     async def on_start(self):
         await self._load_startup_orders()
 
+    async def stop(self, clear=True):
+        if self._updated_order_ids and self.exchange_manager is not None and self.should_store_data():
+            # write pending updates before stopping
+            await self._update_changed_history()
+        await super().stop(clear=clear)
+
+    async def flush(self):
+        if self._updated_order_ids:
+            # coalesced open orders updates are written before each flush
+            await self._update_changed_history()
+        await super().flush()
+
+    async def clear_history(self, flush=True):
+        await super().clear_history(flush=flush)
+        self._stored_open_order_documents = {}
+
     async def _live_callback(
         self,
         exchange: str,
@@ -66,21 +87,97 @@ class OrdersStorage(abstract_storage.AbstractStorage):
         await self.trigger_debounced_update_auth_data(False)
         # only store the current snapshot of open orders when order updates are received
         if self.should_store_data():
-            await self._update_history()
+            if self.ENABLE_DIFF_BASED_OPEN_ORDERS_STORAGE:
+                # updated orders documents are written on the next flush
+                self._updated_order_ids.update(
+                    self._get_updated_order_ids(order[enums.ExchangeConstantsOrderColumns.ID.value])
+                )
+            else:
+                await self._update_history()
             if self.ENABLE_HISTORICAL_ORDER_UPDATES_STORAGE:
                 await self._add_historical_open_orders(order, update_type)
             await self.trigger_debounced_flush()
 
+    def _get_updated_order_ids(self, order_id: str) -> set:
+        """
+        :return: order_id and the ids of the orders which documents include details of this order:
+        orders of its group and orders it is chained to
+        """
+        updated_order_ids = {order_id}
+        orders_manager = self.exchange_manager.exchange_personal_data.orders_manager
+        try:
+            updated_order = orders_manager.get_order(order_id)
+        except KeyError:
+            # order is not in orders manager anymore
+            return updated_order_ids
+        if updated_order.order_group is not None:
+            updated_order_ids.update(
+                group_order.order_id
+                for group_order in orders_manager.get_order_from_group(updated_order.order_group.name)
+            )
+        parent_order = updated_order.triggered_by
+        while parent_order is not None:
+            updated_order_ids.add(parent_order.order_id)
+            parent_order = parent_order.triggered_by
+        return updated_order_ids
+
     @abstract_storage.AbstractStorage.hard_reset_and_retry_if_necessary
     async def _update_history(self):
-        await self._get_db().replace_all(
-            self.HISTORY_TABLE,
-            [
-                _format_order(order, self.exchange_manager)
+        open_orders = self.exchange_manager.exchange_personal_data.orders_manager.get_open_orders()
+        documents = [
+            _format_order(order, self.exchange_manager)
+            for order in open_orders
+        ]
+        await self._get_db().replace_all(self.HISTORY_TABLE, documents, cache=False)
+        self._stored_open_order_documents = {
+            order.order_id: document
+            for order, document in zip(open_orders, documents)
+            if document
+        }
+        self._updated_order_ids = set()
+
+    @abstract_storage.AbstractStorage.hard_reset_and_retry_if_necessary
+    async def _update_changed_history(self):
+        """
+        Only write the documents of the open orders that changed since the last write:
+        updated and new open orders documents are replaced and closed orders documents are deleted
+        """
+        if self._stored_open_order_documents is None:
+            # stored documents are unknown: replace them all
+            await self._update_history()
+            return
+        try:
+            open_orders = {
+                order.order_id: order
                 for order in self.exchange_manager.exchange_personal_data.orders_manager.get_open_orders()
-            ],
-            cache=False,
-        )
+            }
+            removed_order_ids = self._stored_open_order_documents.keys() - open_orders.keys()
+            updated_documents = {}
+            for order_id in (self._updated_order_ids & open_orders.keys()) \
+                    | (open_orders.keys() - self._stored_open_order_documents.keys()):
+                document = _format_order(open_orders[order_id], self.exchange_manager)
+                if document and document != self._stored_open_order_documents.get(order_id):
+                    updated_documents[order_id] = document
+            self._updated_order_ids = set()
+            if to_delete_order_ids := removed_order_ids | (
+                updated_documents.keys() & self._stored_open_order_documents.keys()
+            ):
+                query = await self._get_db().search()
+                await self._get_db().delete(
+                    self.HISTORY_TABLE,
+                    query[constants.STORAGE_ORIGIN_VALUE][enums.ExchangeConstantsOrderColumns.ID.value].one_of(
+                        list(to_delete_order_ids)
+                    )
+                )
+            if updated_documents:
+                await self._get_db().log_many(self.HISTORY_TABLE, list(updated_documents.values()), cache=False)
+            for order_id in removed_order_ids:
+                self._stored_open_order_documents.pop(order_id)
+            self._stored_open_order_documents.update(updated_documents)
+        except Exception:
+            # stored documents might be partially updated
+            self._stored_open_order_documents = None
+            raise
 
     async def _add_historical_open_orders(self, order_dict: dict, update_type: str):
         update_time = time.time()
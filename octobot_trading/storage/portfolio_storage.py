@@ -128,7 +128,7 @@ class PortfolioStorage(abstract_storage.AbstractStorage):
                 first_value[portfolio_history.HistoricalAssetValue.VALUES_KEY].get(reference_market, 0)
             history = [
                 history_val
-                for history_val in hist_portfolio_values_manager.get_dict_historical_values()
+                for history_val in full_history
                 if history_val[portfolio_history.HistoricalAssetValue.TIMESTAMP_KEY] in self._to_update_auth_data_ids_buffer
             ]
             if not self.exchange_manager.is_trader_simulated:
@@ -13,6 +13,8 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library
+import itertools
+
 import octobot_commons.channels_name as channels_name
 import octobot_commons.enums as commons_enums
 import octobot_commons.authentication as authentication
@@ -30,6 +32,16 @@ class TradesStorage(abstract_storage.AbstractStorage):
     LIVE_CHANNEL = channels_name.OctoBotTradingChannelsName.TRADES_CHANNEL.value
     HISTORY_TABLE = commons_enums.DBTables.TRADES.value
 
+    def __init__(self, exchange_manager, plot_settings, use_live_consumer_in_backtesting=None, is_historical=None):
+        super().__init__(
+            exchange_manager, plot_settings,
+            use_live_consumer_in_backtesting=use_live_consumer_in_backtesting, is_historical=is_historical
+        )
+        # ids of the trades in HISTORY_TABLE, None when stored trades are unknown
+        self._stored_trade_ids = None
+        # ids of the buffered trades which documents might already be in HISTORY_TABLE
+        self._updated_trade_ids = set()
+
     @abstract_storage.AbstractStorage.hard_reset_and_retry_if_necessary
     async def _live_callback(
         self,
@@ -41,8 +53,12 @@ class TradesStorage(abstract_storage.AbstractStorage):
         old_trade: bool
     ):
         if trade[enums.ExchangeConstantsOrderColumns.STATUS.value] != enums.OrderStatus.CANCELED.value:
-            await self._get_db().log(
-                self.HISTORY_TABLE,
+            trade_id = trade[enums.ExchangeConstantsOrderColumns.ID.value]
+            if self._stored_trade_ids is None or trade_id in self._stored_trade_ids:
+                # this trade document is replaced on flush
+                self._updated_trade_ids.add(trade_id)
+            # trades are appended to history on flush
+            await self._buffer_documents([
                 _format_trade(
                     trade,
                     self.exchange_manager,
@@ -51,9 +67,11 @@ class TradesStorage(abstract_storage.AbstractStorage):
                     self.plot_settings.kind,
                     self.plot_settings.mode
                 )
-            )
+            ])
+            if self._stored_trade_ids is not None:
+                self._stored_trade_ids.add(trade_id)
             await self.trigger_debounced_flush()
-            self._to_update_auth_data_ids_buffer.add(trade[enums.ExchangeConstantsOrderColumns.ID.value])
+            self._to_update_auth_data_ids_buffer.add(trade_id)
             await self.trigger_debounced_update_auth_data(False)
 
     async def _update_auth_data(self, reset):
@@ -73,27 +91,97 @@ class TradesStorage(abstract_storage.AbstractStorage):
             await authenticator.update_trades(history, self.exchange_manager.exchange_name, reset)
             self._to_update_auth_data_ids_buffer.clear()
 
+    async def clear_history(self, flush=True):
+        await super().clear_history(flush=flush)
+        self._stored_trade_ids = set()
+        self._updated_trade_ids = set()
+
+    async def _write_buffered_documents(self):
+        if self._updated_trade_ids and self._buffered_documents:
+            # upsert updated trades: only keep their latest document and delete their stored ones
+            documents_by_trade_id = {
+                document[commons_enums.DBRows.ID.value]: document
+                for document in self._buffered_documents
+            }
+            self._buffered_documents = list(documents_by_trade_id.values())
+            if to_delete_trade_ids := self._updated_trade_ids & documents_by_trade_id.keys():
+                query = await self._get_db().search()
+                await self._get_db().delete(
+                    self.HISTORY_TABLE,
+                    query[constants.STORAGE_ORIGIN_VALUE][enums.ExchangeConstantsOrderColumns.ID.value].one_of(
+                        list(to_delete_trade_ids)
+                    )
+                )
+        self._updated_trade_ids = set()
+        await super()._write_buffered_documents()
+
+    async def iter_history(self):
+        stored_trade_ids = set()
+        async for trade_dict in super().iter_history():
+            stored_trade_ids.add(trade_dict[enums.ExchangeConstantsOrderColumns.ID.value])
+            yield trade_dict
+        self._stored_trade_ids = stored_trade_ids
+
     @abstract_storage.AbstractStorage.hard_reset_and_retry_if_necessary
     async def _store_history(self):
         database = self._get_db()
-        await database.replace_all(
-            self.HISTORY_TABLE,
-            [
-                _format_trade(
-                    trade.to_dict(),
-                    self.exchange_manager,
-                    self.plot_settings.chart,
-                    self.plot_settings.x_multiplier,
-                    self.plot_settings.kind,
-                    self.plot_settings.mode
+        trades_manager = self.exchange_manager.exchange_personal_data.trades_manager
+        archived_trade_ids = () if trades_manager.trades_archive is None \
+            else trades_manager.trades_archive.get_trade_ids()
+        if self._stored_trade_ids is not None and self._stored_trade_ids.issubset(
+            itertools.chain(archived_trade_ids, trades_manager.trades)
+        ):
+            # no stored trade has been removed: only append new trades
+            await self._buffer_documents(self._get_formatted_trades(
+                itertools.chain(
+                    (
+                        trades_manager.trades_archive.get_trade_dict(trade_id)
+                        for trade_id in archived_trade_ids
+                        if trade_id not in self._stored_trade_ids
+                    ),
+                    (
+                        trade.to_dict()
+                        for trade_id, trade in trades_manager.trades.items()
+                        if trade_id not in self._stored_trade_ids
+                    )
                 )
-                for trade in self.exchange_manager.exchange_personal_data.trades_manager.trades.values()
-                if trade.status is not enums.OrderStatus.CANCELED
-            ],
-            cache=False,
+            ))
+            await self._write_buffered_documents()
+        else:
+            self._buffered_documents = []
+            self._updated_trade_ids = set()
+            archived_trade_dicts = [] if trades_manager.trades_archive is None \
+                else trades_manager.trades_archive.get_trade_dicts()
+            await database.replace_all(
+                self.HISTORY_TABLE,
+                self._get_formatted_trades(
+                    itertools.chain(
+                        archived_trade_dicts,
+                        (trade.to_dict() for trade in trades_manager.trades.values())
+                    )
+                ),
+                cache=False,
+            )
+            self._stored_trade_ids = set()
+        self._stored_trade_ids.update(
+            itertools.chain(archived_trade_ids, trades_manager.trades)
         )
         await database.flush()
 
+    def _get_formatted_trades(self, trade_dicts) -> list:
+        return [
+            _format_trade(
+                trade_dict,
+                self.exchange_manager,
+                self.plot_settings.chart,
+                self.plot_settings.x_multiplier,
+                self.plot_settings.kind,
+                self.plot_settings.mode
+            )
+            for trade_dict in trade_dicts
+            if trade_dict[enums.ExchangeConstantsOrderColumns.STATUS.value] != enums.OrderStatus.CANCELED.value
+        ]
+
     def _get_trade_dict_with_usd_like_volume(self, trade) -> dict:
         trade_dict = trade.to_dict()
         parsed_symbol = commons_symbols.parse_symbol(trade.symbol)
@@ -24,16 +24,33 @@ class TransactionsStorage(abstract_storage.AbstractStorage):
     IS_LIVE_CONSUMER = False
     HISTORY_TABLE = commons_enums.DBTables.TRANSACTIONS.value
 
+    def __init__(self, exchange_manager, plot_settings, use_live_consumer_in_backtesting=None, is_historical=None):
+        super().__init__(
+            exchange_manager, plot_settings,
+            use_live_consumer_in_backtesting=use_live_consumer_in_backtesting, is_historical=is_historical
+        )
+        # transaction_id: transaction of the transactions in HISTORY_TABLE, None when stored transactions are unknown
+        self._stored_transactions = None
+
+    async def clear_history(self, flush=True):
+        await super().clear_history(flush=flush)
+        self._stored_transactions = {}
+
     @abstract_storage.AbstractStorage.hard_reset_and_retry_if_necessary
     async def _store_history(self):
-        transactions = [
-            transaction
-            for transaction in self.exchange_manager.exchange_personal_data.transactions_manager.transactions.values()
-        ]
+        transactions_by_id = self.exchange_manager.exchange_personal_data.transactions_manager.transactions
+        transactions = list(transactions_by_id.values())
         y_data = self.plot_settings.y_data or [0] * len(transactions)
-        await self._get_db().replace_all(
-            self.HISTORY_TABLE,
-            [
+        if (
+            self._stored_transactions is not None
+            and not self.plot_settings.y_data
+            and all(
+                transactions_by_id.get(transaction_id) is transaction
+                for transaction_id, transaction in self._stored_transactions.items()
+            )
+        ):
+            # no stored transaction has been removed or replaced: only append new transactions
+            await self._buffer_documents([
                 _format_transaction(
                     transaction,
                     self.exchange_manager,
@@ -44,9 +61,27 @@ class TransactionsStorage(abstract_storage.AbstractStorage):
                     y_data[index]
                 )
                 for index, transaction in enumerate(transactions)
-            ],
-            cache=False,
-        )
+                if transaction.transaction_id not in self._stored_transactions
+            ])
+            await self._write_buffered_documents()
+        else:
+            await self._get_db().replace_all(
+                self.HISTORY_TABLE,
+                [
+                    _format_transaction(
+                        transaction,
+                        self.exchange_manager,
+                        self.plot_settings.chart,
+                        self.plot_settings.x_multiplier,
+                        self.plot_settings.kind,
+                        self.plot_settings.mode,
+                        y_data[index]
+                    )
+                    for index, transaction in enumerate(transactions)
+                ],
+                cache=False,
+            )
+        self._stored_transactions = dict(transactions_by_id)
         await self.trigger_debounced_flush()
 
     def _get_db(self):
@@ -19,11 +19,43 @@ from octobot_trading.util.initializable import (
     Initializable,
 )
 
+from octobot_trading.util import attribute_index
+from octobot_trading.util.attribute_index import (
+    AttributeIndex,
+)
+
+from octobot_trading.util import notifying_ordered_dict
+from octobot_trading.util.notifying_ordered_dict import (
+    NotifyingOrderedDict,
+)
+
+from octobot_trading.util import read_only_dict
+from octobot_trading.util.read_only_dict import (
+    ReadOnlyDict,
+    get_read_only_dict,
+)
+
 from octobot_trading.util import initialization_util
 from octobot_trading.util.initialization_util import (
     wait_for_topic_init,
 )
 
+from octobot_trading.util import async_util
+from octobot_trading.util.async_util import (
+    gather_with_bounded_concurrency,
+)
+
+from octobot_trading.util import decimal_util
+from octobot_trading.util.decimal_util import (
+    to_decimal,
+    clear_decimal_conversion_cache,
+)
+
+from octobot_trading.util import backtesting_data_stream
+from octobot_trading.util.backtesting_data_stream import (
+    BacktestingDataStream,
+)
+
 from octobot_trading.util import simulator_updater_utils
 from octobot_trading.util import config_util
 
@@ -57,6 +89,14 @@ __all__ = [
     "resume_time_consumer",
     "get_time_channel",
     "Initializable",
+    "AttributeIndex",
+    "NotifyingOrderedDict",
+    "ReadOnlyDict",
+    "get_read_only_dict",
+    "gather_with_bounded_concurrency",
+    "to_decimal",
+    "clear_decimal_conversion_cache",
+    "BacktestingDataStream",
     "is_trading_paused",
     "is_trader_enabled",
     "is_trader_simulator_enabled",
@@ -0,0 +1,38 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library
+import asyncio
+import typing
+
+
+async def gather_with_bounded_concurrency(
+    coroutines: typing.Iterable[typing.Awaitable], max_concurrency: int, return_exceptions: bool = False
+) -> list:
+    """
+    :param coroutines: the coroutines to run
+    :param max_concurrency: the maximum number of coroutines running at the same time
+    :param return_exceptions: when True, errors raised by coroutines are returned instead of being raised, which
+    makes sure that the results of the other coroutines are not lost
+    :return: the result of each coroutine, in the same order as coroutines
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _bounded(coroutine):
+        async with semaphore:
+            return await coroutine
+
+    return await asyncio.gather(
+        *(_bounded(coroutine) for coroutine in coroutines), return_exceptions=return_exceptions
+    )
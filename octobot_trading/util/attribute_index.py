@@ -0,0 +1,59 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import operator
+import typing
+
+
+class AttributeIndex:
+    """
+    Elements grouped by the value of one of their attributes.
+    Elements of each group are kept sorted by their position in their container.
+    """
+    def __init__(self):
+        self.elements_by_key: dict[typing.Hashable, dict[typing.Any, int]] = {}
+        # keys of groups where an element has been added before an element of a greater position
+        self._unsorted_keys: set[typing.Hashable] = set()
+
+    def get(self, key) -> dict[typing.Any, int]:
+        """
+        :param key: the attribute value to get elements of
+        :return: the element: position dict of the elements of the given key, sorted by position
+        """
+        if key in self._unsorted_keys:
+            self.elements_by_key[key] = dict(sorted(self.elements_by_key[key].items(), key=operator.itemgetter(1)))
+            self._unsorted_keys.remove(key)
+        return self.elements_by_key.get(key, {})
+
+    def add(self, key, element, position: int):
+        try:
+            elements = self.elements_by_key[key]
+            if position < next(reversed(elements.values())):
+                self._unsorted_keys.add(key)
+        except KeyError:
+            elements = self.elements_by_key[key] = {}
+        elements[element] = position
+
+    def remove(self, key, element):
+        elements = self.elements_by_key.get(key)
+        if elements is not None:
+            elements.pop(element, None)
+            if not elements:
+                self.elements_by_key.pop(key)
+                self._unsorted_keys.discard(key)
+
+    def clear(self):
+        self.elements_by_key = {}
+        self._unsorted_keys = set()
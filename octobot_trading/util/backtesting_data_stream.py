@@ -0,0 +1,94 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import array
+import bisect
+import operator
+
+
+class BacktestingDataStream:
+    """
+    BacktestingDataStream serves chronological time windows of backtesting data series.
+    Each series is read once from its importer and stored as timestamps and rows arrays: selecting rows is
+    then a binary search from a cursor on the last selected row instead of a database or cache read on each
+    time update.
+    Rows are sorted using their first element: the row timestamp, as read from backtesting databases.
+    """
+
+    def __init__(self):
+        self._series_by_key: dict = {}
+
+    def has_series(self, series_key) -> bool:
+        return series_key in self._series_by_key
+
+    def set_series(self, series_key, rows):
+        """
+        :param series_key: the identifier of the series
+        :param rows: the rows of the series, as read from the backtesting importer
+        """
+        self._series_by_key[series_key] = _DataSeries(sorted(rows, key=operator.itemgetter(0)))
+
+    async def load_series(self, series_key, load_rows, *args, **kwargs):
+        """
+        Reads the series using load_rows when it's not already loaded
+        :param series_key: the identifier of the series
+        :param load_rows: the importer coroutine function returning the series rows
+        """
+        if series_key not in self._series_by_key:
+            self.set_series(series_key, await load_rows(*args, **kwargs))
+
+    def get_rows(self, series_key, inferior_timestamp, superior_timestamp=None) -> list:
+        """
+        :param series_key: the identifier of the series
+        :param inferior_timestamp: the minimum timestamp of the selected rows (included)
+        :param superior_timestamp: the maximum timestamp of the selected rows (included), None to select every row
+        from inferior_timestamp
+        :return: the selected rows
+        """
+        series = self._series_by_key[series_key]
+        start_index = series.move_cursor(inferior_timestamp)
+        if superior_timestamp is None:
+            return series.rows[start_index:]
+        return series.rows[start_index:bisect.bisect_right(series.timestamps, superior_timestamp, start_index)]
+
+    def get_first_row(self, series_key, inferior_timestamp):
+        """
+        :param series_key: the identifier of the series
+        :param inferior_timestamp: the minimum timestamp of the selected row (included)
+        :return: the first row from inferior_timestamp, raises IndexError when there is no such row
+        """
+        series = self._series_by_key[series_key]
+        return series.rows[series.move_cursor(inferior_timestamp)]
+
+    def clear(self):
+        self._series_by_key = {}
+
+
+class _DataSeries:
+    __slots__ = ("rows", "timestamps", "cursor")
+
+    def __init__(self, sorted_rows):
+        self.rows: list = sorted_rows
+        self.timestamps: array.array = array.array("d", (row[0] for row in sorted_rows))
+        # index of the first row of the last selection
+        self.cursor: int = 0
+
+    def move_cursor(self, inferior_timestamp) -> int:
+        cursor = self.cursor
+        if cursor and self.timestamps[cursor - 1] >= inferior_timestamp:
+            # selecting rows from before the last selection: search from the beginning
+            cursor = 0
+        self.cursor = cursor = bisect.bisect_left(self.timestamps, inferior_timestamp, cursor)
+        return cursor
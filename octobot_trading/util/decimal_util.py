@@ -0,0 +1,40 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import decimal
+import functools
+
+import octobot_trading.constants as constants
+
+
+@functools.lru_cache(maxsize=constants.DECIMAL_CONVERSION_CACHE_SIZE, typed=True)
+def _to_cached_decimal(value) -> decimal.Decimal:
+    return decimal.Decimal(str(value))
+
+
+def to_decimal(value) -> decimal.Decimal:
+    """
+    Converts a parsed exchange value (usually a float or a string) into a decimal.Decimal.
+    Exchanges keep sending the same price levels: recently converted values are cached.
+    :param value: the value to convert
+    :return: the same decimal.Decimal as decimal.Decimal(str(value))
+    """
+    if isinstance(value, decimal.Decimal):
+        return value
+    return _to_cached_decimal(value)
+
+
+def clear_decimal_conversion_cache():
+    _to_cached_decimal.cache_clear()
@@ -0,0 +1,73 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import collections
+import typing
+
+
+class NotifyingOrderedDict(collections.OrderedDict):
+    """
+    OrderedDict calling on_set(value, previous_value) after a value is set and on_remove(value) after
+    a value is removed, whichever method is used to edit it. previous_value is None for new keys.
+    Copies are regular OrderedDicts: they don't notify.
+    """
+    __slots__ = ("_on_set", "_on_remove")
+
+    def __init__(
+        self,
+        on_set: typing.Callable[[typing.Any, typing.Any], None],
+        on_remove: typing.Callable[[typing.Any], None],
+        *args, **kwargs
+    ):
+        self._on_set = on_set
+        self._on_remove = on_remove
+        super().__init__(*args, **kwargs)
+
+    def __setitem__(self, key, value):
+        previous_value = self.get(key)
+        super().__setitem__(key, value)
+        self._on_set(value, previous_value)
+
+    def __delitem__(self, key):
+        value = self[key]
+        super().__delitem__(key)
+        self._on_remove(value)
+
+    def pop(self, key, *default):
+        if key not in self:
+            return super().pop(key, *default)
+        value = super().pop(key)
+        self._on_remove(value)
+        return value
+
+    def popitem(self, last=True):
+        key, value = super().popitem(last=last)
+        self._on_remove(value)
+        return key, value
+
+    def clear(self):
+        values = list(self.values())
+        super().clear()
+        for value in values:
+            self._on_remove(value)
+
+    def copy(self) -> collections.OrderedDict:
+        return collections.OrderedDict(self)
+
+    def __copy__(self) -> collections.OrderedDict:
+        return collections.OrderedDict(self)
+
+    def __reduce__(self):
+        return collections.OrderedDict, (list(self.items()), )
@@ -0,0 +1,72 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import copy
+
+
+class ReadOnlyDict(dict):
+    """
+    dict that can't be updated, used to share cached values without letting their users change them.
+    Nested dicts are also ReadOnlyDict and nested lists are tuples.
+    Copies (copy(), copy.copy() and copy.deepcopy()) are regular dicts, deep copies are fully mutable.
+    """
+    __slots__ = ()
+
+    def _read_only(self, *_, **__):
+        raise TypeError(f"{self.__class__.__name__} can't be updated")
+
+    __setitem__ = __delitem__ = __ior__ = clear = pop = popitem = setdefault = update = _read_only
+
+    def copy(self) -> dict:
+        return dict(self)
+
+    def __copy__(self) -> dict:
+        return dict(self)
+
+    def __deepcopy__(self, memo) -> dict:
+        return {
+            key: _get_mutable_copy(value, memo)
+            for key, value in self.items()
+        }
+
+    def __reduce__(self):
+        return ReadOnlyDict, (dict(self), )
+
+
+def get_read_only_dict(element: dict) -> ReadOnlyDict:
+    """
+    :param element: the dict to copy
+    :return: a ReadOnlyDict copy of element, nested dicts and lists are also converted
+    """
+    return ReadOnlyDict(
+        (key, _get_read_only_value(value))
+        for key, value in element.items()
+    )
+
+
+def _get_read_only_value(value):
+    if isinstance(value, dict):
+        return get_read_only_dict(value)
+    if isinstance(value, list):
+        return tuple(_get_read_only_value(element) for element in value)
+    return value
+
+
+def _get_mutable_copy(value, memo):
+    if isinstance(value, ReadOnlyDict):
+        return value.__deepcopy__(memo)
+    if isinstance(value, tuple):
+        return [_get_mutable_copy(element, memo) for element in value]
+    return copy.deepcopy(value, memo)
@@ -14,6 +14,7 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 import numpy as np
+import pytest
 
 from octobot_commons.enums import PriceIndexes
 from octobot_trading.exchange_data.ohlcv.candles_manager import CandlesManager
@@ -92,6 +93,64 @@ def test_get_symbol_prices():
     assert second_sym_price[PriceIndexes.IND_PRICE_TIME.value][-1] == second_candle[PriceIndexes.IND_PRICE_TIME.value]
 
 
+def test_get_symbol_candles_view():
+    candles_manager = CandlesManager()
+    assert candles_manager.get_symbol_candles_view().shape == (len(PriceIndexes), 0)
+    all_candles = _gen_candles(candles_manager.max_candles_count + 5)
+    candles_manager.add_old_and_new_candles(all_candles)
+
+    candles_view = candles_manager.get_symbol_candles_view()
+    assert candles_view.shape == (len(PriceIndexes), candles_manager.max_candles_count)
+    assert candles_view.T.tolist() == [
+        [float(value) for value in candle]
+        for candle in all_candles[-candles_manager.max_candles_count:]
+    ]
+    limited_view = candles_manager.get_symbol_candles_view(limit=3)
+    assert limited_view[PriceIndexes.IND_PRICE_CLOSE.value].tolist() == \
+        [candle[PriceIndexes.IND_PRICE_CLOSE.value] for candle in all_candles[-3:]]
+    assert np.shares_memory(limited_view, candles_manager.close_candles)
+    with pytest.raises(ValueError):
+        limited_view[PriceIndexes.IND_PRICE_CLOSE.value, 0] = 1
+
+    # views follow candle updates
+    updated_candle = list(all_candles[-1])
+    updated_candle[PriceIndexes.IND_PRICE_CLOSE.value] = 1
+    candles_manager.upsert_candle(updated_candle)
+    assert limited_view[PriceIndexes.IND_PRICE_CLOSE.value][-1] == 1
+
+
+def test_get_symbol_candles_view_snapshot():
+    candles_manager = CandlesManager()
+    all_candles = _gen_candles(10)
+    candles_manager.add_old_and_new_candles(all_candles)
+    snapshot = candles_manager.get_symbol_prices_view(snapshot=True)
+    same_snapshot = candles_manager.get_symbol_prices_view(limit=2, snapshot=True)
+    expected_close_candles = [candle[PriceIndexes.IND_PRICE_CLOSE.value] for candle in all_candles]
+    assert snapshot[PriceIndexes.IND_PRICE_CLOSE.value].tolist() == expected_close_candles
+    assert np.shares_memory(snapshot[PriceIndexes.IND_PRICE_CLOSE.value], candles_manager.close_candles)
+
+    # snapshots are not updated
+    updated_candle = list(all_candles[-1])
+    updated_candle[PriceIndexes.IND_PRICE_CLOSE.value] = 1
+    candles_manager.upsert_candle(updated_candle)
+    candles_manager.add_new_candle(_get_candle(11))
+    assert not np.shares_memory(snapshot[PriceIndexes.IND_PRICE_CLOSE.value], candles_manager.close_candles)
+    assert snapshot[PriceIndexes.IND_PRICE_CLOSE.value].tolist() == expected_close_candles
+    assert same_snapshot[PriceIndexes.IND_PRICE_CLOSE.value].tolist() == expected_close_candles[-2:]
+    assert candles_manager.get_symbol_close_candles(3).tolist() == \
+        expected_close_candles[-2:-1] + [1, _get_candle(11)[PriceIndexes.IND_PRICE_CLOSE.value]]
+
+
+def test_get_candles():
+    candles_manager = CandlesManager()
+    assert candles_manager.get_candles() == []
+    all_candles = _gen_candles(10)
+    candles_manager.add_old_and_new_candles(all_candles)
+    assert candles_manager.get_candles() == all_candles
+    assert candles_manager.get_candles(3) == all_candles[-3:]
+    assert candles_manager.get_candles(20) == all_candles
+
+
 def test_get_symbol_candles_data():
     candles_manager = CandlesManager()
     _test_data(candles_manager.get_symbol_close_candles(), 0, np.nan)
@@ -155,6 +214,75 @@ def test_reach_max_candles_count_with_custom_candles_count():
                other_candles[-1][PriceIndexes.IND_PRICE_CLOSE.value])
 
 
+def test_candles_window_after_many_new_candles():
+    candles_manager = CandlesManager()
+    # add enough candles to move the candles window back to the start of the candles buffer several times
+    all_candles = _gen_candles(candles_manager.max_candles_count * 3 + 7)
+    for candle in all_candles:
+        candles_manager.add_new_candle(candle)
+    assert candles_manager.reached_max is True
+    assert len(candles_manager.close_candles) == candles_manager.max_candles_count
+    expected_candles = all_candles[-candles_manager.max_candles_count:]
+    for price_index in PriceIndexes:
+        assert candles_manager.get_symbol_prices()[price_index.value].tolist() == \
+            [candle[price_index.value] for candle in expected_candles]
+    assert candles_manager.get_symbol_close_candles(3).tolist() == \
+        [candle[PriceIndexes.IND_PRICE_CLOSE.value] for candle in expected_candles[-3:]]
+    # returned candles are not updated by new candles
+    close_candles = candles_manager.get_symbol_close_candles()
+    candles_manager.add_new_candle(_get_candle(len(all_candles) + 1))
+    assert close_candles[-1] == expected_candles[-1][PriceIndexes.IND_PRICE_CLOSE.value]
+    _test_data(candles_manager.get_symbol_close_candles(), candles_manager.max_candles_count,
+               _get_candle(len(all_candles) + 1)[PriceIndexes.IND_PRICE_CLOSE.value])
+
+
+def test_upsert_candle():
+    candles_manager = CandlesManager()
+    all_candles = _gen_candles(candles_manager.max_candles_count + 10)
+    candles_manager.add_old_and_new_candles(all_candles)
+    updated_candle = list(all_candles[-2])
+    updated_candle[PriceIndexes.IND_PRICE_CLOSE.value] = 1
+    candles_manager.upsert_candle(updated_candle)
+    assert candles_manager.get_symbol_close_candles(2).tolist() == \
+        [1, all_candles[-1][PriceIndexes.IND_PRICE_CLOSE.value]]
+    assert candles_manager.get_symbol_time_candles(2).tolist() == \
+        [candle[PriceIndexes.IND_PRICE_TIME.value] for candle in all_candles[-2:]]
+
+    # unknown candle: add it
+    new_candle = _get_candle(len(all_candles) + 1)
+    candles_manager.upsert_candle(new_candle)
+    _test_data(candles_manager.get_symbol_close_candles(), candles_manager.max_candles_count,
+               new_candle[PriceIndexes.IND_PRICE_CLOSE.value])
+
+
+def test_candles_time_index():
+    candles_manager = CandlesManager()
+    all_candles = _gen_candles(candles_manager.max_candles_count * 2 + 5)
+    candles_manager.add_old_and_new_candles(all_candles)
+    # dropped candles are not indexed anymore
+    assert len(candles_manager._candle_number_by_time) == candles_manager.max_candles_count
+    assert candles_manager._get_candle_index_from_time(all_candles[0][PriceIndexes.IND_PRICE_TIME.value]) is None
+    for index, candle in enumerate(all_candles[-candles_manager.max_candles_count:]):
+        assert candles_manager._get_candle_index_from_time(candle[PriceIndexes.IND_PRICE_TIME.value]) == index
+
+    # already added candles are not added again
+    candles_manager.add_old_and_new_candles(all_candles[-5:])
+    candles_manager.add_new_candle(all_candles[-3])
+    _test_data(candles_manager.get_symbol_close_candles(), candles_manager.max_candles_count,
+               all_candles[-1][PriceIndexes.IND_PRICE_CLOSE.value])
+
+    # update an old candle
+    updated_candle = list(all_candles[-candles_manager.max_candles_count])
+    updated_candle[PriceIndexes.IND_PRICE_VOL.value] = 2
+    candles_manager.upsert_candle(updated_candle)
+    assert candles_manager.get_symbol_volume_candles()[0] == 2
+    assert candles_manager.get_symbol_time_candles()[0] == updated_candle[PriceIndexes.IND_PRICE_TIME.value]
+
+    candles_manager.replace_all_candles(_gen_candles(3))
+    assert candles_manager._get_candle_index_from_time(all_candles[-1][PriceIndexes.IND_PRICE_TIME.value]) is None
+    assert candles_manager._get_candle_index_from_time(3) == 2
+
+
 def _test_data(candles_data, expected_len, expected_last_val):
     assert len(candles_data) == expected_len
     if expected_len > 0:
@@ -0,0 +1,79 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import octobot_commons.constants as commons_constants
+from octobot_commons.enums import PriceIndexes
+from octobot_trading.exchange_data.ohlcv.preloaded_candles_manager import PreloadedCandlesManager
+
+
+def test_replace_all_candles():
+    candles_manager = PreloadedCandlesManager()
+    assert candles_manager.get_preloaded_symbol_candles_count() == 0
+    candles = _gen_candles(10)
+    candles_manager.replace_all_candles(candles)
+    assert candles_manager.get_preloaded_symbol_candles_count() == 10
+    assert candles_manager.get_preloaded_symbol_close_candles().tolist() == \
+        [candle[PriceIndexes.IND_PRICE_CLOSE.value] for candle in candles]
+    assert candles_manager.get_preloaded_symbol_time_candles().tolist() == \
+        [candle[PriceIndexes.IND_PRICE_TIME.value] for candle in candles]
+    # no candle is selected yet
+    assert candles_manager.get_symbol_close_candles().tolist() == []
+
+
+def test_add_old_and_new_candles():
+    candles_manager = PreloadedCandlesManager()
+    candles = _gen_candles(10)
+    candles_manager.replace_all_candles(candles)
+
+    assert candles_manager._get_candle_index(candles[3]) == 3
+    candles_manager.add_old_and_new_candles(candles[:4])
+    assert candles_manager.time_candles_index == 3
+    assert candles_manager.get_symbol_close_candles().tolist() == \
+        [candle[PriceIndexes.IND_PRICE_CLOSE.value] for candle in candles[:3]]
+
+    # next candles: return index + 1 as it is used as a select length
+    assert candles_manager._get_candle_index(candles[3]) == 4
+    assert candles_manager._get_candle_index(candles[6]) == 7
+    candles_manager.add_old_and_new_candles(candles[:7])
+    assert candles_manager.time_candles_index == 7
+    assert candles_manager.get_symbol_close_candles(2).tolist() == \
+        [candle[PriceIndexes.IND_PRICE_CLOSE.value] for candle in candles[5:7]]
+
+    # past candle
+    assert candles_manager._get_candle_index(candles[1]) == 1
+
+    # unknown candle
+    assert candles_manager._get_candle_index(_get_candle(20)) == commons_constants.DEFAULT_IGNORED_VALUE
+    candles_manager.add_old_and_new_candles([_get_candle(20)])
+    assert candles_manager.time_candles_index == 7
+
+
+def test_upsert_candle():
+    candles_manager = PreloadedCandlesManager()
+    candles = _gen_candles(10)
+    candles_manager.replace_all_candles(candles)
+    candles_manager.add_old_and_new_candles(candles[:6])
+    updated_candle = list(candles[2])
+    updated_candle[PriceIndexes.IND_PRICE_CLOSE.value] = 1
+    candles_manager.upsert_candle(updated_candle)
+    assert candles_manager.get_preloaded_symbol_close_candles()[2] == 1
+
+
+def _gen_candles(size) -> list:
+    return [_get_candle(seed) for seed in range(1, size + 1)]
+
+
+def _get_candle(seed):
+    return [int(seed), seed * 10, seed * 100, seed * 1000, seed * 10000, seed * 100000]
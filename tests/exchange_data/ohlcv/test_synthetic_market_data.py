@@ -0,0 +1,74 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import mock
+import pytest
+
+from octobot_commons.enums import TimeFrames
+from octobot_trading.exchange_data.ohlcv.synthetic_market_data import SyntheticMarketData, \
+    load_synthetic_market_data
+from octobot_trading.exchange_data.ticker.channel.ticker_updater_simulator import TickerUpdaterSimulator
+from octobot_trading.exchange_data.recent_trades.channel.recent_trade_updater_simulator import \
+    RecentTradeUpdaterSimulator
+from tests import event_loop
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+SYMBOL = "BTC/USDT"
+
+
+async def test_get_ticker():
+    candles = _get_candles()
+    synthetic_market_data = SyntheticMarketData(SYMBOL, candles, 60)
+    for candle in candles:
+        # same ticker as generated from each candle
+        assert synthetic_market_data.get_ticker(candle[0]) == \
+            TickerUpdaterSimulator._generate_ticker_from_candle(candle, SYMBOL, candle[0] + 60)
+    assert synthetic_market_data.get_ticker(30) is None
+
+
+async def test_get_recent_trades():
+    candles = _get_candles()
+    synthetic_market_data = SyntheticMarketData(SYMBOL, candles, 60)
+    for candle in candles:
+        # same recent trades as generated from each candle low and high prices
+        assert synthetic_market_data.get_recent_trades(candle[0]) == [
+            RecentTradeUpdaterSimulator._generate_recent_trade(candle[0], candle[3]),
+            RecentTradeUpdaterSimulator._generate_recent_trade(candle[0], candle[2]),
+        ]
+    assert synthetic_market_data.get_recent_trades(30) is None
+    assert SyntheticMarketData(SYMBOL, [], 60).get_recent_trades(0) is None
+
+
+async def test_load_synthetic_market_data():
+    candles = _get_candles()
+    importer = mock.Mock(get_ohlcv=mock.AsyncMock(return_value=[
+        [candle[0], "binance", "BTC", SYMBOL, TimeFrames.ONE_MINUTE.value, candle]
+        for candle in reversed(candles)
+    ]))
+    synthetic_market_data = await load_synthetic_market_data(importer, "binance", SYMBOL, TimeFrames.ONE_MINUTE)
+    importer.get_ohlcv.assert_awaited_once_with(exchange_name="binance", symbol=SYMBOL,
+                                                time_frame=TimeFrames.ONE_MINUTE)
+    assert synthetic_market_data.time_frame_seconds == 60
+    assert synthetic_market_data.get_ticker(candles[1][0]) == \
+        TickerUpdaterSimulator._generate_ticker_from_candle(candles[1], SYMBOL, candles[1][0] + 60)
+
+
+def _get_candles():
+    return [
+        [index * 60, 10.5 + index, 12 + index, 9.25 + index, 11 + index, 100.5 * index]
+        for index in range(10)
+    ]
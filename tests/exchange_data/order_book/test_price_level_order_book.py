@@ -0,0 +1,166 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import random
+
+import pytest
+import pytest_asyncio
+
+from octobot_trading.exchange_data.order_book.order_book_manager import OrderBookManager
+from octobot_trading.exchange_data.order_book.price_level_order_book import PriceLevelOrderBook
+from octobot_trading.enums import ExchangeConstantsOrderBookInfoColumns as ECOBIC
+from octobot_trading.enums import TradeOrderSide
+from tests.test_utils.random_numbers import random_order_book_side, random_timestamp
+from tests import event_loop
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest_asyncio.fixture()
+async def order_book():
+    price_level_order_book = PriceLevelOrderBook()
+    await price_level_order_book.initialize()
+    return price_level_order_book
+
+
+async def test_init(order_book):
+    assert not order_book.order_book_initialized
+    assert order_book.get_ask() is None
+    assert order_book.get_bid() is None
+    assert order_book.get_depth(TradeOrderSide.BUY, 10) == []
+    assert order_book.get_volume_weighted_average_price(TradeOrderSide.SELL, 1) is None
+
+
+async def test_handle_new_books(order_book):
+    ts = random_timestamp()
+    asks = random_order_book_side(count=100)
+    bids = random_order_book_side(count=100)
+    order_book.handle_new_books(asks, bids, timestamp=ts)
+    assert order_book.order_book_initialized
+    assert order_book.timestamp == ts
+    assert order_book.get_ask() == tuple(min(asks))
+    assert order_book.get_bid() == tuple(max(bids))
+
+    # replaces previous book
+    order_book.handle_new_book({
+        ECOBIC.ASKS.value: [[10, 1]],
+        ECOBIC.BIDS.value: [[9, 2]],
+        ECOBIC.TIMESTAMP.value: ts + 1
+    })
+    assert order_book.timestamp == ts + 1
+    assert list(order_book.asks.items()) == [(10, 1)]
+    assert list(order_book.bids.items()) == [(9, 2)]
+
+    # missing key
+    order_book.handle_new_book({ECOBIC.ASKS.value: [[10, 1]]})
+    assert list(order_book.asks.items()) == [(10, 1)]
+
+    order_book.reset_order_book()
+    assert not order_book.order_book_initialized
+    assert order_book.get_ask() is None
+    assert order_book.get_bid() is None
+
+
+async def test_handle_book_deltas(order_book):
+    order_book.handle_new_books(
+        asks=[[10, 1], [11, 2], [12, 3]],
+        bids=[[9, 1], [8, 2], [7, 3]],
+        timestamp=1
+    )
+    # update, add and remove price levels
+    order_book.handle_book_deltas(
+        asks=[["10", "0"], [11, 5], [10.5, 1]],
+        bids=[[9.5, 1], [7, 0], [6, 0]],
+        timestamp=2
+    )
+    assert order_book.timestamp == 2
+    assert order_book.get_ask() == (10.5, 1)
+    assert order_book.get_bid() == (9.5, 1)
+    assert list(order_book.asks.items()) == [(10.5, 1), (11, 5), (12, 3)]
+    assert list(order_book.bids.items()) == [(8, 2), (9, 1), (9.5, 1)]
+
+    # empty book side
+    order_book.handle_book_deltas(asks=[[10.5, 0], [11, 0], [12, 0]], bids=[])
+    assert order_book.timestamp == 2
+    assert order_book.get_ask() is None
+    assert order_book.get_bid() == (9.5, 1)
+
+
+async def test_replay_book_deltas(order_book):
+    # deterministic generated stream: most updates are close to the top of the book
+    # and about 1/4 of them remove their price level
+    rng = random.Random(42)
+    asks = {round(100 + 0.01 * (index + 1), 2): round(rng.uniform(0.1, 10), 4) for index in range(50)}
+    bids = {round(100 - 0.01 * (index + 1), 2): round(rng.uniform(0.1, 10), 4) for index in range(50)}
+    order_book.handle_new_books([[price, size] for price, size in asks.items()],
+                                [[price, size] for price, size in bids.items()])
+    order_book_manager = OrderBookManager()
+    for _ in range(200):
+        ask_deltas = []
+        bid_deltas = []
+        for _ in range(10):
+            level_index = int(rng.expovariate(0.1)) % 50
+            size = 0 if rng.random() < 0.25 else round(rng.uniform(0.1, 10), 4)
+            if rng.random() < 0.5:
+                ask_deltas.append([round(100 + 0.01 * (level_index + 1), 2), size])
+            else:
+                bid_deltas.append([round(100 - 0.01 * (level_index + 1), 2), size])
+        order_book.handle_book_deltas(ask_deltas, bid_deltas)
+        _apply_deltas(asks, ask_deltas)
+        _apply_deltas(bids, bid_deltas)
+        # same best prices as an OrderBookManager rebuilt from the updated book
+        order_book_manager.handle_new_books([[price, size] for price, size in asks.items()],
+                                            [[price, size] for price, size in bids.items()])
+        assert order_book.get_ask()[0] == order_book_manager.get_ask()[0]
+        assert order_book.get_bid()[0] == order_book_manager.get_bid()[0]
+    assert list(order_book.asks.items()) == sorted(asks.items())
+    assert list(order_book.bids.items()) == sorted(bids.items())
+
+
+async def test_get_depth(order_book):
+    order_book.handle_new_books(
+        asks=[[12, 3], [10, 1], [11, 2]],
+        bids=[[9, 1], [8, 2], [7, 3]],
+    )
+    assert order_book.get_depth(TradeOrderSide.SELL, 2) == [(10, 1), (11, 2)]
+    assert order_book.get_depth(TradeOrderSide.BUY, 2) == [(9, 1), (8, 2)]
+    assert order_book.get_depth(TradeOrderSide.BUY, 10) == [(9, 1), (8, 2), (7, 3)]
+    assert order_book.get_depth_size(TradeOrderSide.SELL, 2) == 3
+    assert order_book.get_depth_size(TradeOrderSide.BUY, 10) == 6
+    assert order_book.get_depth_size(TradeOrderSide.BUY, 0) == 0
+
+
+async def test_get_volume_weighted_average_price(order_book):
+    order_book.handle_new_books(
+        asks=[[10, 1], [11, 2], [12, 3]],
+        bids=[[9, 1], [8, 2], [7, 3]],
+    )
+    assert order_book.get_volume_weighted_average_price(TradeOrderSide.SELL, 0.5) == 10
+    assert order_book.get_volume_weighted_average_price(TradeOrderSide.SELL, 2) == 10.5
+    assert order_book.get_volume_weighted_average_price(TradeOrderSide.SELL, 6) == (10 + 22 + 36) / 6
+    assert order_book.get_volume_weighted_average_price(TradeOrderSide.BUY, 3) == (9 + 16) / 3
+    # not enough liquidity
+    assert order_book.get_volume_weighted_average_price(TradeOrderSide.SELL, 6.1) is None
+    # nothing to fill
+    assert order_book.get_volume_weighted_average_price(TradeOrderSide.SELL, 0) is None
+    assert order_book.get_volume_weighted_average_price(TradeOrderSide.BUY, -1) is None
+
+
+def _apply_deltas(book_side, deltas):
+    for price, size in deltas:
+        if size:
+            book_side[price] = size
+        else:
+            book_side.pop(price, None)
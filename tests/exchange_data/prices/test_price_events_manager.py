@@ -15,6 +15,7 @@
 #  License along with this library.
 import decimal
 import os
+import random
 import pytest
 from asyncio import Event
 from mock import patch, Mock
@@ -31,10 +32,13 @@ pytestmark = pytest.mark.asyncio
 
 async def test_reset(price_events_manager):
     if not os.getenv('CYTHON_IGNORE'):
-        price_events_manager.events.append(None)
+        price_events_manager.new_event(decimal_random_price(), random_timestamp(), True)
+        price_events_manager.new_event(decimal_random_price(), random_timestamp(), False)
         assert price_events_manager.events
         price_events_manager.reset()
         assert not price_events_manager.events
+        assert not price_events_manager._trigger_above_events
+        assert not price_events_manager._trigger_below_events
 
 
 async def test_new_event(price_events_manager):
@@ -171,3 +175,67 @@ async def test_remove_event(price_events_manager):
         price_events_manager.remove_event(event_2)
         assert event_2 not in price_events_manager.events
         assert len(price_events_manager.events) == 0
+
+
+async def test_check_events(price_events_manager):
+    above_event_1 = price_events_manager.new_event(decimal.Decimal("12"), 10, True)
+    below_event_1 = price_events_manager.new_event(decimal.Decimal("8"), 10, False)
+    above_event_2 = price_events_manager.new_event(decimal.Decimal("10"), 10, True)
+    below_event_2 = price_events_manager.new_event(decimal.Decimal("10"), 10, False)
+    above_event_3 = price_events_manager.new_event(decimal.Decimal("11"), 20, True)
+    assert price_events_manager._check_events(decimal.Decimal("9"), 10) == [below_event_2]
+    # not triggered before their timestamp
+    assert price_events_manager._check_events(decimal.Decimal("9"), 9) == []
+    # triggered events are returned in registration order
+    assert price_events_manager._check_events(decimal.Decimal("10"), 10) == [above_event_2, below_event_2]
+    assert price_events_manager._check_events(decimal.Decimal("13"), 10) == [above_event_1, above_event_2]
+    assert price_events_manager._check_events(decimal.Decimal("13"), 20) == \
+        [above_event_1, above_event_2, above_event_3]
+    assert price_events_manager._check_events(decimal.Decimal("7"), 20) == [below_event_1, below_event_2]
+
+    # triggered events are set and removed
+    price_events_manager.handle_price(decimal.Decimal("11"), 15)
+    assert above_event_2.is_set()
+    assert not above_event_3.is_set()
+    assert list(price_events_manager.events) == [above_event_1, below_event_1, below_event_2, above_event_3]
+    assert len(price_events_manager._trigger_above_events) == 2
+    assert price_events_manager._check_events(decimal.Decimal("13"), 20) == [above_event_1, above_event_3]
+    price_events_manager.remove_event(above_event_1)
+    price_events_manager.remove_event(below_event_2)
+    assert price_events_manager._check_events(decimal.Decimal("13"), 20) == [above_event_3]
+    assert price_events_manager._check_events(decimal.Decimal("7"), 20) == [below_event_1]
+    price_events_manager.handle_price(decimal.Decimal("7"), 20)
+    assert below_event_1.is_set()
+    assert not below_event_2.is_set()
+    assert list(price_events_manager.events) == [above_event_3]
+    assert len(price_events_manager._trigger_below_events) == 0
+
+
+async def test_handle_price_on_grid_orders(price_events_manager):
+    # sell orders above the current price and buy orders below it, each filled order is replaced
+    # by an order on the other side of the price
+    rng = random.Random(42)
+    start_price = decimal.Decimal(100)
+    step = decimal.Decimal("0.01")
+    events = {}
+    for index in range(100):
+        sell_price = start_price + step * (index + 1)
+        buy_price = start_price - step * (index + 1)
+        events[price_events_manager.new_event(sell_price, 0, True)] = (sell_price, 0, True)
+        events[price_events_manager.new_event(buy_price, 0, False)] = (buy_price, 0, False)
+    price = start_price
+    for timestamp in range(200):
+        price += step * rng.randint(-3, 3)
+        expected_triggered_events = [
+            event
+            for event, (event_price, event_timestamp, trigger_above) in events.items()
+            if event_timestamp <= timestamp and (event_price <= price if trigger_above else event_price >= price)
+        ]
+        price_events_manager.handle_price(price, timestamp)
+        assert [event for event in events if event.is_set()] == expected_triggered_events
+        for event in expected_triggered_events:
+            event_price, _, trigger_above = events.pop(event)
+            new_price = event_price - step if trigger_above else event_price + step
+            events[price_events_manager.new_event(new_price, timestamp, not trigger_above)] = \
+                (new_price, timestamp, not trigger_above)
+    assert len(price_events_manager.events) == len(events) == 200
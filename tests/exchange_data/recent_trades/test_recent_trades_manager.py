@@ -14,9 +14,11 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 import os
+import random
 
 import pytest
 
+from octobot_trading.enums import ExchangeConstantsOrderColumns as ECOC
 from tests.exchange_data import recent_trades_manager, price_events_manager
 
 # All test coroutines will be treated as marked.
@@ -104,6 +106,55 @@ async def test_add_new_trades(recent_trades_manager):
     assert recent_trades_manager.recent_trades[4] == recent_trade_5
 
 
+async def test_add_new_trades_after_removed_trades(recent_trades_manager):
+    trades = [random_recent_trade(timestamp=index) for index in range(recent_trades_manager.MAX_RECENT_TRADES_COUNT)]
+    recent_trades_manager.add_new_trades(trades)
+    new_trades = [random_recent_trade(timestamp=-index) for index in range(1, 11)]
+    assert recent_trades_manager.add_new_trades(new_trades) == new_trades
+    # 10 first trades are removed from recent trades: they are new trades again
+    assert recent_trades_manager.add_new_trades(trades[:11]) == trades[:10]
+    assert list(recent_trades_manager.recent_trades) == trades[20:] + new_trades + trades[:10]
+    assert len(recent_trades_manager._recent_trades_count_by_key) == recent_trades_manager.MAX_RECENT_TRADES_COUNT
+
+
+async def test_add_new_trades_keys(recent_trades_manager):
+    recent_trade = random_recent_trade()
+    # identical trades from the same update are all added
+    assert recent_trades_manager.add_new_trades([recent_trade, dict(recent_trade)]) == [recent_trade, recent_trade]
+    assert recent_trades_manager.add_new_trades([dict(recent_trade)]) == []
+    # trades are identified by their id when available
+    trade_with_id = {**random_recent_trade(), ECOC.ID.value: "1"}
+    assert recent_trades_manager.add_new_trades([trade_with_id]) == [trade_with_id]
+    assert recent_trades_manager.add_new_trades([{**random_recent_trade(), ECOC.ID.value: "1"}]) == []
+    assert len(recent_trades_manager.recent_trades) == 3
+
+    recent_trades_manager.set_all_recent_trades([trade_with_id])
+    assert recent_trades_manager.add_new_trades([recent_trade]) == [recent_trade]
+    assert recent_trades_manager.add_new_trades([trade_with_id]) == []
+
+
+async def test_add_new_trades_stream(recent_trades_manager):
+    # each update contains new trades and the last previously received trades
+    rng = random.Random(42)
+    last_trades = []
+    for second in range(30):
+        trades = [
+            {
+                ECOC.TIMESTAMP.value: second + index / 100,
+                ECOC.SIDE.value: rng.choice(("buy", "sell")),
+                ECOC.PRICE.value: round(rng.uniform(99, 101), 2),
+                ECOC.AMOUNT.value: round(rng.uniform(0.1, 10), 3),
+                ECOC.COST.value: round(rng.uniform(10, 1000), 2),
+            }
+            for index in range(100)
+        ]
+        update = last_trades + trades
+        expected_new_trades = [trade for trade in update if trade not in recent_trades_manager.recent_trades]
+        assert recent_trades_manager.add_new_trades(update) == expected_new_trades == trades
+        last_trades = trades[-5:]
+    assert len(recent_trades_manager.recent_trades) == recent_trades_manager.MAX_RECENT_TRADES_COUNT
+
+
 async def test_add_new_liquidations(recent_trades_manager):
     # if adding no new liquidations
     recent_trades_manager.add_new_liquidations([])
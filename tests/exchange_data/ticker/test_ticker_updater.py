@@ -0,0 +1,156 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import pytest
+import mock
+
+import octobot_trading.errors as errors
+import octobot_trading.exchange_channel as exchange_channel
+from octobot_trading.exchange_data.ticker.channel.ticker_updater import TickerUpdater
+from octobot_trading.enums import ExchangeConstantsTickersColumns
+
+from tests.exchanges import simulated_exchange_manager
+from tests import event_loop
+
+pytestmark = pytest.mark.asyncio
+
+PAIRS = [f"COIN{index}/USDT" for index in range(150)]
+
+
+async def test_fetch_tickers_in_bulk(simulated_exchange_manager):
+    updater = _get_ticker_updater(simulated_exchange_manager)
+    updater.MAX_BULK_TICKERS_FETCH_SYMBOLS = 40
+    tickers = {pair: _get_ticker() for pair in PAIRS[:-1]}
+
+    async def _get_all_currencies_price_ticker(symbols):
+        return {symbol: tickers[symbol] for symbol in symbols if symbol in tickers}
+
+    exchange = simulated_exchange_manager.exchange
+    with mock.patch.object(
+        exchange, "get_all_currencies_price_ticker", mock.AsyncMock(side_effect=_get_all_currencies_price_ticker)
+    ) as get_all_currencies_price_ticker_mock, \
+            mock.patch.object(exchange, "get_price_ticker", mock.AsyncMock(return_value=_get_ticker())) \
+            as get_price_ticker_mock, \
+            mock.patch.object(updater, "push", mock.AsyncMock()) as push_mock:
+        await updater._fetch_tickers(PAIRS)
+        # 4 requests for 150 pairs
+        assert get_all_currencies_price_ticker_mock.call_count == 4
+        assert get_all_currencies_price_ticker_mock.mock_calls[0].kwargs["symbols"] == PAIRS[:40]
+        assert get_all_currencies_price_ticker_mock.mock_calls[-1].kwargs["symbols"] == PAIRS[120:]
+        # missing ticker is fetched alone
+        get_price_ticker_mock.assert_called_once_with(PAIRS[-1])
+        assert [call.args[0] for call in push_mock.mock_calls] == PAIRS
+        assert updater.updating_pairs == set()
+        assert updater.is_bulk_tickers_fetch_supported is True
+
+        # pairs that are already updating are skipped
+        get_all_currencies_price_ticker_mock.reset_mock()
+        get_price_ticker_mock.reset_mock()
+        push_mock.reset_mock()
+        updater.updating_pairs.add(PAIRS[0])
+        tickers.update({pair: _get_ticker(timestamp=2) for pair in PAIRS[:3]})
+        await updater._fetch_tickers(PAIRS[:3])
+        get_all_currencies_price_ticker_mock.assert_called_once_with(symbols=PAIRS[1:3])
+        get_price_ticker_mock.assert_not_called()
+        assert [call.args[0] for call in push_mock.mock_calls] == PAIRS[1:3]
+        assert updater.updating_pairs == {PAIRS[0]}
+
+
+async def test_fetch_tickers_bulk_fallback(simulated_exchange_manager):
+    updater = _get_ticker_updater(simulated_exchange_manager)
+    exchange = simulated_exchange_manager.exchange
+    with mock.patch.object(
+        exchange, "get_all_currencies_price_ticker", mock.AsyncMock(side_effect=errors.NotSupported)
+    ) as get_all_currencies_price_ticker_mock, \
+            mock.patch.object(exchange, "get_price_ticker", mock.AsyncMock(return_value=_get_ticker())) \
+            as get_price_ticker_mock, \
+            mock.patch.object(updater, "push", mock.AsyncMock()) as push_mock:
+        await updater._fetch_tickers(PAIRS[:3])
+        get_all_currencies_price_ticker_mock.assert_called_once_with(symbols=PAIRS[:3])
+        assert updater.is_bulk_tickers_fetch_supported is False
+        assert get_price_ticker_mock.call_count == 3
+        assert [call.args[0] for call in push_mock.mock_calls] == PAIRS[:3]
+
+        # bulk fetch is not tried again on this exchange
+        get_all_currencies_price_ticker_mock.reset_mock()
+        get_price_ticker_mock.reset_mock()
+        await updater._fetch_tickers(PAIRS[:3])
+        get_all_currencies_price_ticker_mock.assert_not_called()
+        assert get_price_ticker_mock.call_count == 3
+
+
+async def test_fetch_tickers_in_bulk_outdated_tickers(simulated_exchange_manager):
+    updater = _get_ticker_updater(simulated_exchange_manager)
+    # bulk tickers can be returned from a cache that is not updated for every pair
+    tickers = {pair: _get_ticker(timestamp=1) for pair in PAIRS[:3]}
+
+    async def _get_all_currencies_price_ticker(symbols):
+        return {symbol: tickers[symbol] for symbol in symbols if symbol in tickers}
+
+    exchange = simulated_exchange_manager.exchange
+    with mock.patch.object(
+        exchange, "get_all_currencies_price_ticker", mock.AsyncMock(side_effect=_get_all_currencies_price_ticker)
+    ), mock.patch.object(exchange, "get_price_ticker", mock.AsyncMock(return_value=_get_ticker(timestamp=3))) \
+            as get_price_ticker_mock, \
+            mock.patch.object(updater, "push", mock.AsyncMock()) as push_mock:
+        await updater._fetch_tickers(PAIRS[:3])
+        get_price_ticker_mock.assert_not_called()
+        assert [call.args[0] for call in push_mock.mock_calls] == PAIRS[:3]
+
+        push_mock.reset_mock()
+        tickers[PAIRS[1]] = _get_ticker(timestamp=2)
+        await updater._fetch_tickers(PAIRS[:3])
+        # tickers that did not change since they were pushed are skipped without extra request
+        get_price_ticker_mock.assert_not_called()
+        assert [call.args[0] for call in push_mock.mock_calls] == [PAIRS[1]]
+        assert [call.args[1] for call in push_mock.mock_calls] == [_get_ticker(timestamp=2)]
+
+
+async def test_fetch_tickers_in_bulk_failed_batch(simulated_exchange_manager):
+    updater = _get_ticker_updater(simulated_exchange_manager)
+    updater.MAX_BULK_TICKERS_FETCH_SYMBOLS = 2
+
+    async def _get_all_currencies_price_ticker(symbols):
+        if PAIRS[2] in symbols:
+            raise errors.FailedRequest("error")
+        return {symbol: _get_ticker() for symbol in symbols}
+
+    exchange = simulated_exchange_manager.exchange
+    with mock.patch.object(
+        exchange, "get_all_currencies_price_ticker", mock.AsyncMock(side_effect=_get_all_currencies_price_ticker)
+    ) as get_all_currencies_price_ticker_mock, \
+            mock.patch.object(exchange, "get_price_ticker", mock.AsyncMock(return_value=_get_ticker())) \
+            as get_price_ticker_mock, \
+            mock.patch.object(updater, "push", mock.AsyncMock()) as push_mock:
+        await updater._fetch_tickers(PAIRS[:6])
+        assert get_all_currencies_price_ticker_mock.call_count == 3
+        # other batches tickers are pushed and failed batch pairs are fetched alone
+        assert get_price_ticker_mock.mock_calls == [mock.call(PAIRS[2]), mock.call(PAIRS[3])]
+        assert [call.args[0] for call in push_mock.mock_calls] == \
+            [PAIRS[0], PAIRS[1], PAIRS[4], PAIRS[5], PAIRS[2], PAIRS[3]]
+        assert updater.is_bulk_tickers_fetch_supported is True
+        assert updater.updating_pairs == set()
+
+
+def _get_ticker_updater(exchange_manager):
+    return TickerUpdater(exchange_channel.get_chan(TickerUpdater.CHANNEL_NAME, exchange_manager.id))
+
+
+def _get_ticker(timestamp=1):
+    return {
+        ExchangeConstantsTickersColumns.CLOSE.value: 1,
+        ExchangeConstantsTickersColumns.TIMESTAMP.value: timestamp,
+        ExchangeConstantsTickersColumns.BASE_VOLUME.value: 1,
+    }
@@ -338,3 +338,22 @@ def _get_fees(type, currency, rate, cost):
         enums.FeePropertyColumns.COST.value: decimal.Decimal(str(cost)),
         enums.FeePropertyColumns.IS_FROM_EXCHANGE.value: False,
     }
+
+
+async def test_create_orders(ccxt_connector):
+    orders = [
+        {"symbol": "BTC/USDT", "type": "limit", "side": "buy", "amount": 1.0, "price": 10.0, "params": {}},
+        {"symbol": "BTC/USDT", "type": "limit", "side": "sell", "amount": 2.0, "price": 20.0, "params": {}},
+    ]
+    with patch.object(ccxt_connector.client, "create_orders", mock.AsyncMock(
+        # second order is refused by the exchange
+        return_value=[{"id": "1"}, {"id": None, "info": {"error": "refused"}}]
+    )) as create_orders_mock, patch.object(ccxt_connector.adapter, "adapt_order", mock.Mock(
+        return_value={"adapted": True}
+    )) as adapt_order_mock:
+        assert await ccxt_connector.create_orders(orders) == [{"adapted": True}, None]
+        create_orders_mock.assert_called_once_with(orders)
+        adapt_order_mock.assert_called_once_with({"id": "1"}, symbol="BTC/USDT", quantity=1.0)
+    with patch.object(ccxt_connector.client, "create_orders", mock.AsyncMock(side_effect=ccxt.NotSupported)):
+        with pytest.raises(octobot_trading.errors.NotSupported):
+            await ccxt_connector.create_orders(orders)
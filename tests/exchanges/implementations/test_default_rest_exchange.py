@@ -14,7 +14,10 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import mock
 import octobot_trading.exchanges as exchanges
+import octobot_trading.enums as enums
+import octobot_trading.errors as errors
 import octobot_commons.enums as commons_enums
 import pytest
 
@@ -52,3 +55,55 @@ async def test_start_request_data_and_stop(default_rest_exchange):
         assert book
     finally:
         await default_rest_exchange.stop()
+
+
+async def test_create_orders_batches_by_symbol(default_rest_exchange):
+    orders_kwargs = [
+        {"symbol": "BTC/USDT", "price": 1},
+        {"symbol": "ETH/USDT", "price": 2},
+        {"symbol": "BTC/USDT", "price": 3},
+        {"symbol": "SOL/USDT", "price": 4},
+    ]
+
+    async def _create_orders_batch(batch_orders_kwargs):
+        if batch_orders_kwargs[0]["symbol"] == "SOL/USDT":
+            raise errors.MissingFunds("error")
+        return [{"price": order_kwargs["price"]} for order_kwargs in batch_orders_kwargs]
+
+    with mock.patch.object(
+        default_rest_exchange, "_create_orders_batch", mock.AsyncMock(side_effect=_create_orders_batch)
+    ) as _create_orders_batch_mock:
+        # failed SOL/USDT batch does not prevent other orders creation
+        assert await default_rest_exchange.create_orders(orders_kwargs) == [
+            {"price": 1}, {"price": 2}, {"price": 3}, None
+        ]
+        # each batch only contains orders of the same symbol
+        assert [call.args[0] for call in _create_orders_batch_mock.mock_calls] == [
+            [orders_kwargs[0], orders_kwargs[2]], [orders_kwargs[1]], [orders_kwargs[3]]
+        ]
+
+
+async def test_cancel_orders_uses_order_request_kwargs(default_rest_exchange):
+    def _order_request_kwargs_factory(exchange_order_id, order_type=None, **kwargs):
+        if order_type is enums.TraderOrderType.STOP_LOSS:
+            kwargs["stop"] = True
+        return kwargs
+
+    with mock.patch.object(
+        default_rest_exchange, "order_request_kwargs_factory", mock.Mock(side_effect=_order_request_kwargs_factory)
+    ), mock.patch.object(default_rest_exchange.connector, "cancel_orders", mock.AsyncMock(
+        side_effect=lambda ids, symbol, **kwargs: [{"id": exchange_order_id, "status": "canceled"}
+                                                   for exchange_order_id in ids]
+    )) as cancel_orders_mock:
+        assert await default_rest_exchange.cancel_orders(
+            ["1", "2", "3"], "BTC/USDT",
+            order_types=[
+                enums.TraderOrderType.BUY_LIMIT, enums.TraderOrderType.STOP_LOSS, enums.TraderOrderType.SELL_LIMIT
+            ]
+        ) == {
+            "1": enums.OrderStatus.CANCELED, "2": enums.OrderStatus.CANCELED, "3": enums.OrderStatus.CANCELED
+        }
+        assert cancel_orders_mock.mock_calls == [
+            mock.call(["1", "3"], "BTC/USDT"),
+            mock.call(["2"], "BTC/USDT", stop=True),
+        ]
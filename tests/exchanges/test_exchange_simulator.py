@@ -19,7 +19,8 @@ import mock
 import pytest
 import octobot_trading.constants as constants
 import octobot_commons.constants as commons_constants
-from octobot_trading.enums import FeePropertyColumns, ExchangeConstantsMarketPropertyColumns, TraderOrderType
+from octobot_trading.enums import FeePropertyColumns, ExchangeConstantsMarketPropertyColumns, TraderOrderType, \
+    ExchangeConstantsMarketStatusColumns
 from octobot_trading.api.exchange import cancel_ccxt_throttle_task
 import octobot_trading.exchanges.util as exchange_util
 
@@ -160,3 +161,22 @@ async def test_init_exchange_tentacle(backtesting_trader):
             init_adapter
         )
         get_rest_exchange_class_mock.assert_called_once()
+
+
+async def test_get_fixed_market_status(backtesting_trader):
+    _, exchange_manager, _ = backtesting_trader
+    exchange = exchange_manager.exchange
+    market_status = exchange.get_fixed_market_status(DEFAULT_BACKTESTING_SYMBOL, with_fixer=False)
+    fixed_market_status = exchange.get_fixed_market_status(DEFAULT_BACKTESTING_SYMBOL, price_example=10)
+    assert fixed_market_status == exchange_util.ExchangeMarketStatusFixer(
+        exchange.connector._get_default_market_status()
+    ).market_status
+    # market statuses are cached until cleared
+    assert exchange.get_fixed_market_status(DEFAULT_BACKTESTING_SYMBOL, with_fixer=False) is market_status
+    assert exchange.get_fixed_market_status(DEFAULT_BACKTESTING_SYMBOL, price_example=20) is fixed_market_status
+    with pytest.raises(TypeError):
+        fixed_market_status[ExchangeConstantsMarketStatusColumns.PRECISION.value] = {}
+    exchange.clear_market_statuses_cache()
+    updated_fixed_market_status = exchange.get_fixed_market_status(DEFAULT_BACKTESTING_SYMBOL, price_example=20)
+    assert updated_fixed_market_status is not fixed_market_status
+    assert updated_fixed_market_status == fixed_market_status
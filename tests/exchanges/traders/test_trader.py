@@ -36,7 +36,7 @@ from octobot_trading.personal_data.orders import Order
 import octobot_trading.errors as errors
 from octobot_trading.enums import TraderOrderType, TradeOrderSide, TradeOrderType, OrderStatus, \
     ExchangeConstantsPositionColumns, PositionMode, MarginType, TakeProfitStopLossMode, ExchangeSupportedElements, \
-    ExchangeConstantsTransactionColumns
+    ExchangeConstantsTransactionColumns, ExchangeConstantsOrderColumns
 from octobot_trading.exchanges.exchange_manager import ExchangeManager
 from octobot_trading.personal_data.orders.order_factory import create_order_instance, create_order_instance_from_raw
 from octobot_trading.personal_data.orders import BuyLimitOrder, BuyMarketOrder, SellLimitOrder, StopLossOrder
@@ -186,11 +186,13 @@ class TestTrader:
         trader_inst.set_is_enabled(False)
         methods = [
             trader_inst.create_order,
+            trader_inst.create_orders,
             trader_inst.create_artificial_order,
             trader_inst.edit_order,
             trader_inst.update_order_as_inactive,
             trader_inst.update_order_as_active,
             trader_inst.cancel_order,
+            trader_inst.cancel_orders,
             trader_inst.cancel_all_orders,
             trader_inst.cancel_order_with_id,
             trader_inst.cancel_open_orders,
@@ -477,6 +479,174 @@ class TestTrader:
 
         await self.stop(exchange_manager)
 
+    async def test_create_and_cancel_orders(self):
+        config, exchange_manager, trader_inst = await self.init_default()
+        orders_manager = exchange_manager.exchange_personal_data.orders_manager
+        portfolio_manager = exchange_manager.exchange_personal_data.portfolio_manager
+        initial_portfolio = copy.deepcopy(portfolio_manager.portfolio.portfolio)
+        orders = self._get_grid_orders(trader_inst, 10)
+
+        created_orders = await trader_inst.create_orders(orders)
+        assert created_orders == orders
+        assert orders_manager.get_open_orders() == orders
+        assert portfolio_manager.portfolio.portfolio["USDT"].available < initial_portfolio["USDT"].available
+        assert portfolio_manager.portfolio.portfolio["BTC"].available < initial_portfolio["BTC"].available
+
+        assert await trader_inst.cancel_orders(orders) == [True] * len(orders)
+        assert orders_manager.get_open_orders() == []
+        assert all(order.is_cancelled() for order in orders)
+        assert all(
+            portfolio_manager.portfolio.portfolio[currency] == initial_portfolio[currency]
+            for currency in portfolio_manager.portfolio.portfolio.keys()
+        )
+
+        await self.stop(exchange_manager)
+
+    async def test_create_orders_in_batch(self):
+        config, exchange_manager, trader_inst = await self.init_default()
+        orders_manager = exchange_manager.exchange_personal_data.orders_manager
+        orders = self._get_grid_orders(trader_inst, 4)
+        exchange_created_orders = []
+        for index, order in enumerate(orders):
+            exchange_created_order = order.to_dict()
+            exchange_created_order[ExchangeConstantsOrderColumns.EXCHANGE_ID.value] = f"exchange_id_{index}"
+            exchange_created_order[ExchangeConstantsOrderColumns.STATUS.value] = OrderStatus.OPEN.value
+            exchange_created_orders.append(exchange_created_order)
+        # exchange refused the last order
+        exchange_created_orders[-1] = None
+        try:
+            trader_inst.simulate = False
+            with mock.patch.object(exchange_manager.exchange, "supports_native_create_orders", mock.Mock(
+                return_value=True
+            )), mock.patch.object(exchange_manager.exchange, "create_orders", mock.AsyncMock(
+                return_value=exchange_created_orders
+            )) as create_orders_mock, mock.patch.object(exchange_manager.exchange, "create_order", mock.AsyncMock(
+                return_value=None
+            )) as create_order_mock:
+                created_orders = await trader_inst.create_orders(orders)
+                create_orders_mock.assert_called_once()
+                assert [
+                    order_kwargs["price"] for order_kwargs in create_orders_mock.mock_calls[0].args[0]
+                ] == [order.origin_price for order in orders]
+                # refused order is created alone
+                create_order_mock.assert_called_once()
+                assert create_order_mock.mock_calls[0].kwargs["price"] == orders[-1].origin_price
+                assert created_orders[-1] is None
+                assert [order.exchange_order_id for order in created_orders[:-1]] == \
+                    ["exchange_id_0", "exchange_id_1", "exchange_id_2"]
+                assert [order.order_id for order in created_orders[:-1]] == \
+                    [order.order_id for order in orders[:-1]]
+                assert orders_manager.get_open_orders() == created_orders[:-1]
+
+            # batch creation is not supported: fallback to concurrent orders creation
+            with mock.patch.object(exchange_manager.exchange, "supports_native_create_orders", mock.Mock(
+                return_value=False
+            )), mock.patch.object(exchange_manager.exchange, "create_orders", mock.AsyncMock(
+            )) as create_orders_mock, mock.patch.object(exchange_manager.exchange, "create_order", mock.AsyncMock(
+                return_value=None
+            )) as create_order_mock:
+                assert await trader_inst.create_orders(orders) == [None] * len(orders)
+                create_orders_mock.assert_not_called()
+                assert create_order_mock.call_count == len(orders)
+
+            # batch request failed: fallback to concurrent orders creation
+            with mock.patch.object(exchange_manager.exchange, "supports_native_create_orders", mock.Mock(
+                return_value=True
+            )), mock.patch.object(exchange_manager.exchange, "create_orders", mock.AsyncMock(
+                side_effect=errors.MissingFunds
+            )) as create_orders_mock, mock.patch.object(exchange_manager.exchange, "create_order", mock.AsyncMock(
+                return_value=None
+            )) as create_order_mock:
+                assert await trader_inst.create_orders(orders) == [None] * len(orders)
+                create_orders_mock.assert_called_once()
+                assert create_order_mock.call_count == len(orders)
+        finally:
+            trader_inst.simulate = True
+        await self.stop(exchange_manager)
+
+    async def test_cancel_orders_in_batch(self):
+        config, exchange_manager, trader_inst = await self.init_default()
+        orders_manager = exchange_manager.exchange_personal_data.orders_manager
+        orders = self._get_grid_orders(trader_inst, 4)
+        await trader_inst.create_orders(orders)
+        for index, order in enumerate(orders):
+            order.exchange_order_id = f"exchange_id_{index}"
+        try:
+            trader_inst.simulate = False
+            with mock.patch.object(exchange_manager.exchange, "supports_native_cancel_orders", mock.Mock(
+                return_value=True
+            )), mock.patch.object(exchange_manager.exchange, "cancel_orders", mock.AsyncMock(
+                # last order is not cancelled by the batch request
+                return_value={
+                    order.exchange_order_id: OrderStatus.CANCELED
+                    for order in orders[:-1]
+                }
+            )) as cancel_orders_mock, mock.patch.object(exchange_manager.exchange, "cancel_order", mock.AsyncMock(
+                return_value=OrderStatus.CANCELED
+            )) as cancel_order_mock:
+                assert await trader_inst.cancel_orders(orders) == [True] * len(orders)
+                cancel_orders_mock.assert_called_once_with(
+                    [order.exchange_order_id for order in orders], self.DEFAULT_SYMBOL,
+                    order_types=[order.order_type for order in orders]
+                )
+                # last order is cancelled alone
+                cancel_order_mock.assert_called_once_with(
+                    orders[-1].exchange_order_id, self.DEFAULT_SYMBOL, orders[-1].order_type
+                )
+                assert all(order.is_cancelled() for order in orders)
+                assert orders_manager.get_open_orders() == []
+                assert all(not order.lock.locked() for order in orders)
+        finally:
+            trader_inst.simulate = True
+        await self.stop(exchange_manager)
+
+    async def test_create_orders_registers_created_orders_before_raising(self):
+        config, exchange_manager, trader_inst = await self.init_default()
+        orders_manager = exchange_manager.exchange_personal_data.orders_manager
+        orders = self._get_grid_orders(trader_inst, 3)
+
+        async def _create_order(**kwargs):
+            if kwargs["price"] == orders[1].origin_price:
+                raise errors.MissingFunds("missing funds")
+            order = orders[0] if kwargs["price"] == orders[0].origin_price else orders[2]
+            exchange_created_order = order.to_dict()
+            exchange_created_order[ExchangeConstantsOrderColumns.EXCHANGE_ID.value] = \
+                f"exchange_id_{order.origin_price}"
+            exchange_created_order[ExchangeConstantsOrderColumns.STATUS.value] = OrderStatus.OPEN.value
+            return exchange_created_order
+
+        try:
+            trader_inst.simulate = False
+            with mock.patch.object(exchange_manager.exchange, "supports_native_create_orders", mock.Mock(
+                return_value=False
+            )), mock.patch.object(exchange_manager.exchange, "create_order", mock.AsyncMock(
+                side_effect=_create_order
+            )) as create_order_mock:
+                with pytest.raises(errors.MissingFunds):
+                    await trader_inst.create_orders(orders)
+                assert create_order_mock.call_count == len(orders)
+                # other orders are created and registered
+                assert [order.exchange_order_id for order in orders_manager.get_open_orders()] == [
+                    f"exchange_id_{orders[0].origin_price}", f"exchange_id_{orders[2].origin_price}"
+                ]
+        finally:
+            trader_inst.simulate = True
+        await self.stop(exchange_manager)
+
+    def _get_grid_orders(self, trader_inst, orders_count):
+        orders = []
+        for index in range(orders_count):
+            order_class, order_type, price = (BuyLimitOrder, TraderOrderType.BUY_LIMIT, 60 - index) \
+                if index % 2 else (SellLimitOrder, TraderOrderType.SELL_LIMIT, 80 + index)
+            order = order_class(trader_inst)
+            order.update(order_type=order_type,
+                         symbol=self.DEFAULT_SYMBOL,
+                         current_price=decimal.Decimal("70"),
+                         quantity=decimal.Decimal("0.1"),
+                         price=decimal.Decimal(str(price)))
+            orders.append(order)
+        return orders
+
     async def test_cancel_open_orders_multi_symbol(self):
         config, exchange_manager, trader_inst = await self.init_default()
         orders_manager = exchange_manager.exchange_personal_data.orders_manager
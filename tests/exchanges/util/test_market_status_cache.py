@@ -0,0 +1,83 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import mock
+import pytest
+
+from octobot_trading.enums import ExchangeConstantsMarketStatusColumns as Ecmsc
+import octobot_trading.exchanges.util as exchange_util
+import octobot_trading.util as util
+
+
+def _get_market_status(amount_min=0.001, cost_min=None):
+    return {
+        Ecmsc.PRECISION.value: {
+            Ecmsc.PRECISION_AMOUNT.value: "3",
+            Ecmsc.PRECISION_PRICE.value: 2,
+        },
+        Ecmsc.LIMITS.value: {
+            Ecmsc.LIMITS_AMOUNT.value: {
+                Ecmsc.LIMITS_AMOUNT_MIN.value: amount_min,
+                Ecmsc.LIMITS_AMOUNT_MAX.value: 1000,
+            },
+            Ecmsc.LIMITS_PRICE.value: {
+                Ecmsc.LIMITS_PRICE_MIN.value: 0.01,
+                Ecmsc.LIMITS_PRICE_MAX.value: 100000,
+            },
+            Ecmsc.LIMITS_COST.value: {
+                Ecmsc.LIMITS_COST_MIN.value: cost_min,
+                Ecmsc.LIMITS_COST_MAX.value: 10000000,
+            },
+        },
+    }
+
+
+def test_get_market_status():
+    cache = exchange_util.MarketStatusCache()
+    factory = mock.Mock(return_value=_get_market_status())
+    market_status = cache.get_market_status("BTC/USDT", factory, with_fixer=False)
+    assert isinstance(market_status, util.ReadOnlyDict)
+    assert market_status == util.get_read_only_dict(_get_market_status())
+    fixed_market_status = cache.get_market_status("BTC/USDT", factory, price_example=10)
+    assert isinstance(fixed_market_status, util.ReadOnlyDict)
+    assert fixed_market_status == exchange_util.ExchangeMarketStatusFixer(_get_market_status(), 10).market_status
+    assert fixed_market_status[Ecmsc.PRECISION.value][Ecmsc.PRECISION_AMOUNT.value] == 3
+    # cached market statuses are returned
+    assert cache.get_market_status("BTC/USDT", factory, with_fixer=False) is market_status
+    assert cache.get_market_status("BTC/USDT", factory, price_example=20) is fixed_market_status
+    factory.assert_called_once()
+    with pytest.raises(TypeError):
+        market_status[Ecmsc.LIMITS.value][Ecmsc.LIMITS_AMOUNT.value][Ecmsc.LIMITS_AMOUNT_MIN.value] = 1
+
+    cache.clear()
+    assert cache.get_market_status("BTC/USDT", factory, with_fixer=False) is not market_status
+    assert factory.call_count == 2
+
+
+def test_get_market_status_requiring_price_example():
+    cache = exchange_util.MarketStatusCache()
+    factory = mock.Mock(return_value=_get_market_status(amount_min=None, cost_min=None))
+    market_status = cache.get_market_status("BTC/USDT", factory, with_fixer=False)
+    assert market_status[Ecmsc.LIMITS.value][Ecmsc.LIMITS_AMOUNT.value][Ecmsc.LIMITS_AMOUNT_MIN.value] is None
+    # fixed market statuses depend on the price example: they are fixed on each call
+    for price_example in (0.01, 10, 10000):
+        fixed_market_status = cache.get_market_status("BTC/USDT", factory, price_example=price_example)
+        assert not isinstance(fixed_market_status, util.ReadOnlyDict)
+        assert fixed_market_status == exchange_util.ExchangeMarketStatusFixer(
+            _get_market_status(amount_min=None, cost_min=None), price_example
+        ).market_status
+    # the cached market status is not updated by the fixer
+    assert market_status[Ecmsc.LIMITS.value][Ecmsc.LIMITS_AMOUNT.value][Ecmsc.LIMITS_AMOUNT_MIN.value] is None
+    factory.assert_called_once()
@@ -380,4 +380,73 @@ async def test_get_orders_to_cancel_from_policies(order_and_exchange_managers):
         }
     )
     # now both orders should be cancelled
-    assert orders_manager.get_orders_to_cancel_from_policies(two_orders) == two_orders
\ No newline at end of file
+    assert orders_manager.get_orders_to_cancel_from_policies(two_orders) == two_orders
+
+
+async def test_orders_indexes(order_and_exchange_managers):
+    orders_manager, exchange_manager = order_and_exchange_managers
+    await reset_orders_manager(orders_manager, enums.OrderStatus.OPEN.value)
+    open_orders = orders_manager.get_open_orders()
+    assert len(open_orders) == 3
+    first_order, second_order, third_order = open_orders
+
+    # exchange_order_id updates
+    assert orders_manager.get_order(None, exchange_order_id=first_order.exchange_order_id) is first_order
+    second_order.exchange_order_id = "exchange_id"
+    assert orders_manager.get_order(None, exchange_order_id="exchange_id") is second_order
+    second_order.exchange_order_id = "new_exchange_id"
+    assert orders_manager.get_order(None, exchange_order_id="new_exchange_id") is second_order
+    assert not orders_manager.has_order(None, exchange_order_id="exchange_id")
+
+    # symbol updates: orders are still selected in orders manager order
+    first_order.symbol = "ETH/USDT"
+    assert orders_manager.get_open_orders(symbol="ETH/USDT") == [first_order]
+    assert orders_manager.get_open_orders(symbol=DEFAULT_SYMBOL) == [second_order, third_order]
+    first_order.symbol = DEFAULT_SYMBOL
+    assert orders_manager.get_open_orders(symbol=DEFAULT_SYMBOL) == open_orders
+    assert orders_manager.get_open_orders(symbol="ETH/USDT") == []
+
+    # status updates
+    second_order.status = enums.OrderStatus.PENDING_CANCEL
+    assert orders_manager.get_pending_cancel_orders(symbol=DEFAULT_SYMBOL) == [second_order]
+    assert orders_manager.get_open_orders(symbol=DEFAULT_SYMBOL) == [first_order, third_order]
+    second_order.status = enums.OrderStatus.OPEN
+    assert orders_manager.get_open_orders(symbol=DEFAULT_SYMBOL) == open_orders
+
+    # tag updates
+    assert orders_manager.get_open_orders(tag="test") == []
+    third_order.tag = "test"
+    second_order.tag = "test"
+    assert orders_manager.get_open_orders(tag="test") == [second_order, third_order]
+    first_order.tag = "test"
+    assert orders_manager.get_open_orders(tag="test") == open_orders
+
+    # group updates
+    group = orders_manager.create_group(personal_data.OneCancelsTheOtherOrderGroup)
+    third_order.add_to_order_group(group)
+    first_order.add_to_order_group(group)
+    assert orders_manager.get_order_from_group(group.name) == [first_order, third_order]
+    assert orders_manager.get_order_from_group("other") == []
+
+    # removed orders are not indexed anymore
+    orders_manager.remove_order_instance(third_order)
+    assert third_order.indexing_orders_manager is None
+    third_order.symbol = "ETH/USDT"
+    assert orders_manager.get_open_orders(symbol="ETH/USDT") == []
+    assert orders_manager.get_order_from_group(group.name) == [first_order]
+    assert orders_manager.get_open_orders(tag="test") == [first_order, second_order]
+
+    # directly edited orders are also indexed
+    orders_manager.orders[third_order.order_id] = third_order
+    assert orders_manager.get_open_orders(symbol="ETH/USDT") == [third_order]
+    # same size replacement: third_order takes first_order position
+    orders_manager.orders[first_order.order_id] = third_order
+    assert first_order.indexing_orders_manager is None
+    assert orders_manager.get_open_orders(tag="test") == [third_order, second_order]
+    assert orders_manager.get_open_orders(symbol="ETH/USDT") == [third_order]
+    del orders_manager.orders[first_order.order_id]
+    assert orders_manager.get_open_orders(symbol="ETH/USDT") == []
+    assert orders_manager.get_open_orders(tag="test") == [second_order]
+    orders_manager.orders = {}
+    assert orders_manager.get_open_orders(symbol=DEFAULT_SYMBOL) == []
+    assert not orders_manager.has_order(None, exchange_order_id="new_exchange_id")
@@ -0,0 +1,221 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import decimal
+import os
+
+import mock
+import numpy
+import pytest
+import sortedcontainers
+
+import octobot_commons.enums as commons_enums
+import octobot_trading.personal_data as personal_data
+import octobot_trading.constants as constants
+
+from tests.exchanges import backtesting_trader_with_historical_pf_value_manager, \
+    backtesting_trader, backtesting_config, backtesting_exchange_manager, fake_backtesting
+from tests import event_loop
+
+
+def _set_value(historical_asset_values, timestamp, value_by_currency):
+    historical_asset_values[timestamp] = personal_data.HistoricalAssetValue(timestamp, value_by_currency)
+
+
+def test_set_and_get():
+    historical_asset_values = personal_data.ColumnarHistoricalAssetValues()
+    assert len(historical_asset_values) == 0
+    assert not historical_asset_values
+    _set_value(historical_asset_values, 3, {"BTC": decimal.Decimal("1.1")})
+    _set_value(historical_asset_values, 1, {"USD": 10, "BTC": 2})
+    _set_value(historical_asset_values, 2, {"USD": 20.5})
+    assert len(historical_asset_values) == 3
+    assert list(historical_asset_values) == [1, 2, 3]
+    assert historical_asset_values.keys().tolist() == [1, 2, 3]
+    assert historical_asset_values.index(2) == 1
+    with pytest.raises(ValueError):
+        historical_asset_values.index(4)
+    assert 2 in historical_asset_values
+    assert 4 not in historical_asset_values
+    with pytest.raises(KeyError):
+        historical_asset_values[4]
+
+    historical_value = historical_asset_values[1]
+    assert isinstance(historical_value, personal_data.HistoricalAssetValue)
+    assert historical_value.get_timestamp() == 1
+    assert historical_value.get("USD") == decimal.Decimal(10)
+    assert isinstance(historical_value.get("USD"), decimal.Decimal)
+    assert "BTC" in historical_value
+    assert "ETH" not in historical_value
+    assert historical_asset_values[3].get("BTC") == decimal.Decimal("1.1")
+    with pytest.raises(KeyError):
+        historical_asset_values[3].get("USD")
+    with pytest.raises(KeyError):
+        historical_asset_values[3].get("ETH")
+    assert list(historical_asset_values[2].get_currencies()) == ["USD"]
+    assert [value.to_dict() for value in historical_asset_values.values()] == [
+        {"t": 1, "v": {"USD": 10, "BTC": 2}},
+        {"t": 2, "v": {"USD": 20.5}},
+        {"t": 3, "v": {"BTC": 1.1}},
+    ]
+
+    # replace values
+    _set_value(historical_asset_values, 1, {"ETH": 3})
+    assert historical_asset_values[1].to_dict() == {"t": 1, "v": {"ETH": 3}}
+
+
+def test_update_and_is_significant_change():
+    historical_asset_values = personal_data.ColumnarHistoricalAssetValues()
+    _set_value(historical_asset_values, 1, {"USD": 10, "BTC": 2})
+    historical_value = historical_asset_values[1]
+    assert historical_value.update({"USD": decimal.Decimal(10), "BTC": 2}) is False
+    assert historical_value.update({"USD": decimal.Decimal(11)}) is True
+    assert historical_value.to_dict() == {"t": 1, "v": {"USD": 11, "BTC": 2}}
+    historical_value.set("ETH", decimal.Decimal("0.5"))
+    assert historical_asset_values[1].get("ETH") == decimal.Decimal("0.5")
+    assert historical_value.is_significant_change("USD", decimal.Decimal("11.5")) is False
+    assert historical_value.is_significant_change("USD", 20) is True
+    with pytest.raises(KeyError):
+        historical_value.is_significant_change("XRP", 1)
+
+
+def test_popitem():
+    historical_asset_values = personal_data.ColumnarHistoricalAssetValues()
+    for timestamp in range(5):
+        _set_value(historical_asset_values, timestamp, {"USD": timestamp * 10})
+    timestamp, historical_value = historical_asset_values.popitem(0)
+    assert timestamp == 0
+    assert historical_value.to_dict() == {"t": 0, "v": {"USD": 0}}
+    timestamp, historical_value = historical_asset_values.popitem()
+    assert timestamp == 4
+    assert historical_value.to_dict() == {"t": 4, "v": {"USD": 40}}
+    timestamp, _ = historical_asset_values.popitem(1)
+    assert timestamp == 2
+    assert list(historical_asset_values) == [1, 3]
+    assert historical_asset_values[3].get("USD") == decimal.Decimal(30)
+    with pytest.raises(IndexError):
+        historical_asset_values.popitem(2)
+    historical_asset_values.clear()
+    with pytest.raises(KeyError):
+        historical_asset_values.popitem(0)
+
+
+def test_chunks_growth():
+    historical_asset_values = personal_data.ColumnarHistoricalAssetValues()
+    with mock.patch.object(personal_data.ColumnarHistoricalAssetValues, "CHUNK_SIZE", 3):
+        for timestamp in range(0, 20, 2):
+            _set_value(historical_asset_values, timestamp, {"USD": timestamp})
+            if timestamp >= 10:
+                # removed rows space is reused
+                historical_asset_values.popitem(0)
+        # insert between existing rows
+        _set_value(historical_asset_values, 13, {"BTC": 13})
+        assert len(historical_asset_values._timestamps) <= len(historical_asset_values) + 3
+    assert historical_asset_values.to_dicts() == [
+        {"t": 10, "v": {"USD": 10}},
+        {"t": 12, "v": {"USD": 12}},
+        {"t": 13, "v": {"BTC": 13}},
+        {"t": 14, "v": {"USD": 14}},
+        {"t": 16, "v": {"USD": 16}},
+        {"t": 18, "v": {"USD": 18}},
+    ]
+
+
+def test_to_dicts_as_historical_asset_values():
+    historical_asset_values = personal_data.ColumnarHistoricalAssetValues()
+    historical_asset_value_by_timestamp = sortedcontainers.SortedDict()
+    for index in range(1000):
+        timestamp = float(1648425600 + index * 3600)
+        value_by_currency = {
+            currency: decimal.Decimal(f"{index * (currency_index + 1) / 7:.8f}")
+            for currency_index, currency in enumerate(("USDT", "BTC", "ETH"))
+        }
+        _set_value(historical_asset_values, timestamp, value_by_currency)
+        _set_value(historical_asset_value_by_timestamp, timestamp, value_by_currency)
+    # same storage rows as HistoricalAssetValue
+    assert historical_asset_values.to_dicts() == [
+        historical_asset_value.to_dict() for historical_asset_value in historical_asset_value_by_timestamp.values()
+    ]
+
+
+def test_from_dicts():
+    dict_values = [
+        {"t": 2, "v": {"USD": 20.5}},
+        {"t": 1, "v": {"USD": 10, "BTC": 2}},
+    ]
+    historical_asset_values = personal_data.ColumnarHistoricalAssetValues.from_dicts(dict_values)
+    assert historical_asset_values.to_dicts() == sorted(dict_values, key=lambda element: element["t"])
+    _set_value(historical_asset_values, 3, {"ETH": 1})
+    assert list(historical_asset_values) == [1, 2, 3]
+    assert personal_data.ColumnarHistoricalAssetValues.from_dicts([]).to_dicts() == []
+
+
+@pytest.mark.parametrize("memory_map", [True, False])
+def test_save_and_load(tmp_path, memory_map):
+    file_path = os.path.join(tmp_path, "history.npy")
+    historical_asset_values = personal_data.ColumnarHistoricalAssetValues()
+    for timestamp in range(4):
+        _set_value(historical_asset_values, timestamp, {"USD": timestamp, "BTC/USDT": 1})
+    historical_asset_values.popitem(0)
+    _set_value(historical_asset_values, 10, {"ETH": 1})
+    historical_asset_values.save(file_path)
+    dict_values = historical_asset_values.to_dicts()
+
+    loaded_values = personal_data.ColumnarHistoricalAssetValues.load(file_path, memory_map=memory_map)
+    assert isinstance(loaded_values._timestamps, numpy.memmap) is memory_map
+    assert loaded_values.to_dicts() == dict_values
+    # update and add values
+    loaded_values[1].update({"USD": 100})
+    _set_value(loaded_values, 11, {"ETH": 2})
+    assert loaded_values[1].get("USD") == decimal.Decimal(100)
+    assert list(loaded_values) == [1, 2, 3, 10, 11]
+    # saved file is not updated
+    assert personal_data.ColumnarHistoricalAssetValues.load(file_path).to_dicts() == dict_values
+
+
+@pytest.mark.asyncio
+async def test_historical_portfolio_value_manager(backtesting_trader_with_historical_pf_value_manager, tmp_path):
+    _, exchange_manager, _ = backtesting_trader_with_historical_pf_value_manager
+    portfolio_manager = exchange_manager.exchange_personal_data.portfolio_manager
+    with mock.patch.object(constants, "ENABLE_COLUMNAR_PORTFOLIO_HISTORY", True):
+        historical_portfolio_value_manager = personal_data.HistoricalPortfolioValueManager(portfolio_manager)
+    assert isinstance(historical_portfolio_value_manager.historical_portfolio_value,
+                      personal_data.ColumnarHistoricalAssetValues)
+    timestamp = 1648425600  # Monday 28 March 2022 00:00:00 UTC
+    exchange_manager.exchange.connector.backtesting.time_manager.current_timestamp = timestamp + 10
+    assert await historical_portfolio_value_manager.on_new_value(
+        timestamp + 5, {"BTC": decimal.Decimal(1), "USD": decimal.Decimal(3000)}, save_changes=False
+    ) is True
+    # not a significant change
+    assert await historical_portfolio_value_manager.on_new_value(
+        timestamp + 6, {"BTC": decimal.Decimal("1.01")}, save_changes=False
+    ) is False
+    assert historical_portfolio_value_manager.get_dict_historical_values() == [
+        {"t": timestamp, "v": {"BTC": 1, "USD": 3000}}
+    ]
+    assert historical_portfolio_value_manager.get_historical_values("USD", commons_enums.TimeFrames.ONE_DAY) == {timestamp: decimal.Decimal(3000)}
+
+    file_path = os.path.join(tmp_path, "history.npy")
+    historical_portfolio_value_manager.save_historical_values_file(file_path)
+    # reload in a default HistoricalPortfolioValueManager
+    other_historical_portfolio_value_manager = personal_data.HistoricalPortfolioValueManager(portfolio_manager)
+    assert other_historical_portfolio_value_manager.use_columnar_history is False
+    other_historical_portfolio_value_manager.load_historical_values_file(file_path)
+    assert other_historical_portfolio_value_manager.use_columnar_history is True
+    assert other_historical_portfolio_value_manager.get_dict_historical_values() == [
+        {"t": timestamp, "v": {"BTC": 1, "USD": 3000}}
+    ]
+    assert other_historical_portfolio_value_manager.get_historical_starting_starting_portfolio_value("USD") == \
+        decimal.Decimal(3000)
@@ -560,6 +560,58 @@ async def test_get_historical_values(historical_portfolio_value_manager):
         == {}
 
 
+async def test_get_historical_values_updated_downsampled_values(historical_portfolio_value_manager):
+    hour_timestamp = 1648461600  # Monday 28 March 2022 10:00:00 UTC
+    historical_portfolio_value_manager.max_history_size = 6
+    historical_portfolio_value_manager.portfolio_manager.exchange_manager.exchange.connector.backtesting.\
+        time_manager.current_timestamp = hour_timestamp + 10 * 3600
+    queried_time_frames = [
+        commons_enums.TimeFrames.ONE_HOUR, commons_enums.TimeFrames.FOUR_HOURS, commons_enums.TimeFrames.ONE_DAY
+    ]
+
+    def _check_downsampled_values():
+        cached_values = {
+            (currency, time_frame): historical_portfolio_value_manager.get_historical_values(currency, time_frame)
+            for currency in ("BTC", "USD")
+            for time_frame in queried_time_frames
+        }
+        # same values as when computed from scratch
+        historical_portfolio_value_manager._downsampled_values.clear()
+        assert cached_values == {
+            (currency, time_frame): historical_portfolio_value_manager.get_historical_values(currency, time_frame)
+            for currency, time_frame in cached_values
+        }
+
+    _check_downsampled_values()
+    # timestamps are not aligned on time frames: their relevancy depends on their neighbors
+    for timestamp_delta in (3600 + 10, 10, 4 * 3600 + 1000, 2 * 3600 + 10, 1800, 5 * 3600 - 1, 8 * 3600 + 7):
+        historical_portfolio_value_manager._add_historical_portfolio_value(
+            hour_timestamp + timestamp_delta, {"BTC": timestamp_delta}
+        )
+        _check_downsampled_values()
+    # max_history_size reached: oldest values have been removed
+    assert len(historical_portfolio_value_manager.historical_portfolio_value) == 6
+    assert historical_portfolio_value_manager.historical_portfolio_value.keys()[0] == hour_timestamp + 1800
+    assert await historical_portfolio_value_manager._upsert_value(
+        [hour_timestamp + 3600 + 10], {"BTC": 1, "USD": 2}, False
+    ) is True
+    assert historical_portfolio_value_manager.get_historical_values("USD", commons_enums.TimeFrames.ONE_HOUR) == {
+        hour_timestamp + 3600 + 10: 2
+    }
+    _check_downsampled_values()
+
+    # history can only contain a single value
+    historical_portfolio_value_manager.max_history_size = 1
+    historical_portfolio_value_manager.historical_portfolio_value.clear()
+    historical_portfolio_value_manager._downsampled_values.clear()
+    for timestamp_delta in (10, 3600 + 10):
+        historical_portfolio_value_manager._add_historical_portfolio_value(
+            hour_timestamp + timestamp_delta, {"BTC": timestamp_delta}
+        )
+        _check_downsampled_values()
+    assert list(historical_portfolio_value_manager.historical_portfolio_value) == [hour_timestamp + 3600 + 10]
+
+
 def _check_historical_value(historical_value, timestamp, value_by_currency):
     assert isinstance(historical_value, personal_data.HistoricalAssetValue)
     assert historical_value.to_dict() == {
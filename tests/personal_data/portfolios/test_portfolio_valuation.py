@@ -0,0 +1,190 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import decimal
+
+import mock
+import pytest
+
+import octobot_trading.constants as constants
+import octobot_trading.personal_data as personal_data
+
+from tests.exchanges import backtesting_trader, backtesting_config, backtesting_exchange_manager, fake_backtesting
+from tests import event_loop
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+
+def _get_valuation(portfolio_manager):
+    value_converter = personal_data.ValueConverter(portfolio_manager)
+    value_converter.update_last_price("BTC/USDT", decimal.Decimal(30000))
+    value_converter.update_last_price("ETH/BTC", decimal.Decimal("0.05"))
+    value_converter.update_last_price("USDT/EUR", decimal.Decimal("0.5"))
+    portfolio_valuation = personal_data.PortfolioValuation(value_converter, "USDT")
+    for symbol in ("BTC/USDT", "ETH/BTC", "USDT/EUR"):
+        portfolio_valuation.on_price_update(symbol)
+    return portfolio_valuation
+
+
+def _get_portfolio(value_by_currency):
+    return {
+        currency: personal_data.SpotAsset(currency, decimal.Decimal(str(value)), decimal.Decimal(str(value)))
+        for currency, value in value_by_currency.items()
+    }
+
+
+async def test_price_updates(backtesting_trader):
+    _, exchange_manager, _ = backtesting_trader
+    portfolio_valuation = _get_valuation(exchange_manager.exchange_personal_data.portfolio_manager)
+    value_converter = portfolio_valuation.value_converter
+    holdings_valuation = personal_data.HoldingsValuation(portfolio_valuation)
+    holdings_valuation.sync_holdings(_get_portfolio({"BTC": 1, "ETH": 10, "EUR": 100, "USDT": 1000, "XRP": 10}))
+    assert portfolio_valuation.unit_values == {
+        "BTC": decimal.Decimal(30000),
+        "ETH": decimal.Decimal(1500),
+        "EUR": decimal.Decimal(2),
+        "USDT": constants.ONE,
+        "XRP": constants.ZERO,
+    }
+    assert holdings_valuation.get_holdings_value("ETH") == decimal.Decimal(15000)
+    assert holdings_valuation.get_holdings_value("XRP") == constants.ZERO
+    assert holdings_valuation.total_value == decimal.Decimal(30000 + 15000 + 200 + 1000)
+
+    with mock.patch.object(value_converter, "evaluate_value", mock.Mock(wraps=value_converter.evaluate_value)) \
+         as evaluate_value_mock:
+        # only ETH is using ETH/BTC
+        value_converter.update_last_price("ETH/BTC", decimal.Decimal("0.1"))
+        portfolio_valuation.on_price_update("ETH/BTC")
+        assert [call.args[0] for call in evaluate_value_mock.call_args_list] == ["ETH"]
+        assert holdings_valuation.total_value == decimal.Decimal(30000 + 30000 + 200 + 1000)
+        evaluate_value_mock.reset_mock()
+
+        # BTC and ETH (through ETH/BTC -> BTC/USDT) are using BTC/USDT
+        value_converter.update_last_price("BTC/USDT", decimal.Decimal(20000))
+        portfolio_valuation.on_price_update("BTC/USDT")
+        assert sorted(call.args[0] for call in evaluate_value_mock.call_args_list) == ["BTC", "ETH"]
+        assert portfolio_valuation.unit_values["ETH"] == decimal.Decimal(2000)
+        assert holdings_valuation.total_value == decimal.Decimal(20000 + 20000 + 200 + 1000)
+        evaluate_value_mock.reset_mock()
+
+        # new symbol
+        value_converter.update_last_price("XRP/USDT", decimal.Decimal("0.5"))
+        portfolio_valuation.on_price_update("XRP/USDT")
+        # XRP is not valued yet and ETH might use another conversion
+        assert sorted(call.args[0] for call in evaluate_value_mock.call_args_list) == ["ETH", "XRP"]
+        assert holdings_valuation.total_value == decimal.Decimal(20000 + 20000 + 200 + 1000 + 5)
+        evaluate_value_mock.reset_mock()
+
+        # unrelated new symbol: only ETH might use another conversion
+        value_converter.update_last_price("SOL/DOT", decimal.Decimal("0.5"))
+        portfolio_valuation.on_price_update("SOL/DOT")
+        assert [call.args[0] for call in evaluate_value_mock.call_args_list] == ["ETH"]
+        evaluate_value_mock.reset_mock()
+
+        # unrelated symbol
+        value_converter.update_last_price("SOL/DOT", decimal.Decimal("0.6"))
+        portfolio_valuation.on_price_update("SOL/DOT")
+        evaluate_value_mock.assert_not_called()
+
+
+async def test_sync_holdings(backtesting_trader):
+    _, exchange_manager, _ = backtesting_trader
+    portfolio_valuation = _get_valuation(exchange_manager.exchange_personal_data.portfolio_manager)
+    holdings_valuation = personal_data.HoldingsValuation(portfolio_valuation)
+    other_holdings_valuation = personal_data.HoldingsValuation(portfolio_valuation)
+    portfolio = _get_portfolio({"BTC": 1, "ETH": 0, "USDT": 1000})
+    holdings_valuation.sync_holdings(portfolio)
+    # zero holdings are not valued
+    assert "ETH" not in portfolio_valuation.unit_values
+    assert holdings_valuation.total_value == decimal.Decimal(31000)
+    other_holdings_valuation.sync_holdings(_get_portfolio({"EUR": 10}))
+    assert other_holdings_valuation.total_value == decimal.Decimal(20)
+
+    with mock.patch.object(portfolio_valuation, "add_currency", mock.Mock(wraps=portfolio_valuation.add_currency)) \
+         as add_currency_mock:
+        holdings_valuation.sync_holdings(portfolio)
+        add_currency_mock.assert_not_called()
+        portfolio["BTC"].update(total=decimal.Decimal(1), available=decimal.Decimal(1))
+        portfolio.pop("USDT")
+        holdings_valuation.sync_holdings(portfolio, valued_currencies={"ETH"})
+        assert [call.args[0] for call in add_currency_mock.call_args_list] == ["BTC", "ETH"]
+    assert portfolio_valuation.unit_values["ETH"] == decimal.Decimal(1500)
+    assert holdings_valuation.total_value == decimal.Decimal(60000)
+
+    # unit values updates are applied to every holdings valuation
+    portfolio_valuation.value_converter.update_last_price("BTC/USDT", decimal.Decimal(10000))
+    portfolio_valuation.value_converter.update_last_price("USDT/EUR", decimal.Decimal(1))
+    portfolio_valuation.on_price_update("BTC/USDT")
+    portfolio_valuation.on_price_update("USDT/EUR")
+    assert holdings_valuation.total_value == decimal.Decimal(20000)
+    assert other_holdings_valuation.total_value == decimal.Decimal(10)
+
+    portfolio_valuation.clear()
+    assert portfolio_valuation.unit_values == {}
+    assert holdings_valuation.total_value == other_holdings_valuation.total_value == constants.ZERO
+
+
+async def test_portfolio_value_holder_incremental_valuation(backtesting_trader):
+    _, exchange_manager, _ = backtesting_trader
+    portfolio_manager = exchange_manager.exchange_personal_data.portfolio_manager
+    balance = {
+        "BTC": {"available": decimal.Decimal("10"), "total": decimal.Decimal("10")},
+        "ETH": {"available": decimal.Decimal("100"), "total": decimal.Decimal("100")},
+        "USDT": {"available": decimal.Decimal("1000"), "total": decimal.Decimal("1000")},
+    }
+    initial_prices = [
+        ("BTC/USDT", decimal.Decimal(30000)),
+        ("ETH/BTC", decimal.Decimal("0.05")),
+    ]
+    prices = [
+        ("ETH/BTC", decimal.Decimal("0.06")),
+        ("BTC/USDT", decimal.Decimal(30000)),
+        ("BTC/USDT", decimal.Decimal(31000)),
+    ]
+    values = []
+    for use_incremental_valuation in (False, True):
+        portfolio_value_holder = portfolio_manager.portfolio_value_holder
+        portfolio_value_holder.value_converter.last_prices_by_trading_pair.clear()
+        portfolio_value_holder.value_converter.missing_currency_data_in_exchange.clear()
+        portfolio_value_holder.reset_portfolio_values()
+        portfolio_value_holder.use_incremental_valuation = use_incremental_valuation
+        for symbol, price in initial_prices:
+            portfolio_value_holder.value_converter.update_last_price(symbol, price)
+        portfolio_manager.portfolio.update_portfolio_from_balance(balance, True)
+        portfolio_manager.handle_balance_updated()
+        holder_values = []
+        for symbol, price in prices:
+            portfolio_manager.handle_mark_price_update(symbol, price)
+            # incremental totals can differ on the last decimal digits
+            holder_values.append((
+                _rounded(portfolio_value_holder.portfolio_current_value),
+                _rounded(portfolio_value_holder.get_origin_portfolio_current_value()),
+                {
+                    currency: _rounded(value)
+                    for currency, value in portfolio_value_holder.current_crypto_currencies_values.items()
+                },
+                _rounded(portfolio_manager.portfolio_profitability.profitability),
+            ))
+        values.append(holder_values)
+    assert values[0] == values[1]
+    assert values[1][-1][0] == _rounded(
+        decimal.Decimal(10) + decimal.Decimal(100) * decimal.Decimal("0.06") +
+        decimal.Decimal(1000) / decimal.Decimal(31000)
+    )
+
+
+def _rounded(value):
+    return value.quantize(decimal.Decimal("1e-15"))
@@ -0,0 +1,131 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import decimal
+import itertools
+import random
+
+import mock
+
+import octobot_commons.constants as commons_constants
+import octobot_trading.enums as enums
+import octobot_trading.personal_data as personal_data
+import octobot_trading.personal_data.portfolios.portfolio_util as portfolio_util
+
+
+def test_get_assets_deltas():
+    orders = [
+        _order("BTC/USDT", "0.1", "2000", "buy"),
+        _order("BTC/USDT", "0.05", "1100", "sell", fee=("BNB", "0.01")),
+        _order("ETH/BTC", "1", "0.05", "buy", fee=("ETH", "0.001")),
+        _order("ETH/BTC", "2", "0.1", "sell", exchange_order_id="ignored"),
+    ]
+    ignored_filled_quantity_per_order_exchange_id = {"ignored": decimal.Decimal("2")}
+    orders_combinations = personal_data.UnknownOrdersCombinations(
+        orders, ignored_filled_quantity_per_order_exchange_id, {}, False
+    )
+    for orders_count in range(1, len(orders) + 1):
+        for orders_indexes in itertools.combinations(range(len(orders)), orders_count):
+            assert orders_combinations.get_assets_deltas(orders_indexes) == personal_data.get_assets_delta_from_orders(
+                orders_combinations.get_orders(orders_indexes), ignored_filled_quantity_per_order_exchange_id,
+                False, force_fully_filled_orders=True
+            )
+
+
+def test_iterate_combinations():
+    orders = [
+        _order("BTC/USDT", "0.1", "2000", "buy"),
+        # unrelated to portfolio deltas
+        _order("SOL/USDT", "1", "200", "buy"),
+        _order("BTC/USDT", "0.2", "4000", "buy"),
+        _order("BTC/USDT", "0.1", "2100", "sell"),
+        _order("BTC/USDT", "1", "20000", "buy"),
+    ]
+    portfolio_asset_deltas = _deltas({"BTC": "0.3", "USDT": "-6000"})
+    orders_combinations = personal_data.UnknownOrdersCombinations(orders, {}, portfolio_asset_deltas, False)
+    assert orders_combinations.candidate_orders_indexes == [0, 2, 3, 4]
+    assert orders_combinations.get_combinations_count(2) == 6
+    assert list(orders_combinations.iterate_combinations(3)) == list(itertools.combinations([0, 2, 3, 4], 3))
+
+    screened_orders_combinations = personal_data.UnknownOrdersCombinations(orders, {}, portfolio_asset_deltas, True)
+    # the sell order alone has opposite deltas and combinations including the 1 BTC buy order
+    # are larger than portfolio deltas
+    assert list(screened_orders_combinations.iterate_combinations(1)) == [(0, ), (2, )]
+    assert list(screened_orders_combinations.iterate_combinations(2)) == [(0, 2), (0, 3), (2, 3)]
+    assert list(screened_orders_combinations.iterate_combinations(4)) == []
+
+
+def test_screened_combinations_can_explain_deltas():
+    # buy and sell grid orders with an unexplained extra ETH delta
+    rng = random.Random(42)
+    orders = [
+        _order(
+            "ETH/USDT", str(round(rng.uniform(0.01, 0.1), 6)), str(round(rng.uniform(20, 300), 6)),
+            "buy" if index % 2 else "sell"
+        )
+        for index in range(10)
+    ]
+    deltas = personal_data.get_assets_delta_from_orders(orders[:4], {}, False, True)[0]
+    deltas["ETH"] += decimal.Decimal("0.5")
+    portfolio_asset_deltas = _deltas({asset_name: str(delta) for asset_name, delta in deltas.items()})
+    orders_combinations = personal_data.UnknownOrdersCombinations(orders, {}, portfolio_asset_deltas, False)
+    screened_orders_combinations = personal_data.UnknownOrdersCombinations(orders, {}, portfolio_asset_deltas, True)
+    skipped_combinations_count = 0
+    for orders_count in range(1, len(orders) + 1):
+        screened_combinations = set(screened_orders_combinations.iterate_combinations(orders_count))
+        for orders_indexes in orders_combinations.iterate_combinations(orders_count):
+            if orders_indexes in screened_combinations:
+                continue
+            skipped_combinations_count += 1
+            # skipped combinations don't add any explanation to portfolio deltas
+            orders_asset_deltas, expected_fee_related_deltas, possible_fees_asset_deltas, _ = \
+                orders_combinations.get_assets_deltas(orders_indexes)
+            assert not portfolio_util.compute_assets_deltas_from_orders(
+                orders_asset_deltas, expected_fee_related_deltas, possible_fees_asset_deltas,
+                portfolio_asset_deltas,
+                allow_portfolio_delta_shrinking=False,
+                register_missed_partial_delta_as_ignored=True,
+                ignore_order_unrelated_deltas=False,
+                ignore_order_extra_deltas=True,
+            ).adds_explanations()
+    assert skipped_combinations_count
+
+
+def _deltas(deltas: dict[str, str]) -> dict[str, dict[str, decimal.Decimal]]:
+    return {
+        asset_name: {
+            commons_constants.PORTFOLIO_TOTAL: decimal.Decimal(delta),
+            commons_constants.PORTFOLIO_AVAILABLE: decimal.Decimal(delta),
+        }
+        for asset_name, delta in deltas.items()
+    }
+
+
+def _order(symbol: str, quantity: str, cost: str, side: str, fee=None, exchange_order_id=None) -> personal_data.Order:
+    order = personal_data.Order(mock.Mock())
+    order.symbol = symbol
+    if exchange_order_id is not None:
+        order.exchange_order_id = exchange_order_id
+    order.origin_quantity = decimal.Decimal(quantity)
+    order.total_cost = decimal.Decimal(cost)
+    order.origin_price = order.total_cost / order.origin_quantity
+    order.side = enums.TradeOrderSide(side)
+    if fee:
+        order.fee = {
+            enums.FeePropertyColumns.CURRENCY.value: fee[0],
+            enums.FeePropertyColumns.COST.value: decimal.Decimal(fee[1]),
+            enums.FeePropertyColumns.IS_FROM_EXCHANGE.value: True,
+        }
+    return order
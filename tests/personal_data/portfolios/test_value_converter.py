@@ -156,6 +156,68 @@ def test_try_convert_currency_value_using_multiple_pairs_with_nested_bridges(bac
         decimal.Decimal("0.1") / decimal.Decimal("0.0000001")
 
 
+
+def test_try_convert_currency_value_using_multiple_pairs_shortest_bridge(backtesting_trader):
+    config, exchange_manager, trader = backtesting_trader
+    portfolio_manager = exchange_manager.exchange_personal_data.portfolio_manager
+    value_converter = portfolio_manager.portfolio_value_holder.value_converter
+
+    # long bridge first in pairs: ADA -> DOT -> ETH -> BTC -> USDT
+    value_converter.last_prices_by_trading_pair["ADA/DOT"] = decimal.Decimal("0.1")
+    value_converter.last_prices_by_trading_pair["DOT/ETH"] = decimal.Decimal("0.01")
+    value_converter.last_prices_by_trading_pair["ETH/BTC"] = decimal.Decimal("0.1")
+    value_converter.last_prices_by_trading_pair["BTC/USDT"] = decimal.Decimal("10000")
+    # short bridge: ADA -> BTC -> USDT
+    value_converter.last_prices_by_trading_pair["ADA/BTC"] = decimal.Decimal("0.0001")
+    assert value_converter.try_convert_currency_value_using_multiple_pairs("ADA", "USDT", constants.ONE, []) == \
+           decimal.Decimal("0.0001") * decimal.Decimal("10000")
+    assert value_converter.get_saved_price_conversion_bridge("ADA", "USDT") == [
+        ("ADA", "BTC"), ("BTC", "USDT")
+    ]
+
+    # pairs added after the first bridge search are also used
+    value_converter.last_prices_by_trading_pair["XRP/ETH"] = decimal.Decimal("2")
+    assert value_converter.try_convert_currency_value_using_multiple_pairs("XRP", "USDT", constants.ONE, []) == \
+           decimal.Decimal("2") * decimal.Decimal("0.1") * decimal.Decimal("10000")
+    assert value_converter.get_saved_price_conversion_bridge("XRP", "USDT") == [
+        ("XRP", "ETH"), ("ETH", "BTC"), ("BTC", "USDT")
+    ]
+    # intermediary bridge is saved
+    assert value_converter.get_saved_price_conversion_bridge("ETH", "USDT") == [
+        ("ETH", "BTC"), ("BTC", "USDT")
+    ]
+
+    # unpriced pairs are skipped when a priced bridge is available
+    value_converter.last_prices_by_trading_pair["XRP/BTC"] = constants.ZERO
+    assert value_converter.try_convert_currency_value_using_multiple_pairs("XRP", "BTC", constants.ONE, []) == \
+           decimal.Decimal("2") * decimal.Decimal("0.1")
+    assert value_converter.get_saved_price_conversion_bridge("XRP", "BTC") == [
+        ("XRP", "ETH"), ("ETH", "BTC")
+    ]
+
+
+def test_try_convert_currency_value_using_multiple_pairs_replaced_pairs(backtesting_trader):
+    config, exchange_manager, trader = backtesting_trader
+    portfolio_manager = exchange_manager.exchange_personal_data.portfolio_manager
+    value_converter = portfolio_manager.portfolio_value_holder.value_converter
+
+    value_converter.last_prices_by_trading_pair["BTC/USDT"] = decimal.Decimal("100")
+    exchange_manager.exchange_config.traded_symbol_pairs = ["BTC/USDT", "ETH/BTC"]
+    with pytest.raises(errors.PendingPriceDataError):
+        # missing ETH/BTC price
+        value_converter.try_convert_currency_value_using_multiple_pairs("ETH", "USDT", constants.ONE, [])
+    # same size replacement: ETH/BTC is replaced by ADA/BTC
+    exchange_manager.exchange_config.traded_symbol_pairs = ["BTC/USDT", "ADA/BTC"]
+    assert value_converter.try_convert_currency_value_using_multiple_pairs("ETH", "USDT", constants.ONE, []) \
+           is None
+    with pytest.raises(errors.PendingPriceDataError):
+        # missing ADA/BTC price
+        value_converter.try_convert_currency_value_using_multiple_pairs("ADA", "USDT", constants.ONE, [])
+    value_converter.last_prices_by_trading_pair["ADA/BTC"] = decimal.Decimal("0.1")
+    assert value_converter.try_convert_currency_value_using_multiple_pairs("ADA", "USDT", constants.ONE, []) == \
+           decimal.Decimal("0.1") * decimal.Decimal("100")
+
+
 def test_get_usd_like_value(backtesting_trader):
     config, exchange_manager, trader = backtesting_trader
     portfolio_manager = exchange_manager.exchange_personal_data.portfolio_manager
@@ -176,6 +238,43 @@ def test_get_usd_like_value(backtesting_trader):
         value_converter.get_usd_like_value("ETH", decimal.Decimal("11"))
 
 
+
+def test_last_price_symbols_index(backtesting_trader):
+    config, exchange_manager, trader = backtesting_trader
+    portfolio_manager = exchange_manager.exchange_personal_data.portfolio_manager
+    value_converter = portfolio_manager.portfolio_value_holder.value_converter
+
+    assert value_converter.has_last_price_symbol("BTC", "USDT") is False
+    value_converter.update_last_price("BTC/USDT:USDT", decimal.Decimal("30000"))
+    assert value_converter.has_last_price_symbol("BTC", "USDT") is True
+    assert value_converter.has_last_price_symbol("USDT", "BTC") is True
+    assert value_converter.has_last_price_symbol("ETH", "USDT") is False
+    # settlement asset is ignored when looking for a price
+    assert value_converter.convert_currency_value_using_last_prices(decimal.Decimal("2"), "BTC", "USDT") \
+        == decimal.Decimal("60000")
+    assert value_converter.convert_currency_value_using_last_prices(decimal.Decimal("30000"), "USDT", "BTC") \
+        == constants.ONE
+
+    # also up to date when last_prices_by_trading_pair is directly updated
+    value_converter.last_prices_by_trading_pair["ETH/BUSD"] = decimal.Decimal("2000")
+    assert value_converter.has_last_price_symbol("ETH", "BUSD") is True
+    assert value_converter.get_usd_like_value("ETH", decimal.Decimal("2")) == decimal.Decimal("4000")
+    value_converter.last_prices_by_trading_pair.pop("BTC/USDT:USDT")
+    assert value_converter.has_last_price_symbol("BTC", "USDT") is False
+    with pytest.raises(errors.MissingPriceDataError):
+        value_converter.convert_currency_value_using_last_prices(constants.ONE, "BTC", "USDT")
+    with pytest.raises(errors.MissingPriceDataError):
+        value_converter.get_usd_like_value("BTC", constants.ONE)
+
+    # also up to date when a symbol is directly replaced by another one
+    value_converter.last_prices_by_trading_pair["BTC/USDT"] = decimal.Decimal("30000")
+    assert value_converter.has_last_price_symbol("BTC", "USDT") is True
+    value_converter.last_prices_by_trading_pair.pop("BTC/USDT")
+    value_converter.last_prices_by_trading_pair["SOL/USDT"] = decimal.Decimal("100")
+    assert value_converter.has_last_price_symbol("BTC", "USDT") is False
+    assert value_converter.get_usd_like_value("SOL", decimal.Decimal("2")) == decimal.Decimal("200")
+
+
 def test_can_convert_symbol_to_usd_like():
     assert trading_personal_data.ValueConverter.can_convert_symbol_to_usd_like("BTC/USDT") is True
     assert trading_personal_data.ValueConverter.can_convert_symbol_to_usd_like(
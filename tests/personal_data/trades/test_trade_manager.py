@@ -13,11 +13,14 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import decimal
+
+import mock
 import pytest
 
 from tests import event_loop
 from tests.exchanges import simulated_exchange_manager, simulated_trader
-from tests.personal_data.trades import create_trade
+from tests.personal_data.trades import create_trade, create_executed_trade
 
 import octobot_trading.personal_data as personal_data
 import octobot_trading.enums as enums
@@ -95,3 +98,124 @@ def test_get_completed_trades_pnl(trade_manager_and_trader):
     # does not depend on trades_manager trades
     trade_manager.trades.clear()
     assert len(trade_manager.get_completed_trades_pnl(trades)) == 3
+
+
+def test_get_trades(trade_manager_and_trader):
+    trade_manager, trader = trade_manager_and_trader
+    trades = [
+        create_trade(trader, f"exchange_{index % 3}", False, f"order_{index % 5}")
+        for index in range(10)
+    ]
+    for index, trade in enumerate(trades):
+        trade.trade_id = str(index)
+        assert trade_manager.upsert_trade_instance(trade) is True
+    assert trade_manager.get_trades() == trades
+    assert trade_manager.get_trades(origin_order_id="order_1") == [trades[1], trades[6]]
+    assert trade_manager.get_trades(exchange_order_id="exchange_1") == [trades[1], trades[4], trades[7]]
+    assert trade_manager.get_trades(origin_order_id="order_1", exchange_order_id="exchange_1") == [trades[1]]
+    assert trade_manager.get_trades(origin_order_id="order_6") == []
+    # the last trade of an order is its entry trade
+    assert trade_manager._get_last_trade_from_order_id("order_1") is trades[6]
+
+    # updated trades are still selected in trades manager order
+    trades[6].origin_order_id = "order_6"
+    trades[0].origin_order_id = "order_1"
+    assert trade_manager.get_trades(origin_order_id="order_1") == [trades[0], trades[1]]
+    assert trade_manager.get_trades(origin_order_id="order_6") == [trades[6]]
+    assert trade_manager.get_trade_from_order_id("order_1") is trades[0]
+
+    # removed trades are not indexed anymore
+    trade_manager._remove_oldest_trades(2)
+    assert trades[0].indexing_trades_manager is None
+    assert trade_manager.get_trades(origin_order_id="order_1") == []
+    assert trade_manager.get_trades(exchange_order_id="exchange_1") == [trades[4], trades[7]]
+
+    # directly edited trades are also indexed: a replacing trade takes the replaced trade position
+    trade_manager.trades["4"] = trades[1]
+    assert trades[4].indexing_trades_manager is None
+    assert trade_manager.get_trades(exchange_order_id="exchange_1") == [trades[1], trades[7]]
+    trade_manager.trades = {}
+    assert trade_manager.get_trades(exchange_order_id="exchange_1") == []
+
+
+def test_get_total_paid_fees(trade_manager_and_trader):
+    trade_manager, trader = trade_manager_and_trader
+    assert trade_manager.get_total_paid_fees() == {}
+    trades = [
+        create_trade(trader, str(index), False, str(index))
+        for index in range(4)
+    ]
+    for index, trade in enumerate(trades):
+        trade.trade_id = str(index)
+        trade.fee = {
+            enums.FeePropertyColumns.COST.value: decimal.Decimal(index + 1),
+            enums.FeePropertyColumns.CURRENCY.value: "BTC" if index % 2 else "USDT",
+        }
+        trade_manager.upsert_trade_instance(trade)
+    assert trade_manager.get_total_paid_fees() == {"USDT": decimal.Decimal(4), "BTC": decimal.Decimal(6)}
+
+    # fee updates
+    trades[1].fee = {
+        enums.FeePropertyColumns.COST.value: decimal.Decimal("0.5"),
+        enums.FeePropertyColumns.CURRENCY.value: "ETH",
+    }
+    assert trade_manager.get_total_paid_fees() == {
+        "USDT": decimal.Decimal(4), "BTC": decimal.Decimal(4), "ETH": decimal.Decimal("0.5")
+    }
+
+    # removed trades fees are not counted anymore
+    trade_manager._remove_oldest_trades(2)
+    assert trade_manager.get_total_paid_fees() == {"USDT": decimal.Decimal(3), "BTC": decimal.Decimal(4)}
+
+    # directly added trades fees are also counted
+    trade_manager.trades["0"] = trades[0]
+    assert trade_manager.get_total_paid_fees() == {"USDT": decimal.Decimal(4), "BTC": decimal.Decimal(4)}
+    # same size replacement: the replaced trade fee is not counted anymore
+    trade_manager.trades["0"] = trades[1]
+    assert trade_manager.get_total_paid_fees() == {
+        "USDT": decimal.Decimal(3), "BTC": decimal.Decimal(4), "ETH": decimal.Decimal("0.5")
+    }
+    del trade_manager.trades["0"]
+    assert trade_manager.get_total_paid_fees() == {"USDT": decimal.Decimal(3), "BTC": decimal.Decimal(4)}
+    trade_manager.clear()
+    assert trade_manager.get_total_paid_fees() == {}
+
+
+def test_get_total_paid_fees_without_registered_fee(trade_manager_and_trader):
+    trade_manager, trader = trade_manager_and_trader
+    fees = [
+        {
+            enums.FeePropertyColumns.COST.value: decimal.Decimal(1),
+            enums.FeePropertyColumns.CURRENCY.value: "USDT",
+        },
+        # fee without currency
+        {enums.FeePropertyColumns.COST.value: decimal.Decimal(2)},
+        None,
+    ]
+    trades = [
+        create_executed_trade(
+            trader, enums.TradeOrderSide.BUY, index, decimal.Decimal(1), decimal.Decimal(10), "BTC/USDT", fee
+        )
+        for index, fee in enumerate(fees)
+    ]
+    for index, trade in enumerate(trades):
+        trade.trade_id = str(index)
+        trade.origin_order_id = str(index)
+        assert trade_manager.upsert_trade_instance(trade) is True
+    # trades are indexed even without any registered fee
+    assert trade_manager.get_trades(origin_order_id="1") == [trades[1]]
+    with mock.patch.object(trade_manager.logger, "warning", mock.Mock()) as warning_mock:
+        assert trade_manager.get_total_paid_fees() == {"USDT": decimal.Decimal(1)}
+        assert warning_mock.call_count == 2
+        assert "Trade without any registered fee" in warning_mock.mock_calls[0].args[0]
+
+    trades[1].fee = {
+        enums.FeePropertyColumns.COST.value: decimal.Decimal(2),
+        enums.FeePropertyColumns.CURRENCY.value: "USDT",
+    }
+    trades[2].status = enums.OrderStatus.CANCELED
+    with mock.patch.object(trade_manager.logger, "warning", mock.Mock()) as warning_mock:
+        assert trade_manager.get_total_paid_fees() == {"USDT": decimal.Decimal(3)}
+        warning_mock.assert_not_called()
+    trade_manager._remove_oldest_trades(3)
+    assert trade_manager.get_total_paid_fees() == {}
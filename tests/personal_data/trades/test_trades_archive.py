@@ -0,0 +1,165 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import decimal
+
+import pytest
+
+from tests import event_loop
+from tests.exchanges import simulated_exchange_manager, simulated_trader
+from tests.personal_data.trades import create_executed_trade
+
+import octobot_trading.personal_data as personal_data
+import octobot_trading.personal_data.trades.trades_archive as trades_archive
+import octobot_trading.enums as enums
+
+
+@pytest.fixture
+def trader(simulated_trader):
+    _, _, trader_instance = simulated_trader
+    return trader_instance
+
+
+def test_archive_trade(trader):
+    archive = trades_archive.TradesArchive(trader)
+    assert len(archive) == 0
+    trades = _create_trades(trader, 3)
+    for trade in trades:
+        archive.archive_trade(trade)
+    assert len(archive) == 3
+    assert "1" in archive
+    assert "4" not in archive
+    assert archive.paid_fees == {"USDT": decimal.Decimal("0.3")}
+
+    # archived trades are materialized as when loaded from storage
+    for trade in trades:
+        archived_trade = archive.get_trade(trade.trade_id)
+        assert archived_trade is not trade
+        assert archived_trade.to_dict() == trade.to_dict()
+    assert list(archive.get_trade_dicts()) == [trade.to_dict() for trade in trades]
+    assert [trade.trade_id for trade in archive.get_trades(origin_order_id="order_1")] == ["1"]
+    assert [trade.trade_id for trade in archive.get_trades(exchange_order_id="exchange_2")] == ["2"]
+    assert archive.get_trades(origin_order_id="order_1", exchange_order_id="exchange_2") == []
+    with pytest.raises(KeyError):
+        archive.get_trade("4")
+
+    archive.clear()
+    assert len(archive) == 0
+    assert archive.paid_fees == {}
+
+
+def test_archive_trade_values(trader):
+    archive = trades_archive.TradesArchive(trader)
+    trades = _create_trades(trader, 6)
+    # decimals are restored with their exact precision, including those that can't be stored in typed arrays
+    for trade, price in zip(trades, (
+        decimal.Decimal("1.00"), decimal.Decimal("0.000000012345678901"), decimal.Decimal("-3E+5"),
+        decimal.Decimal("123456789.0123456789012"), decimal.Decimal("-0"), decimal.Decimal("1E-200"),
+    )):
+        trade.executed_price = price
+    trades[1].tag = "tag"
+    trades[2].reduce_only = True
+    trades[3].executed_time = None
+    trades[4].tag = ["unhashable", "tag"]
+    for trade in trades:
+        archive.archive_trade(trade)
+    for trade in trades:
+        trade_dict = archive.get_trade_dict(trade.trade_id)
+        assert trade_dict == trade.to_dict()
+        assert str(trade_dict[enums.ExchangeConstantsOrderColumns.PRICE.value]) == str(trade.executed_price)
+        assert type(trade_dict[enums.ExchangeConstantsOrderColumns.REDUCE_ONLY.value]) is bool
+    assert archive.get_trade_dict("3")[enums.ExchangeConstantsOrderColumns.TIMESTAMP.value] is None
+
+
+def test_archive_trade_order_ids(trader):
+    archive = trades_archive.TradesArchive(trader)
+    trades = _create_trades(trader, 5)
+    trades[3].origin_order_id = "order_1"
+    trades[4].origin_order_id = "order_1"
+    trades[4].exchange_order_id = "exchange_1"
+    for trade in trades:
+        archive.archive_trade(trade)
+    assert [trade.trade_id for trade in archive.get_trades(origin_order_id="order_1")] == ["1", "3", "4"]
+    assert [trade.trade_id for trade in archive.get_trades(exchange_order_id="exchange_1")] == ["1", "4"]
+    assert [
+        trade.trade_id for trade in archive.get_trades(origin_order_id="order_1", exchange_order_id="exchange_1")
+    ] == ["1", "4"]
+    assert archive.get_trades(origin_order_id="order_1", exchange_order_id="exchange_0") == []
+    assert archive.get_trades(origin_order_id="unknown") == []
+    archive.clear()
+    assert archive.get_trades(origin_order_id="order_1") == []
+
+
+def test_archive_trade_without_registered_fee(trader):
+    archive = trades_archive.TradesArchive(trader)
+    trades = _create_trades(trader, 3)
+    # fee without currency
+    trades[1].fee = {enums.FeePropertyColumns.COST.value: decimal.Decimal(2)}
+    trades[2].fee = None
+    for trade in trades:
+        archive.archive_trade(trade)
+    assert len(archive) == 3
+    assert archive.paid_fees == {"USDT": decimal.Decimal("0.1")}
+
+
+def test_trades_manager_archive_trades(trader):
+    trades_manager = personal_data.TradesManager(trader)
+    # archive is disabled by default
+    assert trades_manager.trades_archive is None
+    assert trades_manager.archive_trades(until=10) == 0
+
+    trades_manager.trades_archive = trades_archive.TradesArchive(trader)
+    trades = _create_trades(trader, 5)
+    for trade in trades:
+        trades_manager.upsert_trade_instance(trade)
+    # trades 0 to 2 are executed before 3
+    assert trades_manager.archive_trades(until=3) == 3
+    assert list(trades_manager.trades) == ["3", "4"]
+    assert len(trades_manager.trades_archive) == 3
+    assert trades_manager.has_trade("1")
+    assert trades_manager.upsert_trade_instance(trades[1]) is False
+    assert trades_manager.get_trade("1").to_dict() == trades[1].to_dict()
+    assert trades_manager.get_trades() == trades[3:]
+    assert [trade.trade_id for trade in trades_manager.get_trades(include_archived=True)] == \
+        ["0", "1", "2", "3", "4"]
+    assert trades_manager.get_total_paid_fees() == {"USDT": decimal.Decimal("0.5")}
+
+    # trades beyond MAX_TRADES_COUNT are archived instead of being removed
+    trades_manager.MAX_TRADES_COUNT = 2
+    trades_manager.TRADES_ARCHIVE_HORIZON = 0
+    trades_manager.upsert_trade_instance(_create_trades(trader, 6)[5])
+    assert list(trades_manager.trades) == []
+    assert len(trades_manager.trades_archive) == 6
+
+    trades_manager.clear()
+    assert len(trades_manager.trades_archive) == 0
+
+
+def _create_trades(trader, count):
+    trades = []
+    for index in range(count):
+        trade = create_executed_trade(
+            trader, enums.TradeOrderSide.BUY, index, decimal.Decimal(index + 1), decimal.Decimal(100), "BTC/USDT",
+            {
+                enums.FeePropertyColumns.COST.value: decimal.Decimal("0.1"),
+                enums.FeePropertyColumns.CURRENCY.value: "USDT",
+            }
+        )
+        trade.trade_id = str(index)
+        trade.origin_order_id = f"order_{index}"
+        trade.exchange_order_id = f"exchange_{index}"
+        trade.creation_time = index
+        trades.append(trade)
+    return trades
@@ -0,0 +1,39 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import octobot_commons.databases as commons_databases
+
+
+class CountingDBWriter(commons_databases.DBWriterReader):
+    """
+    Local database counting write operations and written documents
+    """
+    def __init__(self, file_path):
+        super().__init__(file_path)
+        self.write_operations_count = 0
+        self.written_documents_count = 0
+
+    async def log_many(self, table_name: str, rows: list, cache=True):
+        self.write_operations_count += 1
+        self.written_documents_count += len(rows)
+        return await super().log_many(table_name, rows, cache=cache)
+
+    async def delete(self, table_name: str, dict_query: dict):
+        self.write_operations_count += 1
+        return await super().delete(table_name, dict_query)
+
+    async def delete_all(self, table_name: str):
+        self.write_operations_count += 1
+        return await super().delete_all(table_name)
@@ -0,0 +1,156 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import decimal
+import os
+
+import pytest
+
+import octobot_trading.constants as constants
+import octobot_trading.enums as enums
+import octobot_trading.personal_data as personal_data
+import octobot_trading.storage.orders_storage as orders_storage
+
+from tests import event_loop
+from tests.exchanges import simulated_exchange_manager, simulated_trader
+from tests.storage import CountingDBWriter
+
+pytestmark = pytest.mark.asyncio
+
+OPEN_ORDERS_COUNT = 30
+FILLS_COUNT = 10
+FILLS_BY_FLUSH = 5
+SYMBOL = "BTC/USDT"
+
+
+class _LocalOrdersStorage(orders_storage.OrdersStorage):
+    def __init__(self, exchange_manager, db, enable_diff_based_storage):
+        super().__init__(exchange_manager)
+        self.db = db
+        self.ENABLE_DIFF_BASED_OPEN_ORDERS_STORAGE = enable_diff_based_storage
+
+    def should_store_data(self):
+        return True
+
+    def _get_db(self):
+        return self.db
+
+    async def trigger_debounced_update_auth_data(self, reset: bool):
+        pass
+
+    async def trigger_debounced_flush(self):
+        # flushes are explicitly triggered at the end of each debounce window
+        pass
+
+
+async def test_diff_based_grid_fills_storage(simulated_trader, tmp_path):
+    _, exchange_manager, trader = simulated_trader
+    replace_all_db = await _store_grid_fills(
+        exchange_manager, trader, os.path.join(tmp_path, "replace_all.json"), False
+    )
+    diff_db = await _store_grid_fills(
+        exchange_manager, trader, os.path.join(tmp_path, "diff.json"), True
+    )
+    assert _get_stored_order_ids(await diff_db.all(orders_storage.OrdersStorage.HISTORY_TABLE)) == \
+        _get_stored_order_ids(await replace_all_db.all(orders_storage.OrdersStorage.HISTORY_TABLE))
+    assert diff_db.written_documents_count < replace_all_db.written_documents_count
+
+
+
+async def test_diff_based_storage_related_orders_updates(simulated_trader, tmp_path):
+    _, exchange_manager, trader = simulated_trader
+    orders_manager = exchange_manager.exchange_personal_data.orders_manager
+    orders_manager.clear()
+    db = CountingDBWriter(os.path.join(tmp_path, "diff.json"))
+    storage = _LocalOrdersStorage(exchange_manager, db, True)
+    group_order_1, group_order_2, parent_order, chained_order = [
+        _add_order(orders_manager, trader, index) for index in range(4)
+    ]
+    group = orders_manager.create_group(personal_data.OneCancelsTheOtherOrderGroup)
+    group_order_1.add_to_order_group(group)
+    group_order_2.add_to_order_group(group)
+    chained_order.triggered_by = parent_order
+    parent_order.add_chained_order(chained_order)
+    await storage.store_history()
+
+    # group_order_2 is updated without any channel message for it
+    group_order_2.tag = "updated tag"
+    await _notify_order_update(storage, group_order_1.to_dict())
+    # parent_order document includes its chained orders: it changed without any channel message for it
+    chained_order.origin_price = decimal.Decimal(100)
+    await _notify_order_update(storage, chained_order.to_dict())
+    await storage.flush()
+
+    stored_documents = {
+        document[constants.STORAGE_ORIGIN_VALUE][enums.ExchangeConstantsOrderColumns.ID.value]: document
+        for document in await db.all(orders_storage.OrdersStorage.HISTORY_TABLE)
+    }
+    assert stored_documents[group_order_2.order_id][constants.STORAGE_ORIGIN_VALUE][
+        enums.ExchangeConstantsOrderColumns.TAG.value
+    ] == "updated tag"
+    assert stored_documents[parent_order.order_id][enums.StoredOrdersAttr.CHAINED_ORDERS.value][0][
+        constants.STORAGE_ORIGIN_VALUE
+    ][enums.ExchangeConstantsOrderColumns.PRICE.value] == 100
+    await storage.stop()
+
+
+async def _store_grid_fills(exchange_manager, trader, db_path, enable_diff_based_storage):
+    orders_manager = exchange_manager.exchange_personal_data.orders_manager
+    orders_manager.clear()
+    db = CountingDBWriter(db_path)
+    storage = _LocalOrdersStorage(exchange_manager, db, enable_diff_based_storage)
+    orders = [_add_order(orders_manager, trader, index) for index in range(OPEN_ORDERS_COUNT)]
+    await storage.store_history()
+    db.write_operations_count = db.written_documents_count = 0
+    for index in range(FILLS_COUNT):
+        # filled order is replaced by a new order
+        filled_order = orders.pop(0)
+        filled_order_dict = filled_order.to_dict()
+        filled_order_dict[enums.ExchangeConstantsOrderColumns.STATUS.value] = enums.OrderStatus.FILLED.value
+        orders_manager.remove_order_instance(filled_order)
+        await _notify_order_update(storage, filled_order_dict)
+        orders.append(_add_order(orders_manager, trader, OPEN_ORDERS_COUNT + index))
+        await _notify_order_update(storage, orders[-1].to_dict())
+        if (index + 1) % FILLS_BY_FLUSH == 0:
+            await storage.flush()
+    await storage.stop()
+    return db
+
+
+async def _notify_order_update(storage, order_dict):
+    await storage._live_callback(
+        storage.exchange_manager.exchange_name, storage.exchange_manager.id, "Bitcoin", SYMBOL, order_dict,
+        enums.OrderUpdateType.STATE_CHANGE.value, True
+    )
+
+
+def _add_order(orders_manager, trader, index):
+    order = personal_data.BuyLimitOrder(trader)
+    order.update(
+        order_type=enums.TraderOrderType.BUY_LIMIT,
+        symbol=SYMBOL,
+        order_id=f"order_{index}",
+        quantity=decimal.Decimal(1),
+        price=decimal.Decimal(index + 1),
+    )
+    orders_manager._add_order(order.order_id, order)
+    return order
+
+
+def _get_stored_order_ids(documents):
+    return sorted(
+        document[constants.STORAGE_ORIGIN_VALUE][enums.ExchangeConstantsOrderColumns.ID.value]
+        for document in documents
+    )
@@ -0,0 +1,192 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import decimal
+import os
+
+import mock
+import pytest
+
+import octobot_commons.display as commons_display
+import octobot_commons.enums as commons_enums
+
+import octobot_trading.enums as enums
+import octobot_trading.personal_data as personal_data
+import octobot_trading.storage.trades_storage as trades_storage
+
+from tests import event_loop
+from tests.exchanges import simulated_exchange_manager, simulated_trader
+from tests.personal_data.trades import create_executed_trade
+from tests.storage import CountingDBWriter
+
+pytestmark = pytest.mark.asyncio
+
+
+class _LocalTradesStorage(trades_storage.TradesStorage):
+    def __init__(self, exchange_manager, db):
+        super().__init__(
+            exchange_manager,
+            commons_display.PlotSettings(
+                chart=commons_enums.PlotCharts.MAIN_CHART.value,
+                x_multiplier=1000,
+                mode="markers",
+                kind="scattergl",
+            )
+        )
+        self.db = db
+
+    def _get_db(self):
+        return self.db
+
+    async def trigger_debounced_update_auth_data(self, reset: bool):
+        pass
+
+    async def trigger_debounced_flush(self):
+        pass
+
+
+async def test_append_only_trades_storage(simulated_trader, tmp_path):
+    _, exchange_manager, trader = simulated_trader
+    trades_manager = exchange_manager.exchange_personal_data.trades_manager
+    db = CountingDBWriter(os.path.join(tmp_path, "trades.json"))
+    storage = _LocalTradesStorage(exchange_manager, db)
+    trades = _create_trades(trader, 7)
+    for trade in trades[:5]:
+        trades_manager.upsert_trade_instance(trade)
+
+    # stored trades are unknown: rewrite history
+    await storage.store_history()
+    assert db.write_operations_count == 2
+    assert db.written_documents_count == 5
+    assert _get_trade_ids(await storage.get_history()) == ["0", "1", "2", "3", "4"]
+
+    # only new trades are appended
+    for trade in trades[5:]:
+        trades_manager.upsert_trade_instance(trade)
+    await storage.store_history()
+    assert db.write_operations_count == 3
+    assert db.written_documents_count == 7
+    await storage.store_history()
+    assert db.write_operations_count == 3
+
+    # live trades are buffered
+    live_trade = _create_trades(trader, 8)[7]
+    trades_manager.upsert_trade_instance(live_trade)
+    await _notify_trade(storage, live_trade)
+    assert db.write_operations_count == 3
+    await storage.flush()
+    assert db.write_operations_count == 4
+    assert db.written_documents_count == 8
+    await storage.store_history()
+    assert db.write_operations_count == 4
+    storage.MAX_BUFFERED_DOCUMENTS_COUNT = 2
+    buffered_trades = _create_trades(trader, 10)[8:]
+    for trade in buffered_trades:
+        trades_manager.upsert_trade_instance(trade)
+        await _notify_trade(storage, trade)
+    # 2 trades are written at once
+    assert db.write_operations_count == 5
+    assert db.written_documents_count == 10
+
+    # stored trades are loaded from storage one by one
+    stored_trade_ids = [str(index) for index in range(10)]
+    assert _get_trade_ids([trade_dict async for trade_dict in storage.iter_history()]) == stored_trade_ids
+    exchange_manager.storage_manager.trades_storage = storage
+    await trades_manager.reload_history(False)
+    assert list(trades_manager.trades) == stored_trade_ids
+    assert trades_manager.get_trade("3").to_dict() == trades[3].to_dict()
+
+    # history is rewritten when trades are removed
+    trades_manager.trades.pop("0")
+    await storage.store_history()
+    assert db.write_operations_count == 7
+    assert db.written_documents_count == 19
+    assert _get_trade_ids(await storage.get_history()) == stored_trade_ids[1:]
+
+    await storage.clear_history()
+    assert await storage.get_history() == []
+    await storage.store_history()
+    assert _get_trade_ids(await storage.get_history()) == stored_trade_ids[1:]
+
+    # trades are only created once when stored several times
+    stored_trade_dicts = await storage.get_history()
+
+    async def _iter_history():
+        for trade_dict in stored_trade_dicts + stored_trade_dicts[:3]:
+            yield trade_dict
+
+    with mock.patch.object(storage, "iter_history", _iter_history), \
+            mock.patch.object(personal_data.Trade, "from_dict", mock.Mock(wraps=personal_data.Trade.from_dict)) \
+            as from_dict_mock:
+        await trades_manager.reload_history(False)
+        assert from_dict_mock.call_count == len(stored_trade_dicts)
+    assert list(trades_manager.trades) == stored_trade_ids[1:]
+
+
+async def test_updated_trades_are_upserted(simulated_trader, tmp_path):
+    _, exchange_manager, trader = simulated_trader
+    trades_manager = exchange_manager.exchange_personal_data.trades_manager
+    db = CountingDBWriter(os.path.join(tmp_path, "trades.json"))
+    storage = _LocalTradesStorage(exchange_manager, db)
+    trades = _create_trades(trader, 2)
+    for trade in trades:
+        trades_manager.upsert_trade_instance(trade)
+    await storage.store_history()
+    assert _get_trade_ids(await storage.get_history()) == ["0", "1"]
+
+    # live updates of a stored trade replace its document
+    await _notify_trade(storage, trades[0])
+    trades[0].executed_price = decimal.Decimal(200)
+    await _notify_trade(storage, trades[0])
+    await storage.flush()
+    stored_trades = await storage.get_history()
+    assert sorted(_get_trade_ids(stored_trades)) == ["0", "1"]
+    assert [
+        trade_dict[enums.ExchangeConstantsOrderColumns.PRICE.value]
+        for trade_dict in stored_trades
+        if trade_dict[enums.ExchangeConstantsOrderColumns.ID.value] == "0"
+    ] == [200]
+
+    # stored trades are unknown: live trades replace their stored document
+    storage = _LocalTradesStorage(exchange_manager, db)
+    await _notify_trade(storage, trades[1])
+    await storage.flush()
+    assert sorted(_get_trade_ids(await storage.get_history())) == ["0", "1"]
+
+
+async def _notify_trade(storage, trade):
+    await storage._live_callback(
+        storage.exchange_manager.exchange_name, storage.exchange_manager.id, "Bitcoin", trade.symbol,
+        trade.to_dict(), False
+    )
+
+
+def _get_trade_ids(trade_dicts):
+    return [trade_dict[enums.ExchangeConstantsOrderColumns.ID.value] for trade_dict in trade_dicts]
+
+
+def _create_trades(trader, count):
+    trades = []
+    for index in range(count):
+        trade = create_executed_trade(
+            trader, enums.TradeOrderSide.BUY, index, decimal.Decimal(index + 1), decimal.Decimal(100), "BTC/USDT",
+            {
+                enums.FeePropertyColumns.COST.value: decimal.Decimal("0.1"),
+                enums.FeePropertyColumns.CURRENCY.value: "USDT",
+            }
+        )
+        trade.trade_id = str(index)
+        trades.append(trade)
+    return trades
@@ -0,0 +1,172 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+
+import mock
+import pytest
+
+import async_channel.constants as channel_constants
+
+import octobot_trading.exchange_channel as exchange_channel
+from octobot_trading.enums import ExchangeChannelConsumerMode
+
+from tests import event_loop
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+
+async def test_coalescing_queue():
+    queue = exchange_channel.CoalescingQueue(maxsize=2)
+    queue.put_nowait(_get_message("BTC/USDT", "1h", 1))
+    queue.put_nowait(_get_message("ETH/USDT", "1h", 1))
+    # full queue: queued messages can still be replaced
+    await asyncio.wait_for(queue.put(_get_message("BTC/USDT", "1h", 2)), 1)
+    with pytest.raises(asyncio.QueueFull):
+        queue.put_nowait(_get_message("BTC/USDT", "4h", 1))
+    assert queue.qsize() == 2
+    assert queue.get_nowait() == _get_message("BTC/USDT", "1h", 2)
+    queue.task_done()
+    queue.put_nowait(_get_message("BTC/USDT", "4h", 1))
+    assert queue.get_nowait() == _get_message("ETH/USDT", "1h", 1)
+    queue.task_done()
+    assert queue.get_nowait() == _get_message("BTC/USDT", "4h", 1)
+    queue.task_done()
+    assert queue.empty()
+    # replaced messages are not unfinished tasks
+    await asyncio.wait_for(queue.join(), 1)
+
+
+async def test_coalescing_queue_messages_without_symbol():
+    queue = exchange_channel.CoalescingQueue()
+    queue.put_nowait(_get_message(None, None, 1))
+    await asyncio.wait_for(queue.put(_get_message(None, None, 2)), 1)
+    queue.put_nowait(_get_message(None, "1h", 3))
+    queue.put_nowait(_get_message("BTC/USDT", None, 4))
+    queue.put_nowait(_get_message("BTC/USDT", None, 5))
+    # messages without symbol are not replaced
+    assert queue.qsize() == 4
+    assert [queue.get_nowait()["price"] for _ in range(4)] == [1, 2, 3, 5]
+    assert queue.empty()
+
+
+async def test_new_coalescing_consumer():
+    channel = exchange_channel.TimeFrameExchangeChannel(mock.Mock(exchange_name="binance"))
+    received_messages = []
+
+    async def callback(**kwargs):
+        received_messages.append(kwargs)
+
+    consumer = await channel.new_consumer(callback, consumer_mode=ExchangeChannelConsumerMode.COALESCING)
+    try:
+        assert isinstance(consumer, exchange_channel.ExchangeChannelCoalescingConsumer)
+        for price in range(10):
+            await consumer.queue.put(_get_message("BTC/USDT", "1h", price))
+            await consumer.queue.put(_get_message("ETH/USDT", "1h", price))
+        await _wait_for_messages(received_messages, 2)
+        # only the latest message of each symbol is consumed
+        assert received_messages == [_get_message("BTC/USDT", "1h", 9), _get_message("ETH/USDT", "1h", 9)]
+    finally:
+        await consumer.stop()
+
+
+async def test_new_batched_consumer():
+    channel = exchange_channel.ExchangeChannel(mock.Mock(exchange_name="binance"))
+    received_batches = []
+
+    async def callback(messages):
+        received_batches.append(messages)
+
+    consumer = await channel.new_consumer(callback, consumer_mode=ExchangeChannelConsumerMode.BATCHED)
+    try:
+        assert isinstance(consumer, exchange_channel.ExchangeChannelBatchedConsumer)
+        messages = [_get_message("BTC/USDT", None, price) for price in range(10)]
+        for message in messages:
+            consumer.queue.put_nowait(message)
+        await _wait_for_messages(received_batches, 1)
+        # every queued message is consumed at once
+        assert received_batches == [messages]
+    finally:
+        await consumer.stop()
+
+    # default consumer
+    assert type(await channel.new_consumer(callback)) is exchange_channel.ExchangeChannelConsumer
+    await channel.get_consumers()[-1].stop()
+
+
+async def test_get_filtered_consumers():
+    channel = exchange_channel.TimeFrameExchangeChannel(mock.Mock(exchange_name="binance"))
+    btc_1h_consumer = exchange_channel.ExchangeChannelConsumer(None)
+    btc_consumer = exchange_channel.ExchangeChannelConsumer(None)
+    time_frames_consumer = exchange_channel.ExchangeChannelConsumer(None)
+    channel.add_new_consumer(btc_1h_consumer, {channel.CRYPTOCURRENCY_KEY: "BTC", channel.SYMBOL_KEY: "BTC/USDT",
+                                               channel.TIME_FRAME_KEY: "1h"})
+    channel.add_new_consumer(btc_consumer, {channel.CRYPTOCURRENCY_KEY: "BTC", channel.SYMBOL_KEY: "BTC/USDT",
+                                            channel.TIME_FRAME_KEY: channel_constants.CHANNEL_WILDCARD})
+    assert channel.get_filtered_consumers(symbol="BTC/USDT", time_frame="1h") == [btc_1h_consumer, btc_consumer]
+    assert channel.get_filtered_consumers(symbol="BTC/USDT", time_frame="4h") == [btc_consumer]
+    assert channel.get_filtered_consumers(symbol="ETH/USDT", time_frame="1h") == []
+
+    # filtered consumers are updated when consumers are added or removed
+    channel.add_new_consumer(time_frames_consumer, {channel.CRYPTOCURRENCY_KEY: channel_constants.CHANNEL_WILDCARD,
+                                                    channel.SYMBOL_KEY: channel_constants.CHANNEL_WILDCARD,
+                                                    channel.TIME_FRAME_KEY: ["1h", "4h"]})
+    assert channel.get_filtered_consumers(symbol="BTC/USDT", time_frame="4h") == [btc_consumer, time_frames_consumer]
+    assert channel.get_filtered_consumers(symbol="ETH/USDT", time_frame="1h") == [time_frames_consumer]
+    assert channel.get_filtered_consumers(symbol="ETH/USDT", time_frame="1d") == []
+    await channel.remove_consumer(btc_consumer)
+    assert channel.get_filtered_consumers(symbol="BTC/USDT", time_frame="1h") == \
+           [btc_1h_consumer, time_frames_consumer]
+    assert channel.get_filtered_consumers(symbol="BTC/USDT") == [btc_1h_consumer, time_frames_consumer]
+    assert channel.get_filtered_consumers(cryptocurrency="ETH") == [time_frames_consumer]
+
+
+async def test_get_filtered_consumers_as_consumers_filters():
+    channel = exchange_channel.TimeFrameExchangeChannel(mock.Mock(exchange_name="binance"))
+    symbols = [f"COIN{index}/USDT" for index in range(10)]
+    time_frames = ["1m", "1h", "1d"]
+    for symbol in symbols:
+        for time_frame in time_frames + [channel_constants.CHANNEL_WILDCARD]:
+            channel.add_new_consumer(exchange_channel.ExchangeChannelConsumer(None), {
+                channel.CRYPTOCURRENCY_KEY: symbol.split("/")[0],
+                channel.SYMBOL_KEY: symbol,
+                channel.TIME_FRAME_KEY: time_frame
+            })
+    for symbol in symbols + ["ETH/USDT", channel_constants.CHANNEL_WILDCARD]:
+        for time_frame in time_frames + ["4h", channel_constants.CHANNEL_WILDCARD]:
+            # same consumers as when checking every consumer filters
+            assert channel.get_filtered_consumers(symbol=symbol, time_frame=time_frame) == \
+                channel.get_consumer_from_filters({
+                    channel.CRYPTOCURRENCY_KEY: channel_constants.CHANNEL_WILDCARD,
+                    channel.SYMBOL_KEY: symbol,
+                    channel.TIME_FRAME_KEY: time_frame
+                })
+
+
+async def _wait_for_messages(received_messages, count):
+    for _ in range(100):
+        if len(received_messages) >= count:
+            return
+        await asyncio.sleep(0.001)
+
+
+def _get_message(symbol, time_frame, price):
+    return {
+        "exchange": "binance",
+        "symbol": symbol,
+        "time_frame": time_frame,
+        "price": price,
+    }
@@ -0,0 +1,39 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import octobot_trading.util as util
+
+
+def test_attribute_index():
+    index = util.AttributeIndex()
+    assert index.get("a") == {}
+    index.add("a", "element_1", 1)
+    index.add("b", "element_2", 2)
+    index.add("a", "element_3", 3)
+    assert list(index.get("a")) == ["element_1", "element_3"]
+    assert list(index.get("b")) == ["element_2"]
+
+    # elements are kept sorted by position
+    index.remove("b", "element_2")
+    index.add("a", "element_2", 2)
+    assert list(index.get("a")) == ["element_1", "element_2", "element_3"]
+    assert "b" not in index.elements_by_key
+
+    index.remove("a", "element_1")
+    index.remove("a", "unknown_element")
+    index.remove("unknown_key", "element_1")
+    assert list(index.get("a")) == ["element_2", "element_3"]
+    index.clear()
+    assert index.get("a") == {}
@@ -0,0 +1,131 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import json
+import os
+import time
+
+import mock
+import pytest
+
+import octobot_commons.databases as databases
+import octobot_commons.enums as commons_enums
+import octobot_commons.constants as commons_constants
+import octobot_backtesting.enums as backtesting_enums
+import octobot_backtesting.importers as importers
+
+import octobot_trading.util as util
+
+from tests import event_loop
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+EXCHANGE_NAME = "binance"
+PAIRS = ["BTC/USDT", "ETH/USDT"]
+TIME_FRAMES = [commons_enums.TimeFrames.ONE_HOUR, commons_enums.TimeFrames.FOUR_HOURS]
+START_TIMESTAMP = 1672531200
+END_TIMESTAMP = START_TIMESTAMP + 3 * commons_constants.DAYS_TO_SECONDS
+
+
+async def test_load_series():
+    stream = util.BacktestingDataStream()
+    load_rows = mock.AsyncMock(return_value=[[3, "c"], [1, "a"], [2, "b"]])
+    assert not stream.has_series("BTC/USDT")
+    await stream.load_series("BTC/USDT", load_rows, symbol="BTC/USDT")
+    await stream.load_series("BTC/USDT", load_rows, symbol="BTC/USDT")
+    # series are only loaded once
+    load_rows.assert_awaited_once_with(symbol="BTC/USDT")
+    assert stream.has_series("BTC/USDT")
+    # rows are sorted by timestamp
+    assert stream.get_rows("BTC/USDT", 0) == [[1, "a"], [2, "b"], [3, "c"]]
+    stream.clear()
+    assert not stream.has_series("BTC/USDT")
+
+
+async def test_get_rows():
+    stream = util.BacktestingDataStream()
+    rows = [[timestamp, str(timestamp)] for timestamp in range(0, 100, 10)]
+    stream.set_series("BTC/USDT", rows)
+    # inferior and superior timestamps are included
+    assert stream.get_rows("BTC/USDT", 10, 30) == rows[1:4]
+    assert stream.get_rows("BTC/USDT", 31, 39) == []
+    assert stream.get_rows("BTC/USDT", 31, 40) == [rows[4]]
+    assert stream.get_rows("BTC/USDT", 85) == [rows[9]]
+    assert stream.get_rows("BTC/USDT", 91) == []
+    # selecting from before the last selection
+    assert stream.get_rows("BTC/USDT", -10, 5) == [rows[0]]
+    assert stream.get_rows("BTC/USDT", 0) == rows
+
+    assert stream.get_first_row("BTC/USDT", 25) == rows[3]
+    assert stream.get_first_row("BTC/USDT", 30) == rows[3]
+    assert stream.get_first_row("BTC/USDT", 0) == rows[0]
+    with pytest.raises(IndexError):
+        stream.get_first_row("BTC/USDT", 91)
+    with pytest.raises(KeyError):
+        stream.get_rows("ETH/USDT", 0)
+
+
+async def test_get_rows_from_importer_series(tmp_path):
+    file_path = os.path.join(tmp_path, "stream.data")
+    await _create_data_file(file_path)
+    importer = importers.ExchangeDataImporter({}, file_path)
+    await importer.initialize()
+    try:
+        stream = util.BacktestingDataStream()
+        last_timestamp = START_TIMESTAMP - 1
+        for timestamp in range(START_TIMESTAMP, END_TIMESTAMP, commons_constants.HOURS_TO_SECONDS):
+            for pair in PAIRS:
+                for time_frame in TIME_FRAMES:
+                    series_key = (pair, time_frame.value)
+                    if not stream.has_series(series_key):
+                        await stream.load_series(
+                            series_key, importer.get_ohlcv,
+                            exchange_name=EXCHANGE_NAME, symbol=pair, time_frame=time_frame
+                        )
+                    # same selections as the ones from the importer
+                    assert stream.get_rows(series_key, last_timestamp + 1, timestamp) == \
+                        await importer.get_ohlcv_from_timestamps(
+                            exchange_name=EXCHANGE_NAME, symbol=pair, time_frame=time_frame,
+                            inferior_timestamp=last_timestamp + 1, superior_timestamp=timestamp
+                        )
+            last_timestamp = timestamp
+    finally:
+        await importer.stop()
+
+
+async def _create_data_file(file_path):
+    database = databases.SQLiteDatabase(file_path)
+    await database.initialize()
+    await database.insert(
+        backtesting_enums.DataTables.DESCRIPTION, timestamp=time.time(), version="1.1", exchange=EXCHANGE_NAME,
+        symbols=json.dumps(PAIRS), time_frames=json.dumps([tf.value for tf in TIME_FRAMES]),
+        start_timestamp=START_TIMESTAMP, end_timestamp=END_TIMESTAMP
+    )
+    for pair_index, pair in enumerate(PAIRS):
+        for time_frame in TIME_FRAMES:
+            time_frame_seconds = commons_enums.TimeFramesMinutes[time_frame] * commons_constants.MINUTE_TO_SECONDS
+            candle_timestamps = list(range(START_TIMESTAMP, END_TIMESTAMP, time_frame_seconds))
+            await database.insert_all(
+                backtesting_enums.ExchangeDataTables.OHLCV, timestamp=candle_timestamps,
+                exchange_name=EXCHANGE_NAME, cryptocurrency=pair.split("/")[0], symbol=pair,
+                time_frame=time_frame.value,
+                candle=[
+                    json.dumps([candle_timestamp, 100 + pair_index, 110 + pair_index, 90 + pair_index,
+                                105 + pair_index, 1000])
+                    for candle_timestamp in candle_timestamps
+                ]
+            )
+    await database.stop()
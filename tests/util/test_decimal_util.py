@@ -0,0 +1,43 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import decimal
+
+import pytest
+
+import octobot_trading.constants as constants
+import octobot_trading.util as util
+
+
+def test_to_decimal():
+    util.clear_decimal_conversion_cache()
+    for value in (1, 1.0, 0.1, 1e-07, 123456789.123, "0.30000000000000004", "1e-8"):
+        converted = util.to_decimal(value)
+        assert converted == decimal.Decimal(str(value))
+        # same representation as decimal.Decimal(str(value))
+        assert str(converted) == str(decimal.Decimal(str(value)))
+    # equal values of different types are not mixed up
+    assert str(util.to_decimal(1)) == "1"
+    assert str(util.to_decimal(1.0)) == "1.0"
+    # decimal.Decimal are not converted
+    assert util.to_decimal(constants.ONE) is constants.ONE
+    assert util.to_decimal(constants.NaN).is_nan()
+    # repeated values are cached
+    assert util.to_decimal(0.1) is util.to_decimal(0.1)
+    with pytest.raises(decimal.InvalidOperation):
+        util.to_decimal(None)
+    with pytest.raises(decimal.InvalidOperation):
+        util.to_decimal("1.1.1")
+
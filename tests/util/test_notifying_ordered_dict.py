@@ -0,0 +1,72 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import collections
+import copy
+
+import mock
+
+import octobot_trading.util as util
+
+
+def test_notifying_ordered_dict():
+    on_set = mock.Mock()
+    on_remove = mock.Mock()
+    elements = util.NotifyingOrderedDict(on_set, on_remove, {"a": 1})
+    on_set.assert_called_once_with(1, None)
+    on_set.reset_mock()
+
+    elements["b"] = 2
+    on_set.assert_called_once_with(2, None)
+    on_set.reset_mock()
+    elements["a"] = 3
+    on_set.assert_called_once_with(3, 1)
+    on_set.reset_mock()
+    elements.update({"c": 4})
+    elements.setdefault("d", 5)
+    assert on_set.mock_calls == [mock.call(4, None), mock.call(5, None)]
+    # replacing keeps the key position
+    assert list(elements.items()) == [("a", 3), ("b", 2), ("c", 4), ("d", 5)]
+    on_remove.assert_not_called()
+
+    del elements["a"]
+    on_remove.assert_called_once_with(3)
+    on_remove.reset_mock()
+    assert elements.pop("b") == 2
+    on_remove.assert_called_once_with(2)
+    on_remove.reset_mock()
+    assert elements.pop("unknown", None) is None
+    on_remove.assert_not_called()
+    assert elements.popitem(last=False) == ("c", 4)
+    on_remove.assert_called_once_with(4)
+    on_remove.reset_mock()
+    elements["e"] = 6
+    elements.clear()
+    assert on_remove.mock_calls == [mock.call(5), mock.call(6)]
+    assert elements == {}
+
+
+def test_copies():
+    on_set = mock.Mock()
+    on_remove = mock.Mock()
+    elements = util.NotifyingOrderedDict(on_set, on_remove, {"a": 1, "b": 2})
+    on_set.reset_mock()
+    for elements_copy in (elements.copy(), copy.copy(elements), copy.deepcopy(elements)):
+        assert type(elements_copy) is collections.OrderedDict
+        assert elements_copy == elements
+        elements_copy["c"] = 3
+        elements_copy.clear()
+    on_set.assert_not_called()
+    on_remove.assert_not_called()
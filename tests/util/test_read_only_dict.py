@@ -0,0 +1,64 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import copy
+import pickle
+
+import pytest
+
+import octobot_trading.util as util
+
+
+def test_get_read_only_dict():
+    element = {"a": {"b": [1, {"c": 2}]}, "d": 3}
+    read_only_dict = util.get_read_only_dict(element)
+    assert read_only_dict == {"a": {"b": (1, {"c": 2})}, "d": 3}
+    assert isinstance(read_only_dict["a"], util.ReadOnlyDict)
+    assert isinstance(read_only_dict["a"]["b"][1], util.ReadOnlyDict)
+    # element is copied
+    element["a"]["b"].append(4)
+    assert read_only_dict["a"]["b"] == (1, {"c": 2})
+
+    for update in (
+        lambda: read_only_dict.__setitem__("d", 4),
+        lambda: read_only_dict["a"].__setitem__("e", 4),
+        lambda: read_only_dict["a"]["b"][1].update({"c": 3}),
+        lambda: read_only_dict.pop("d"),
+        lambda: read_only_dict.setdefault("e", 1),
+        lambda: read_only_dict.clear(),
+    ):
+        with pytest.raises(TypeError):
+            update()
+    with pytest.raises(TypeError):
+        del read_only_dict["d"]
+    with pytest.raises(TypeError):
+        read_only_dict |= {"e": 1}
+    assert read_only_dict == {"a": {"b": (1, {"c": 2})}, "d": 3}
+
+
+def test_read_only_dict_copies():
+    read_only_dict = util.get_read_only_dict({"a": {"b": [1, {"c": 2}]}, "d": 3})
+    for shallow_copy in (read_only_dict.copy(), copy.copy(read_only_dict)):
+        assert type(shallow_copy) is dict
+        shallow_copy["d"] = 4
+    deep_copy = copy.deepcopy(read_only_dict)
+    assert deep_copy == {"a": {"b": [1, {"c": 2}]}, "d": 3}
+    # deep copies are fully mutable
+    deep_copy["a"]["b"][1]["c"] = 3
+    deep_copy["a"]["b"].append(4)
+    assert read_only_dict == {"a": {"b": (1, {"c": 2})}, "d": 3}
+    unpickled = pickle.loads(pickle.dumps(read_only_dict))
+    assert isinstance(unpickled, util.ReadOnlyDict)
+    assert unpickled == read_only_dict